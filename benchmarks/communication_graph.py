@@ -0,0 +1,178 @@
+"""
+Query latency of the indexed CommunicationGraph on a large message history.
+
+Fills a graph with direct, multicast and broadcast messages spread over agents,
+tasks and threads (100,000 messages by default), then times the queries used by
+manager observations and agent views. Each query is also timed against a
+full-history scan-and-sort equivalent, which is how the graph answered them
+before it kept secondary indexes.
+
+Usage:
+    python -m benchmarks.communication_graph --messages 100000
+"""
+
+import argparse
+import json
+import random
+import statistics
+import time
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+from manager_agent_gym.schemas.core.communication import (
+    CommunicationGraph,
+    Message,
+    MessageType,
+)
+
+
+def build_graph(
+    messages: int, agents: int, tasks: int, threads: int, seed: int
+) -> CommunicationGraph:
+    rng = random.Random(seed)
+    agent_ids = [f"agent_{i}" for i in range(agents)]
+    task_ids = [uuid4() for _ in range(tasks)]
+    thread_ids = [uuid4() for _ in range(threads)]
+    graph = CommunicationGraph()
+    start = datetime(2025, 1, 1)
+    for i in range(messages):
+        sender = rng.choice(agent_ids)
+        roll = rng.random()
+        if roll < 0.05:
+            kwargs: dict = {"message_type": MessageType.BROADCAST}
+        elif roll < 0.15:
+            kwargs = {"recipients": rng.sample(agent_ids, 3)}
+        else:
+            kwargs = {"receiver_id": rng.choice(agent_ids)}
+        graph.add_message(
+            Message(
+                sender_id=sender,
+                content=f"message {i}",
+                timestamp=start + timedelta(seconds=i),
+                related_task_id=rng.choice(task_ids) if rng.random() < 0.3 else None,
+                thread_id=rng.choice(thread_ids) if rng.random() < 0.2 else None,
+                **kwargs,
+            )
+        )
+    return graph
+
+
+def _time_ms(fn: Callable[[], object], repeats: int) -> float:
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000.0)
+    return round(statistics.median(samples), 4)
+
+
+def run(messages: int, agents: int, repeats: int, seed: int) -> dict[str, object]:
+    start = time.perf_counter()
+    graph = build_graph(messages, agents, tasks=200, threads=100, seed=seed)
+    build_s = time.perf_counter() - start
+
+    everything = list(graph.messages.values())
+    newest = max(m.timestamp for m in everything)
+    since = newest - timedelta(seconds=messages // 100)
+    agent, other = "agent_0", "agent_1"
+    task_id = next(m.related_task_id for m in everything if m.related_task_id)
+
+    def scan_inbox() -> list[Message]:
+        found = [
+            m for m in everything if agent in m.get_all_recipients() or m.is_broadcast()
+        ]
+        found.sort(key=lambda m: m.timestamp, reverse=True)
+        return found[:20]
+
+    def scan_conversation() -> list[Message]:
+        found = [
+            m
+            for m in everything
+            if (m.sender_id == agent and other in m.get_all_recipients())
+            or (m.sender_id == other and agent in m.get_all_recipients())
+        ]
+        found.sort(key=lambda m: m.timestamp)
+        return found[-50:]
+
+    queries: dict[str, tuple[Callable[[], object], Callable[[], object]]] = {
+        "recent_10": (
+            lambda: graph.get_recent_messages(limit=10),
+            lambda: sorted(everything, key=lambda m: m.timestamp, reverse=True)[:10],
+        ),
+        "since_last_1pct": (
+            lambda: graph.get_recent_messages(since=since),
+            lambda: sorted(
+                (m for m in everything if m.timestamp >= since),
+                key=lambda m: m.timestamp,
+                reverse=True,
+            ),
+        ),
+        "agent_inbox_20": (
+            lambda: graph.get_messages_for_agent(agent, limit=20),
+            scan_inbox,
+        ),
+        "agent_inbox_requests_since": (
+            lambda: graph.get_messages_for_agent(
+                agent, since=since, message_types=[MessageType.DIRECT]
+            ),
+            lambda: [
+                m
+                for m in scan_inbox()
+                if m.timestamp >= since and m.message_type == MessageType.DIRECT
+            ],
+        ),
+        "conversation_50": (
+            lambda: graph.get_conversation_history(agent, other, limit=50),
+            scan_conversation,
+        ),
+        "task_messages": (
+            lambda: graph.get_task_messages(task_id),
+            lambda: sorted(
+                (m for m in everything if m.related_task_id == task_id),
+                key=lambda m: m.timestamp,
+            ),
+        ),
+        "agent_stats": (
+            lambda: graph.get_agent_communication_stats(agent),
+            lambda: (
+                sum(1 for m in everything if m.sender_id == agent),
+                sum(
+                    1
+                    for m in everything
+                    if agent in m.get_all_recipients() or m.is_broadcast()
+                ),
+            ),
+        ),
+    }
+
+    results: dict[str, object] = {
+        "messages": messages,
+        "agents": agents,
+        "build_seconds": round(build_s, 3),
+    }
+    for name, (indexed, scan) in queries.items():
+        indexed_ms = _time_ms(indexed, repeats)
+        scan_ms = _time_ms(scan, max(1, repeats // 10))
+        results[name] = {
+            "indexed_ms": indexed_ms,
+            "scan_ms": scan_ms,
+            "speedup": round(scan_ms / indexed_ms, 1) if indexed_ms else None,
+        }
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=(__doc__ or "").splitlines()[1])
+    parser.add_argument("--messages", type=int, default=100_000)
+    parser.add_argument("--agents", type=int, default=50)
+    parser.add_argument("--repeats", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    print(
+        json.dumps(run(args.messages, args.agents, args.repeats, args.seed), indent=2)
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,193 @@
+"""
+End-to-end engine throughput (timesteps/sec) on a synthetic workflow.
+
+Runs ``WorkflowExecutionEngine.run_full_execution`` over a workflow built by
+``benchmarks.synthetic`` with zero-latency worker agents, a manager that builds
+its observation every timestep and code-only rubrics evaluated every timestep,
+so the numbers measure the engine's own overhead. ``--simulate-llm`` swaps in
+the structured manager answered by the offline LLM simulator; ``--outputs``
+also writes the per-timestep outputs and snapshots to a temporary directory.
+Per-phase wall time comes from the engine's phase profiler.
+
+Long horizons need deep workflows: ``--width 10 --depth 1000`` gives 10,000
+top-level tasks that take about 1,000 timesteps to finish.
+
+Usage:
+    python -m benchmarks.engine_throughput --timesteps 200
+"""
+
+import argparse
+import asyncio
+import json
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+from uuid import UUID
+
+from benchmarks.synthetic import (
+    SyntheticWorkflowSpec,
+    add_spec_arguments,
+    build_workflow,
+    make_stakeholder,
+    seed_communication,
+    spec_from_args,
+)
+from benchmarks.workflow_ops import code_only_evaluator
+from manager_agent_gym.core.common.llm_interface import configure_llm_simulator
+from manager_agent_gym.core.common.llm_simulator import SimulatedLLM
+from manager_agent_gym.core.common.profiling import PhaseProfiler
+from manager_agent_gym.core.communication.service import CommunicationService
+from manager_agent_gym.core.execution.engine import WorkflowExecutionEngine
+from manager_agent_gym.core.manager_agent import (
+    ChainOfThoughtManagerAgent,
+    ManagerAgent,
+)
+from manager_agent_gym.core.workflow_agents.registry import AgentRegistry
+from manager_agent_gym.schemas.config import OutputConfig
+from manager_agent_gym.schemas.core.base import TaskStatus
+from manager_agent_gym.schemas.core.workflow import Workflow
+from manager_agent_gym.schemas.execution.manager_actions import NoOpAction
+from manager_agent_gym.schemas.execution.state import ExecutionState
+from manager_agent_gym.schemas.preferences.preference import PreferenceWeights
+from manager_agent_gym.schemas.workflow_agents.stakeholder import (
+    StakeholderPublicProfile,
+)
+
+
+class _ObservingManager(ManagerAgent):
+    """Builds its observation every timestep, then does nothing."""
+
+    observation_fields = frozenset({"task_status_counts"})
+
+    def __init__(self) -> None:
+        super().__init__("benchmark_manager", PreferenceWeights(preferences=[]))
+
+    async def step(
+        self,
+        workflow: Workflow,
+        execution_state: ExecutionState,
+        stakeholder_profile: StakeholderPublicProfile,
+        current_timestep: int,
+        running_tasks: dict,
+        completed_task_ids: set[UUID],
+        failed_task_ids: set[UUID],
+        communication_service: CommunicationService | None = None,
+        previous_reward: float = 0.0,
+        done: bool = False,
+    ) -> NoOpAction:
+        observation = await self.create_observation(
+            workflow=workflow,
+            execution_state=execution_state,
+            stakeholder_profile=stakeholder_profile,
+            current_timestep=current_timestep,
+            running_tasks=running_tasks,
+            completed_task_ids=completed_task_ids,
+            failed_task_ids=failed_task_ids,
+            communication_service=communication_service,
+        )
+        return NoOpAction(
+            reasoning="benchmark",
+            success=True,
+            result_summary=f"{observation.task_status_counts}",
+        )
+
+    def reset(self) -> None:
+        pass
+
+
+async def run(
+    spec: SyntheticWorkflowSpec,
+    timesteps: int,
+    simulate_llm: bool = False,
+    outputs: bool = False,
+) -> dict:
+    workflow = build_workflow(spec)
+    service = await seed_communication(workflow, spec)
+    stakeholder = make_stakeholder()
+    workflow.add_agent(stakeholder)
+
+    manager: ManagerAgent = _ObservingManager()
+    simulator: SimulatedLLM | None = None
+    if simulate_llm:
+        simulator = SimulatedLLM(seed=spec.seed)
+        configure_llm_simulator(simulator)
+        manager = ChainOfThoughtManagerAgent(PreferenceWeights(preferences=[]))
+
+    profiler = PhaseProfiler(enabled=True)
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = WorkflowExecutionEngine(
+            workflow=workflow,
+            agent_registry=AgentRegistry(),
+            stakeholder_agent=stakeholder,
+            manager_agent=manager,
+            seed=spec.seed,
+            evaluations=[code_only_evaluator()],
+            output_config=(
+                OutputConfig(base_output_dir=Path(tmp), create_run_subdirectory=False)
+                if outputs
+                else None
+            ),
+            max_timesteps=timesteps,
+            enable_timestep_logging=outputs,
+            enable_final_metrics_logging=outputs,
+            communication_service=service,
+            log_preference_evaluation_progress=False,
+            profiler=profiler,
+        )
+        start = time.perf_counter()
+        try:
+            results = await engine.run_full_execution()
+        finally:
+            if simulator is not None:
+                configure_llm_simulator(None)
+        wall = time.perf_counter() - start
+
+    phases: dict[str, dict[str, Any]] = {}
+    for result in results:
+        for name, phase in result.metadata.get("profile", {}).get("phases", {}).items():
+            total = phases.setdefault(name, {"count": 0, "wall_ms": 0.0})
+            total["count"] += phase["count"]
+            total["wall_ms"] += phase["wall_ms"]
+    completed = sum(
+        1
+        for t in workflow._index.tasks(workflow).values()
+        if t.is_atomic_task() and t.status == TaskStatus.COMPLETED
+    )
+    steps = len(results)
+    return {
+        "spec": spec.model_dump(),
+        "manager": type(manager).__name__,
+        "outputs": outputs,
+        "tasks": len(workflow._index.tasks(workflow)),
+        "timesteps": steps,
+        "execution_state": engine.execution_state.value,
+        "leaf_tasks_completed": completed,
+        "wall_seconds": round(wall, 3),
+        "timesteps_per_sec": round(steps / wall, 2) if wall else 0.0,
+        "mean_timestep_ms": round(wall * 1000.0 / steps, 3) if steps else 0.0,
+        "phases_ms_per_timestep": {
+            name: round(total["wall_ms"] / steps, 3)
+            for name, total in sorted(phases.items())
+        }
+        if steps
+        else {},
+        "simulated_llm": simulator.stats() if simulator is not None else None,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=(__doc__ or "").splitlines()[1])
+    add_spec_arguments(parser)
+    parser.add_argument("--timesteps", type=int, default=200)
+    parser.add_argument("--simulate-llm", dest="simulate_llm", action="store_true")
+    parser.add_argument("--outputs", action="store_true")
+    args = parser.parse_args()
+    results = asyncio.run(
+        run(spec_from_args(args), args.timesteps, args.simulate_llm, args.outputs)
+    )
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""
+Per-timestep cost of building manager observations, by manager type.
+
+Loads the example scenario with the most tasks (or ``--scenario``), registers
+its full team and seeds the communication graph, then times
+``create_observation`` plus reads of the fields each manager declares it uses.
+The "eager" column materializes every field, which is what building the
+observation cost before fields could be deferred. One task is touched per
+iteration so that every build sees a new workflow version, as it would after a
+real timestep.
+
+Usage:
+    python -m benchmarks.manager_observation --iterations 200
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+
+from examples.scenarios import SCENARIOS
+from manager_agent_gym.core.communication.service import CommunicationService
+from manager_agent_gym.core.manager_agent import (
+    ChainOfThoughtManagerAgent,
+    ManagerAgent,
+    OneShotDelegateManagerAgent,
+    RandomManagerAgent,
+)
+from manager_agent_gym.core.workflow_agents.interface import AgentInterface
+from manager_agent_gym.schemas.core.resources import Resource
+from manager_agent_gym.schemas.core.tasks import Task
+from manager_agent_gym.schemas.core.workflow import Workflow
+from manager_agent_gym.schemas.execution.manager import ManagerObservation
+from manager_agent_gym.schemas.execution.state import ExecutionState
+from manager_agent_gym.schemas.preferences.preference import PreferenceWeights
+from manager_agent_gym.schemas.workflow_agents import AgentConfig
+from manager_agent_gym.schemas.workflow_agents.stakeholder import (
+    StakeholderPublicProfile,
+)
+
+
+class _IdleAgent(AgentInterface[AgentConfig]):
+    async def execute_task(self, task: Task, resources: list[Resource]):
+        raise NotImplementedError
+
+
+def load_scenario(name: str | None) -> tuple[str, Workflow]:
+    """Named scenario, or the one with the most tasks, with its whole team."""
+    if name is None:
+        sizes: dict[str, int] = {}
+        for scenario, spec in SCENARIOS.items():
+            workflow = spec.create_workflow()
+            sizes[scenario] = len(workflow._index.tasks(workflow))
+        chosen = max(sizes, key=sizes.__getitem__)
+    else:
+        chosen = name
+    spec = SCENARIOS[chosen]
+    workflow = spec.create_workflow()
+    for joins in spec.create_team_timeline().values():
+        for entry in joins:
+            config = entry[1] if isinstance(entry, tuple) else entry
+            if isinstance(config, AgentConfig) and config.agent_id not in (
+                workflow.agents
+            ):
+                workflow.add_agent(_IdleAgent(config))
+    return chosen, workflow
+
+
+async def seed_messages(workflow: Workflow, count: int) -> CommunicationService:
+    service = CommunicationService()
+    agent_ids = list(workflow.agents) or ["agent"]
+    for i in range(count):
+        sender = agent_ids[i % len(agent_ids)]
+        receiver = agent_ids[(i + 1) % len(agent_ids)]
+        await service.send_direct_message(sender, receiver, f"status update {i}")
+    return service
+
+
+async def time_manager(
+    manager: ManagerAgent,
+    workflow: Workflow,
+    service: CommunicationService,
+    iterations: int,
+) -> dict:
+    profile = StakeholderPublicProfile(
+        display_name="Stakeholder", role="Owner", preference_summary=""
+    )
+    tasks = list(workflow.tasks.values())
+    fields = manager.observation_fields
+    lazy_us: list[float] = []
+    eager_us: list[float] = []
+    for i in range(iterations):
+        for samples, eager in ((lazy_us, False), (eager_us, True)):
+            touched = tasks[(2 * i + eager) % len(tasks)]
+            touched.status = touched.status
+            start = time.perf_counter()
+            observation = await manager.create_observation(
+                workflow=workflow,
+                execution_state=ExecutionState.RUNNING,
+                stakeholder_profile=profile,
+                current_timestep=2 * i + eager,
+                running_tasks={},
+                completed_task_ids=set(),
+                failed_task_ids=set(),
+                communication_service=service,
+            )
+            if eager:
+                observation.materialize()
+            else:
+                for name in fields or ManagerObservation.model_fields:
+                    getattr(observation, name)
+            samples.append((time.perf_counter() - start) * 1e6)
+    return {
+        "observation_fields": sorted(fields) if fields is not None else "all",
+        "mean_build_us": round(statistics.fmean(lazy_us), 1),
+        "mean_eager_build_us": round(statistics.fmean(eager_us), 1),
+    }
+
+
+async def run(scenario: str | None, iterations: int, messages: int) -> dict:
+    name, workflow = load_scenario(scenario)
+    service = await seed_messages(workflow, messages)
+    preferences = PreferenceWeights(preferences=[])
+    managers: dict[str, ManagerAgent] = {
+        "random": RandomManagerAgent(preferences),
+        "one_shot": OneShotDelegateManagerAgent(preferences),
+        "chain_of_thought": ChainOfThoughtManagerAgent(preferences),
+    }
+    return {
+        "scenario": name,
+        "tasks": len(workflow._index.tasks(workflow)),
+        "agents": len(workflow.agents),
+        "messages": messages,
+        "iterations": iterations,
+        "managers": {
+            label: await time_manager(manager, workflow, service, iterations)
+            for label, manager in managers.items()
+        },
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=(__doc__ or "").splitlines()[1])
+    parser.add_argument("--scenario", default=None, choices=sorted(SCENARIOS))
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--messages", type=int, default=500)
+    args = parser.parse_args()
+    results = asyncio.run(run(args.scenario, args.iterations, args.messages))
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+"""
+Run the benchmark suite and write machine-readable results for comparison.
+
+Runs every benchmark module at a fixed size (``--quick`` for a CI-sized pass)
+and writes one JSON document with the commit, interpreter and platform next to
+the results. With ``--baseline`` each timing is compared to the same metric in
+a previous results file: durations (``*_us``, ``*_ms``, ``*_seconds``) that grew
+or rates (``*_per_sec``) that fell by more than ``--threshold`` are reported as
+regressions.
+
+Usage:
+    python -m benchmarks.run_suite --output results.json
+    python -m benchmarks.run_suite --quick --baseline main.json --fail-on-regression
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import subprocess
+import sys
+from collections.abc import Callable
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from benchmarks import (
+    communication_graph,
+    engine_throughput,
+    manager_observation,
+    snapshot_restore,
+    task_completion,
+    workflow_ops,
+)
+from benchmarks.synthetic import SyntheticWorkflowSpec
+
+LOWER_IS_BETTER = ("_us", "_ms", "_seconds")
+HIGHER_IS_BETTER = ("_per_sec",)
+
+
+def _suite(quick: bool) -> dict[str, Callable[[], Any]]:
+    spec = (
+        SyntheticWorkflowSpec(width=10, depth=5, resources=20, messages=100)
+        if quick
+        else SyntheticWorkflowSpec(width=50, depth=20, resources=500, messages=2000)
+    )
+    deep = (
+        SyntheticWorkflowSpec(width=5, depth=50, resources=0, messages=0)
+        if quick
+        else SyntheticWorkflowSpec(width=10, depth=1000, resources=0, messages=0)
+    )
+    restore = (
+        SyntheticWorkflowSpec(width=5, resources=50, messages=100)
+        if quick
+        else SyntheticWorkflowSpec(width=10, resources=1000, messages=500)
+    )
+    n = 10 if quick else 50
+    return {
+        "communication_graph": lambda: communication_graph.run(
+            messages=5_000 if quick else 100_000, agents=50, repeats=n, seed=0
+        ),
+        "task_completion": lambda: asyncio.run(
+            task_completion.run(
+                phases=4 if quick else 10,
+                streams=4 if quick else 10,
+                chain=10 if quick else 50,
+                timesteps=n,
+            )
+        ),
+        "manager_observation": lambda: asyncio.run(
+            manager_observation.run(None, iterations=n, messages=100 if quick else 500)
+        ),
+        "workflow_ops": lambda: asyncio.run(workflow_ops.run(spec, iterations=n)),
+        "engine_throughput": lambda: asyncio.run(
+            engine_throughput.run(spec, timesteps=spec.depth * 3)
+        ),
+        "engine_throughput_long_horizon": lambda: asyncio.run(
+            engine_throughput.run(deep, timesteps=deep.depth * 3)
+        ),
+        "snapshot_restore": lambda: asyncio.run(
+            snapshot_restore.run(restore, timestep=20 if quick else 100)
+        ),
+    }
+
+
+def _git_commit() -> dict[str, Any]:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+        dirty = bool(
+            subprocess.run(
+                ["git", "status", "--porcelain", "--untracked-files=no"],
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout.strip()
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return {"commit": None, "dirty": None}
+    return {"commit": commit, "dirty": dirty}
+
+
+def flatten(value: Any, prefix: str = "") -> dict[str, float]:
+    """Numeric leaves of a results document keyed by dotted path."""
+    flat: dict[str, float] = {}
+    if isinstance(value, dict):
+        for key, item in value.items():
+            flat.update(flatten(item, f"{prefix}.{key}" if prefix else str(key)))
+    elif isinstance(value, (int, float)) and not isinstance(value, bool):
+        flat[prefix] = float(value)
+    return flat
+
+
+def compare(
+    current: dict[str, Any], baseline: dict[str, Any], threshold: float
+) -> dict[str, Any]:
+    """Per-metric ratios (current / baseline) and the metrics that regressed."""
+    now = flatten(current["results"])
+    before = flatten(baseline["results"])
+    ratios: dict[str, float] = {}
+    regressions: list[str] = []
+    for key, value in sorted(now.items()):
+        lower = key.endswith(LOWER_IS_BETTER)
+        higher = key.endswith(HIGHER_IS_BETTER)
+        old = before.get(key)
+        if not (lower or higher) or not old or not value:
+            continue
+        ratio = value / old
+        ratios[key] = round(ratio, 3)
+        if (lower and ratio > 1 + threshold) or (higher and ratio < 1 - threshold):
+            regressions.append(key)
+    return {
+        "baseline_commit": baseline.get("commit"),
+        "threshold": threshold,
+        "ratios": ratios,
+        "regressions": regressions,
+    }
+
+
+def run(quick: bool, only: list[str] | None = None) -> dict[str, Any]:
+    suite = _suite(quick)
+    unknown = set(only or ()) - set(suite)
+    if unknown:
+        raise ValueError(f"Unknown benchmarks: {sorted(unknown)}")
+    results: dict[str, Any] = {}
+    for name, benchmark in suite.items():
+        if only and name not in only:
+            continue
+        print(f"running {name}...", file=sys.stderr)
+        results[name] = benchmark()
+    return {
+        **_git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "quick": quick,
+        "results": results,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=(__doc__ or "").splitlines()[1])
+    parser.add_argument("--quick", action="store_true", help="CI-sized inputs")
+    parser.add_argument(
+        "--only", default=None, help="Comma-separated benchmark names to run"
+    )
+    parser.add_argument("--output", type=Path, default=None)
+    parser.add_argument("--baseline", type=Path, default=None)
+    parser.add_argument("--threshold", type=float, default=0.2)
+    parser.add_argument("--fail-on-regression", action="store_true")
+    args = parser.parse_args()
+
+    document = run(args.quick, args.only.split(",") if args.only else None)
+    if args.baseline is not None:
+        document["comparison"] = compare(
+            document, json.loads(args.baseline.read_text()), args.threshold
+        )
+    text = json.dumps(document, indent=2)
+    if args.output is not None:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(text)
+    print(text)
+    if args.fail_on_regression and document.get("comparison", {}).get("regressions"):
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,201 @@
+"""
+Restore time for a late timestep of a long synthetic run.
+
+Runs the engine with delta snapshots on a workflow from ``benchmarks.synthetic``
+that is deep enough to still be running at ``--timestep``. It then restores that
+timestep into a freshly built copy of the workflow with ``WorkflowStateRestorer``
+in two modes:
+
+- eager: materialize the snapshot from the log and validate every resource and
+  message;
+- lazy: use the log's span index and ``model_construct``; resources and
+  messages are registered as lazy entries and built on first use.
+
+Load, workflow state, communication history and stakeholder preferences are
+timed separately and make up ``total``. ``first_use`` (not in ``total``) then
+times building everything a lazy restore deferred: every resource and the
+message graph. ``--run-dir`` reuses a run written by an earlier invocation
+(with ``--keep-run``).
+
+Usage:
+    python -m benchmarks.snapshot_restore --timestep 200 --width 10 --resources 1000
+"""
+
+import argparse
+import asyncio
+import json
+import shutil
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+from benchmarks.engine_throughput import _ObservingManager
+from benchmarks.synthetic import (
+    SyntheticWorkflowSpec,
+    add_spec_arguments,
+    build_workflow,
+    make_stakeholder,
+    seed_communication,
+    spec_from_args,
+)
+from manager_agent_gym.core.communication.service import CommunicationService
+from manager_agent_gym.core.execution.engine import WorkflowExecutionEngine
+from manager_agent_gym.core.execution.state_restorer import WorkflowStateRestorer
+from manager_agent_gym.core.workflow_agents.registry import AgentRegistry
+from manager_agent_gym.schemas.config import OutputConfig
+
+RUN_ID = "bench"
+
+
+class _MessageObservingManager(_ObservingManager):
+    """Also reads recent messages, which the restorer replays."""
+
+    observation_fields = frozenset({"task_status_counts", "recent_messages"})
+
+
+async def write_run(spec: SyntheticWorkflowSpec, timesteps: int, run_dir: Path) -> None:
+    """Run the engine for ``timesteps`` timesteps, writing outputs to ``run_dir``."""
+    workflow = build_workflow(spec)
+    service = await seed_communication(workflow, spec)
+    stakeholder = make_stakeholder()
+    workflow.add_agent(stakeholder)
+    engine = WorkflowExecutionEngine(
+        workflow=workflow,
+        agent_registry=AgentRegistry(),
+        stakeholder_agent=stakeholder,
+        manager_agent=_MessageObservingManager(),
+        seed=spec.seed,
+        output_config=OutputConfig(
+            base_output_dir=run_dir, run_id=RUN_ID, create_run_subdirectory=False
+        ),
+        max_timesteps=timesteps,
+        communication_service=service,
+        log_preference_evaluation_progress=False,
+    )
+    await engine.run_full_execution()
+
+
+def _restore(spec: SyntheticWorkflowSpec, run_dir: Path, timestep: int, lazy: bool):
+    workflow = build_workflow(spec)
+    service = CommunicationService()
+    stakeholder = make_stakeholder()
+    phases: dict[str, float] = {}
+
+    start = time.perf_counter()
+    restorer = WorkflowStateRestorer(str(run_dir), timestep, lazy=lazy)
+    restorer.load_snapshot_data()
+    phases["load"] = time.perf_counter() - start
+    start = time.perf_counter()
+    restorer.restore_workflow_state(workflow)
+    phases["workflow_state"] = time.perf_counter() - start
+    start = time.perf_counter()
+    restorer.restore_communication_history(service)
+    phases["communication"] = time.perf_counter() - start
+    start = time.perf_counter()
+    restorer.restore_stakeholder_preferences(stakeholder)
+    phases["preferences"] = time.perf_counter() - start
+    phases["total"] = sum(phases.values())
+    start = time.perf_counter()
+    workflow.materialize_resources()
+    messages = service.graph.messages
+    phases["first_use"] = time.perf_counter() - start
+    state = (
+        {str(t.id): t.status.value for t in workflow.tasks.values()},
+        sorted((str(r.id), r.name) for r in workflow.resources.values()),
+        sorted(str(m) for m in messages),
+    )
+    return phases, state
+
+
+def _summarize_ms(samples: list[dict[str, float]]) -> dict[str, dict[str, float]]:
+    return {
+        phase: {
+            "mean_ms": round(statistics.fmean(s[phase] for s in samples) * 1e3, 3),
+            "min_ms": round(min(s[phase] for s in samples) * 1e3, 3),
+        }
+        for phase in samples[0]
+    }
+
+
+async def run(
+    spec: SyntheticWorkflowSpec,
+    timestep: int,
+    repeats: int = 3,
+    run_dir: Path | None = None,
+    keep_run: bool = False,
+) -> dict[str, Any]:
+    # Layers finish about one per timestep; keep the workflow running past the target
+    spec = spec.model_copy(update={"depth": max(spec.depth, timestep + 5)})
+    tmp: str | None = None
+    write_seconds = None
+    if run_dir is None or not run_dir.exists():
+        if run_dir is None:
+            tmp = tempfile.mkdtemp(prefix="restore_bench_")
+            run_dir = Path(tmp) / f"run_{RUN_ID}"
+        start = time.perf_counter()
+        await write_run(spec, timestep + 1, run_dir)
+        write_seconds = round(time.perf_counter() - start, 3)
+    try:
+        log = next((run_dir / "workflow_outputs").glob("workflow_snapshots_*.jsonl"))
+        results: dict[str, Any] = {
+            "spec": spec.model_dump(),
+            "timestep": timestep,
+            "run_dir": str(run_dir),
+            "write_run_seconds": write_seconds,
+            "snapshot_log_bytes": log.stat().st_size,
+            "timestep_file_bytes": (
+                run_dir / "timestep_data" / f"timestep_{timestep:04d}.json"
+            )
+            .stat()
+            .st_size,
+        }
+        states = {}
+        for label, lazy in (("eager", False), ("lazy", True)):
+            samples = []
+            for _ in range(repeats):
+                phases, states[label] = _restore(spec, run_dir, timestep, lazy)
+                samples.append(phases)
+            results[label] = _summarize_ms(samples)
+        results["same_state"] = states["eager"] == states["lazy"]
+        results["speedup"] = round(
+            results["eager"]["total"]["mean_ms"] / results["lazy"]["total"]["mean_ms"],
+            2,
+        )
+        return results
+    finally:
+        if tmp is not None and not keep_run:
+            shutil.rmtree(tmp, ignore_errors=True)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=(__doc__ or "").splitlines()[1])
+    add_spec_arguments(parser)
+    parser.add_argument("--timestep", type=int, default=200)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument(
+        "--run-dir",
+        dest="run_dir",
+        type=Path,
+        default=None,
+        help="Run directory to restore from; written there first if missing",
+    )
+    parser.add_argument(
+        "--keep-run", dest="keep_run", action="store_true", help="Keep the temp run"
+    )
+    args = parser.parse_args()
+    results = asyncio.run(
+        run(
+            spec_from_args(args),
+            args.timestep,
+            args.repeats,
+            args.run_dir,
+            args.keep_run,
+        )
+    )
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,261 @@
+"""
+Parameterized synthetic workflows shared by the benchmarks.
+
+``build_workflow`` lays tasks out in ``depth`` dependency layers of ``width``
+top-level tasks. Each task past the first layer depends on ``fan_in`` tasks of
+the previous layer and carries ``subtask_depth`` levels of ``subtask_width``
+nested subtasks. Leaves are pre-assigned round-robin to zero-latency agents, so
+the engine can run the workflow without a deciding manager. Resources of
+``resource_bytes`` each are attached as outputs of the first ``completed_layers``
+layers, which are marked completed; ``seed_communication`` adds message volume.
+Task and resource IDs are derived from the seed, so rebuilding a spec yields
+the same workflow (e.g. to restore a snapshot of an earlier run into it).
+"""
+
+import argparse
+import random
+import statistics
+import time
+from collections.abc import Callable
+from typing import Any
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+from manager_agent_gym.core.communication.service import CommunicationService
+from manager_agent_gym.core.workflow_agents.interface import AgentInterface
+from manager_agent_gym.core.workflow_agents.stakeholder_agent import StakeholderAgent
+from manager_agent_gym.schemas.core.base import TaskStatus
+from manager_agent_gym.schemas.core.resources import Resource
+from manager_agent_gym.schemas.core.tasks import Task
+from manager_agent_gym.schemas.core.workflow import Workflow
+from manager_agent_gym.schemas.preferences.preference import PreferenceWeights
+from manager_agent_gym.schemas.unified_results import create_task_result
+from manager_agent_gym.schemas.workflow_agents import AgentConfig
+from manager_agent_gym.schemas.workflow_agents.stakeholder import StakeholderConfig
+
+
+class SyntheticWorkflowSpec(BaseModel):
+    """Shape of a synthetic workflow."""
+
+    width: int = Field(default=20, ge=1, description="Top-level tasks per layer")
+    depth: int = Field(default=10, ge=1, description="Dependency layers")
+    fan_in: int = Field(
+        default=2, ge=0, description="Dependencies on the previous layer per task"
+    )
+    subtask_depth: int = Field(default=1, ge=0, description="Levels of nesting")
+    subtask_width: int = Field(default=2, ge=1, description="Children per level")
+    agents: int = Field(default=8, ge=1, description="Zero-latency worker agents")
+    resources: int = Field(default=100, ge=0, description="Output resources")
+    resource_bytes: int = Field(default=2048, ge=0, description="Content per resource")
+    completed_layers: int = Field(
+        default=1, ge=0, description="Leading layers marked completed"
+    )
+    messages: int = Field(default=500, ge=0, description="Seeded direct messages")
+    seed: int = 0
+
+    @property
+    def label(self) -> str:
+        return (
+            f"w{self.width}_d{self.depth}_f{self.fan_in}"
+            f"_s{self.subtask_depth}x{self.subtask_width}"
+        )
+
+
+def add_spec_arguments(parser: argparse.ArgumentParser) -> None:
+    """Command-line flags for every ``SyntheticWorkflowSpec`` field."""
+    for name, field in SyntheticWorkflowSpec.model_fields.items():
+        parser.add_argument(
+            f"--{name.replace('_', '-')}",
+            dest=name,
+            type=int,
+            default=field.default,
+            help=field.description,
+        )
+
+
+def spec_from_args(args: argparse.Namespace) -> SyntheticWorkflowSpec:
+    return SyntheticWorkflowSpec(
+        **{name: getattr(args, name) for name in SyntheticWorkflowSpec.model_fields}
+    )
+
+
+class InstantAgent(AgentInterface[AgentConfig]):
+    """Worker that completes every task immediately without output."""
+
+    def __init__(self, agent_id: str) -> None:
+        super().__init__(
+            AgentConfig(
+                agent_id=agent_id,
+                agent_type="ai",
+                system_prompt="benchmark agent",
+                model_name="none",
+                agent_description="benchmark agent",
+                agent_capabilities=["benchmark agent"],
+            )
+        )
+
+    async def execute_task(self, task: Task, resources: list[Resource]):
+        return create_task_result(
+            task_id=task.id,
+            agent_id=self.agent_id,
+            success=True,
+            execution_time=0.0,
+            resources=[],
+        )
+
+
+def make_stakeholder() -> StakeholderAgent:
+    """Stakeholder with no preferences (never calls an LLM in these benchmarks)."""
+    return StakeholderAgent(
+        config=StakeholderConfig(
+            agent_id="stakeholder",
+            agent_type="stakeholder",
+            system_prompt="Stakeholder",
+            model_name="o3",
+            name="Stakeholder",
+            role="Owner",
+            initial_preferences=PreferenceWeights(preferences=[]),
+            agent_description="Stakeholder",
+            agent_capabilities=["Stakeholder"],
+        )
+    )
+
+
+def _uuid(rng: random.Random) -> UUID:
+    return UUID(int=rng.getrandbits(128), version=4)
+
+
+def _nest(
+    task: Task,
+    levels: int,
+    width: int,
+    agents: list[str],
+    counter: list[int],
+    ids: random.Random,
+):
+    if levels == 0:
+        task.assigned_agent_id = agents[counter[0] % len(agents)]
+        counter[0] += 1
+        return
+    for i in range(width):
+        child = Task(
+            id=_uuid(ids),
+            name=f"{task.name}.{i}",
+            description=f"subtask of {task.name}",
+        )
+        _nest(child, levels - 1, width, agents, counter, ids)
+        task.add_subtask(child)
+
+
+def build_workflow(spec: SyntheticWorkflowSpec) -> Workflow:
+    """Workflow of the given shape with its worker agents registered."""
+    rng = random.Random(spec.seed)
+    ids = random.Random(f"ids-{spec.seed}")
+    workflow = Workflow(
+        id=_uuid(ids),
+        name=f"synthetic-{spec.label}",
+        workflow_goal="benchmark",
+        owner_id=_uuid(ids),
+    )
+    agent_ids = [f"worker_{i}" for i in range(spec.agents)]
+    for agent_id in agent_ids:
+        workflow.add_agent(InstantAgent(agent_id))
+
+    counter = [0]
+    layers: list[list[Task]] = []
+    for d in range(spec.depth):
+        previous = layers[-1] if layers else []
+        layer: list[Task] = []
+        for w in range(spec.width):
+            parents = rng.sample(previous, min(spec.fan_in, len(previous)))
+            task = Task(
+                id=_uuid(ids),
+                name=f"task-{d}-{w}",
+                description=f"Synthetic task {w} of layer {d}",
+                dependency_task_ids=[p.id for p in parents],
+                estimated_duration_hours=1.0,
+                estimated_cost=100.0,
+            )
+            _nest(task, spec.subtask_depth, spec.subtask_width, agent_ids, counter, ids)
+            layer.append(task)
+        layers.append(layer)
+
+    completed = [t for layer in layers[: spec.completed_layers] for t in layer]
+    outputs: dict[int, list[UUID]] = {}
+    for i in range(spec.resources):
+        resource = Resource(
+            id=_uuid(ids),
+            name=f"artifact-{i}",
+            description="synthetic output",
+            content=("lorem ipsum " * (spec.resource_bytes // 12 + 1))[
+                : spec.resource_bytes
+            ],
+            content_type="text/plain",
+        )
+        workflow.add_resource(resource)
+        if completed:
+            outputs.setdefault(i % len(completed), []).append(resource.id)
+    for position, task in enumerate(completed):
+        # Reassigned, not appended in place, so task renderings are invalidated
+        task.output_resource_ids = [
+            *task.output_resource_ids,
+            *outputs.get(position, []),
+        ]
+        _complete(task)
+
+    for layer in layers:
+        for task in layer:
+            workflow.add_task(task)
+    return workflow
+
+
+def _complete(task: Task) -> None:
+    for subtask in task.subtasks:
+        _complete(subtask)
+    task.status = TaskStatus.COMPLETED
+
+
+async def seed_communication(
+    workflow: Workflow, spec: SyntheticWorkflowSpec
+) -> CommunicationService:
+    """Communication service holding ``spec.messages`` direct messages."""
+    service = CommunicationService()
+    agent_ids = list(workflow.agents) or ["agent"]
+    task_ids: list[UUID] = list(workflow.tasks)
+    for i in range(spec.messages):
+        await service.send_direct_message(
+            agent_ids[i % len(agent_ids)],
+            agent_ids[(i + 1) % len(agent_ids)],
+            f"status update {i}",
+            related_task_id=task_ids[i % len(task_ids)] if task_ids else None,
+        )
+    return service
+
+
+def summarize_us(samples: list[float]) -> dict[str, float]:
+    """Mean/median/p95/min of per-call durations (seconds) in microseconds."""
+    ordered = sorted(samples)
+    p95 = ordered[min(len(ordered) - 1, int(0.95 * len(ordered)))]
+    return {
+        "mean_us": round(statistics.fmean(ordered) * 1e6, 2),
+        "median_us": round(statistics.median(ordered) * 1e6, 2),
+        "p95_us": round(p95 * 1e6, 2),
+        "min_us": round(ordered[0] * 1e6, 2),
+    }
+
+
+def time_calls(
+    fn: Callable[[], Any],
+    iterations: int,
+    before: Callable[[int], Any] | None = None,
+) -> dict[str, float]:
+    """Time ``fn`` ``iterations`` times; ``before(i)`` runs untimed first."""
+    samples: list[float] = []
+    for i in range(iterations):
+        if before is not None:
+            before(i)
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return summarize_us(samples)
@@ -0,0 +1,196 @@
+"""
+Microbenchmarks of per-timestep workflow operations on synthetic workflows.
+
+Times the operations the engine repeats every timestep on a workflow built by
+``benchmarks.synthetic``: ready-task scheduling (after a structural change,
+after one completion, and unchanged), task graph validation, pretty printing
+(re-rendered after a change and memoized), manager observation building,
+snapshot serialization (full dump and delta-log append), and timestep
+evaluation with code-only rubrics (with and without the rubric memo).
+
+Usage:
+    python -m benchmarks.workflow_ops --width 50 --depth 20 --iterations 50
+"""
+
+import argparse
+import asyncio
+import json
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+from benchmarks.synthetic import (
+    SyntheticWorkflowSpec,
+    add_spec_arguments,
+    build_workflow,
+    seed_communication,
+    spec_from_args,
+    summarize_us,
+    time_calls,
+)
+from examples.end_to_end_examples.standard_rules import cost_rubric, speed_rubric
+from manager_agent_gym.core.evaluation.common_evaluators import (
+    build_default_evaluators,
+)
+from manager_agent_gym.core.evaluation.validation_engine import ValidationEngine
+from manager_agent_gym.core.execution.snapshot_store import SnapshotLogWriter
+from manager_agent_gym.core.manager_agent import ChainOfThoughtManagerAgent
+from manager_agent_gym.schemas.core.base import TaskStatus
+from manager_agent_gym.schemas.core.workflow import Workflow
+from manager_agent_gym.schemas.execution.state import ExecutionState
+from manager_agent_gym.schemas.preferences.evaluator import Evaluator
+from manager_agent_gym.schemas.preferences.preference import PreferenceWeights
+from manager_agent_gym.schemas.preferences.rubric import RunCondition, WorkflowRubric
+from manager_agent_gym.schemas.workflow_agents.stakeholder import (
+    StakeholderPublicProfile,
+)
+
+
+def _touch(workflow: Workflow) -> None:
+    """Record a no-op write so caches keyed on the workflow version miss."""
+    task = next(iter(workflow.tasks.values()))
+    task.status = task.status
+
+
+def _complete_one_ready(workflow: Workflow) -> None:
+    ready = workflow.get_ready_tasks()
+    if ready:
+        ready[0].status = TaskStatus.COMPLETED
+
+
+def code_only_evaluator() -> Evaluator:
+    """Function rubrics of the default evaluators, run every timestep."""
+    rubrics = [
+        r.model_copy(update={"run_condition": RunCondition.EACH_TIMESTEP})
+        for evaluator in build_default_evaluators(None)
+        for r in evaluator.rubrics
+        if r.evaluator_function is not None
+    ]
+    rubrics += [
+        WorkflowRubric(name="speed", evaluator_function=speed_rubric, max_score=1.0),
+        WorkflowRubric(name="cost", evaluator_function=cost_rubric, max_score=1.0),
+    ]
+    return Evaluator(name="code_only", rubrics=rubrics)
+
+
+def snapshot_of(workflow: Workflow, timestep: int) -> dict[str, Any]:
+    """The workflow part of a timestep snapshot, as the output writer builds it."""
+    return {
+        **workflow.model_dump(mode="json", exclude={"agents", "success_criteria"}),
+        "timestep": timestep,
+    }
+
+
+async def run(spec: SyntheticWorkflowSpec, iterations: int) -> dict:
+    workflow = build_workflow(spec)
+    service = await seed_communication(workflow, spec)
+    leaves = sum(
+        1 for t in workflow._index.tasks(workflow).values() if t.is_atomic_task()
+    )
+    results: dict[str, Any] = {
+        "spec": spec.model_dump(),
+        "tasks": len(workflow._index.tasks(workflow)),
+        "leaf_tasks": leaves,
+        "iterations": iterations,
+    }
+
+    scheduler = workflow._scheduler
+    results["get_ready_tasks"] = {
+        "rebuild": time_calls(
+            workflow.get_ready_tasks, iterations, lambda i: scheduler.invalidate()
+        ),
+        "after_completion": time_calls(
+            workflow.get_ready_tasks,
+            iterations,
+            lambda i: _complete_one_ready(workflow),
+        ),
+        "unchanged": time_calls(workflow.get_ready_tasks, iterations),
+    }
+    results["validate_task_graph"] = time_calls(
+        workflow.validate_task_graph, iterations
+    )
+    results["pretty_print"] = {
+        "after_change": time_calls(
+            workflow.pretty_print, iterations, lambda i: _touch(workflow)
+        ),
+        "memoized": time_calls(workflow.pretty_print, iterations),
+    }
+
+    manager = ChainOfThoughtManagerAgent(PreferenceWeights(preferences=[]))
+    profile = StakeholderPublicProfile(
+        display_name="Stakeholder", role="Owner", preference_summary=""
+    )
+    samples: list[float] = []
+    for i in range(iterations):
+        _touch(workflow)
+        start = time.perf_counter()
+        observation = await manager.create_observation(
+            workflow=workflow,
+            execution_state=ExecutionState.RUNNING,
+            stakeholder_profile=profile,
+            current_timestep=i,
+            running_tasks={},
+            completed_task_ids=set(),
+            failed_task_ids=set(),
+            communication_service=service,
+        )
+        observation.materialize()
+        samples.append(time.perf_counter() - start)
+    results["create_observation"] = summarize_us(samples)
+
+    payload = json.dumps(snapshot_of(workflow, 0))
+    with tempfile.TemporaryDirectory() as tmp:
+        log = SnapshotLogWriter(Path(tmp) / "snapshots.jsonl")
+        # First write is a keyframe; the timed writes are deltas
+        log.write(0, snapshot_of(workflow, 0))
+        delta_samples: list[float] = []
+        for i in range(1, iterations + 1):
+            _complete_one_ready(workflow)
+            start = time.perf_counter()
+            log.write(i, snapshot_of(workflow, i))
+            delta_samples.append(time.perf_counter() - start)
+        log_bytes = log.path.stat().st_size
+    results["snapshot"] = {
+        "full_json_bytes": len(payload),
+        "full_dump": time_calls(
+            lambda: json.dumps(snapshot_of(workflow, 0)), iterations
+        ),
+        "delta_log_append": summarize_us(delta_samples),
+        "delta_log_bytes": log_bytes,
+    }
+
+    evaluator = code_only_evaluator()
+    evaluation: dict[str, Any] = {"rubrics": len(evaluator.rubrics)}
+    for label, memoize in (("memoized", True), ("unmemoized", False)):
+        engine = ValidationEngine(seed=0, memoize_rubrics=memoize)
+        samples = []
+        for i in range(iterations):
+            if i % 2:
+                _touch(workflow)
+            start = time.perf_counter()
+            await engine.evaluate_timestep(
+                workflow=workflow,
+                timestep=i,
+                cadence=RunCondition.EACH_TIMESTEP,
+                communications=None,
+                manager_actions=None,
+                workflow_evaluators=[evaluator],
+            )
+            samples.append(time.perf_counter() - start)
+        evaluation[label] = summarize_us(samples)
+    results["evaluate_timestep"] = evaluation
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=(__doc__ or "").splitlines()[1])
+    add_spec_arguments(parser)
+    parser.add_argument("--iterations", type=int, default=50)
+    args = parser.parse_args()
+    results = asyncio.run(run(spec_from_args(args), args.iterations))
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -32,6 +32,7 @@ configure_library_logging(logging.INFO)
 import asyncio
 from datetime import datetime
 import argparse
+import functools
 from manager_agent_gym.core.execution.engine import WorkflowExecutionEngine
 from manager_agent_gym.core.manager_agent.factory import create_manager
 from manager_agent_gym.core.workflow_agents.registry import AgentRegistry
@@ -46,6 +47,25 @@ from examples.common_stakeholders import create_stakeholder_agent
 from manager_agent_gym.core.evaluation.common_evaluators import build_default_evaluators
 from manager_agent_gym.schemas.workflow_agents import AgentConfig
 from manager_agent_gym.schemas.preferences.rubric import RunCondition
+from manager_agent_gym.schemas.config import OutputConfig
+from manager_agent_gym.batch import BatchRunSpec, BatchRunner, expand_grid
+from manager_agent_gym.core.common.content_store import dedup_report
+from manager_agent_gym.core.common.llm_cache import LLMCacheMode, LLMResponseCache
+from manager_agent_gym.core.common.llm_interface import (
+    close_llm_clients,
+    configure_llm_cache,
+    configure_llm_simulator,
+    get_llm_cache,
+    get_llm_simulator,
+)
+from manager_agent_gym.core.common.llm_simulator import SimulatedLLM
+from manager_agent_gym.core.common.profiling import PhaseProfiler
+from manager_agent_gym.core.common.rate_limiter import (
+    LLMRateLimiter,
+    RateBudget,
+    configure_rate_limiter,
+    get_rate_limiter,
+)
 
 from examples.scenarios import SCENARIOS
 
@@ -74,7 +94,7 @@ def create_evaluator_to_measure_goal_achievement(name: str) -> Evaluator:
     if not SCENARIOS[name].create_evaluator_to_measure_goal_achievement:
         raise ValueError(f"No evaluator to measure goal achievement for {name}")
 
-    return SCENARIOS[name].create_evaluator_to_measure_goal_achievement() #type: ignore
+    return SCENARIOS[name].create_evaluator_to_measure_goal_achievement()  # type: ignore
 
 
 async def run_demo(
@@ -88,6 +108,10 @@ async def run_demo(
     restore_from_snapshot: str | None = None,
     restore_timestep: int | None = None,
     rerun_suffix: str = "_rerun",
+    run_suffix: str | None = None,
+    output_config: OutputConfig | None = None,
+    profile: bool = False,
+    resource_spill_threshold_bytes: int | None = None,
 ):
     """Run a workflow end-to-end with shared config."""
 
@@ -148,14 +172,15 @@ async def run_demo(
             rerun_base_output_dir = f"./simulation_outputs{rerun_suffix}"
         print(f"🔄 Re-evaluation mode: Saving results to {rerun_base_output_dir}")
 
-    import os  # Ensure os is available in local scope
-
-    output_config = settings.build_labeled_output_config(
-        label=label,
-        base_output_dir=rerun_base_output_dir,
-        run_suffix=os.environ.get("MAG_RUN_SUFFIX"),
-        label_as_subdir=True,
-    )
+    if output_config is None:
+        output_config = settings.build_labeled_output_config(
+            label=label,
+            base_output_dir=rerun_base_output_dir,
+            run_suffix=run_suffix or os.environ.get("MAG_RUN_SUFFIX"),
+            label_as_subdir=True,
+        )
+    if resource_spill_threshold_bytes is not None:
+        output_config.resource_spill_threshold_bytes = resource_spill_threshold_bytes
 
     # 9. Make a stakeholder agent
     stakeholder = create_stakeholder_agent(persona="balanced", preferences=preferences)
@@ -197,6 +222,7 @@ async def run_demo(
         timestep_end_callbacks=default_timestep_callbacks(),
         evaluations=default_evaluators,
         seed=seed,
+        profiler=PhaseProfiler(enabled=profile),
     )
     print("   ✅ Engine configured")
 
@@ -212,8 +238,6 @@ async def run_demo(
 
     # Check if we should restore from existing snapshot
     if restore_from_snapshot is not None:
-        import os
-
         if os.path.exists(restore_from_snapshot):
             print(f"\n🔄 RESTORING FROM SNAPSHOT: {restore_from_snapshot}")
             print("=" * 60)
@@ -306,10 +330,54 @@ async def run_demo(
     # Or compute via the engine using its configured categories
     # Performance files are written by engine on completion
 
+    llm_cache = get_llm_cache()
+    if llm_cache is not None:
+        print(f"   LLM cache: {llm_cache.stats()}")
+    rate_limiter = get_rate_limiter()
+    if rate_limiter is not None:
+        print(f"   LLM rate limiter: {rate_limiter.stats()}")
+    llm_simulator = get_llm_simulator()
+    if llm_simulator is not None:
+        print(f"   Simulated LLM: {llm_simulator.stats()}")
+    if engine.content_store is not None:
+        print(f"   Resource store (this run): {engine.content_store.stats()}")
+        print(
+            f"   Resource store (all runs): {dedup_report(engine.content_store.root)}"
+        )
+
     print(f"\n✅ {workflow_name.upper()} DEMO COMPLETE")
     return engine, results
 
 
+async def run_batch_entry(
+    spec: BatchRunSpec,
+    output_config: OutputConfig,
+    *,
+    max_timesteps: int | None = None,
+    model_name: str = "o3",
+) -> dict[str, float]:
+    """Batch runner entry point: run one (scenario, seed, mode) and report rewards.
+
+    Sweep-wide options are bound with ``functools.partial`` so they travel to
+    the worker processes with the pickled entry point.
+    """
+    engine, results = await run_demo(
+        workflow_name=spec.scenario,
+        manager_agent_mode=spec.manager_mode,
+        seed=spec.seed,
+        max_timesteps=max_timesteps,
+        model_name=model_name,
+        output_config=output_config,
+    )
+    final_eval = engine.validation_engine.evaluation_results[-1]
+    metrics = {
+        f"reward/{name}": ps.score * ps.weight
+        for name, ps in final_eval.preference_scores.items()
+    }
+    metrics["timesteps"] = float(len(results))
+    return metrics
+
+
 if __name__ == "__main__":
     # Silence noisy debug logs
     logging.getLogger("litellm").setLevel(logging.CRITICAL)
@@ -349,16 +417,126 @@ if __name__ == "__main__":
         default=1,
         help="Number of random seeds to run sequentially (seed, seed+1, ...).",
     )
+    parser.add_argument(
+        "--batch-workers",
+        dest="batch_workers",
+        type=int,
+        default=0,
+        help=(
+            "Run seeds (and manager modes, comma-separated) in parallel worker "
+            "processes; --workflow_name all sweeps every scenario."
+        ),
+    )
+    parser.add_argument(
+        "--llm-concurrency",
+        dest="llm_concurrency",
+        type=int,
+        default=None,
+        help="Global cap on in-flight LLM calls across batch workers.",
+    )
+    parser.add_argument(
+        "--llm-cache",
+        dest="llm_cache",
+        default=None,
+        help="SQLite file caching structured LLM responses across runs.",
+    )
+    parser.add_argument(
+        "--llm-cache-replay",
+        dest="llm_cache_replay",
+        action="store_true",
+        help="Serve LLM responses only from --llm-cache (misses fail; no API calls).",
+    )
+    parser.add_argument(
+        "--llm-rpm",
+        dest="llm_rpm",
+        type=float,
+        default=None,
+        help="Requests-per-minute budget per model (shared across batch workers).",
+    )
+    parser.add_argument(
+        "--llm-tpm",
+        dest="llm_tpm",
+        type=float,
+        default=None,
+        help="Tokens-per-minute budget per model (shared across batch workers).",
+    )
+    parser.add_argument(
+        "--simulate-llm",
+        dest="simulate_llm",
+        action="store_true",
+        help="Answer every LLM call from the offline, seeded simulator (no API calls).",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Record per-phase timings in each timestep result and a Chrome trace.",
+    )
+    parser.add_argument(
+        "--resource-store-threshold",
+        dest="resource_store_threshold",
+        type=int,
+        default=None,
+        help=(
+            "Store resource content of at least this many bytes once, by hash, in "
+            "a content store shared by the runs (0 stores all content)."
+        ),
+    )
     args = parser.parse_args()
+    llm_rate_budget = (
+        RateBudget(requests_per_minute=args.llm_rpm, tokens_per_minute=args.llm_tpm)
+        if args.llm_rpm or args.llm_tpm
+        else None
+    )
+    llm_cache_mode: LLMCacheMode = "replay" if args.llm_cache_replay else "read_write"
+
+    if args.batch_workers > 0:
+        scenarios = (
+            list(SCENARIOS) if args.workflow_name == "all" else [args.workflow_name]
+        )
+        modes = (
+            args.manager_agent_mode.split(",") if args.manager_agent_mode else [None]
+        )
+        runner = BatchRunner(
+            functools.partial(
+                run_batch_entry,
+                max_timesteps=args.max_timesteps,
+                model_name=args.model_name,
+            ),
+            base_output_dir=args.output_dir or settings.default_output_dir,
+            max_workers=args.batch_workers,
+            llm_concurrency=args.llm_concurrency,
+            llm_cache_path=args.llm_cache,
+            llm_cache_mode=llm_cache_mode,
+            llm_rate_budget=llm_rate_budget,
+            simulate_llm=args.simulate_llm,
+            resource_spill_threshold_bytes=args.resource_store_threshold,
+        )
+        batch_results = runner.run(
+            expand_grid(
+                scenarios,
+                seeds=range(args.seed, args.seed + max(1, args.num_seeds)),
+                manager_modes=modes,
+            )
+        )
+        failed = [r for r in batch_results if r.status == "failed"]
+        print(
+            f"\n✅ Batch complete: {len(batch_results) - len(failed)} succeeded, "
+            f"{len(failed)} failed (results in {runner.base_output_dir / 'batch_results.csv'})"
+        )
+        raise SystemExit(1 if failed else 0)
+
+    if args.llm_cache:
+        configure_llm_cache(LLMResponseCache(args.llm_cache, mode=llm_cache_mode))
+    if args.simulate_llm:
+        configure_llm_simulator(SimulatedLLM(seed=args.seed))
+    if llm_rate_budget is not None:
+        configure_rate_limiter(LLMRateLimiter(default_budget=llm_rate_budget))
 
     async def _run_multi_seed() -> None:
         base_seed = int(args.seed)
         num_seeds = max(1, int(args.num_seeds))
         for i in range(num_seeds):
             current_seed = base_seed + i
-            # Encode seed in run_id via environment so outputs land under
-            # <output_dir>/<workflow_name>/run_seed_<n>/...
-            os.environ["MAG_RUN_SUFFIX"] = f"seed_{current_seed}"
             print(f"\n==== Running seed {current_seed} ====")
             await run_demo(
                 offline_run_dir=args.offline_run_dir,
@@ -371,6 +549,11 @@ if __name__ == "__main__":
                 restore_from_snapshot=args.restore_from_snapshot,
                 restore_timestep=args.restore_timestep,
                 rerun_suffix=args.rerun_suffix,
+                # Outputs land under <output_dir>/<workflow_name>/run_seed_<n>/...
+                run_suffix=f"seed_{current_seed}",
+                profile=args.profile,
+                resource_spill_threshold_bytes=args.resource_store_threshold,
             )
+        await close_llm_clients()
 
     asyncio.run(_run_multi_seed())
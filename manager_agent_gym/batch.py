@@ -0,0 +1,459 @@
+"""
+Parallel batch runner for (scenario x seed x manager mode) sweeps.
+
+Runs are fanned out across a process pool; each worker process executes a chunk
+of runs concurrently on one asyncio loop. Every run gets its own ``OutputConfig``
+(``<base>/<scenario>/<mode>/run_seed_<n>/``) so no process-global state such as
+environment variables is needed to separate outputs.
+
+Each finished run writes a ``batch_result.json`` marker into its run directory.
+With ``resume=True`` successful runs are loaded from their markers and only
+missing or failed runs execute again. Results are aggregated into
+``batch_results.csv`` / ``batch_results.json`` under the base output directory.
+
+With ``resource_spill_threshold_bytes`` set, every run spills resource content
+to one content store at ``<base>/resource_blobs`` so artifacts repeated across
+seeds and scenarios are stored once; cross-run deduplication statistics are
+written to ``resource_store_stats.json``.
+
+Example:
+    ```python
+    async def run_one(spec: BatchRunSpec, output_config: OutputConfig) -> dict[str, float]:
+        ...  # build workflow/engine for spec.scenario, run, return metrics
+
+    runner = BatchRunner(run_one, base_output_dir="./sweeps/nightly", max_workers=8)
+    results = runner.run(expand_grid(["icaap"], seeds=range(5), manager_modes=["cot"]))
+    ```
+
+``run_fn`` must be a module-level async function (or a ``functools.partial`` of
+one) so it can be pickled into the worker processes.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import csv
+import json
+import multiprocessing
+import os
+import time
+import traceback
+from collections.abc import Awaitable, Callable, Iterable, Sequence
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Literal
+
+from pydantic import BaseModel, Field
+
+from .core.common.content_store import dedup_report
+from .core.common.llm_cache import LLMCacheMode, LLMResponseCache
+from .core.common.llm_interface import (
+    close_llm_clients,
+    configure_llm_cache,
+    configure_llm_concurrency,
+    configure_llm_simulator,
+)
+from .core.common.llm_simulator import SimulatedLLM
+from .core.common.logging import logger
+from .core.common.rate_limiter import (
+    LLMRateLimiter,
+    RateBudget,
+    configure_rate_limiter,
+)
+from .schemas.config import OutputConfig
+
+RESULT_MARKER_FILENAME = "batch_result.json"
+RESOURCE_BLOB_DIRNAME = "resource_blobs"
+
+BatchRunFn = Callable[["BatchRunSpec", OutputConfig], Awaitable[dict[str, float]]]
+
+
+class BatchRunSpec(BaseModel):
+    """One point of a batch sweep."""
+
+    scenario: str = Field(..., description="Scenario (workflow) name")
+    seed: int = Field(..., description="Global run seed")
+    manager_mode: str | None = Field(
+        default=None, description="Manager mode passed to the run function"
+    )
+
+    @property
+    def run_key(self) -> str:
+        return f"{self.scenario}/{self.manager_mode or 'default'}/seed_{self.seed}"
+
+    def build_output_config(
+        self,
+        base_output_dir: Path,
+        resource_spill_threshold_bytes: int | None = None,
+    ) -> OutputConfig:
+        """Isolated output directories for this run (the content store is shared)."""
+        return OutputConfig(
+            base_output_dir=base_output_dir
+            / self.scenario
+            / (self.manager_mode or "default"),
+            run_id=f"seed_{self.seed}",
+            create_run_subdirectory=True,
+            resource_blob_dir=base_output_dir / RESOURCE_BLOB_DIRNAME,
+            resource_spill_threshold_bytes=resource_spill_threshold_bytes,
+        )
+
+
+class BatchRunResult(BaseModel):
+    """Outcome of one batch run; one row of the aggregated results table."""
+
+    spec: BatchRunSpec
+    status: Literal["succeeded", "failed"]
+    output_dir: str
+    duration_seconds: float = 0.0
+    metrics: dict[str, float] = Field(default_factory=dict)
+    error: str | None = None
+    resumed: bool = Field(
+        default=False, description="Loaded from a previous batch invocation"
+    )
+
+
+def expand_grid(
+    scenarios: Iterable[str],
+    seeds: Iterable[int],
+    manager_modes: Iterable[str | None] = (None,),
+) -> list[BatchRunSpec]:
+    """Cartesian product of scenarios, seeds and manager modes."""
+    seed_list = list(seeds)
+    mode_list = list(manager_modes)
+    return [
+        BatchRunSpec(scenario=scenario, seed=seed, manager_mode=mode)
+        for scenario in scenarios
+        for mode in mode_list
+        for seed in seed_list
+    ]
+
+
+def _run_dir(output_config: OutputConfig) -> Path:
+    return output_config.base_output_dir / f"run_{output_config.run_id}"
+
+
+def _load_marker(run_dir: Path) -> BatchRunResult | None:
+    marker = run_dir / RESULT_MARKER_FILENAME
+    if not marker.exists():
+        return None
+    try:
+        return BatchRunResult.model_validate_json(marker.read_text())
+    except Exception:
+        logger.warning("Ignoring unreadable batch marker %s", marker, exc_info=True)
+        return None
+
+
+def _write_marker(run_dir: Path, result: BatchRunResult) -> None:
+    run_dir.mkdir(parents=True, exist_ok=True)
+    tmp = run_dir / f"{RESULT_MARKER_FILENAME}.tmp"
+    tmp.write_text(result.model_dump_json(indent=2))
+    os.replace(tmp, run_dir / RESULT_MARKER_FILENAME)
+
+
+async def _execute_run(
+    run_fn: BatchRunFn,
+    spec: BatchRunSpec,
+    base_output_dir: Path,
+    resource_spill_threshold_bytes: int | None = None,
+) -> BatchRunResult:
+    output_config = spec.build_output_config(
+        base_output_dir, resource_spill_threshold_bytes
+    )
+    run_dir = _run_dir(output_config)
+    start = time.perf_counter()
+    try:
+        metrics = await run_fn(spec, output_config)
+        result = BatchRunResult(
+            spec=spec,
+            status="succeeded",
+            output_dir=str(run_dir),
+            duration_seconds=time.perf_counter() - start,
+            metrics={k: float(v) for k, v in (metrics or {}).items()},
+        )
+    except Exception:
+        logger.error("Batch run %s failed", spec.run_key, exc_info=True)
+        result = BatchRunResult(
+            spec=spec,
+            status="failed",
+            output_dir=str(run_dir),
+            duration_seconds=time.perf_counter() - start,
+            error=traceback.format_exc(limit=5),
+        )
+    _write_marker(run_dir, result)
+    return result
+
+
+def _init_worker(
+    llm_concurrency: int | None,
+    llm_cache_path: Path | None,
+    llm_cache_mode: LLMCacheMode,
+    llm_rate_budget: RateBudget | None,
+    simulate_llm: bool,
+) -> None:
+    configure_llm_concurrency(llm_concurrency)
+    if simulate_llm:
+        configure_llm_simulator(SimulatedLLM())
+    if llm_rate_budget is not None:
+        configure_rate_limiter(LLMRateLimiter(default_budget=llm_rate_budget))
+    if llm_cache_path is not None:
+        configure_llm_cache(LLMResponseCache(llm_cache_path, mode=llm_cache_mode))
+
+
+def _run_chunk(
+    run_fn: BatchRunFn,
+    specs: list[BatchRunSpec],
+    base_output_dir: Path,
+    resource_spill_threshold_bytes: int | None = None,
+) -> list[BatchRunResult]:
+    """Worker entry point: run a chunk of specs concurrently on one event loop."""
+
+    async def _gather() -> list[BatchRunResult]:
+        try:
+            return list(
+                await asyncio.gather(
+                    *(
+                        _execute_run(
+                            run_fn,
+                            spec,
+                            base_output_dir,
+                            resource_spill_threshold_bytes,
+                        )
+                        for spec in specs
+                    )
+                )
+            )
+        finally:
+            await close_llm_clients()
+
+    return asyncio.run(_gather())
+
+
+class BatchRunner:
+    """Fan out batch runs across a process pool with a shared LLM budget.
+
+    Args:
+        run_fn (BatchRunFn): Module-level async function executing one run and
+            returning scalar metrics for the results table.
+        base_output_dir (str | Path): Root directory for all run outputs and the
+            aggregated results table.
+        max_workers (int): Maximum number of worker processes. Fewer are started
+            when there are fewer chunks of runs, or when ``llm_concurrency`` is
+            lower.
+        runs_per_worker (int): Runs executed concurrently inside each worker
+            process (asyncio).
+        llm_concurrency (int | None): Global cap on in-flight LLM calls across the
+            whole batch. It is split evenly across the worker processes actually
+            started, and caps their number so each gets at least one; None leaves
+            LLM calls uncapped.
+        resume (bool): Skip runs whose previous attempt succeeded.
+        llm_cache_path (str | Path | None): Shared LLM response cache used by
+            every worker (see ``core.common.llm_cache``).
+        llm_cache_mode (LLMCacheMode): ``read_write`` or ``replay``.
+        llm_rate_budget (RateBudget | None): Global per-model request/token
+            budget, split evenly across the worker processes started (see
+            ``core.common.rate_limiter``); None disables rate limiting.
+        start_method (str): Multiprocessing start method for workers. Defaults
+            to "spawn", since forking a process that already holds HTTP clients
+            or threads can deadlock the children.
+        simulate_llm (bool): Answer every LLM call in the workers from the
+            offline simulator (see ``core.common.llm_simulator``).
+        resource_spill_threshold_bytes (int | None): Store resource content of
+            at least this size in the batch-wide content store (0 stores all
+            content by hash); None keeps content inline in each run.
+    """
+
+    def __init__(
+        self,
+        run_fn: BatchRunFn,
+        base_output_dir: str | Path,
+        max_workers: int = 4,
+        runs_per_worker: int = 1,
+        llm_concurrency: int | None = None,
+        resume: bool = True,
+        start_method: str = "spawn",
+        llm_cache_path: str | Path | None = None,
+        llm_cache_mode: LLMCacheMode = "read_write",
+        llm_rate_budget: RateBudget | None = None,
+        simulate_llm: bool = False,
+        resource_spill_threshold_bytes: int | None = None,
+    ) -> None:
+        if max_workers < 1 or runs_per_worker < 1:
+            raise ValueError("max_workers and runs_per_worker must be at least 1")
+        self.run_fn = run_fn
+        self.base_output_dir = Path(base_output_dir)
+        self.max_workers = max_workers
+        self.runs_per_worker = runs_per_worker
+        self.llm_concurrency = llm_concurrency
+        self.resume = resume
+        self.start_method = start_method
+        self.llm_cache_path = Path(llm_cache_path) if llm_cache_path else None
+        self.llm_cache_mode: LLMCacheMode = llm_cache_mode
+        self.llm_rate_budget = llm_rate_budget
+        self.simulate_llm = simulate_llm
+        self.resource_spill_threshold_bytes = resource_spill_threshold_bytes
+
+    def pool_size(self, num_chunks: int) -> int:
+        """Worker processes started for ``num_chunks`` chunks of runs.
+
+        Never more than ``llm_concurrency``, so every worker can hold at least
+        one LLM call without the batch exceeding the global cap.
+        """
+        size = min(self.max_workers, num_chunks)
+        if self.llm_concurrency is not None:
+            size = min(size, max(1, self.llm_concurrency))
+        return size
+
+    def llm_concurrency_per_worker(self, workers: int) -> int | None:
+        """Share of ``llm_concurrency`` for each of ``workers`` processes."""
+        if self.llm_concurrency is None:
+            return None
+        return max(1, self.llm_concurrency // workers)
+
+    def llm_rate_budget_per_worker(self, workers: int) -> RateBudget | None:
+        """Share of ``llm_rate_budget`` for each of ``workers`` processes."""
+        if self.llm_rate_budget is None:
+            return None
+        return RateBudget(
+            **{
+                name: limit / workers
+                for name, limit in self.llm_rate_budget.model_dump().items()
+                if limit is not None
+            }
+        )
+
+    def run(self, specs: Sequence[BatchRunSpec]) -> list[BatchRunResult]:
+        """Execute all specs and write the aggregated results table.
+
+        Returns:
+            Results in the order of ``specs``.
+        """
+        results: dict[str, BatchRunResult] = {}
+        pending: list[BatchRunSpec] = []
+        for spec in specs:
+            previous = (
+                _load_marker(_run_dir(spec.build_output_config(self.base_output_dir)))
+                if self.resume
+                else None
+            )
+            if previous is not None and previous.status == "succeeded":
+                results[spec.run_key] = previous.model_copy(update={"resumed": True})
+            else:
+                pending.append(spec)
+
+        logger.info(
+            "Batch: %s runs (%s resumed, %s to execute) on %s workers",
+            len(specs),
+            len(specs) - len(pending),
+            len(pending),
+            self.max_workers,
+        )
+
+        chunks = [
+            pending[i : i + self.runs_per_worker]
+            for i in range(0, len(pending), self.runs_per_worker)
+        ]
+        if chunks:
+            workers = self.pool_size(len(chunks))
+            if workers < min(self.max_workers, len(chunks)):
+                logger.info(
+                    "Batch: limiting pool to %s workers to stay within "
+                    "llm_concurrency=%s",
+                    workers,
+                    self.llm_concurrency,
+                )
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context(self.start_method),
+                initializer=_init_worker,
+                initargs=(
+                    self.llm_concurrency_per_worker(workers),
+                    self.llm_cache_path,
+                    self.llm_cache_mode,
+                    self.llm_rate_budget_per_worker(workers),
+                    self.simulate_llm,
+                ),
+            ) as pool:
+                futures = {
+                    pool.submit(
+                        _run_chunk,
+                        self.run_fn,
+                        chunk,
+                        self.base_output_dir,
+                        self.resource_spill_threshold_bytes,
+                    ): chunk
+                    for chunk in chunks
+                }
+                for future in as_completed(futures):
+                    try:
+                        for result in future.result():
+                            results[result.spec.run_key] = result
+                    except Exception as e:
+                        # Worker crashed (e.g. BrokenProcessPool); record the chunk so a resumed batch retries it
+                        logger.error("Batch worker failed: %s", e, exc_info=True)
+                        for spec in futures[future]:
+                            results[spec.run_key] = BatchRunResult(
+                                spec=spec,
+                                status="failed",
+                                output_dir=str(
+                                    _run_dir(
+                                        spec.build_output_config(self.base_output_dir)
+                                    )
+                                ),
+                                error=f"{type(e).__name__}: {e}",
+                            )
+
+        ordered = [results[spec.run_key] for spec in specs]
+        self.write_results_table(ordered)
+        if self.resource_spill_threshold_bytes is not None:
+            self.write_resource_store_stats()
+        return ordered
+
+    def write_resource_store_stats(self) -> dict:
+        """Write cross-run deduplication statistics of the shared content store."""
+        report = dedup_report(self.base_output_dir / RESOURCE_BLOB_DIRNAME)
+        self.base_output_dir.mkdir(parents=True, exist_ok=True)
+        with open(self.base_output_dir / "resource_store_stats.json", "w") as f:
+            json.dump(report, f, indent=2)
+        logger.info(
+            "Resource store: %s runs, %s logical bytes stored as %s bytes on disk",
+            report["runs"],
+            report["logical_bytes"],
+            report["disk_bytes"],
+        )
+        return report
+
+    def write_results_table(self, results: Sequence[BatchRunResult]) -> Path:
+        """Write ``batch_results.csv`` and ``batch_results.json``; returns the CSV path."""
+        self.base_output_dir.mkdir(parents=True, exist_ok=True)
+        metric_names = sorted({name for r in results for name in r.metrics})
+        csv_path = self.base_output_dir / "batch_results.csv"
+        with open(csv_path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(
+                [
+                    "scenario",
+                    "manager_mode",
+                    "seed",
+                    "status",
+                    "duration_seconds",
+                    *metric_names,
+                    "output_dir",
+                    "error",
+                ]
+            )
+            for r in results:
+                writer.writerow(
+                    [
+                        r.spec.scenario,
+                        r.spec.manager_mode or "",
+                        r.spec.seed,
+                        r.status,
+                        f"{r.duration_seconds:.3f}",
+                        *(r.metrics.get(name, "") for name in metric_names),
+                        r.output_dir,
+                        r.error.strip().splitlines()[-1] if r.error else "",
+                    ]
+                )
+        with open(self.base_output_dir / "batch_results.json", "w") as f:
+            json.dump([r.model_dump(mode="json") for r in results], f, indent=2)
+        return csv_path
@@ -0,0 +1,201 @@
+"""
+Content-addressed blob store for large resource content.
+
+Resources whose content exceeds ``spill_threshold_bytes`` are written once to
+``<root>/<sha256[:2]>/<sha256>`` and keep only a ``ContentRef`` in memory (see
+``Resource.spill``). Blobs are read back through a read-only memory map, and
+previews decode just the leading bytes they need, so prompts and
+``pretty_print`` never load a whole artifact to show its first lines.
+
+Writes are atomic (temporary file, then rename), so several runs or batch
+workers can share one store directory: content repeated across timesteps,
+seeds or scenarios is written once. Each run records the blobs it referenced
+in a manifest under ``<root>/runs/`` (see ``write_manifest``), from which
+``dedup_report`` computes cross-run deduplication statistics.
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any
+
+MANIFEST_DIRNAME = "runs"
+
+
+def content_hash(text: str) -> str:
+    """SHA-256 of the UTF-8 encoded content."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class ContentStore:
+    """Blob files keyed by the SHA-256 of their content.
+
+    Args:
+        root (str | Path): Directory holding the blobs (created on demand).
+        spill_threshold_bytes (int): Content of at least this many UTF-8
+            bytes is spilled to disk; smaller content stays inline.
+
+    Attributes:
+        writes (int): Blobs written to disk.
+        bytes_written (int): Bytes written to disk.
+        duplicate_puts (int): Puts whose blob already existed.
+        logical_bytes (int): Bytes of every put, duplicates included.
+        reads (int): Full blob reads.
+        prefix_reads (int): Prefix (preview) reads.
+    """
+
+    def __init__(self, root: str | Path, spill_threshold_bytes: int = 64 * 1024):
+        if spill_threshold_bytes < 0:
+            raise ValueError("spill_threshold_bytes must be >= 0")
+        self.root = Path(root)
+        self.spill_threshold_bytes = spill_threshold_bytes
+        self.writes = 0
+        self.bytes_written = 0
+        self.duplicate_puts = 0
+        self.logical_bytes = 0
+        self.reads = 0
+        self.prefix_reads = 0
+        # Blobs referenced by this process: hash -> size in bytes
+        self._referenced: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> "ContentStore":
+        # A handle on a directory shared by runs: deep copies of resources and
+        # workflows keep reading from (and counting against) the same store
+        return self
+
+    def path_for(self, sha256: str) -> Path:
+        return self.root / sha256[:2] / sha256
+
+    def should_spill(self, text: str) -> bool:
+        # Cheap bound first: a str of n chars encodes to between n and 4n bytes
+        if len(text) * 4 < self.spill_threshold_bytes:
+            return False
+        if len(text) >= self.spill_threshold_bytes:
+            return True
+        return len(text.encode("utf-8")) >= self.spill_threshold_bytes
+
+    def put(self, text: str) -> str:
+        """Store ``text`` (written only if absent) and return its hash."""
+        data = text.encode("utf-8")
+        sha256 = hashlib.sha256(data).hexdigest()
+        path = self.path_for(sha256)
+        with self._lock:
+            self.logical_bytes += len(data)
+            self._referenced[sha256] = len(data)
+        if path.exists():
+            with self._lock:
+                self.duplicate_puts += 1
+            return sha256
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+        with self._lock:
+            self.writes += 1
+            self.bytes_written += len(data)
+        return sha256
+
+    def read(self, sha256: str) -> str:
+        """Full content of a blob."""
+        with self._lock:
+            self.reads += 1
+        return self._read_bytes(sha256, None).decode("utf-8")
+
+    def read_prefix(self, sha256: str, max_chars: int) -> str:
+        """At most ``max_chars`` leading characters of a blob."""
+        with self._lock:
+            self.prefix_reads += 1
+        # Up to 4 bytes per char; a split trailing character is dropped
+        data = self._read_bytes(sha256, max(0, max_chars) * 4)
+        return data.decode("utf-8", errors="ignore")[:max_chars]
+
+    def _read_bytes(self, sha256: str, limit: int | None) -> bytes:
+        path = self.path_for(sha256)
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return b""
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return mapped[:limit] if limit is not None else mapped[:]
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "writes": self.writes,
+            "bytes_written": self.bytes_written,
+            "duplicate_puts": self.duplicate_puts,
+            "logical_bytes": self.logical_bytes,
+            "referenced_blobs": len(self._referenced),
+            "reads": self.reads,
+            "prefix_reads": self.prefix_reads,
+        }
+
+    def write_manifest(self, run_dir: str | Path) -> Path:
+        """Record the blobs referenced so far as the manifest of ``run_dir``.
+
+        The manifest is keyed by the run directory, so re-running into the
+        same directory replaces it instead of counting the run twice.
+        """
+        run_dir = Path(run_dir).resolve()
+        key = hashlib.sha256(str(run_dir).encode("utf-8")).hexdigest()[:16]
+        path = self.root / MANIFEST_DIRNAME / f"{key}.json"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            manifest = {
+                "run_dir": str(run_dir),
+                **self.stats(),
+                "blobs": dict(self._referenced),
+            }
+        tmp = path.with_suffix(".json.tmp")
+        tmp.write_text(json.dumps(manifest))
+        os.replace(tmp, path)
+        return path
+
+
+def dedup_report(root: str | Path) -> dict[str, Any]:
+    """Cross-run deduplication statistics of a shared content store.
+
+    ``logical_bytes`` is what the runs stored (each run counting every
+    resource it spilled); ``disk_bytes`` is what the blob files occupy.
+    """
+    root = Path(root)
+    manifests: list[dict[str, Any]] = []
+    for path in sorted((root / MANIFEST_DIRNAME).glob("*.json")):
+        try:
+            manifests.append(json.loads(path.read_text()))
+        except (OSError, ValueError):
+            continue
+    blobs = disk_bytes = 0
+    if root.exists():
+        for shard in root.iterdir():
+            if not shard.is_dir() or shard.name == MANIFEST_DIRNAME:
+                continue
+            for blob in shard.iterdir():
+                if not blob.name.startswith("."):
+                    blobs += 1
+                    disk_bytes += blob.stat().st_size
+    logical = sum(m.get("logical_bytes", 0) for m in manifests)
+    per_run_unique = sum(sum(m.get("blobs", {}).values()) for m in manifests)
+    shared: dict[str, int] = {}
+    for m in manifests:
+        for sha in m.get("blobs", {}):
+            shared[sha] = shared.get(sha, 0) + 1
+    return {
+        "runs": len(manifests),
+        "blobs": blobs,
+        "disk_bytes": disk_bytes,
+        "logical_bytes": logical,
+        # Bytes each run would have stored had it deduplicated only within itself
+        "per_run_unique_bytes": per_run_unique,
+        "blobs_shared_across_runs": sum(1 for n in shared.values() if n > 1),
+        "saved_bytes": max(0, logical - disk_bytes),
+        "dedup_ratio": round(logical / disk_bytes, 3) if disk_bytes else None,
+    }
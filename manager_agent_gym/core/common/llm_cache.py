@@ -0,0 +1,244 @@
+"""
+Persistent, content-addressed cache for structured LLM responses.
+
+Responses from ``generate_structured_response`` are stored in SQLite under a
+SHA-256 of everything that determines the output (model, prompts, response
+schema, seed, sampling parameters). Re-running scenarios, restoring from
+snapshots or evaluating identical rubric prompts across seeds then reuses the
+stored response instead of paying for the call again.
+
+Modes:
+    - ``read_write``: serve hits, call the provider on misses and store results.
+    - ``replay``: read-only; misses raise ``LLMCacheMissError`` so offline
+      re-evaluation never reaches the provider.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Literal
+
+from .logging import logger
+
+LLMCacheMode = Literal["read_write", "replay"]
+
+# Cache hits buffer their access time and write it back in batches of this size
+_ACCESS_FLUSH_BATCH = 64
+
+
+class LLMCacheMissError(LookupError):
+    """Raised in replay mode when a request has no cached response."""
+
+
+def make_cache_key(
+    *,
+    model: str,
+    system_prompt: str,
+    user_prompt: str | None,
+    response_schema: dict[str, Any],
+    seed: int,
+    temperature: float,
+    max_completion_tokens: int = 0,
+) -> str:
+    """Stable content hash of an LLM request."""
+    payload = json.dumps(
+        {
+            "model": model,
+            "system_prompt": system_prompt,
+            "user_prompt": user_prompt,
+            "response_schema": response_schema,
+            "seed": seed,
+            "temperature": temperature,
+            "max_completion_tokens": max_completion_tokens,
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache:
+    """SQLite-backed response store with LRU eviction by total size.
+
+    Safe to share between threads and between processes (WAL journal), e.g.
+    across batch workers pointing at the same file. Access times of hits are
+    buffered and written back in batches (and before every store, eviction or
+    close), so reads do not commit a transaction each.
+
+    Args:
+        path (str | Path): SQLite database file.
+        mode (LLMCacheMode): ``read_write`` or read-only ``replay``.
+        max_bytes (int | None): Evict least-recently-used entries once stored
+            responses exceed this size; None disables eviction.
+
+    Attributes:
+        hits (int): Lookups served from the cache.
+        misses (int): Lookups with no stored response.
+        writes (int): Responses stored.
+        evictions (int): Entries removed by the size limit.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        mode: LLMCacheMode = "read_write",
+        max_bytes: int | None = 512 * 1024 * 1024,
+    ) -> None:
+        self.path = Path(path)
+        self.mode: LLMCacheMode = mode
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        # key -> last access time not yet written back
+        self._pending_access: dict[str, float] = {}
+
+        if mode == "replay":
+            if not self.path.exists():
+                raise FileNotFoundError(f"LLM replay cache not found: {self.path}")
+            self._conn = sqlite3.connect(
+                f"file:{self.path}?mode=ro",
+                uri=True,
+                check_same_thread=False,
+                timeout=30.0,
+            )
+        else:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(
+                self.path, check_same_thread=False, timeout=30.0
+            )
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                " key TEXT PRIMARY KEY,"
+                " response TEXT NOT NULL,"
+                " size INTEGER NOT NULL,"
+                " created_at REAL NOT NULL,"
+                " last_access REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS responses_last_access"
+                " ON responses(last_access)"
+            )
+            self._conn.commit()
+        self._total_bytes = self._stored_bytes()
+
+    @property
+    def read_only(self) -> bool:
+        return self.mode == "replay"
+
+    def get(self, key: str) -> str | None:
+        """Return the stored response JSON for ``key``, if any."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            if not self.read_only:
+                self._pending_access[key] = time.time()
+                if len(self._pending_access) >= _ACCESS_FLUSH_BATCH:
+                    self._flush_access()
+                    self._conn.commit()
+            return row[0]
+
+    def put(self, key: str, response_json: str) -> None:
+        """Store a response; no-op in replay mode."""
+        if self.read_only:
+            return
+        size = len(response_json.encode("utf-8"))
+        now = time.time()
+        with self._lock:
+            self._pending_access.pop(key, None)
+            # Read the replaced entry's size in the same write transaction
+            self._conn.execute("BEGIN IMMEDIATE")
+            self._flush_access()
+            row = self._conn.execute(
+                "SELECT size FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses"
+                " (key, response, size, created_at, last_access)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (key, response_json, size, now, now),
+            )
+            self._conn.commit()
+            self.writes += 1
+            self._total_bytes += size - (row[0] if row is not None else 0)
+            if self.max_bytes is not None and self._total_bytes > self.max_bytes:
+                self._evict()
+
+    def stats(self) -> dict[str, float]:
+        """Hit/miss counters plus current size of the store."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "writes": self.writes,
+            "evictions": self.evictions,
+            "entries": self._count(),
+            "bytes": self._total_bytes,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            if self._pending_access:
+                self._flush_access()
+                self._conn.commit()
+            self._conn.close()
+
+    def _flush_access(self) -> None:
+        # Callers hold the lock and commit
+        if not self._pending_access:
+            return
+        self._conn.executemany(
+            "UPDATE responses SET last_access = ? WHERE key = ?",
+            [(ts, key) for key, ts in self._pending_access.items()],
+        )
+        self._pending_access.clear()
+
+    def _stored_bytes(self) -> int:
+        row = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()
+        return int(row[0])
+
+    def _count(self) -> int:
+        with self._lock:
+            return int(
+                self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+            )
+
+    def _evict(self) -> None:
+        # Other processes may share the file; re-read the exact total first
+        self._total_bytes = self._stored_bytes()
+        if self.max_bytes is None:
+            return
+        excess = self._total_bytes - self.max_bytes
+        if excess <= 0:
+            return
+        victims: list[str] = []
+        freed = 0
+        for key, size in self._conn.execute(
+            "SELECT key, size FROM responses ORDER BY last_access ASC"
+        ):
+            victims.append(key)
+            freed += size
+            if freed >= excess:
+                break
+        self._conn.executemany(
+            "DELETE FROM responses WHERE key = ?", [(k,) for k in victims]
+        )
+        self._conn.commit()
+        self.evictions += len(victims)
+        self._total_bytes -= freed
+        logger.debug("LLM cache evicted %s entries (%s bytes)", len(victims), freed)
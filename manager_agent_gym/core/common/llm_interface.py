@@ -2,13 +2,122 @@
 Centralized LLM interface using Instructor for structured outputs.
 """
 
-from typing import TypeVar, Type, Any
+from typing import TypeVar, Type, Any, AsyncIterator
+import asyncio
 import os
+from contextlib import asynccontextmanager
+from weakref import WeakKeyDictionary
 from pydantic import BaseModel
+from .llm_cache import LLMCacheMissError, LLMResponseCache, make_cache_key
+from .llm_simulator import SimulatedLLM
 from .logging import logger
+from .rate_limiter import LLMPriority, RateLimitGrant, rate_limited
 
 T = TypeVar("T", bound=BaseModel)
 
+# Process-wide cap on in-flight LLM calls (None = unlimited). Semaphores are
+# created per event loop so separate asyncio.run() invocations do not share one.
+_llm_concurrency_limit: int | None = None
+_llm_call_semaphores: "WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = WeakKeyDictionary()
+
+
+# Optional persistent response cache consulted by generate_structured_response
+_llm_response_cache: LLMResponseCache | None = None
+
+
+def configure_llm_cache(cache: LLMResponseCache | None) -> None:
+    """Install (or remove with None) the process-wide LLM response cache."""
+    global _llm_response_cache
+    _llm_response_cache = cache
+
+
+def get_llm_cache() -> LLMResponseCache | None:
+    """Return the installed LLM response cache, if any."""
+    return _llm_response_cache
+
+
+# Optional offline stand-in answering every LLM call (see llm_simulator)
+_llm_simulator: SimulatedLLM | None = None
+
+
+def configure_llm_simulator(simulator: SimulatedLLM | None) -> None:
+    """Route all LLM calls to ``simulator`` (or back to providers with None)."""
+    global _llm_simulator
+    _llm_simulator = simulator
+
+
+def get_llm_simulator() -> SimulatedLLM | None:
+    """Return the installed LLM simulator, if any."""
+    return _llm_simulator
+
+
+def configure_llm_concurrency(limit: int | None) -> None:
+    """Cap the number of concurrent LLM calls made from this process.
+
+    Args:
+        limit: Maximum in-flight calls, or None to remove the cap.
+    """
+    global _llm_concurrency_limit
+    if limit is not None and limit < 1:
+        raise ValueError("LLM concurrency limit must be at least 1")
+    _llm_concurrency_limit = limit
+    _llm_call_semaphores.clear()
+
+
+@asynccontextmanager
+async def llm_call_slot(
+    model: str | None = None,
+    priority: LLMPriority = LLMPriority.TASK_EXECUTION,
+    estimated_tokens: int = 0,
+) -> AsyncIterator[RateLimitGrant]:
+    """Admit one LLM call through the rate limiter and the concurrency budget.
+
+    Args:
+        model: Rate-limit key (model name); None uses the limiter's default budget.
+        priority: Scheduling class used when the limiter queues requests.
+        estimated_tokens: Expected prompt + completion tokens, charged up front;
+            report the actual count with ``grant.record_tokens``.
+    """
+    async with rate_limited(model or "default", priority, estimated_tokens) as grant:
+        if _llm_concurrency_limit is None:
+            yield grant
+            return
+        loop = asyncio.get_running_loop()
+        semaphore = _llm_call_semaphores.get(loop)
+        if semaphore is None:
+            semaphore = _llm_call_semaphores[loop] = asyncio.Semaphore(
+                _llm_concurrency_limit
+            )
+        async with semaphore:
+            yield grant
+
+
+def estimate_tokens(*texts: str | None) -> int:
+    """Rough token estimate (~4 characters per token) for rate-limit accounting."""
+    return sum(len(text) for text in texts if text) // 4
+
+
+def run_result_total_tokens(run_result: Any) -> int | None:
+    """Total tokens used by an agents-SDK ``RunResult``, when reported."""
+    try:
+        return int(run_result.context_wrapper.usage.total_tokens)
+    except Exception:
+        return None
+
+
+async def run_agent(agent: Any, input: Any, **kwargs: Any) -> Any:
+    """Run an agents-SDK agent, or answer it from the installed simulator.
+
+    Drop-in for ``agents.Runner.run``; with a simulator installed the result
+    carries a synthesized ``final_output`` and simulated token usage.
+    """
+    simulator = _llm_simulator
+    if simulator is not None:
+        return await simulator.run_agent(agent, input, context=kwargs.get("context"))
+    from agents import Runner  # type: ignore
+
+    return await Runner.run(agent, input, **kwargs)
+
 
 class LLMInferenceTruncationError(Exception):
     """Raised when the LLM provider indicates a truncation/content block.
@@ -55,29 +164,88 @@ class LLMInferenceTruncationError(Exception):
         return base + (" [" + ", ".join(details) + "]" if details else "")
 
 
+# Shared provider clients, keyed by (provider, api key, base URL) within each
+# event loop: httpx connection pools are bound to the loop that opened them.
+_llm_clients: "WeakKeyDictionary[asyncio.AbstractEventLoop, dict[tuple[str, str | None, str | None], Any]]" = WeakKeyDictionary()
+_llm_max_connections: int = 100
+
+
+def configure_llm_client_pool(max_connections: int) -> None:
+    """Set the connection cap for pooled LLM clients created after this call.
+
+    Args:
+        max_connections: Maximum open (and keep-alive) connections per client.
+    """
+    global _llm_max_connections
+    if max_connections < 1:
+        raise ValueError("max_connections must be at least 1")
+    _llm_max_connections = max_connections
+
+
+async def close_llm_clients() -> None:
+    """Close the pooled LLM clients owned by the running event loop.
+
+    Clients are shared by everything on the loop, so call this once all LLM
+    users on the loop are done; later calls transparently open new clients.
+    """
+    clients = _llm_clients.pop(asyncio.get_running_loop(), {})
+    for client in clients.values():
+        try:
+            await client.close()
+        except Exception:
+            logger.warning("Failed to close LLM client", exc_info=True)
+
+
 def _get_openai_client():
-    """Get configured OpenAI async client patched by Instructor.
+    """Get the shared OpenAI async client (patched by Instructor) for this loop.
 
-    Lazy-imports provider SDKs so they are optional until actually used.
+    One client, and therefore one keep-alive connection pool, is reused per
+    (provider, api key, base URL) and event loop. Lazy-imports provider SDKs
+    so they are optional until actually used.
     """
+    api_key = os.getenv("OPENAI_API_KEY")
+    base_url = os.getenv("OPENAI_BASE_URL")
+    key = ("openai", api_key, base_url)
     try:
-        from openai import AsyncOpenAI  # type: ignore
+        loop: asyncio.AbstractEventLoop | None = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+    if loop is not None:
+        cached = _llm_clients.get(loop, {}).get(key)
+        if cached is not None:
+            return cached
+
+    try:
+        from openai import AsyncOpenAI, DefaultAsyncHttpxClient  # type: ignore
+        from openai._constants import DEFAULT_CONNECTION_LIMITS
     except Exception as e:  # pragma: no cover - import guard
         raise ImportError(
             "OpenAI SDK is not installed. Install with `uv sync --group openai`."
         ) from e
 
     client = AsyncOpenAI(
-        api_key=os.getenv("OPENAI_API_KEY"),
+        api_key=api_key,
+        base_url=base_url,
         timeout=300.0,
+        http_client=DefaultAsyncHttpxClient(
+            # Built from the SDK's own Limits class: newer SDKs ship their own
+            # httpx fork, whose Limits is not the installed httpx's
+            limits=type(DEFAULT_CONNECTION_LIMITS)(
+                max_connections=_llm_max_connections,
+                max_keepalive_connections=_llm_max_connections,
+            ),
+        ),
     )
 
     try:
         import instructor  # type: ignore
+
         instructor.patch(client)  # type: ignore[attr-defined]
     except Exception:
         pass
 
+    if loop is not None:
+        _llm_clients.setdefault(loop, {})[key] = client
     return client
 
 
@@ -119,6 +287,7 @@ async def generate_structured_response(
     max_completion_tokens: int = 0,
     max_retries: int = 0,
     retry_delay_seconds: float = 0.5,
+    priority: LLMPriority = LLMPriority.TASK_EXECUTION,
 ) -> T:
     """
     Generate a structured response via Instructor with Pydantic validation and provider-agnostic handling.
@@ -133,14 +302,64 @@ async def generate_structured_response(
         max_completion_tokens: Maximum tokens to generate
         max_retries: Number of retry attempts on failure
         retry_delay_seconds: Base delay between retries (exponential backoff)
+        priority: Rate-limiter scheduling class for this call
 
     Returns:
         Instance of response_type populated with LLM response
 
     Raises:
         LLMInferenceTruncationError: If no valid response is received from LLM
+        LLMCacheMissError: If the response cache is in replay mode and has no entry
         ValueError: If model is not supported for structured outputs
     """
+    simulator = _llm_simulator
+    if simulator is not None:
+        # Simulated responses bypass the response cache so they never mix
+        # with recorded provider output
+        try:
+            async with llm_call_slot(
+                model,
+                priority,
+                estimate_tokens(system_prompt, user_prompt)
+                + max(max_completion_tokens, 0),
+            ) as grant:
+                response, input_tokens, output_tokens = await simulator.respond(
+                    response_type,
+                    model,
+                    system_prompt,
+                    user_prompt,
+                    seed,
+                    prompt_tokens=estimate_tokens(system_prompt, user_prompt),
+                )
+                grant.record_tokens(input_tokens + output_tokens)
+            return response
+        except Exception as e:
+            raise LLMInferenceTruncationError(
+                f"Simulated LLM request failed for {response_type.__name__}: {e}",
+                model=model,
+                provider_fields={"seed": seed, "error_type": type(e).__name__},
+            ) from e
+
+    cache = _llm_response_cache
+    cache_key: str | None = None
+    if cache is not None:
+        cache_key = make_cache_key(
+            model=model,
+            system_prompt=system_prompt,
+            user_prompt=user_prompt,
+            response_schema=response_type.model_json_schema(),
+            seed=seed,
+            temperature=temperature,
+            max_completion_tokens=max_completion_tokens,
+        )
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return response_type.model_validate_json(cached)
+        if cache.read_only:
+            raise LLMCacheMissError(
+                f"No cached response for {response_type.__name__} ({model}) in replay mode"
+            )
+
     # Build messages array
     messages = [{"role": "system", "content": system_prompt}]
     if user_prompt:
@@ -162,10 +381,19 @@ async def generate_structured_response(
 
         # Delegate validation and retries to Instructor (patched method not typed)
         create_fn: Any = client.chat.completions.create
-        result: T = await create_fn(
-            max_retries=max_retries,
-            **kwargs,
-        )
+        async with llm_call_slot(
+            model,
+            priority,
+            estimate_tokens(system_prompt, user_prompt) + max(max_completion_tokens, 0),
+        ) as grant:
+            result: T = await create_fn(
+                max_retries=max_retries,
+                **kwargs,
+            )
+            usage = getattr(getattr(result, "_raw_response", None), "usage", None)
+            grant.record_tokens(getattr(usage, "total_tokens", None))
+        if cache is not None and cache_key is not None:
+            cache.put(cache_key, result.model_dump_json())
         return result
 
     except Exception as e:
@@ -0,0 +1,337 @@
+"""
+Offline, deterministic stand-in for LLM providers.
+
+``SimulatedLLM`` answers ``generate_structured_response`` and agents-SDK runs
+(``run_agent``) without network access. Each response is a schema-valid
+instance of the requested Pydantic model, synthesized from its field types and
+constraints: ``Literal`` choices, enums, numeric and length bounds, and JSON
+schema ``enum`` hints such as the ID universes of constrained manager actions.
+Latency and token usage are drawn from seeded distributions.
+
+Draws are derived from the simulator seed and the request content, not from
+call order, so concurrent calls and repeated runs produce identical outputs.
+Install process-wide with ``llm_interface.configure_llm_simulator``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import enum
+import hashlib
+import json
+import math
+import random
+import types
+import typing
+from collections.abc import Sequence
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, TypeVar
+from uuid import UUID
+
+from pydantic import BaseModel
+from pydantic.fields import FieldInfo
+
+T = TypeVar("T", bound=BaseModel)
+
+_EPOCH = datetime(2025, 1, 1, tzinfo=timezone.utc)
+# Nested models deeper than this only get their required fields
+_MAX_DEPTH = 6
+
+
+class _Unsupported(TypeError):
+    """No synthetic value can be produced for an annotation."""
+
+
+class SimulatedRunResult:
+    """Minimal agents-SDK ``RunResult`` look-alike returned by ``run_agent``.
+
+    Exposes ``final_output`` and ``context_wrapper.usage`` (input/output/total
+    tokens), which is all the workflow agents read from a run.
+    """
+
+    __slots__ = ("input", "final_output", "context_wrapper")
+
+    def __init__(
+        self, input: Any, final_output: Any, usage: Any, context: Any = None
+    ) -> None:
+        self.input = input
+        self.final_output = final_output
+        self.context_wrapper = types.SimpleNamespace(context=context, usage=usage)
+
+    def __str__(self) -> str:
+        return f"SimulatedRunResult(final_output={self.final_output!r})"
+
+
+def _make_usage(input_tokens: int, output_tokens: int) -> Any:
+    try:
+        from agents.usage import Usage  # type: ignore
+
+        return Usage(
+            requests=1,
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            total_tokens=input_tokens + output_tokens,
+        )
+    except ImportError:  # pragma: no cover - agents SDK is optional here
+        return types.SimpleNamespace(
+            requests=1,
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            total_tokens=input_tokens + output_tokens,
+            input_tokens_details=None,
+        )
+
+
+class SimulatedLLM:
+    """Seeded generator of schema-valid structured responses.
+
+    Args:
+        seed (int): Base seed; with the request content it determines every
+            response, latency and token count.
+        latency_mean_seconds (float): Mean simulated call latency. Zero (the
+            default) returns immediately, for measuring engine overhead.
+        latency_std_seconds (float): Standard deviation of the latency.
+        output_tokens_mean (int): Mean completion tokens reported per call.
+        output_tokens_std (int): Standard deviation of completion tokens.
+        max_list_items (int): Upper bound on synthesized list lengths (lists
+            always get at least one item unless their schema caps them at 0).
+
+    Attributes:
+        calls (int): Responses produced.
+        input_tokens (int): Prompt tokens reported (estimated from the prompts).
+        output_tokens (int): Completion tokens reported.
+        latency_seconds (float): Total simulated latency.
+    """
+
+    def __init__(
+        self,
+        seed: int = 0,
+        latency_mean_seconds: float = 0.0,
+        latency_std_seconds: float = 0.0,
+        output_tokens_mean: int = 400,
+        output_tokens_std: int = 100,
+        max_list_items: int = 3,
+    ) -> None:
+        if latency_mean_seconds < 0 or latency_std_seconds < 0:
+            raise ValueError("Simulated latency must be non-negative")
+        if max_list_items < 1:
+            raise ValueError("max_list_items must be at least 1")
+        self.seed = seed
+        self.latency_mean_seconds = latency_mean_seconds
+        self.latency_std_seconds = latency_std_seconds
+        self.output_tokens_mean = output_tokens_mean
+        self.output_tokens_std = output_tokens_std
+        self.max_list_items = max_list_items
+        self.calls = 0
+        self.input_tokens = 0
+        self.output_tokens = 0
+        self.latency_seconds = 0.0
+
+    def rng_for(self, *request: Any) -> random.Random:
+        """Random source determined by the simulator seed and ``request``."""
+        payload = json.dumps([self.seed, *request], sort_keys=True, default=str)
+        digest = hashlib.sha256(payload.encode("utf-8")).digest()
+        return random.Random(int.from_bytes(digest[:8], "big"))
+
+    async def respond(
+        self,
+        response_type: type[T],
+        *request: Any,
+        prompt_tokens: int = 0,
+    ) -> tuple[T, int, int]:
+        """Simulate one call answering ``request`` with a ``response_type``.
+
+        Returns:
+            The synthesized response, input tokens and output tokens.
+        """
+        rng = self.rng_for(response_type.__name__, *request)
+        output = self.synthesize(response_type, rng)
+        output_tokens = max(
+            1, round(rng.gauss(self.output_tokens_mean, self.output_tokens_std))
+        )
+        latency = max(
+            0.0, rng.gauss(self.latency_mean_seconds, self.latency_std_seconds)
+        )
+
+        self.calls += 1
+        self.input_tokens += prompt_tokens
+        self.output_tokens += output_tokens
+        self.latency_seconds += latency
+        if latency > 0:
+            await asyncio.sleep(latency)
+        return output, prompt_tokens, output_tokens
+
+    async def run_agent(
+        self, agent: Any, input: Any, context: Any = None
+    ) -> SimulatedRunResult:
+        """Answer an agents-SDK run with an instance of ``agent.output_type``."""
+        output_type = getattr(agent, "output_type", None)
+        instructions = getattr(agent, "instructions", None)
+        prompt = input if isinstance(input, str) else json.dumps(input, default=str)
+        request = (
+            getattr(agent, "name", ""),
+            instructions if isinstance(instructions, str) else None,
+            prompt,
+        )
+        prompt_tokens = (len(prompt) + len(request[1] or "")) // 4
+        if isinstance(output_type, type) and issubclass(output_type, BaseModel):
+            output, input_tokens, output_tokens = await self.respond(
+                output_type, *request, prompt_tokens=prompt_tokens
+            )
+        else:
+            # Plain-text agents get a deterministic text answer
+            text, input_tokens, output_tokens = await self.respond(
+                _TextOutput, *request, prompt_tokens=prompt_tokens
+            )
+            output = text.text
+        return SimulatedRunResult(
+            input=input,
+            final_output=output,
+            usage=_make_usage(input_tokens, output_tokens),
+            context=context,
+        )
+
+    def synthesize(self, model: type[T], rng: random.Random) -> T:
+        """Build a valid ``model`` instance from its field annotations."""
+        return self._model(model, rng, depth=0)
+
+    def stats(self) -> dict[str, float]:
+        """Call and token counters plus total simulated latency."""
+        return {
+            "calls": self.calls,
+            "input_tokens": self.input_tokens,
+            "output_tokens": self.output_tokens,
+            "latency_seconds": round(self.latency_seconds, 6),
+        }
+
+    # ------------------------------------------------------------------
+    # Value synthesis
+    # ------------------------------------------------------------------
+    def _model(self, model: type[T], rng: random.Random, depth: int) -> T:
+        values: dict[str, Any] = {}
+        for name, info in model.model_fields.items():
+            if not info.is_required() and depth >= _MAX_DEPTH:
+                continue
+            try:
+                values[name] = self._field(name, info, rng, depth)
+            except _Unsupported:
+                if info.is_required():
+                    raise
+        return model.model_validate(values)
+
+    def _field(self, name: str, info: FieldInfo, rng: random.Random, depth: int) -> Any:
+        extra = info.json_schema_extra
+        enum = extra.get("enum") if isinstance(extra, dict) else None
+        if isinstance(enum, list):
+            choices = [c for c in enum if c is not None] or enum
+            if choices:
+                return rng.choice(choices)
+        return self._value(info.annotation, info.metadata, name, rng, depth)
+
+    def _value(
+        self,
+        annotation: Any,
+        metadata: Sequence[Any],
+        name: str,
+        rng: random.Random,
+        depth: int,
+    ) -> Any:
+        origin = typing.get_origin(annotation)
+        args = typing.get_args(annotation)
+
+        if origin is typing.Annotated:
+            return self._value(args[0], [*metadata, *args[1:]], name, rng, depth)
+        if annotation is None or annotation is type(None):
+            return None
+        if origin is typing.Union or origin is types.UnionType:
+            members = [a for a in args if a is not type(None)]
+            if not members:
+                return None
+            return self._value(rng.choice(members), metadata, name, rng, depth)
+        if origin is typing.Literal:
+            return rng.choice(args)
+        if annotation is Any or annotation is object:
+            return f"simulated {name}"
+
+        if isinstance(annotation, type):
+            if issubclass(annotation, BaseModel):
+                return self._model(annotation, rng, depth + 1)
+            if issubclass(annotation, enum.Enum):
+                return rng.choice(list(annotation))
+            if annotation is bool:
+                return rng.random() < 0.5
+            if issubclass(annotation, int):
+                return self._number(metadata, rng, integer=True)
+            if issubclass(annotation, float):
+                return self._number(metadata, rng, integer=False)
+            if issubclass(annotation, str):
+                return self._text(name, metadata, rng)
+            if issubclass(annotation, UUID):
+                return UUID(int=rng.getrandbits(128), version=4)
+            if issubclass(annotation, datetime):
+                return _EPOCH + timedelta(seconds=rng.randrange(365 * 86400))
+            if issubclass(annotation, date):
+                return (_EPOCH + timedelta(days=rng.randrange(365))).date()
+
+        container = origin or annotation
+        if container in (list, set, frozenset, Sequence) or (
+            container is tuple and (not args or args[-1] is Ellipsis)
+        ):
+            item = args[0] if args else str
+            count = self._length(metadata, rng)
+            items = [self._value(item, (), name, rng, depth) for _ in range(count)]
+            if container is set:
+                return set(items)
+            if container is frozenset:
+                return frozenset(items)
+            if container is tuple:
+                return tuple(items)
+            return items
+        if container is tuple:
+            return tuple(self._value(a, (), name, rng, depth) for a in args)
+        if container is dict:
+            return {}
+        raise _Unsupported(f"cannot synthesize a value for {annotation!r}")
+
+    def _length(self, metadata: Sequence[Any], rng: random.Random) -> int:
+        low = max((getattr(m, "min_length", None) or 0 for m in metadata), default=0)
+        caps = [getattr(m, "max_length", None) for m in metadata]
+        high = min([c for c in caps if c is not None] or [self.max_list_items])
+        return rng.randint(min(max(low, 1), high), max(low, high))
+
+    def _number(
+        self, metadata: Sequence[Any], rng: random.Random, integer: bool
+    ) -> int | float:
+        step = 1.0 if integer else 1e-6
+        span = 10.0 if integer else 1.0
+        low: float | None = None
+        high: float | None = None
+        for m in metadata:
+            if getattr(m, "ge", None) is not None:
+                low = float(m.ge)
+            if getattr(m, "gt", None) is not None:
+                low = float(m.gt) + step
+            if getattr(m, "le", None) is not None:
+                high = float(m.le)
+            if getattr(m, "lt", None) is not None:
+                high = float(m.lt) - step
+        if low is None:
+            low = 0.0 if high is None else min(0.0, high - span)
+        if high is None:
+            high = low + span
+        if integer:
+            return rng.randint(math.ceil(low), math.floor(high))
+        return rng.uniform(low, high)
+
+    def _text(self, name: str, metadata: Sequence[Any], rng: random.Random) -> str:
+        text = f"Simulated {name.replace('_', ' ')} {rng.randrange(10**6):06d}"
+        for m in metadata:
+            if getattr(m, "min_length", None):
+                text = text.ljust(m.min_length, ".")
+            if getattr(m, "max_length", None):
+                text = text[: m.max_length]
+        return text
+
+
+class _TextOutput(BaseModel):
+    text: str
@@ -0,0 +1,210 @@
+"""
+Named-span instrumentation for the execution engine's hot path.
+
+``PhaseProfiler.span(name)`` measures wall time, process CPU time and garbage
+collections of a block of code, plus the net change in allocated memory blocks
+and traced bytes with ``track_allocations``. Spans nest through a context
+variable, so spans opened in tasks spawned from inside a span are parented
+correctly. Completed spans are
+grouped per timestep and can be exported as a Chrome trace (viewable in
+Perfetto or ``chrome://tracing``).
+
+A disabled profiler hands out one shared no-op context manager and records
+nothing.
+
+CPU time, collections and allocation counts are process-wide: for spans that
+overlap concurrently running coroutines or threads (e.g. agent tasks) they
+include that other work, and only the wall time is specific to the span.
+"""
+
+import asyncio
+import gc
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import nullcontext
+from contextvars import ContextVar
+from itertools import count
+from typing import Any, Awaitable, ContextManager, TypeVar
+
+T = TypeVar("T")
+
+_NO_SPAN: ContextManager[None] = nullcontext()
+_current_span: ContextVar[int | None] = ContextVar("profiling_span", default=None)
+
+
+class _Span:
+    __slots__ = (
+        "profiler",
+        "name",
+        "attributes",
+        "span_id",
+        "parent_id",
+        "token",
+        "wall_start",
+        "cpu_start",
+        "gc_start",
+        "blocks_start",
+        "traced_start",
+    )
+
+    def __init__(
+        self, profiler: "PhaseProfiler", name: str, attributes: dict[str, Any]
+    ) -> None:
+        self.profiler = profiler
+        self.name = name
+        self.attributes = attributes
+
+    def __enter__(self) -> None:
+        self.span_id = next(self.profiler._ids)
+        self.parent_id = _current_span.get()
+        self.token = _current_span.set(self.span_id)
+        self.gc_start = _gc_collections()
+        if self.profiler.track_allocations:
+            self.blocks_start = sys.getallocatedblocks()
+            self.traced_start = tracemalloc.get_traced_memory()[0]
+        self.cpu_start = time.process_time()
+        self.wall_start = time.perf_counter()
+
+    def __exit__(self, *exc_info: object) -> None:
+        wall_end = time.perf_counter()
+        cpu_end = time.process_time()
+        _current_span.reset(self.token)
+        record: dict[str, Any] = {
+            "name": self.name,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "start_ms": (self.wall_start - self.profiler._origin) * 1000.0,
+            "wall_ms": (wall_end - self.wall_start) * 1000.0,
+            "cpu_ms": (cpu_end - self.cpu_start) * 1000.0,
+            "gc_collections": _gc_collections() - self.gc_start,
+            "track": _track_name(),
+        }
+        if self.profiler.track_allocations:
+            record["alloc_blocks"] = sys.getallocatedblocks() - self.blocks_start
+            record["alloc_bytes"] = (
+                tracemalloc.get_traced_memory()[0] - self.traced_start
+            )
+        if self.attributes:
+            record["attributes"] = self.attributes
+        if exc_info[0] is not None:
+            record["error"] = getattr(exc_info[0], "__name__", str(exc_info[0]))
+        self.profiler._record(record)
+
+
+def _gc_collections() -> int:
+    return sum(generation["collections"] for generation in gc.get_stats())
+
+
+def _track_name() -> str:
+    try:
+        task = asyncio.current_task()
+    except RuntimeError:
+        task = None
+    if task is not None:
+        return task.get_name()
+    return threading.current_thread().name
+
+
+class PhaseProfiler:
+    """Collects named spans per timestep.
+
+    Args:
+        enabled: Record spans; when False every ``span`` call is a no-op.
+        track_allocations: Also record the net change in allocated blocks and
+            traced bytes per span. Starts ``tracemalloc`` and counts heap blocks
+            on every span boundary, which slows the run noticeably.
+    """
+
+    def __init__(self, enabled: bool = False, track_allocations: bool = False) -> None:
+        self.enabled = enabled
+        self.track_allocations = enabled and track_allocations
+        if self.track_allocations and not tracemalloc.is_tracing():
+            tracemalloc.start()
+        self._ids = count(1)
+        self._origin = time.perf_counter()
+        self._timestep: int | None = None
+        self._profiles: dict[int | None, dict[str, Any]] = {}
+
+    def span(self, name: str, **attributes: Any) -> ContextManager[None]:
+        """Context manager timing the enclosed block as span ``name``."""
+        if not self.enabled:
+            return _NO_SPAN
+        return _Span(self, name, attributes)
+
+    async def instrument(
+        self, awaitable: Awaitable[T], name: str, **attributes: Any
+    ) -> T:
+        """Await ``awaitable`` inside span ``name`` (for work handed to other tasks)."""
+        with self.span(name, **attributes):
+            return await awaitable
+
+    def start_timestep(self, timestep: int) -> None:
+        """Attribute spans completed from now on to ``timestep``."""
+        if self.enabled:
+            self._timestep = timestep
+
+    def timestep_profile(self, timestep: int) -> dict[str, Any]:
+        """Spans of ``timestep`` plus per-phase wall/CPU totals.
+
+        The returned dict is live: spans of the timestep that complete later
+        are added to it.
+        """
+        return self._profile(timestep)
+
+    def chrome_trace(self) -> dict[str, Any]:
+        """All recorded spans in Chrome trace event format."""
+        tracks: dict[str, int] = {}
+        events: list[dict[str, Any]] = []
+        for timestep, profile in self._profiles.items():
+            for span in profile["spans"]:
+                tid = tracks.setdefault(span["track"], len(tracks) + 1)
+                args = {
+                    "timestep": timestep,
+                    "cpu_ms": round(span["cpu_ms"], 3),
+                    "gc_collections": span["gc_collections"],
+                    **span.get("attributes", {}),
+                }
+                for key in ("alloc_blocks", "alloc_bytes"):
+                    if key in span:
+                        args[key] = span[key]
+                events.append(
+                    {
+                        "name": span["name"],
+                        "cat": "engine",
+                        "ph": "X",
+                        "ts": span["start_ms"] * 1000.0,
+                        "dur": span["wall_ms"] * 1000.0,
+                        "pid": 1,
+                        "tid": tid,
+                        "args": args,
+                    }
+                )
+        for track, tid in tracks.items():
+            events.append(
+                {
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": 1,
+                    "tid": tid,
+                    "args": {"name": track},
+                }
+            )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def _profile(self, timestep: int | None) -> dict[str, Any]:
+        profile = self._profiles.get(timestep)
+        if profile is None:
+            profile = self._profiles[timestep] = {"spans": [], "phases": {}}
+        return profile
+
+    def _record(self, record: dict[str, Any]) -> None:
+        profile = self._profile(self._timestep)
+        profile["spans"].append(record)
+        phase = profile["phases"].setdefault(
+            record["name"], {"count": 0, "wall_ms": 0.0, "cpu_ms": 0.0}
+        )
+        phase["count"] += 1
+        phase["wall_ms"] += record["wall_ms"]
+        phase["cpu_ms"] += record["cpu_ms"]
@@ -0,0 +1,344 @@
+"""
+Process-wide adaptive rate limiting for LLM and tool traffic.
+
+Every provider call acquires a grant from a shared ``LLMRateLimiter`` keyed by
+model (or tool) name. Each key has token buckets for requests-per-minute and
+tokens-per-minute. Waiters are served strictly by ``LLMPriority`` (manager
+decisions before task execution before evaluation), then FIFO. A provider 429
+pauses the key for the advertised ``retry-after`` (or an exponential backoff)
+and halves its effective rate, which then recovers additively on success, so
+a burst of rate-limit errors does not turn into a retry storm.
+
+Nothing is limited until a limiter is installed with ``configure_rate_limiter``.
+"""
+
+import asyncio
+import heapq
+import itertools
+import re
+import time
+from contextlib import asynccontextmanager
+from enum import IntEnum
+from typing import Any, AsyncIterator
+
+from pydantic import BaseModel, Field
+
+from .logging import logger
+
+
+class LLMPriority(IntEnum):
+    """Scheduling class of a request; lower values are served first."""
+
+    MANAGER = 0
+    TASK_EXECUTION = 1
+    EVALUATION = 2
+
+
+class RateBudget(BaseModel):
+    """Per-key request and token budgets (None = unlimited)."""
+
+    requests_per_minute: float | None = Field(default=None, gt=0)
+    tokens_per_minute: float | None = Field(default=None, gt=0)
+
+
+class _Bucket:
+    """Token bucket holding at most one minute of budget."""
+
+    def __init__(self, per_minute: float) -> None:
+        self.capacity = per_minute
+        self.rate = per_minute / 60.0
+        self.level = per_minute
+        self.updated = time.monotonic()
+
+    def refill(self, now: float, factor: float) -> None:
+        self.level = min(
+            self.capacity * factor,
+            self.level + self.rate * factor * (now - self.updated),
+        )
+        self.updated = now
+
+    def wait_time(self, amount: float, factor: float) -> float:
+        # Requests larger than the bucket only need a full bucket
+        needed = min(amount, self.capacity * factor) - self.level
+        return 0.0 if needed <= 0 else needed / (self.rate * factor)
+
+
+class _KeyState:
+    def __init__(self, budget: RateBudget | None) -> None:
+        self.requests = (
+            _Bucket(budget.requests_per_minute)
+            if budget and budget.requests_per_minute
+            else None
+        )
+        self.tokens = (
+            _Bucket(budget.tokens_per_minute)
+            if budget and budget.tokens_per_minute
+            else None
+        )
+        self.waiters: list[tuple[int, int, int, asyncio.Future[None]]] = []
+        self.factor = 1.0
+        self.paused_until = 0.0
+        self.consecutive_limits = 0
+        self.timer: asyncio.TimerHandle | None = None
+        self.granted = 0
+        self.rate_limited = 0
+        self.wait_seconds = 0.0
+
+
+class RateLimitGrant:
+    """Handle for one admitted request; report actual token usage through it."""
+
+    def __init__(
+        self, limiter: "LLMRateLimiter | None", key: str, estimated_tokens: int
+    ) -> None:
+        self._limiter = limiter
+        self.key = key
+        self.estimated_tokens = estimated_tokens
+
+    def record_tokens(self, actual_tokens: int | None) -> None:
+        """Charge the difference between actual and estimated tokens."""
+        if self._limiter is None or actual_tokens is None:
+            return
+        self._limiter.adjust_tokens(self.key, actual_tokens - self.estimated_tokens)
+        self.estimated_tokens = actual_tokens
+
+
+class LLMRateLimiter:
+    """Priority token-bucket scheduler with adaptive backoff.
+
+    Args:
+        budgets (dict[str, RateBudget] | None): Budgets per model/tool key.
+        default_budget (RateBudget | None): Budget for keys without an entry.
+        min_rate_factor (float): Floor for the adaptive rate multiplier.
+        recovery_step (float): Additive rate recovery per successful request.
+        base_backoff_seconds (float): First pause after a 429 without retry-after.
+        max_backoff_seconds (float): Cap for pauses after repeated 429s.
+    """
+
+    def __init__(
+        self,
+        budgets: dict[str, RateBudget] | None = None,
+        default_budget: RateBudget | None = None,
+        min_rate_factor: float = 0.1,
+        recovery_step: float = 0.05,
+        base_backoff_seconds: float = 1.0,
+        max_backoff_seconds: float = 60.0,
+    ) -> None:
+        self.budgets = dict(budgets or {})
+        self.default_budget = default_budget
+        self.min_rate_factor = min_rate_factor
+        self.recovery_step = recovery_step
+        self.base_backoff_seconds = base_backoff_seconds
+        self.max_backoff_seconds = max_backoff_seconds
+        self._states: dict[str, _KeyState] = {}
+        self._sequence = itertools.count()
+
+    def _state(self, key: str) -> _KeyState:
+        state = self._states.get(key)
+        if state is None:
+            state = self._states[key] = _KeyState(
+                self.budgets.get(key, self.default_budget)
+            )
+        return state
+
+    async def acquire(
+        self,
+        key: str,
+        priority: LLMPriority = LLMPriority.TASK_EXECUTION,
+        tokens: int = 0,
+    ) -> None:
+        """Wait until ``key`` can admit one request of ``tokens`` tokens."""
+        state = self._state(key)
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        heapq.heappush(
+            state.waiters, (int(priority), next(self._sequence), tokens, future)
+        )
+        start = time.monotonic()
+        self._pump(key)
+        try:
+            await future
+        except asyncio.CancelledError:
+            # Let the next waiter through if we were at the head
+            self._pump(key)
+            raise
+        state.granted += 1
+        state.wait_seconds += time.monotonic() - start
+
+    def adjust_tokens(self, key: str, delta: int) -> None:
+        """Charge (or refund) ``delta`` tokens against the key's token bucket."""
+        state = self._state(key)
+        if state.tokens is not None and delta:
+            state.tokens.refill(time.monotonic(), state.factor)
+            state.tokens.level -= delta
+
+    def on_success(self, key: str) -> None:
+        state = self._state(key)
+        state.consecutive_limits = 0
+        state.factor = min(1.0, state.factor + self.recovery_step)
+
+    def on_rate_limited(self, key: str, retry_after: float | None = None) -> None:
+        """Pause ``key`` and shrink its effective rate after a provider 429."""
+        state = self._state(key)
+        state.rate_limited += 1
+        state.consecutive_limits += 1
+        state.factor = max(self.min_rate_factor, state.factor * 0.5)
+        delay = (
+            retry_after
+            if retry_after is not None
+            else min(
+                self.max_backoff_seconds,
+                self.base_backoff_seconds * 2 ** (state.consecutive_limits - 1),
+            )
+        )
+        state.paused_until = max(state.paused_until, time.monotonic() + delay)
+        logger.warning(
+            "Rate limited on %s; pausing %.1fs (rate factor %.2f)",
+            key,
+            delay,
+            state.factor,
+        )
+
+    def stats(self) -> dict[str, dict[str, float]]:
+        """Per-key grant, 429 and queueing counters."""
+        return {
+            key: {
+                "granted": state.granted,
+                "rate_limited": state.rate_limited,
+                "wait_seconds": state.wait_seconds,
+                "rate_factor": state.factor,
+                "queued": len(state.waiters),
+            }
+            for key, state in self._states.items()
+        }
+
+    def _pump(self, key: str) -> None:
+        """Admit waiters in priority order while budget allows; else re-arm a timer."""
+        state = self._states[key]
+        if state.timer is not None:
+            state.timer.cancel()
+            state.timer = None
+        while state.waiters:
+            _, _, tokens, future = state.waiters[0]
+            if future.done():
+                heapq.heappop(state.waiters)
+                continue
+            now = time.monotonic()
+            wait = state.paused_until - now
+            for bucket, amount in ((state.requests, 1), (state.tokens, tokens)):
+                if bucket is not None:
+                    bucket.refill(now, state.factor)
+                    wait = max(wait, bucket.wait_time(amount, state.factor))
+            if wait > 0:
+                state.timer = future.get_loop().call_later(wait, self._pump, key)
+                return
+            heapq.heappop(state.waiters)
+            if state.requests is not None:
+                state.requests.level -= 1
+            if state.tokens is not None:
+                state.tokens.level -= tokens
+            future.set_result(None)
+
+
+_rate_limiter: LLMRateLimiter | None = None
+
+
+def configure_rate_limiter(limiter: LLMRateLimiter | None) -> None:
+    """Install (or remove with None) the process-wide rate limiter."""
+    global _rate_limiter
+    _rate_limiter = limiter
+
+
+def get_rate_limiter() -> LLMRateLimiter | None:
+    return _rate_limiter
+
+
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|s|m|h)")
+_DURATION_UNITS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+
+def _parse_duration(value: str) -> float | None:
+    """Parse ``retry-after`` style values: ``"2"``, ``"1.5s"``, ``"6m0s"``, ``"20ms"``."""
+    value = value.strip()
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    parts = _DURATION_PART.findall(value)
+    if not parts:
+        return None
+    return sum(float(n) * _DURATION_UNITS[unit] for n, unit in parts)
+
+
+def _error_chain(error: BaseException) -> list[BaseException]:
+    # SDK wrappers (Instructor retries, agent runners) chain the provider error
+    chain: list[BaseException] = []
+    current: BaseException | None = error
+    while current is not None and current not in chain:
+        chain.append(current)
+        current = current.__cause__ or current.__context__
+    return chain
+
+
+def _rate_limit_cause(error: BaseException) -> BaseException | None:
+    for candidate in _error_chain(error):
+        status = getattr(candidate, "status_code", None) or getattr(
+            candidate, "status", None
+        )
+        if status == 429 or "RateLimit" in type(candidate).__name__:
+            return candidate
+    return None
+
+
+def is_rate_limit_error(error: BaseException) -> bool:
+    """Whether ``error`` is (or wraps) a provider 429 (OpenAI, LiteLLM, Anthropic, ...)."""
+    return _rate_limit_cause(error) is not None
+
+
+def retry_after_from_error(error: BaseException) -> float | None:
+    """Extract the advised wait from rate-limit response headers, if present."""
+    cause = _rate_limit_cause(error) or error
+    response: Any = getattr(cause, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+    if headers.get("retry-after-ms"):
+        try:
+            return float(headers["retry-after-ms"]) / 1000.0
+        except ValueError:
+            pass
+    waits = [
+        _parse_duration(headers[name])
+        for name in (
+            "retry-after",
+            "x-ratelimit-reset-requests",
+            "x-ratelimit-reset-tokens",
+        )
+        if headers.get(name)
+    ]
+    waits = [w for w in waits if w is not None]
+    return max(waits) if waits else None
+
+
+@asynccontextmanager
+async def rate_limited(
+    key: str,
+    priority: LLMPriority = LLMPriority.TASK_EXECUTION,
+    estimated_tokens: int = 0,
+) -> AsyncIterator[RateLimitGrant]:
+    """Admit one request for ``key`` through the installed limiter (if any).
+
+    Provider 429s raised inside the block feed the adaptive backoff.
+    """
+    limiter = _rate_limiter
+    if limiter is None:
+        yield RateLimitGrant(None, key, estimated_tokens)
+        return
+    await limiter.acquire(key, priority, estimated_tokens)
+    try:
+        yield RateLimitGrant(limiter, key, estimated_tokens)
+    except Exception as e:
+        if is_rate_limit_error(e):
+            limiter.on_rate_limited(key, retry_after_from_error(e))
+        raise
+    else:
+        limiter.on_success(key)
@@ -41,7 +41,7 @@ class CommunicationService:
 
     def __init__(self):
         """Initialize the communication service."""
-        self.graph = CommunicationGraph()
+        self._graph = CommunicationGraph()
         self._message_listeners: dict[
             str, list[Callable[[Message], Awaitable[None]] | Callable[[Message], None]]
         ] = {}
@@ -49,6 +49,12 @@ class CommunicationService:
         # Workflow control flags (per-instance)
         self._end_workflow_requested: bool = False
 
+    @property
+    def graph(self) -> CommunicationGraph:
+        """The message graph, with any pending restored messages added."""
+        self._graph.link_pending()
+        return self._graph
+
     def request_end_workflow(self, reason: str | None = None) -> None:
         """Signal that the current workflow should end as soon as possible."""
         self._end_workflow_requested = True
@@ -280,15 +286,7 @@ class CommunicationService:
         Returns:
             List of task-related messages sorted by timestamp
         """
-        task_messages = [
-            msg
-            for msg in self.graph.messages.values()
-            if msg.related_task_id == task_id
-        ]
-
-        # Sort by timestamp
-        task_messages.sort(key=lambda m: m.timestamp)
-        return task_messages
+        return self.graph.get_task_messages(task_id)
 
     def get_recent_broadcasts(
         self, since_minutes: int = 60, limit: int = 10
@@ -304,28 +302,21 @@ class CommunicationService:
             List of recent broadcast messages
         """
         since_time = datetime.now() - timedelta(minutes=since_minutes)
+        return self.graph.get_broadcasts(since=since_time, limit=limit or None)
 
-        broadcasts = [
-            msg
-            for msg in self.graph.messages.values()
-            if msg.is_broadcast() and msg.timestamp >= since_time
-        ]
-
-        # Sort by timestamp (newest first) and apply limit
-        broadcasts.sort(key=lambda m: m.timestamp, reverse=True)
-        return broadcasts[:limit] if limit else broadcasts
-
-    def get_all_messages(self) -> list[Message]:
+    def get_all_messages(self, limit: int | None = None) -> list[Message]:
         """
         Get all messages in the communication system.
 
         Useful for manager oversight and debugging/examples.
 
+        Args:
+            limit: Only return the most recent ``limit`` messages
+
         Returns:
             List of all messages sorted by timestamp (newest first)
         """
-        all_messages = list(self.graph.messages.values())
-        return sorted(all_messages, key=lambda m: m.timestamp, reverse=True)
+        return self.graph.get_recent_messages(limit=limit)
 
     def get_all_messages_grouped(
         self,
@@ -345,7 +336,7 @@ class CommunicationService:
             A list of `SenderMessagesView` when grouping by sender, or a list of
             `ThreadMessagesView` when grouping by thread.
         """
-        messages = list(self.graph.messages.values())
+        messages = self.graph.index.all.oldest_first()
         if not include_broadcasts:
             messages = [m for m in messages if not m.is_broadcast()]
 
@@ -453,9 +444,7 @@ class CommunicationService:
 
         # Recent activity summary
         recent_time = datetime.now() - timedelta(hours=1)
-        recent_messages = [
-            msg for msg in self.graph.messages.values() if msg.timestamp >= recent_time
-        ]
+        recent_messages = self.graph.get_recent_messages(since=recent_time)
 
         # Communication patterns
         agent_stats = {}
@@ -480,9 +469,7 @@ class CommunicationService:
                     if len(msg.content) > 100
                     else msg.content,
                 }
-                for msg in sorted(
-                    recent_messages, key=lambda m: m.timestamp, reverse=True
-                )[:20]
+                for msg in recent_messages[:20]
             ],
         }
 
@@ -702,10 +689,9 @@ class CommunicationService:
             type_counts[msg_type] = type_counts.get(msg_type, 0) + 1
 
         # Most active agents
-        agent_activity: dict[str, int] = {}
-        for msg in self.graph.messages.values():
-            sender = msg.sender_id
-            agent_activity[sender] = agent_activity.get(sender, 0) + 1
+        agent_activity: dict[str, int] = {
+            sender: len(outbox) for sender, outbox in self.graph.index.outbox.items()
+        }
 
         most_active = sorted(agent_activity.items(), key=lambda x: x[1], reverse=True)[
             :5
@@ -713,16 +699,15 @@ class CommunicationService:
 
         # Recent activity trend (messages per hour for last 24 hours)
         now = datetime.now()
+        all_messages = self.graph.index.all
         hourly_counts = []
         for i in range(24):
             hour_start = now - timedelta(hours=i + 1)
             hour_end = now - timedelta(hours=i)
-            hour_count = sum(
-                1
-                for msg in self.graph.messages.values()
-                if hour_start <= msg.timestamp < hour_end
+            hourly_counts.append(
+                all_messages.count_since(hour_start)
+                - all_messages.count_since(hour_end)
             )
-            hourly_counts.append(hour_count)
 
         return {
             "total_messages": total_messages,
@@ -13,6 +13,7 @@ from ..common.llm_interface import (
     generate_structured_response,
     LLMInferenceTruncationError,
 )
+from ..common.rate_limiter import LLMPriority
 
 
 class TaskDecompositionError(Exception):
@@ -64,6 +65,7 @@ async def decompose_task(
             response_type=SubtaskResponse,
             temperature=1,
             seed=seed,
+            priority=LLMPriority.MANAGER,
         )
 
         for subtask_data in response.subtasks:
@@ -104,6 +106,14 @@ def find_task_in_workflow(task_id: UUID, workflow_tasks: list[Task]) -> Task | N
     Returns:
         The task if found, None otherwise
     """
+    # Adopted tasks share their workflow's O(1) index; resolve through it directly
+    for task in workflow_tasks:
+        owner = task._owning_workflow()
+        if owner is not None:
+            found = owner.find_task_by_id(task_id)
+            if found is not None:
+                return found
+            break
     for task in workflow_tasks:
         found = task.find_task_by_id(task_id)
         if found:
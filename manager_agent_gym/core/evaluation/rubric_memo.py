@@ -0,0 +1,279 @@
+"""
+Fingerprint-based reuse of rubric results across timesteps.
+
+A rubric's result depends only on the workflow sections it reads (its
+``WorkflowScope``) and the supplemental context it requests
+(``required_context``). ``RubricFingerprinter`` digests those inputs, once per
+section per evaluation pass, and ``RubricMemo`` returns the previous result of
+a rubric whenever its fingerprint has not changed since it was last scored.
+
+Which rubrics are memoized:
+- LLM rubrics always; their prompt is built only from the scoped workflow
+  context, so an unchanged fingerprint means an identical prompt.
+- Function rubrics only when they declare a ``scope``, which acts as the
+  promise that the function reads nothing outside those sections.
+"""
+
+import hashlib
+from collections.abc import Callable, Iterable
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from ...schemas.core.tasks import Task
+from ...schemas.core.workflow import Workflow
+from ...schemas.evaluation.success_criteria import ValidationContext
+from ...schemas.evaluation.workflow_scope import WorkflowScope, WorkflowSection
+from ...schemas.preferences.evaluation import RubricResult
+from ...schemas.preferences.rubric import AdditionalContextItem, WorkflowRubric
+
+# Sections rendered by ``Workflow.pretty_print`` (the context of unscoped LLM rubrics)
+FULL_WORKFLOW_SECTIONS: frozenset[WorkflowSection] = frozenset(
+    {
+        WorkflowSection.WORKFLOW,
+        WorkflowSection.AGENTS,
+        WorkflowSection.TASKS,
+        WorkflowSection.RESOURCES,
+    }
+)
+
+
+def _digest(parts: Iterable[object]) -> str:
+    h = hashlib.sha256()
+    for part in parts:
+        h.update(part if isinstance(part, bytes) else str(part).encode("utf-8"))
+        h.update(b"\x1f")
+    return h.hexdigest()
+
+
+def _json(value: object) -> str:
+    return value.model_dump_json() if isinstance(value, BaseModel) else repr(value)
+
+
+def is_memoizable(rubric: WorkflowRubric) -> bool:
+    return rubric.llm_prompt is not None or rubric.scope is not None
+
+
+def rubric_identity(rubric: WorkflowRubric) -> str:
+    """Digest of the rubric definition itself (prompt, model, scoring, inputs)."""
+    fn = rubric.evaluator_function
+    return _digest(
+        (
+            rubric.name,
+            rubric.llm_prompt,
+            rubric.llm_model,
+            rubric.max_score,
+            f"{getattr(fn, '__module__', '')}.{getattr(fn, '__qualname__', fn)}"
+            if fn is not None
+            else None,
+            sorted(item.value for item in rubric.required_context),
+            rubric.scope.model_dump_json() if rubric.scope else None,
+        )
+    )
+
+
+class RubricFingerprinter:
+    """Per-pass fingerprints of the workflow state rubrics read.
+
+    Section digests are cached for the lifetime of the instance, so create one
+    per evaluation pass (the state is assumed not to change during the pass).
+    """
+
+    def __init__(self, workflow: Workflow) -> None:
+        self.workflow = workflow
+        self._cache: dict[tuple[object, ...], str] = {}
+
+    def fingerprint(self, rubric: WorkflowRubric, context: ValidationContext) -> str:
+        scope = rubric.scope
+        sections = scope.sections if scope is not None else FULL_WORKFLOW_SECTIONS
+        parts: list[str] = [rubric_identity(rubric)]
+        for section in sorted(sections, key=lambda s: s.value):
+            parts.append(self._section(section, scope, context))
+        # The scoped context renders resources/messages/preferences when no sections are set
+        if scope is not None and not scope.sections:
+            for section in (
+                WorkflowSection.RESOURCES,
+                WorkflowSection.MESSAGES,
+                WorkflowSection.PREFERENCES,
+            ):
+                parts.append(self._section(section, scope, context))
+        for item in sorted(rubric.required_context, key=lambda i: i.value):
+            parts.append(self._context_item(item, context))
+        if rubric.llm_prompt is None:
+            # Function rubrics may read the preferences handed to them in the context
+            parts.append(self._section(WorkflowSection.PREFERENCES, None, context))
+        return _digest(parts)
+
+    def _memo(self, key: tuple[object, ...], compute: Callable[[], str]) -> str:
+        value = self._cache.get(key)
+        if value is None:
+            value = self._cache[key] = compute()
+        return value
+
+    def _section(
+        self,
+        section: WorkflowSection,
+        scope: WorkflowScope | None,
+        context: ValidationContext,
+    ) -> str:
+        scope_key = scope.model_dump_json() if scope is not None else None
+        wf = self.workflow
+        match section:
+            case WorkflowSection.WORKFLOW:
+                return self._memo(
+                    (section,),
+                    lambda: _digest(
+                        (
+                            wf.name,
+                            wf.workflow_goal,
+                            wf.total_budget,
+                            wf.total_expected_hours,
+                            wf.total_cost,
+                            len(wf.agents),
+                            len(wf.resources),
+                            len(wf.tasks),
+                        )
+                    ),
+                )
+            case WorkflowSection.AGENTS:
+                return self._memo((section,), lambda: _digest(sorted(wf.agents)))
+            case WorkflowSection.TASKS:
+                task_ids = scope.task_ids if scope is not None else None
+                return self._memo(
+                    (section, tuple(sorted(map(str, task_ids))) if task_ids else None),
+                    lambda: self._tasks_digest(task_ids),
+                )
+            case WorkflowSection.RESOURCES:
+                return self._memo(
+                    (section, scope_key),
+                    lambda: _digest(
+                        r.model_dump_json()
+                        for r in wf.resources.values()
+                        if scope is None
+                        or (
+                            (not scope.resource_ids or r.id in scope.resource_ids)
+                            and (
+                                not scope.resource_types
+                                or r.content_type in scope.resource_types
+                            )
+                        )
+                    ),
+                )
+            case WorkflowSection.MESSAGES:
+                return self._memo(
+                    (section, scope_key),
+                    lambda: _digest(
+                        m.message_id
+                        for m in wf.messages
+                        if scope is None
+                        or (
+                            (not scope.since or m.timestamp >= scope.since)
+                            and (
+                                not scope.message_types
+                                or m.message_type in scope.message_types
+                            )
+                            and (
+                                not scope.related_task_ids
+                                or m.related_task_id in scope.related_task_ids
+                            )
+                        )
+                    ),
+                )
+            case WorkflowSection.PREFERENCES:
+                prefs = context.current_preferences
+                return self._memo(
+                    (section,),
+                    lambda: _digest(
+                        (p.name, p.weight) for p in (prefs.preferences if prefs else [])
+                    ),
+                )
+        return ""
+
+    def _tasks_digest(self, task_ids: set[UUID] | None) -> str:
+        seen: set[UUID] = set()
+        parts: list[str] = []
+
+        def visit(task: Task) -> None:
+            if task.id in seen:
+                return
+            seen.add(task.id)
+            parts.append(task.model_dump_json(exclude={"subtasks"}))
+            parts.append(",".join(str(child.id) for child in task.subtasks))
+            for child in task.subtasks:
+                visit(child)
+
+        for task in self.workflow.tasks.values():
+            if task_ids and task.id not in task_ids:
+                continue
+            visit(task)
+        return _digest(parts)
+
+    def _context_item(
+        self, item: AdditionalContextItem, context: ValidationContext
+    ) -> str:
+        match item:
+            case AdditionalContextItem.MANAGER_ACTIONS:
+                value: object = context.manager_actions
+            case AdditionalContextItem.COMMS_BY_SENDER:
+                value = context.communications_by_sender
+            case AdditionalContextItem.AGENT_PUBLIC_STATES:
+                value = context.agent_public_states
+            case AdditionalContextItem.AGENT_TOOL_USAGE_BY_TASK:
+                value = context.agent_tool_usage_by_task
+            case _:
+                # Placeholder items are not populated yet
+                return item.value
+        return self._memo(
+            (item,),
+            lambda: _digest(
+                _json(v)
+                for v in (
+                    value.items()
+                    if isinstance(value, dict)
+                    else (value if isinstance(value, list) else [value])
+                )
+            ),
+        )
+
+
+class RubricMemo:
+    """Per-run table of the last result and fingerprint of each rubric.
+
+    Attributes:
+        hits (int): Rubric evaluations answered from the table in the current pass.
+        misses (int): Rubric evaluations that had to run in the current pass.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[tuple[str, str], tuple[str, RubricResult]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def start_pass(self) -> None:
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, owner: str, rubric_key: str, fingerprint: str) -> RubricResult | None:
+        entry = self._entries.get((owner, rubric_key))
+        if entry is not None and entry[0] == fingerprint:
+            self.hits += 1
+            return entry[1].model_copy()
+        self.misses += 1
+        return None
+
+    def put(
+        self, owner: str, rubric_key: str, fingerprint: str, result: RubricResult
+    ) -> None:
+        # Failed evaluations are retried on the next pass instead of being reused
+        if result.error is None:
+            self._entries[(owner, rubric_key)] = (fingerprint, result)
+        else:
+            self._entries.pop((owner, rubric_key), None)
+
+    def stats(self) -> dict[str, float]:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
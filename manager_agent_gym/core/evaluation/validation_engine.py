@@ -21,6 +21,12 @@ from ...schemas.evaluation.success_criteria import (
 from ...schemas.core.workflow import Workflow
 from ...schemas.preferences.preference import PreferenceWeights
 from ..evaluation.validation_rules import WorkflowValidationRule
+from ..evaluation.rubric_memo import (
+    RubricFingerprinter,
+    RubricMemo,
+    is_memoizable,
+    rubric_identity,
+)
 from ..common.logging import logger
 from uuid import UUID
 from ...schemas.preferences.evaluation import (
@@ -66,11 +72,15 @@ class ValidationEngine:
         reward_aggregator (BaseRewardAggregator | None): Aggregator mapping evaluation
             results to a reward value (scalar or structured). Defaults to utility sum.
         reward_projection (RewardProjection | None): Optional projector to scalar reward.
+        memoize_rubrics (bool): Reuse a rubric's previous result while the workflow
+            state it reads is unchanged (see ``rubric_memo``).
 
     Attributes:
         evaluation_results (list[EvaluationResult]): History of evaluation outputs.
         reward_vector (list[float]): Scalar reward per timestep (zeros where not evaluated).
         most_recent_reward (float): Last projected reward value.
+        rubric_memo_stats (dict[int, dict[str, float]]): Memo hits, misses and hit
+            rate per evaluated timestep (also stored in ``EvaluationResult.metrics``).
     """
 
     def __init__(
@@ -81,6 +91,7 @@ class ValidationEngine:
         selected_timesteps: list[int] | None = None,
         reward_aggregator: BaseRewardAggregator[object] | None = None,
         reward_projection: RewardProjection[object] | None = None,
+        memoize_rubrics: bool = True,
     ) -> None:
         self._rubric_semaphore: asyncio.Semaphore = asyncio.Semaphore(
             max(1, int(max_concurrent_rubrics))
@@ -103,6 +114,9 @@ class ValidationEngine:
         self.reward_vector: list[float] = []
         # Seed for LLM-based rubric evaluation
         self.seed: int = seed
+        # Per-run memo of rubric results keyed by state fingerprint
+        self._rubric_memo: RubricMemo | None = RubricMemo() if memoize_rubrics else None
+        self.rubric_memo_stats: dict[int, dict[str, float]] = {}
 
     async def evaluate_timestep(
         self,
@@ -163,34 +177,50 @@ class ValidationEngine:
         # 3) Run all rubrics concurrently using a single TaskGroup and tqdm
         rubric_results_by_owner: dict[str, list[RubricResult]] = {}
         normalized_by_owner: dict[str, list[float]] = {}
+        memo = self._rubric_memo
+        fingerprinter = RubricFingerprinter(workflow) if memo is not None else None
+        if memo is not None:
+            memo.start_pass()
 
         async def _eval_one(owner: str, r: WorkflowRubric) -> None:
-            async with self._rubric_semaphore:
-                # Build minimal, per-rubric context on demand
-                ctx = self._build_context_for_rubric(
-                    workflow=workflow,
-                    timestep=timestep,
-                    preferences=preferences,
-                    required=r.required_context,
-                    communications=communications,
-                    manager_actions=manager_actions,
+            # Build minimal, per-rubric context on demand
+            ctx = self._build_context_for_rubric(
+                workflow=workflow,
+                timestep=timestep,
+                preferences=preferences,
+                required=r.required_context,
+                communications=communications,
+                manager_actions=manager_actions,
+            )
+            rr: RubricResult | None = None
+            memo_key: tuple[str, str] | None = None
+            if memo is not None and fingerprinter is not None and is_memoizable(r):
+                memo_key = (
+                    rubric_identity(r),
+                    fingerprinter.fingerprint(r, ctx),
                 )
-                es, error_message, raw_output = await self._evaluate_single_rubric(
-                    workflow, r, ctx
+                rr = memo.get(owner, *memo_key)
+            if rr is None:
+                async with self._rubric_semaphore:
+                    (
+                        es,
+                        error_message,
+                        raw_output,
+                    ) = await self._evaluate_single_rubric(workflow, r, ctx)
+                clamped = max(0.0, min(r.max_score, float(es.score)))
+                rr = RubricResult(
+                    name=r.name,
+                    score=clamped,
+                    max_score=r.max_score,
+                    normalized_score=clamped / r.max_score if r.max_score > 0 else 0.0,
+                    message=es.reasoning,
+                    error=error_message,
+                    raw_output=raw_output,
                 )
-            clamped = max(0.0, min(r.max_score, float(es.score)))
-            normalized = clamped / r.max_score if r.max_score > 0 else 0.0
-            rr = RubricResult(
-                name=r.name,
-                score=clamped,
-                max_score=r.max_score,
-                normalized_score=normalized,
-                message=es.reasoning,
-                error=error_message,
-                raw_output=raw_output,
-            )
+                if memo is not None and memo_key is not None:
+                    memo.put(owner, *memo_key, rr)
             rubric_results_by_owner.setdefault(owner, []).append(rr)
-            normalized_by_owner.setdefault(owner, []).append(normalized)
+            normalized_by_owner.setdefault(owner, []).append(rr.normalized_score)
             pbar.update(1)
 
         pbar = _make_pbar(
@@ -275,6 +305,18 @@ class ValidationEngine:
             evaluation_results=evaluation_results,
             weighted_preference_total=preference_sum_weighted,
         )
+        if memo is not None:
+            memo_stats = memo.stats()
+            result.metrics["rubric_memo"] = memo_stats
+            if cadence is not None:
+                self.rubric_memo_stats[timestep] = memo_stats
+            logger.info(
+                "Rubric memo at timestep %s: %s hits, %s misses (hit rate %.0f%%)",
+                timestep,
+                memo_stats["hits"],
+                memo_stats["misses"],
+                100 * memo_stats["hit_rate"],
+            )
         # Only append to history when a cadence is specified (on-demand calls with
         # cadence=None should not mutate history as some tests expect)
         if cadence is not None:
@@ -363,6 +405,7 @@ class ValidationEngine:
                     description=rubric.description or "",
                     frequency=ValidationFrequency.MANUAL,
                     seed=self.seed,
+                    scope=rubric.scope,
                 )
                 vr = await temp_rule.validate(context)
                 reasoning = (
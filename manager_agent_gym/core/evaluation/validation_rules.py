@@ -10,6 +10,7 @@ from ..common.llm_interface import (
     generate_structured_response,
     LLMInferenceTruncationError,
 )
+from ..common.rate_limiter import LLMPriority
 from ...schemas.common.llm_responses import (
     LLMScoredResponse,
     LLMScoreLevel,
@@ -215,6 +216,7 @@ OUTPUT REQUIREMENTS (JSON only, no prose outside JSON):
                 model=self.model,
                 # temperature=0.1,
                 seed=self.seed,
+                priority=LLMPriority.EVALUATION,
             )
 
             # Interpret union score (bool | level | numeric)
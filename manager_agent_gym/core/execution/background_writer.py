@@ -0,0 +1,152 @@
+"""
+Off-loop file writing for simulation outputs.
+
+``BackgroundWriter`` runs write jobs on a dedicated thread so JSON encoding and
+disk I/O stay out of the event loop. Jobs run strictly in submission order,
+which keeps writes to any one file ordered. The queue is bounded: when the
+disk falls behind, submitters wait for a slot instead of letting pending
+payloads accumulate in memory. Code running on the event loop uses
+``submit_async``, which waits on a worker thread so the loop keeps running;
+``submit`` blocks the calling thread and is meant for callers off the loop.
+
+``orjson`` is used for encoding when installed, otherwise the stdlib encoder.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import queue
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+from ..common.logging import logger
+
+try:
+    import orjson
+except ImportError:  # optional speed-up
+    orjson = None  # type: ignore[assignment]
+
+
+def encode_json(payload: Any, indent: bool = True) -> bytes:
+    """Encode ``payload`` as UTF-8 JSON, falling back to ``str`` for unknown types."""
+    if orjson is not None:
+        options = orjson.OPT_NON_STR_KEYS
+        if indent:
+            options |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(payload, default=str, option=options)
+        except TypeError:
+            # e.g. integers beyond 64 bits; the stdlib encoder handles them
+            pass
+    return json.dumps(payload, indent=2 if indent else None, default=str).encode()
+
+
+def write_json_file(path: Path, payload: Any, indent: bool = True) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(encode_json(payload, indent))
+
+
+def _json_job(path: Path, payload: Any, indent: bool) -> Callable[[], None]:
+    def job() -> None:
+        write_json_file(path, payload, indent)
+
+    return job
+
+
+_STOP = object()
+
+
+class BackgroundWriter:
+    """Single-thread, bounded-queue executor for output writes.
+
+    Args:
+        max_pending: Jobs that may be queued before submitters have to wait.
+
+    Attributes:
+        jobs_completed (int): Jobs run so far (including failed ones).
+        jobs_failed (int): Jobs that raised; failures are logged, not re-raised.
+        blocked_seconds (float): Time submitters spent waiting on a full queue.
+    """
+
+    def __init__(self, max_pending: int = 64) -> None:
+        self._queue: queue.Queue[Any] = queue.Queue(maxsize=max(1, max_pending))
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+        self.jobs_completed = 0
+        self.jobs_failed = 0
+        self.blocked_seconds = 0.0
+
+    def submit(self, job: Callable[[], None]) -> None:
+        """Queue ``job``; blocks while ``max_pending`` jobs are already waiting."""
+        self._ensure_thread()
+        try:
+            self._queue.put_nowait(job)
+        except queue.Full:
+            start = time.perf_counter()
+            self._queue.put(job)
+            self.blocked_seconds += time.perf_counter() - start
+
+    async def submit_async(self, job: Callable[[], None]) -> None:
+        """Queue ``job`` from the event loop; a full queue suspends only the caller."""
+        self._ensure_thread()
+        try:
+            self._queue.put_nowait(job)
+        except queue.Full:
+            start = time.perf_counter()
+            await asyncio.to_thread(self._queue.put, job)
+            self.blocked_seconds += time.perf_counter() - start
+
+    def write_json(self, path: Path, payload: Any, indent: bool = True) -> None:
+        """Queue writing ``payload`` to ``path``; the payload must not be mutated afterwards."""
+        self.submit(_json_job(path, payload, indent))
+
+    async def write_json_async(
+        self, path: Path, payload: Any, indent: bool = True
+    ) -> None:
+        """Event-loop variant of ``write_json``."""
+        await self.submit_async(_json_job(path, payload, indent))
+
+    def flush(self) -> None:
+        """Block until every job submitted so far has run."""
+        if self._thread is None:
+            return
+        done = threading.Event()
+        self.submit(done)  # type: ignore[arg-type]
+        done.wait()
+
+    def close(self) -> None:
+        """Run outstanding jobs and stop the thread; a later ``submit`` restarts it."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._queue.put(_STOP)
+            thread.join()
+
+    def _ensure_thread(self) -> None:
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="output-writer", daemon=True
+                )
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            job = self._queue.get()
+            if job is _STOP:
+                return
+            if isinstance(job, threading.Event):
+                job.set()
+                continue
+            try:
+                job()
+            except Exception:
+                self.jobs_failed += 1
+                logger.error("background output write failed", exc_info=True)
+            self.jobs_completed += 1
@@ -6,21 +6,27 @@ agent can observe state and take actions between task executions.
 """
 
 import asyncio
-import json
 import traceback
 from datetime import datetime
 from typing import cast
-from typing import Awaitable, Callable, Sequence
+from typing import Any, Awaitable, Callable, Sequence
 from uuid import UUID
 
 from ...schemas.core.communication import SenderMessagesView
 from ...schemas.core.communication import Message, MessageType
 from .state_restorer import WorkflowStateRestorer
 
+from ..common.content_store import ContentStore
+from ..common.llm_interface import close_llm_clients
+from ..common.profiling import PhaseProfiler
 from ..common.logging import logger
 from asyncio import TaskGroup
 from ..workflow_agents.interface import StakeholderBase
-from ...schemas.config import OutputConfig
+from ...schemas.config import (
+    EventDrivenExecutionConfig,
+    OutputConfig,
+    TimestepAdvancePolicy,
+)
 from .output_writer import WorkflowSerialiser
 from ...schemas.core.base import TaskStatus
 from ...schemas.core.resources import Resource
@@ -77,6 +83,13 @@ class WorkflowExecutionEngine:
         max_concurrent_rubrics (int): Concurrency limit for rubric evaluation.
         reward_aggregator (BaseRewardAggregator | None): Aggregator used by the evaluator.
         reward_projection (RewardProjection | None): Optional projection to scalar reward.
+        event_driven_execution (EventDrivenExecutionConfig | None): Opt-in event-driven
+            task completion; ``None`` keeps the per-timestep completion barrier.
+        memoize_rubrics (bool): Reuse rubric results while the workflow state a
+            rubric reads is unchanged.
+        profiler (PhaseProfiler | None): Span instrumentation of each timestep's
+            phases; when enabled, each result carries ``metadata["profile"]`` and
+            a Chrome trace is saved with the run outputs. Disabled by default.
 
     Attributes:
         current_timestep (int): Zero-based timestep index.
@@ -121,6 +134,9 @@ class WorkflowExecutionEngine:
         max_concurrent_rubrics: int = 100,
         reward_aggregator: BaseRewardAggregator[object] | None = None,
         reward_projection: RewardProjection[object] | None = None,
+        event_driven_execution: EventDrivenExecutionConfig | None = None,
+        memoize_rubrics: bool = True,
+        profiler: PhaseProfiler | None = None,
     ):
         self.workflow = workflow
         self.agent_registry = agent_registry
@@ -132,6 +148,14 @@ class WorkflowExecutionEngine:
         self.seed: int = seed
 
         self.output_config = output_config or OutputConfig()
+        # Optional disk spill keeping large resource content out of memory
+        self.content_store: ContentStore | None = None
+        threshold = self.output_config.resource_spill_threshold_bytes
+        if threshold is not None and self.output_config.resource_blob_dir is not None:
+            self.content_store = ContentStore(
+                self.output_config.resource_blob_dir, spill_threshold_bytes=threshold
+            )
+            self.workflow.set_content_store(self.content_store)
         self.enable_timestep_logging = enable_timestep_logging
         self.enable_final_metrics_logging = enable_final_metrics_logging
         self._timestep_end_callbacks: list[
@@ -147,9 +171,14 @@ class WorkflowExecutionEngine:
         self.running_tasks: dict[UUID, asyncio.Task] = {}
         self.completed_task_ids: set[UUID] = set()
         self.failed_task_ids: set[UUID] = set()
+        # Reverse map so finished asyncio tasks resolve to task IDs in O(1)
+        self._running_task_ids: dict[asyncio.Task, UUID] = {}
+        self.event_driven_execution = event_driven_execution
+        self._completion_queue: asyncio.Queue[asyncio.Task] = asyncio.Queue()
 
         self.max_timesteps = max_timesteps
         self._task_group: TaskGroup | None = None
+        self.profiler = profiler or PhaseProfiler(enabled=False)
 
         self.validation_engine = ValidationEngine(
             max_concurrent_rubrics=max_concurrent_rubrics,
@@ -157,6 +186,7 @@ class WorkflowExecutionEngine:
             reward_aggregator=reward_aggregator,
             reward_projection=reward_projection,
             seed=self.seed,
+            memoize_rubrics=memoize_rubrics,
         )
 
         self.communication_service = (
@@ -193,7 +223,9 @@ class WorkflowExecutionEngine:
         # Evaluation cadence configuration (default: BOTH) using rubric enum
         self.evaluation_cadence: RunCondition = RunCondition.ON_COMPLETION
 
-    def restore_from_snapshot(self, snapshot_dir: str, timestep: int) -> None:
+    def restore_from_snapshot(
+        self, snapshot_dir: str, timestep: int, lazy: bool = False
+    ) -> None:
         """
         Restore engine state from a previous simulation snapshot.
 
@@ -204,9 +236,12 @@ class WorkflowExecutionEngine:
         Args:
             snapshot_dir: Path to simulation run directory containing timestep_data/
             timestep: Target timestep to restore from
+            lazy: Restore through the snapshot log's span index, parsing only
+                what each restore step needs and trusting snapshot contents
+                (see ``WorkflowStateRestorer``)
         """
         # Create and configure state restorer
-        restorer = WorkflowStateRestorer(snapshot_dir, timestep)
+        restorer = WorkflowStateRestorer(snapshot_dir, timestep, lazy=lazy)
         restorer.load_snapshot_data()
 
         logger.info("Restoring workflow state from timestep %s", timestep)
@@ -244,10 +279,6 @@ class WorkflowExecutionEngine:
                     )
                 task.execution_notes = task_data.get("execution_notes", [])
 
-        # Synchronize embedded subtasks with the updated registry to fix status inconsistencies
-        for task in self.workflow.tasks.values():
-            task.sync_embedded_tasks_with_registry(self.workflow.tasks)
-
         # Update workflow-level state
         self.workflow.total_cost = workflow_snapshot.get("total_cost", 0.0)
         if workflow_snapshot.get("started_at"):
@@ -336,7 +367,8 @@ class WorkflowExecutionEngine:
                 self.timestep_results.append(timestep_result)
 
                 # Save workflow state after each timestep
-                await self._save_workflow_state(timestep_result)
+                with self.profiler.span("save_outputs"):
+                    await self._save_workflow_state(timestep_result)
 
                 # Check for completion
                 if self.workflow.is_complete():
@@ -363,6 +395,7 @@ class WorkflowExecutionEngine:
 
         # Exiting TaskGroup ensures all scheduled validations completed
         self._task_group = None
+        self.manager_agent.cancel_prefetch()
 
         # Run final evaluation set
         communications_sender = (
@@ -388,10 +421,29 @@ class WorkflowExecutionEngine:
         )
 
         if save_outputs:
-            self.serialise_workflow_states_and_metrics()
+            # Serialising and queueing the final outputs may wait on the writer;
+            # do it on a worker thread so other runs on this loop keep going
+            await asyncio.to_thread(self.serialise_workflow_states_and_metrics)
+            if self.profiler.enabled:
+                await self.output_writer.write_json_async(
+                    self.output_config.get_profile_trace_path(),
+                    self.profiler.chrome_trace(),
+                )
+        # Outputs are written in the background; make them durable before returning
+        await asyncio.to_thread(self.output_writer.close)
 
         return self.timestep_results
 
+    async def shutdown(self) -> None:
+        """Release pooled resources held on the current event loop.
+
+        Closes the shared LLM HTTP clients. They are shared with any other
+        engine on the same loop, so call this once all of them have finished.
+        Also finishes pending output writes if timesteps were driven manually.
+        """
+        await asyncio.to_thread(self.output_writer.close)
+        await close_llm_clients()
+
     async def execute_timestep(self) -> ExecutionResult:
         """
         Execute a single timestep of the workflow.
@@ -402,32 +454,52 @@ class WorkflowExecutionEngine:
         if not self.manager_agent:
             raise ValueError("Manager agent not configured")
 
-        start_time = datetime.now()
         timestep = self.current_timestep
+        self.profiler.start_timestep(timestep)
+        with self.profiler.span("timestep"):
+            result = await self._run_timestep(timestep)
+        if self.profiler.enabled:
+            result.metadata["profile"] = self.profiler.timestep_profile(timestep)
+        return result
+
+    async def _run_timestep(self, timestep: int) -> ExecutionResult:
+        start_time = datetime.now()
 
-        agent_coordination_changes = self._check_and_apply_agent_changes()
+        with self.profiler.span("agent_changes"):
+            agent_coordination_changes = self._check_and_apply_agent_changes()
 
         manager_action = None
         if self.manager_agent:
             self.execution_state = ExecutionState.WAITING_FOR_MANAGER
             # Unified RL-style step: agent constructs observation internally
             done_flag = self._is_terminal_state() or self.workflow.is_complete()
-            manager_action = await self.manager_agent.step(
-                workflow=self.workflow,
-                execution_state=self.execution_state,
-                current_timestep=self.current_timestep,
-                running_tasks=self.running_tasks,
-                completed_task_ids=self.completed_task_ids,
-                failed_task_ids=self.failed_task_ids,
-                communication_service=self.communication_service,
-                previous_reward=self.validation_engine.most_recent_reward,
-                done=done_flag,
-                stakeholder_profile=self.stakeholder_agent.public_profile,
-            )
-            try:
-                action_result = await manager_action.execute(
-                    self.workflow, self.communication_service
+            with self.profiler.span("manager_step"):
+                manager_action = await self.manager_agent.step(
+                    workflow=self.workflow,
+                    execution_state=self.execution_state,
+                    current_timestep=self.current_timestep,
+                    running_tasks=self.running_tasks,
+                    completed_task_ids=self.completed_task_ids,
+                    failed_task_ids=self.failed_task_ids,
+                    communication_service=self.communication_service,
+                    previous_reward=self.validation_engine.most_recent_reward,
+                    done=done_flag,
+                    stakeholder_profile=self.stakeholder_agent.public_profile,
                 )
+                # Pin deferred observation fields before the action changes the state
+                if self.manager_agent.last_observation is not None:
+                    self.manager_agent.last_observation.materialize()
+            try:
+                with self.profiler.span(
+                    "manager_action",
+                    # Custom actions need not declare an action_type
+                    action_type=getattr(
+                        manager_action, "action_type", type(manager_action).__name__
+                    ),
+                ):
+                    action_result = await manager_action.execute(
+                        self.workflow, self.communication_service
+                    )
             except Exception:
                 logger.error("failed to execute manager action", exc_info=True)
                 action_result = None
@@ -440,10 +512,33 @@ class WorkflowExecutionEngine:
             )
 
         self.execution_state = ExecutionState.EXECUTING_TASKS
-        tasks_started, tasks_completed, tasks_failed = await self._execute_ready_tasks()
+        with self.profiler.span("agent_tasks"):
+            (
+                tasks_started,
+                tasks_completed,
+                tasks_failed,
+            ) = await self._execute_ready_tasks()
 
         self._update_workflow_state(tasks_completed, tasks_failed)
 
+        # The next manager step observes this state unless evaluation or the
+        # stakeholder changes it, so the manager may start deciding it now
+        if (
+            self.manager_agent
+            and timestep + 1 < self.max_timesteps
+            and not (self._is_terminal_state() or self.workflow.is_complete())
+        ):
+            await self.manager_agent.prefetch_next_step(
+                workflow=self.workflow,
+                execution_state=ExecutionState.WAITING_FOR_MANAGER,
+                current_timestep=timestep + 1,
+                running_tasks=self.running_tasks,
+                completed_task_ids=self.completed_task_ids,
+                failed_task_ids=self.failed_task_ids,
+                communication_service=self.communication_service,
+                stakeholder_profile=self.stakeholder_agent.public_profile,
+            )
+
         # Evaluate preferences for this timestep if configured
         did_eval_this_step = False
         if self.evaluation_cadence in (
@@ -460,17 +555,18 @@ class WorkflowExecutionEngine:
                 list[SenderMessagesView], communications_sender
             )
             manager_actions = self.manager_agent.get_action_buffer()
-            await self.validation_engine.evaluate_timestep(
-                workflow=self.workflow,
-                timestep=self.current_timestep,
-                preferences=self._get_preferences_from_stakeholder_agent(
-                    self.current_timestep
-                ),
-                workflow_evaluators=self.evaluations,
-                cadence=RunCondition.EACH_TIMESTEP,
-                communications=comms_by_sender,
-                manager_actions=manager_actions,
-            )
+            with self.profiler.span("evaluation"):
+                await self.validation_engine.evaluate_timestep(
+                    workflow=self.workflow,
+                    timestep=self.current_timestep,
+                    preferences=self._get_preferences_from_stakeholder_agent(
+                        self.current_timestep
+                    ),
+                    workflow_evaluators=self.evaluations,
+                    cadence=RunCondition.EACH_TIMESTEP,
+                    communications=comms_by_sender,
+                    manager_actions=manager_actions,
+                )
             did_eval_this_step = True
 
         # If cadence is not EACH_TIMESTEP/BOTH, still evaluate on selected timesteps only
@@ -486,17 +582,18 @@ class WorkflowExecutionEngine:
             )
             comms_by_sender = cast(list[SenderMessagesView], communications_sender)
             manager_actions = self.manager_agent.get_action_buffer()
-            await self.validation_engine.evaluate_timestep(
-                workflow=self.workflow,
-                timestep=self.current_timestep,
-                preferences=self._get_preferences_from_stakeholder_agent(
-                    self.current_timestep
-                ),
-                workflow_evaluators=self.evaluations,
-                cadence=RunCondition.EACH_TIMESTEP,
-                communications=comms_by_sender,
-                manager_actions=manager_actions,
-            )
+            with self.profiler.span("evaluation"):
+                await self.validation_engine.evaluate_timestep(
+                    workflow=self.workflow,
+                    timestep=self.current_timestep,
+                    preferences=self._get_preferences_from_stakeholder_agent(
+                        self.current_timestep
+                    ),
+                    workflow_evaluators=self.evaluations,
+                    cadence=RunCondition.EACH_TIMESTEP,
+                    communications=comms_by_sender,
+                    manager_actions=manager_actions,
+                )
             did_eval_this_step = True
         # Ensure reward vector has an entry for this timestep even if no evals were run
         if not did_eval_this_step:
@@ -505,7 +602,8 @@ class WorkflowExecutionEngine:
                 rv.extend([0.0] * (self.current_timestep + 1 - len(rv)))
 
         # Run stakeholder policy step
-        await self.stakeholder_agent.policy_step(self.current_timestep)
+        with self.profiler.span("stakeholder_policy"):
+            await self.stakeholder_agent.policy_step(self.current_timestep)
 
         execution_time = (datetime.now() - start_time).total_seconds()
 
@@ -525,19 +623,25 @@ class WorkflowExecutionEngine:
             ),
         }
 
-        # Build observation for outputs/callbacks
-        # Note: this is a duplicicative secdondary observation, which is not used by the manager agent directly
-        # TODO: move this around so we expose the last observ
-        observation = await self.manager_agent.create_observation(
-            workflow=self.workflow,
-            execution_state=self.execution_state,
-            current_timestep=self.current_timestep,
-            running_tasks=self.running_tasks,
-            completed_task_ids=self.completed_task_ids,
-            failed_task_ids=self.failed_task_ids,
-            communication_service=self.communication_service,
-            stakeholder_profile=self.stakeholder_agent.public_profile,
-        )
+        # Outputs/callbacks get the observation the manager acted on; one is
+        # only built here if the manager's step did not produce it
+        with self.profiler.span("observation"):
+            observation = self.manager_agent.last_observation
+            if (
+                observation is None
+                or observation.timestep != timestep
+                or observation.workflow_id != self.workflow.id
+            ):
+                observation = await self.manager_agent.create_observation(
+                    workflow=self.workflow,
+                    execution_state=self.execution_state,
+                    current_timestep=self.current_timestep,
+                    running_tasks=self.running_tasks,
+                    completed_task_ids=self.completed_task_ids,
+                    failed_task_ids=self.failed_task_ids,
+                    communication_service=self.communication_service,
+                    stakeholder_profile=self.stakeholder_agent.public_profile,
+                )
 
         # Calculate total simulated time from completed tasks in this timestep
         total_simulated_hours = 0.0
@@ -556,13 +660,12 @@ class WorkflowExecutionEngine:
             completed_tasks_simulated_hours=total_simulated_hours,
             manager_action=manager_action,
             manager_observation=observation,
-            workflow_snapshot={
-                **self.workflow.model_dump(
-                    mode="json", exclude={"agents", "success_criteria"}
-                ),
-                "agents": self.output_writer._serialize_agents_for_snapshot(),
-                "success_criteria": [],
-            },
+            # Delta snapshots are written to the snapshot log by the output writer
+            workflow_snapshot=(
+                None
+                if self.output_writer.writes_delta_snapshots
+                else self._build_workflow_snapshot()
+            ),
             preference_change_event=self.recent_preference_change,
             agent_coordination_changes=agent_coordination_changes,
             stakeholder_preference_state=safe_stakeholder_pref_state,
@@ -590,7 +693,11 @@ class WorkflowExecutionEngine:
             )
             for cb in self._timestep_end_callbacks:
                 try:
-                    await cb(ctx)
+                    with self.profiler.span(
+                        "timestep_end_callback",
+                        callback=getattr(cb, "__name__", repr(cb)),
+                    ):
+                        await cb(ctx)
                 except Exception:
                     logger.error(
                         f"timestep_end callback failed: {traceback.format_exc()}"
@@ -599,6 +706,16 @@ class WorkflowExecutionEngine:
         self.current_timestep += 1
         return result
 
+    def _build_workflow_snapshot(self) -> dict:
+        with self.profiler.span("workflow_snapshot"):
+            return {
+                **self.workflow.model_dump(
+                    mode="json", exclude={"agents", "success_criteria"}
+                ),
+                "agents": self.output_writer._serialize_agents_for_snapshot(),
+                "success_criteria": [],
+            }
+
     def _inject_communication_service(self) -> None:
         """Inject communication service into all agents in the workflow."""
         for agent in self.workflow.agents.values():
@@ -612,113 +729,180 @@ class WorkflowExecutionEngine:
         """
         Execute all tasks that are ready to start.
 
+        By default every running task is awaited before new tasks start. With
+        ``event_driven_execution`` configured, completions are consumed from a
+        queue until the advance policy is met, and downstream tasks start as soon
+        as their dependencies complete.
+
         Returns:
             Tuple of (tasks_started, tasks_completed, tasks_failed)
         """
-        tasks_started = []
-        tasks_completed = []
-        tasks_failed = []
+        tasks_started: list[UUID] = []
+        tasks_completed: list[UUID] = []
+        tasks_failed: list[UUID] = []
 
         if self.running_tasks:
-            done_tasks, pending_tasks = await asyncio.wait(
-                self.running_tasks.values(),
-                return_when=asyncio.ALL_COMPLETED,
-                timeout=300,
-            )
+            if self.event_driven_execution is None:
+                done_tasks, _ = await asyncio.wait(
+                    self.running_tasks.values(),
+                    return_when=asyncio.ALL_COMPLETED,
+                    timeout=300,
+                )
+                for done_task in done_tasks:
+                    await self._record_task_outcome(
+                        done_task, tasks_completed, tasks_failed
+                    )
+            else:
+                await self._await_completions(
+                    self.event_driven_execution,
+                    tasks_started,
+                    tasks_completed,
+                    tasks_failed,
+                )
 
-            for done_task in done_tasks:
-                task_id = None
-                for tid, atask in self.running_tasks.items():
-                    if atask == done_task:
-                        task_id = tid
-                        break
+        # Start new tasks that are ready
+        tasks_started.extend(self._start_ready_tasks())
 
-                if task_id:
-                    try:
-                        result = await done_task
-                        if result.success:
-                            tasks_completed.append(task_id)
-                            self.completed_task_ids.add(task_id)
-
-                            resource_ids = []
-                            new_resources = []
-                            for resource in result.output_resources:
-                                self.workflow.add_resource(resource)
-                                resource_ids.append(resource.id)
-                                new_resources.append(resource)
-
-                            # Validation system removed; skip resource validations
-
-                            existing_task = self.workflow.tasks.get(task_id)
-                            if existing_task is not None:
-                                completed_task = existing_task.model_copy(
-                                    update={
-                                        "status": TaskStatus.COMPLETED,
-                                        "completed_at": result.completed_at,
-                                        "actual_duration_hours": float(
-                                            result.simulated_duration_hours
-                                        ),
-                                        "actual_cost": result.actual_cost,
-                                        "output_resource_ids": existing_task.output_resource_ids
-                                        + resource_ids,
-                                    }
-                                )
-                                self.workflow.tasks[task_id] = completed_task
-                                # Synchronize embedded subtasks with updated registry to fix inconsistencies
-                                for sync_task in self.workflow.tasks.values():
-                                    sync_task.sync_embedded_tasks_with_registry(
-                                        self.workflow.tasks
-                                    )
-                                self.workflow.total_simulated_hours += float(
-                                    result.simulated_duration_hours
-                                )
-                                self.workflow.total_cost += float(result.actual_cost)
+        return tasks_started, tasks_completed, tasks_failed
 
-                            else:
-                                logger.warning(
-                                    f"Completed task {task_id} no longer exists in workflow (possibly removed). Skipping state update."
-                                )
+    async def _await_completions(
+        self,
+        config: EventDrivenExecutionConfig,
+        tasks_started: list[UUID],
+        tasks_completed: list[UUID],
+        tasks_failed: list[UUID],
+    ) -> None:
+        """Consume the completion queue until the timestep advance policy is met.
 
-                        else:
-                            tasks_failed.append(task_id)
-                            self.failed_task_ids.add(task_id)
-
-                            task = self.workflow.tasks.get(task_id)
-                            if task is not None:
-                                task.status = TaskStatus.FAILED
-                                task.execution_notes.append(
-                                    f"Failed: {result.error_message}"
-                                )
-                                # Synchronize embedded subtasks with updated registry to fix inconsistencies
-                                for sync_task in self.workflow.tasks.values():
-                                    sync_task.sync_embedded_tasks_with_registry(
-                                        self.workflow.tasks
-                                    )
-                            else:
-                                logger.warning(
-                                    f"Failed task {task_id} no longer exists in workflow (possibly removed). Skipping state update."
-                                )
+        Each completion is recorded as it arrives and newly-ready tasks are
+        started immediately, so dependents do not wait for the next timestep.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + config.max_wait_seconds
+        if config.advance_policy == TimestepAdvancePolicy.QUANTUM:
+            deadline = min(deadline, loop.time() + config.quantum_seconds)
+        awaiting = set(self.running_tasks.values())
+        processed = 0
+
+        while self.running_tasks:
+            if config.advance_policy == TimestepAdvancePolicy.ALL and not awaiting:
+                break
+            if (
+                config.advance_policy == TimestepAdvancePolicy.FIRST_K
+                and processed >= config.first_k
+            ):
+                break
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                done_task = await asyncio.wait_for(
+                    self._completion_queue.get(), timeout=remaining
+                )
+            except TimeoutError:
+                break
+            awaiting.discard(done_task)
+            if await self._record_task_outcome(
+                done_task, tasks_completed, tasks_failed
+            ):
+                processed += 1
+                tasks_started.extend(self._start_ready_tasks())
+
+        # Record completions that already landed without waiting any longer
+        while not self._completion_queue.empty():
+            done_task = self._completion_queue.get_nowait()
+            if await self._record_task_outcome(
+                done_task, tasks_completed, tasks_failed
+            ):
+                tasks_started.extend(self._start_ready_tasks())
 
-                    except Exception as e:
-                        logger.error(
-                            f"Task {task_id} failed with exception: {traceback.format_exc()}"
-                        )
-                        tasks_failed.append(task_id)
-                        self.failed_task_ids.add(task_id)
-
-                        # Update task status if task still exists
-                        task = self.workflow.tasks.get(task_id)
-                        if task is not None:
-                            task.status = TaskStatus.FAILED
-                            task.execution_notes.append(f"Exception: {str(e)}")
-                        else:
-                            logger.warning(
-                                f"Exception for task {task_id}, but task no longer exists in workflow. Skipping state update."
-                            )
+    async def _record_task_outcome(
+        self,
+        done_task: asyncio.Task,
+        tasks_completed: list[UUID],
+        tasks_failed: list[UUID],
+    ) -> UUID | None:
+        """Apply a finished agent task to the workflow.
 
-                    del self.running_tasks[task_id]
+        Returns:
+            The task ID, or None if the asyncio task is no longer tracked.
+        """
+        task_id = self._running_task_ids.pop(done_task, None)
+        if task_id is None:
+            return None
 
-        # Start new tasks that are ready
+        try:
+            result = await done_task
+            if result.success:
+                tasks_completed.append(task_id)
+                self.completed_task_ids.add(task_id)
+
+                resource_ids = []
+                for resource in result.output_resources:
+                    self.workflow.add_resource(resource)
+                    resource_ids.append(resource.id)
+
+                # Validation system removed; skip resource validations
+
+                existing_task = self.workflow.tasks.get(task_id)
+                if existing_task is not None:
+                    # Registry and embedded subtasks share one object, so a
+                    # single in-place write updates every view of the task
+                    existing_task.completed_at = result.completed_at
+                    existing_task.actual_duration_hours = float(
+                        result.simulated_duration_hours
+                    )
+                    existing_task.actual_cost = result.actual_cost
+                    existing_task.output_resource_ids = (
+                        existing_task.output_resource_ids + resource_ids
+                    )
+                    existing_task.status = TaskStatus.COMPLETED
+                    self.workflow.total_simulated_hours += float(
+                        result.simulated_duration_hours
+                    )
+                    self.workflow.total_cost += float(result.actual_cost)
+
+                else:
+                    logger.warning(
+                        f"Completed task {task_id} no longer exists in workflow (possibly removed). Skipping state update."
+                    )
+
+            else:
+                tasks_failed.append(task_id)
+                self.failed_task_ids.add(task_id)
+
+                task = self.workflow.tasks.get(task_id)
+                if task is not None:
+                    task.status = TaskStatus.FAILED
+                    task.execution_notes.append(f"Failed: {result.error_message}")
+                else:
+                    logger.warning(
+                        f"Failed task {task_id} no longer exists in workflow (possibly removed). Skipping state update."
+                    )
+
+        except Exception as e:
+            logger.error(
+                f"Task {task_id} failed with exception: {traceback.format_exc()}"
+            )
+            tasks_failed.append(task_id)
+            self.failed_task_ids.add(task_id)
+
+            # Update task status if task still exists
+            task = self.workflow.tasks.get(task_id)
+            if task is not None:
+                task.status = TaskStatus.FAILED
+                task.execution_notes.append(f"Exception: {str(e)}")
+            else:
+                logger.warning(
+                    f"Exception for task {task_id}, but task no longer exists in workflow. Skipping state update."
+                )
+
+        del self.running_tasks[task_id]
+        return task_id
+
+    def _start_ready_tasks(self) -> list[UUID]:
+        """Start every ready task that has an assigned agent. Returns started IDs."""
+        tasks_started: list[UUID] = []
         ready_tasks = self.workflow.get_ready_tasks()
 
         for task in ready_tasks:
@@ -740,10 +924,21 @@ class WorkflowExecutionEngine:
                     resources = self._get_task_resources(task)
 
                     # Start task execution
-                    execution_task = asyncio.create_task(
-                        agent.execute_task(task, resources)
-                    )
+                    execution = agent.execute_task(task, resources)
+                    if self.profiler.enabled:
+                        execution = self.profiler.instrument(
+                            execution,
+                            "agent_task",
+                            task_id=str(task.id),
+                            agent_id=agent.agent_id,
+                        )
+                    execution_task = asyncio.create_task(execution)
                     self.running_tasks[task.id] = execution_task
+                    self._running_task_ids[execution_task] = task.id
+                    if self.event_driven_execution is not None:
+                        execution_task.add_done_callback(
+                            self._completion_queue.put_nowait
+                        )
 
                     # Update task status and timing
                     # READY -> RUNNING when the engine actually starts execution
@@ -752,7 +947,7 @@ class WorkflowExecutionEngine:
 
                     tasks_started.append(task.id)
 
-        return tasks_started, tasks_completed, tasks_failed
+        return tasks_started
 
     def _get_task_resources(self, task: Task) -> list[Resource]:
         """
@@ -803,84 +998,57 @@ class WorkflowExecutionEngine:
         if self.workflow.is_complete() and self.workflow.completed_at is None:
             self.workflow.completed_at = datetime.now()
 
-        # Propagate completion to all composite tasks whose atomic subtasks are all completed (recursive)
+        # Propagate completion to composites and refresh derived effective_status.
+        # Single post-order pass over the forest: each node is visited once and
+        # composites aggregate their children's leaf summaries.
         try:
-            status_updated = False
-
-            def _update_composite_completion(node: Task) -> None:
-                nonlocal status_updated
-                if not node.is_atomic_task():
-                    atomic_children = node.get_atomic_subtasks()
-
-                    def _is_leaf_completed(leaf: Task) -> bool:
-                        current = self.workflow.tasks.get(leaf.id)
-                        return (
-                            current and current.status == TaskStatus.COMPLETED
-                        ) or leaf.status == TaskStatus.COMPLETED
-
-                    if atomic_children and all(
-                        _is_leaf_completed(leaf) for leaf in atomic_children
-                    ):
-                        if node.status != TaskStatus.COMPLETED:
-                            node.status = TaskStatus.COMPLETED
-                            node.completed_at = datetime.now()
-                            status_updated = True
-                    # Recurse into children for nested composites
-                    for child in node.subtasks:
-                        _update_composite_completion(child)
-
-            for top in self.workflow.tasks.values():
-                _update_composite_completion(top)
-
-            # Synchronize embedded subtasks if any status was updated to fix inconsistencies
-            if status_updated:
-                for task in self.workflow.tasks.values():
-                    task.sync_embedded_tasks_with_registry(self.workflow.tasks)
-
-            # Normalize composite task states: composites should never be READY/RUNNING
-            for task in self.workflow.tasks.values():
-                try:
-                    if not task.is_atomic_task() and task.status in (
-                        TaskStatus.READY,
-                        TaskStatus.RUNNING,
-                    ):
-                        task.status = TaskStatus.PENDING
-                except Exception:
-                    continue
-
-            # Update derived effective_status for all tasks (including embedded composites)
-            def _leaf_statuses(node: Task) -> list[TaskStatus]:
-                if node.is_atomic_task():
-                    reg = self.workflow.tasks.get(node.id)
-                    return [reg.status if reg is not None else node.status]
-                statuses: list[TaskStatus] = []
-                for leaf in node.get_atomic_subtasks():
-                    reg = self.workflow.tasks.get(leaf.id)
-                    statuses.append(reg.status if reg is not None else leaf.status)
-                return statuses
-
-            def _set_effective_status_recursive(node: Task) -> None:
+            now = datetime.now()
+            # task id -> (all leaves completed, any leaf running, any leaf ready)
+            summaries: dict[UUID, tuple[bool, bool, bool]] = {}
+
+            def _summarize(node: Task) -> tuple[bool, bool, bool]:
+                cached = summaries.get(node.id)
+                if cached is not None:
+                    return cached
                 try:
                     if node.is_atomic_task():
+                        summary = (
+                            node.status == TaskStatus.COMPLETED,
+                            node.status == TaskStatus.RUNNING,
+                            node.status == TaskStatus.READY,
+                        )
                         node.effective_status = node.status.value
                     else:
-                        leaves = _leaf_statuses(node)
-                        if leaves and all(s == TaskStatus.COMPLETED for s in leaves):
+                        children = [_summarize(child) for child in node.subtasks]
+                        summary = (
+                            all(c[0] for c in children),
+                            any(c[1] for c in children),
+                            any(c[2] for c in children),
+                        )
+                        all_done, any_running, any_ready = summary
+                        if all_done:
+                            if node.status != TaskStatus.COMPLETED:
+                                node.status = TaskStatus.COMPLETED
+                                node.completed_at = now
                             node.effective_status = TaskStatus.COMPLETED.value
-                        elif any(s == TaskStatus.RUNNING for s in leaves):
-                            node.effective_status = TaskStatus.RUNNING.value
-                        elif any(s == TaskStatus.READY for s in leaves):
-                            node.effective_status = TaskStatus.READY.value
                         else:
-                            node.effective_status = TaskStatus.PENDING.value
-                    # Recurse into children so embedded composites get their own value
-                    for child in node.subtasks:
-                        _set_effective_status_recursive(child)
+                            # Composite tasks are never READY/RUNNING themselves
+                            if node.status in (TaskStatus.READY, TaskStatus.RUNNING):
+                                node.status = TaskStatus.PENDING
+                            if any_running:
+                                node.effective_status = TaskStatus.RUNNING.value
+                            elif any_ready:
+                                node.effective_status = TaskStatus.READY.value
+                            else:
+                                node.effective_status = TaskStatus.PENDING.value
                 except Exception:
                     node.effective_status = node.status.value
+                    summary = (node.status == TaskStatus.COMPLETED, False, False)
+                summaries[node.id] = summary
+                return summary
 
-            for root in self.workflow.tasks.values():
-                _set_effective_status_recursive(root)
+            for root in list(self.workflow.tasks.values()):
+                _summarize(root)
         except Exception:
             # Non-fatal; composite completion is a quality-of-life enhancement
             logger.error("Composite completion propagation failed", exc_info=True)
@@ -911,7 +1079,7 @@ class WorkflowExecutionEngine:
 
         # Delegate writing to OutputWriter
         try:
-            self.output_writer.save_timestep(
+            await self.output_writer.save_timestep(
                 timestep_result=timestep_result,
                 workflow=self.workflow,
                 current_timestep=timestep,
@@ -923,7 +1091,9 @@ class WorkflowExecutionEngine:
         except Exception:
             logger.error("output writer failed saving timestep", exc_info=True)
 
-        metrics = {
+        self.output_writer.append_timestep_record(timestep_result)
+
+        metrics: dict[str, Any] = {
             "execution_summary": {
                 "total_timesteps": self.current_timestep,
                 "total_tasks": len(self.workflow.tasks),
@@ -946,15 +1116,16 @@ class WorkflowExecutionEngine:
                     tr.execution_time_seconds for tr in self.timestep_results
                 ),
             },
-            "timestep_results": [
-                tr.model_dump(mode="json") for tr in self.timestep_results
-            ],
+            # Per-timestep results are appended to the run log (see iter_run_log)
+            "run_log": self.output_config.get_run_log_path().name,
         }
+        prefetch_stats = self.manager_agent.prefetch_stats
+        if prefetch_stats is not None:
+            metrics["manager_prefetch"] = prefetch_stats
 
-        filepath = self.output_config.get_final_metrics_path()
-        filepath.parent.mkdir(parents=True, exist_ok=True)
-        with open(filepath, "w") as f:
-            json.dump(metrics, f, indent=2, default=str)
+        await self.output_writer.write_json_async(
+            self.output_config.get_final_metrics_path(), metrics
+        )
 
     def serialise_workflow_states_and_metrics(self) -> None:
         """Write high-level execution logs (manager actions) into execution_logs directory."""
@@ -986,6 +1157,13 @@ class WorkflowExecutionEngine:
             )
         except Exception:
             logger.error("output writer failed saving workflow summary", exc_info=True)
+        if self.content_store is not None and self.output_config.timestep_dir:
+            try:
+                self.content_store.write_manifest(
+                    self.output_config.timestep_dir.parent
+                )
+            except Exception:
+                logger.error("failed writing resource store manifest", exc_info=True)
 
     def get_current_workflow_state(self) -> Workflow:
         """
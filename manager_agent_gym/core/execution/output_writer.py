@@ -7,11 +7,11 @@ execution logs, and evaluation outputs.
 
 from __future__ import annotations
 
-import json
+from pathlib import Path
 from typing import Any, Sequence
 
 from ..common.logging import logger
-from ...schemas.config import OutputConfig
+from ...schemas.config import OutputConfig, SnapshotFormat
 from ...schemas.core.workflow import Workflow
 from ...schemas.unified_results import ExecutionResult
 from ..manager_agent import ManagerAgent
@@ -20,6 +20,9 @@ from ...schemas.preferences.preference import (
 )
 from ..communication.service import CommunicationService
 from ...schemas.execution.manager_actions import ActionResult
+from .background_writer import BackgroundWriter, write_json_file
+from .run_log import RunLogWriter
+from .snapshot_store import SnapshotLogWriter
 
 
 class WorkflowSerialiser:
@@ -32,6 +35,61 @@ class WorkflowSerialiser:
         self.output_config = output_config
         self.communication_service = communication_service
         self.workflow = workflow
+        self._snapshot_log: SnapshotLogWriter | None = None
+        self._run_log: RunLogWriter | None = None
+        # Encoding and disk I/O run off the event loop unless disabled
+        self._background: BackgroundWriter | None = (
+            BackgroundWriter(max_pending=output_config.max_pending_writes)
+            if output_config.background_writes
+            else None
+        )
+
+    @property
+    def writes_delta_snapshots(self) -> bool:
+        return self.output_config.snapshot_format == SnapshotFormat.DELTA
+
+    def _snapshot_log_writer(self) -> SnapshotLogWriter:
+        if self._snapshot_log is None:
+            self._snapshot_log = SnapshotLogWriter(
+                self.output_config.get_workflow_snapshot_log_path(),
+                keyframe_interval=self.output_config.snapshot_keyframe_interval,
+            )
+        return self._snapshot_log
+
+    def append_timestep_record(self, timestep_result: ExecutionResult) -> None:
+        """Append the timestep result to the run log (written in the background)."""
+        try:
+            if self._run_log is None:
+                self._run_log = RunLogWriter(self.output_config.get_run_log_path())
+            self._run_log.append(timestep_result.model_dump(mode="json"))
+        except Exception:
+            logger.error("failed appending timestep to run log", exc_info=True)
+
+    def write_json(self, path: Path, payload: Any) -> None:
+        """Write ``payload`` to ``path``, in the background when enabled.
+
+        Writes are applied in call order; ``payload`` must not be mutated
+        afterwards.
+        """
+        if self._background is not None:
+            self._background.write_json(path, payload)
+        else:
+            write_json_file(path, payload)
+
+    async def write_json_async(self, path: Path, payload: Any) -> None:
+        """Event-loop variant of ``write_json``; a full write queue never blocks the loop."""
+        if self._background is not None:
+            await self._background.write_json_async(path, payload)
+        else:
+            write_json_file(path, payload)
+
+    def close(self) -> None:
+        """Finish all pending writes and release the run log."""
+        if self._run_log is not None:
+            self._run_log.close()
+            self._run_log = None
+        if self._background is not None:
+            self._background.close()
 
     def ensure_directories(self) -> None:
         try:
@@ -39,7 +97,7 @@ class WorkflowSerialiser:
         except Exception:
             logger.error("failed to create output directories", exc_info=True)
 
-    def save_timestep(
+    async def save_timestep(
         self,
         timestep_result: ExecutionResult,
         workflow: Workflow,
@@ -47,21 +105,32 @@ class WorkflowSerialiser:
         manager_agent: ManagerAgent | None,
         stakeholder_weights: PreferenceWeights | None,
     ) -> None:
-        """Write timestep result and a full workflow snapshot for this timestep."""
+        """Write timestep result and the workflow snapshot for this timestep.
+
+        With ``SnapshotFormat.DELTA`` the snapshot is appended to the run's
+        snapshot log and the timestep file references it; otherwise a full
+        snapshot file is written per timestep.
+        """
         # 1) Write timestep result
+        recent_messages: list[dict[str, Any]] = []
         try:
             filepath = self.output_config.get_timestep_file_path(current_timestep)
-            filepath.parent.mkdir(parents=True, exist_ok=True)
-            with open(filepath, "w") as f:
-                data = timestep_result.model_dump(mode="json")
-                # Add headline cumulative hours for convenience in per-timestep files
-                try:
-                    data["cumulative_workflow_hours"] = float(
-                        workflow.total_simulated_hours
-                    )
-                except Exception:
-                    data["cumulative_workflow_hours"] = "FAILED_TO_CALCULATE"
-                json.dump(data, f, indent=2, default=str)
+            data = timestep_result.model_dump(mode="json")
+            # Add headline cumulative hours for convenience in per-timestep files
+            try:
+                data["cumulative_workflow_hours"] = float(
+                    workflow.total_simulated_hours
+                )
+            except Exception:
+                data["cumulative_workflow_hours"] = "FAILED_TO_CALCULATE"
+            observation = data["metadata"].get("manager_observation") or {}
+            recent_messages = observation.get("recent_messages") or []
+            if self.writes_delta_snapshots:
+                data["metadata"]["workflow_snapshot_ref"] = {
+                    "log": self.output_config.get_workflow_snapshot_log_path().name,
+                    "timestep": current_timestep,
+                }
+            await self.write_json_async(filepath, data)
         except Exception:
             logger.error("failed writing timestep result", exc_info=True)
 
@@ -144,6 +213,8 @@ class WorkflowSerialiser:
                 "timestep": current_timestep,
                 "manager_state": manager_state,
                 "stakeholder_state": stakeholder_state,
+                # Messages the manager observed, restored into the message graph
+                "recent_messages": recent_messages,
                 # Explicit headline figure for convenience
                 "cumulative_workflow_hours": (
                     float(workflow.total_simulated_hours)
@@ -153,14 +224,20 @@ class WorkflowSerialiser:
             }
 
             wf_dir = self.output_config.workflow_dir
-            if wf_dir is not None:
-                try:
-                    wf_dir.mkdir(parents=True, exist_ok=True)
-                except Exception:
-                    pass
+            if wf_dir is not None and self.writes_delta_snapshots:
+                log = self._snapshot_log_writer()
+                if self._background is not None:
+
+                    def write_snapshot() -> None:
+                        log.write(current_timestep, workflow_snapshot)
+
+                    # Diffing against the previous snapshot happens off-loop too
+                    await self._background.submit_async(write_snapshot)
+                else:
+                    log.write(current_timestep, workflow_snapshot)
+            elif wf_dir is not None:
                 snapshot_name = f"workflow_execution_{self.output_config.run_id}_t{current_timestep:04d}.json"
-                with open(wf_dir / snapshot_name, "w") as wf_f:
-                    json.dump(workflow_snapshot, wf_f, indent=2, default=str)
+                await self.write_json_async(wf_dir / snapshot_name, workflow_snapshot)
         except Exception:
             logger.error("failed writing per-timestep workflow snapshot", exc_info=True)
 
@@ -211,9 +288,7 @@ class WorkflowSerialiser:
                     else "FAILED_TO_CALCULATE"
                 ),
             }
-            path = self.output_config.get_workflow_summary_path()
-            with open(path, "w") as f:
-                json.dump(snapshot, f, indent=2, default=str)
+            self.write_json(self.output_config.get_workflow_summary_path(), snapshot)
         except Exception:
             logger.error("save_workflow_summary failed", exc_info=True)
 
@@ -226,10 +301,6 @@ class WorkflowSerialiser:
             exec_dir = self.output_config.execution_logs_dir
             if exec_dir is None:
                 return
-            try:
-                exec_dir.mkdir(parents=True, exist_ok=True)
-            except Exception:
-                pass
             path = exec_dir / f"execution_log_{run_id}.json"
 
             actions: list[dict[str, Any]] = []
@@ -253,8 +324,7 @@ class WorkflowSerialiser:
                     )
 
             payload = {"run_id": run_id, "manager_actions": actions}
-            with open(path, "w") as f:
-                json.dump(payload, f, indent=2, default=str)
+            self.write_json(path, payload)
         except Exception:
             logger.error("save_execution_logs failed", exc_info=True)
 
@@ -265,24 +335,19 @@ class WorkflowSerialiser:
         ev_dir = self.output_config.evaluation_dir
         if ev_dir is None:
             return
-        try:
-            ev_dir.mkdir(parents=True, exist_ok=True)
-        except Exception:
-            pass
 
         # Save full history
         try:
             history_path = self.output_config.get_evaluation_results_path(
                 timestamp=self.output_config.run_id
             )
-            with open(history_path, "w") as f:
-                history_payload = {
-                    "evaluation_history": [
-                        er.model_dump(mode="json") for er in evaluation_results
-                    ],
-                    "reward_vector": list(reward_vector or []),
-                }
-                json.dump(history_payload, f, indent=2, default=str)
+            history_payload = {
+                "evaluation_history": [
+                    er.model_dump(mode="json") for er in evaluation_results
+                ],
+                "reward_vector": list(reward_vector or []),
+            }
+            self.write_json(history_path, history_payload)
         except Exception:
             logger.error("failed saving evaluation history", exc_info=True)
 
@@ -293,10 +358,7 @@ class WorkflowSerialiser:
                 final_path = (
                     ev_dir / f"final_evaluation_{self.output_config.run_id}.json"
                 )
-                with open(final_path, "w") as f:
-                    json.dump(
-                        final_eval.model_dump(mode="json"), f, indent=2, default=str
-                    )
+                self.write_json(final_path, final_eval.model_dump(mode="json"))
         except Exception:
             logger.error("failed saving final evaluation", exc_info=True)
 
@@ -0,0 +1,174 @@
+"""
+Append-only run log of per-timestep records.
+
+``RunLogWriter`` appends one compact JSON line per record to a JSONL file
+(optionally gzip- or zstd-compressed). Encoding and file I/O happen on a
+background thread, so the engine only pays for ``model_dump`` per timestep
+and the cost of a write no longer grows with the length of the run.
+``iter_run_log`` streams records back without loading the whole file.
+
+zstd compression needs the optional ``zstandard`` package.
+"""
+
+from __future__ import annotations
+
+import gzip
+import io
+import json
+import queue
+import threading
+from pathlib import Path
+from typing import IO, Any, Iterator
+
+from ..common.logging import logger
+from ...schemas.config import RunLogCompression
+
+_SUFFIXES = {
+    RunLogCompression.NONE: "",
+    RunLogCompression.GZIP: ".gz",
+    RunLogCompression.ZSTD: ".zst",
+}
+
+
+def _compression_for(path: Path) -> RunLogCompression:
+    for compression, suffix in _SUFFIXES.items():
+        if suffix and path.name.endswith(suffix):
+            return compression
+    return RunLogCompression.NONE
+
+
+def _zstandard() -> Any:
+    try:
+        import zstandard
+    except ImportError as e:
+        raise ImportError(
+            "zstd run logs require the 'zstandard' package (pip install zstandard)"
+        ) from e
+    return zstandard
+
+
+def _open_for_append(path: Path) -> IO[str]:
+    compression = _compression_for(path)
+    if compression == RunLogCompression.GZIP:
+        # Each session appends a new gzip member; readers decode members in sequence
+        return gzip.open(path, "at", encoding="utf-8")
+    if compression == RunLogCompression.ZSTD:
+        writer = _zstandard().ZstdCompressor().stream_writer(open(path, "ab"))
+        return io.TextIOWrapper(writer, encoding="utf-8")
+    return open(path, "a", encoding="utf-8")
+
+
+def _open_for_read(path: Path) -> IO[str]:
+    compression = _compression_for(path)
+    if compression == RunLogCompression.GZIP:
+        return gzip.open(path, "rt", encoding="utf-8")
+    if compression == RunLogCompression.ZSTD:
+        reader = (
+            _zstandard()
+            .ZstdDecompressor()
+            .stream_reader(open(path, "rb"), read_across_frames=True)
+        )
+        return io.TextIOWrapper(reader, encoding="utf-8")
+    return open(path, "r", encoding="utf-8")
+
+
+def iter_run_log(path: Path) -> Iterator[dict[str, Any]]:
+    """Yield the records of a run log one at a time.
+
+    A truncated final line (e.g. from a crashed run) ends iteration quietly.
+    """
+    with _open_for_read(Path(path)) as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                logger.warning("stopping at malformed run log record in %s", path)
+                return
+
+
+_CLOSE = object()
+
+
+class RunLogWriter:
+    """Appends JSON records to a run log from a background thread.
+
+    Args:
+        path: Log file; the compression is chosen from its suffix
+            (``.jsonl``, ``.jsonl.gz`` or ``.jsonl.zst``).
+        flush_interval: Seconds of inactivity after which buffered records are
+            flushed to disk.
+    """
+
+    def __init__(self, path: Path, flush_interval: float = 1.0) -> None:
+        self.path = Path(path)
+        self.flush_interval = flush_interval
+        self.records_written = 0
+        self._queue: queue.Queue[Any] = queue.Queue()
+        self._thread: threading.Thread | None = None
+        self._closed = False
+        if _compression_for(self.path) == RunLogCompression.ZSTD:
+            _zstandard()
+
+    def append(self, record: dict[str, Any]) -> None:
+        """Queue ``record`` for writing; it must not be mutated afterwards."""
+        if self._closed:
+            raise RuntimeError(f"run log {self.path} is closed")
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run, name="run-log-writer", daemon=True
+            )
+            self._thread.start()
+        self._queue.put(record)
+
+    def flush(self) -> None:
+        """Block until every queued record has been written and flushed."""
+        if self._thread is None or self._closed:
+            return
+        done = threading.Event()
+        self._queue.put(done)
+        done.wait()
+
+    def close(self) -> None:
+        """Write outstanding records and stop the writer thread."""
+        if self._closed:
+            return
+        self._closed = True
+        if self._thread is not None:
+            self._queue.put(_CLOSE)
+            self._thread.join()
+
+    def _run(self) -> None:
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            f = _open_for_append(self.path)
+        except Exception:
+            logger.error("failed opening run log %s", self.path, exc_info=True)
+            self._drain()
+            return
+        with f:
+            while True:
+                try:
+                    item = self._queue.get(timeout=self.flush_interval)
+                except queue.Empty:
+                    f.flush()
+                    continue
+                if item is _CLOSE:
+                    return
+                if isinstance(item, threading.Event):
+                    f.flush()
+                    item.set()
+                    continue
+                try:
+                    f.write(json.dumps(item, separators=(",", ":"), default=str))
+                    f.write("\n")
+                    self.records_written += 1
+                except Exception:
+                    logger.error("failed writing run log record", exc_info=True)
+
+    def _drain(self) -> None:
+        """Discard records after a failed open without blocking flush/close."""
+        while (item := self._queue.get()) is not _CLOSE:
+            if isinstance(item, threading.Event):
+                item.set()
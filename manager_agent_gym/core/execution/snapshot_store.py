@@ -0,0 +1,565 @@
+"""
+Delta-encoded workflow snapshots.
+
+Per-timestep workflow snapshots are appended to a single JSONL log: a full
+keyframe every ``keyframe_interval`` timesteps and, in between, only what
+changed since the previous timestep (changed/new/removed tasks, resources,
+agents and messages, plus changed top-level fields). ``SnapshotLogReader``
+materializes the full snapshot of any logged timestep from the nearest
+preceding keyframe.
+
+Log records::
+
+    {"timestep": 0, "kind": "keyframe", "snapshot": {...}}
+    {"timestep": 1, "kind": "delta", "delta": {"set": {...}, "sections": {...}}}
+
+Alongside the log the writer keeps an index (``<log>.idx``, one JSON line per
+record) with the byte span of every top-level field and every section item in
+the record. ``SnapshotLogReader.view`` uses it to resolve a timestep to spans
+without parsing the log, so a restore can parse the tasks it needs and leave
+resources and messages unread until they are accessed.
+"""
+
+from __future__ import annotations
+
+import json
+import mmap
+import re
+from collections.abc import Iterator, Mapping
+from pathlib import Path
+from typing import Any
+
+# Snapshot sections diffed per item. Dict sections are keyed by their own keys,
+# list sections by the given item field.
+KEYED_SECTIONS: dict[str, str | None] = {
+    "tasks": None,
+    "resources": None,
+    "agents": "agent_id",
+    "messages": "message_id",
+    "recent_messages": "message_id",
+}
+
+_MISSING = object()
+
+# Records are written with these keys first, so the index scan can skip parsing
+_RECORD_HEADER = re.compile(rb'^\{"timestep": (-?\d+), "kind": "(\w+)"')
+_INDEX_HEADER = re.compile(
+    rb'^\{"timestep": (-?\d+), "kind": "(\w+)", "offset": (\d+), "length": (\d+)'
+)
+
+
+def _as_mapping(value: Any, key_field: str | None) -> dict[str, Any] | None:
+    if key_field is None:
+        return value if isinstance(value, dict) else None
+    if not isinstance(value, list):
+        return None
+    mapping: dict[str, Any] = {}
+    for item in value:
+        if not isinstance(item, dict) or item.get(key_field) is None:
+            return None
+        mapping[str(item[key_field])] = item
+    # Duplicate keys cannot be diffed per item
+    return mapping if len(mapping) == len(value) else None
+
+
+def _diff_section(previous: dict[str, Any], current: dict[str, Any]) -> dict | None:
+    changed = {
+        key: value
+        for key, value in current.items()
+        if previous.get(key, _MISSING) != value
+    }
+    removed = [key for key in previous if key not in current]
+    section: dict[str, Any] = {}
+    if changed:
+        section["changed"] = changed
+    if removed:
+        section["removed"] = removed
+    # Applying a delta keeps surviving keys in place and appends new ones
+    expected = [key for key in previous if key in current]
+    expected += [key for key in current if key not in previous]
+    if list(current) != expected:
+        section["order"] = list(current)
+    return section or None
+
+
+def _apply_section(previous: dict[str, Any], section: dict[str, Any]) -> dict:
+    removed = set(section.get("removed", ()))
+    merged = {key: value for key, value in previous.items() if key not in removed}
+    merged.update(section.get("changed", {}))
+    order = section.get("order")
+    if order is not None:
+        merged = {key: merged[key] for key in order}
+    return merged
+
+
+def diff_snapshots(previous: dict[str, Any], current: dict[str, Any]) -> dict:
+    """Delta that turns ``previous`` into ``current`` under ``apply_snapshot_delta``."""
+    delta: dict[str, Any] = {"set": {}, "unset": [], "sections": {}}
+    for field, value in current.items():
+        old = previous.get(field, _MISSING)
+        if field in KEYED_SECTIONS:
+            key_field = KEYED_SECTIONS[field]
+            old_items = _as_mapping(old, key_field)
+            new_items = _as_mapping(value, key_field)
+            if old_items is not None and new_items is not None:
+                section = _diff_section(old_items, new_items)
+                if section is not None:
+                    delta["sections"][field] = section
+                continue
+        if old != value:
+            delta["set"][field] = value
+    delta["unset"] = [field for field in previous if field not in current]
+    return {key: value for key, value in delta.items() if value}
+
+
+def index_path_for(log_path: Path) -> Path:
+    """Path of the span index kept next to a snapshot log."""
+    return log_path.with_name(log_path.name + ".idx")
+
+
+class _RecordEncoder:
+    """Builds a record's JSON text piecewise, tracking the span of each value.
+
+    ``json.dumps`` escapes non-ASCII characters, so character offsets are byte
+    offsets in the encoded line.
+    """
+
+    def __init__(self) -> None:
+        self._parts: list[str] = []
+        self._pos = 0
+
+    def raw(self, text: str) -> None:
+        self._parts.append(text)
+        self._pos += len(text)
+
+    def value(self, value: Any) -> list[int]:
+        start = self._pos
+        self.raw(json.dumps(value, default=str))
+        return [start, self._pos]
+
+    def fields(self, values: dict[str, Any]) -> dict[str, list[int]]:
+        """Encode ``values`` as an object; returns the span of each value."""
+        spans: dict[str, list[int]] = {}
+        self.raw("{")
+        for i, (name, value) in enumerate(values.items()):
+            self.raw((", " if i else "") + json.dumps(name) + ": ")
+            spans[name] = self.value(value)
+        self.raw("}")
+        return spans
+
+    def items(self, items: dict[str, Any], as_list: bool) -> dict[str, list[int]]:
+        """Encode section items as an object (or a list); returns item spans."""
+        if not as_list:
+            return self.fields(items)
+        spans: dict[str, list[int]] = {}
+        self.raw("[")
+        for i, (key, item) in enumerate(items.items()):
+            if i:
+                self.raw(", ")
+            spans[key] = self.value(item)
+        self.raw("]")
+        return spans
+
+    def text(self) -> str:
+        return "".join(self._parts)
+
+
+def _encode_keyframe(
+    timestep: int, snapshot: dict[str, Any]
+) -> tuple[str, dict[str, Any]]:
+    enc = _RecordEncoder()
+    enc.raw(json.dumps({"timestep": timestep, "kind": "keyframe"})[:-1])
+    enc.raw(', "snapshot": {')
+    fields: dict[str, list[int]] = {}
+    sections: dict[str, dict[str, Any]] = {}
+    for i, (field, value) in enumerate(snapshot.items()):
+        enc.raw((", " if i else "") + json.dumps(field) + ": ")
+        key_field = KEYED_SECTIONS.get(field, _MISSING)
+        items = (
+            _as_mapping(value, key_field)  # type: ignore[arg-type]
+            if key_field is not _MISSING
+            else None
+        )
+        if items is None:
+            fields[field] = enc.value(value)
+        else:
+            sections[field] = {"items": enc.items(items, key_field is not None)}
+    enc.raw("}}")
+    return enc.text(), {"fields": fields, "sections": sections}
+
+
+def _encode_delta(timestep: int, delta: dict[str, Any]) -> tuple[str, dict[str, Any]]:
+    enc = _RecordEncoder()
+    enc.raw(json.dumps({"timestep": timestep, "kind": "delta"})[:-1])
+    enc.raw(', "delta": {')
+    entry: dict[str, Any] = {"fields": {}, "sections": {}}
+    parts = 0
+    if delta.get("set"):
+        enc.raw('"set": ')
+        entry["fields"] = enc.fields(delta["set"])
+        parts += 1
+    if delta.get("unset"):
+        enc.raw((", " if parts else "") + '"unset": ')
+        enc.value(delta["unset"])
+        entry["unset"] = delta["unset"]
+        parts += 1
+    if delta.get("sections"):
+        enc.raw((", " if parts else "") + '"sections": {')
+        for i, (field, section) in enumerate(delta["sections"].items()):
+            enc.raw((", " if i else "") + json.dumps(field) + ": {")
+            indexed: dict[str, Any] = {}
+            keys = 0
+            if "changed" in section:
+                enc.raw('"changed": ')
+                indexed["items"] = enc.fields(section["changed"])
+                keys += 1
+            for name in ("removed", "order"):
+                if name in section:
+                    enc.raw((", " if keys else "") + json.dumps(name) + ": ")
+                    enc.value(section[name])
+                    indexed[name] = section[name]
+                    keys += 1
+            enc.raw("}")
+            entry["sections"][field] = indexed
+        enc.raw("}")
+    enc.raw("}}")
+    return enc.text(), entry
+
+
+def apply_snapshot_delta(previous: dict[str, Any], delta: dict) -> dict[str, Any]:
+    """Return the snapshot obtained by applying ``delta`` to ``previous``."""
+    snapshot = dict(previous)
+    for field in delta.get("unset", ()):
+        snapshot.pop(field, None)
+    for field, section in delta.get("sections", {}).items():
+        key_field = KEYED_SECTIONS[field]
+        items = _apply_section(_as_mapping(snapshot[field], key_field) or {}, section)
+        snapshot[field] = items if key_field is None else list(items.values())
+    snapshot.update(delta.get("set", {}))
+    return snapshot
+
+
+class SnapshotLogWriter:
+    """Appends keyframes and per-timestep deltas to a JSONL snapshot log.
+
+    Only the previous snapshot is held in memory to compute the next delta.
+    With ``index`` the span index used by ``SnapshotLogReader.view`` is
+    appended alongside each record.
+    """
+
+    def __init__(
+        self, path: Path, keyframe_interval: int = 50, index: bool = True
+    ) -> None:
+        self.path = Path(path)
+        self.index_path = index_path_for(self.path) if index else None
+        self.keyframe_interval = max(1, keyframe_interval)
+        self._previous: dict[str, Any] | None = None
+        self._last_keyframe: int | None = None
+
+    def write(self, timestep: int, snapshot: dict[str, Any]) -> str:
+        """Append ``snapshot`` for ``timestep``; returns the record kind written."""
+        if (
+            self._previous is None
+            or self._last_keyframe is None
+            or timestep - self._last_keyframe >= self.keyframe_interval
+        ):
+            kind = "keyframe"
+            line, entry = _encode_keyframe(timestep, snapshot)
+            self._last_keyframe = timestep
+        else:
+            kind = "delta"
+            line, entry = _encode_delta(
+                timestep, diff_snapshots(self._previous, snapshot)
+            )
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        data = (line + "\n").encode("ascii")
+        with open(self.path, "ab") as f:
+            offset = f.tell()
+            f.write(data)
+        if self.index_path is not None:
+            entry = {
+                "timestep": timestep,
+                "kind": kind,
+                "offset": offset,
+                "length": len(data),
+                **entry,
+            }
+            with open(self.index_path, "a") as f:
+                f.write(json.dumps(entry) + "\n")
+        self._previous = snapshot
+        return kind
+
+
+class SnapshotLogReader:
+    """Random access to the snapshots in a log written by ``SnapshotLogWriter``.
+
+    Record offsets come from the span index when it covers the whole log, and
+    otherwise from one scan of the log; materializing a timestep reads only the
+    nearest keyframe at or before it and the deltas that follow.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        # (timestep, byte offset, kind) in log order
+        self._records: list[tuple[int, int, str]] = []
+        # Latest record position for each timestep
+        self._positions: dict[int, int] = {}
+        # Raw span index lines aligned with ``_records``, parsed by ``view``
+        self._index_lines: list[bytes] | None = None
+        if not self._read_index():
+            self._scan_log()
+
+    def _read_index(self) -> bool:
+        """Take record offsets from the span index if it matches the log."""
+        index_path = index_path_for(self.path)
+        if not index_path.exists():
+            return False
+        lines = [line for line in index_path.read_bytes().splitlines() if line]
+        records: list[tuple[int, int, str]] = []
+        end = 0
+        for line in lines:
+            header = _INDEX_HEADER.match(line)
+            # Records must be contiguous from the start of the log
+            if header is None or int(header[3]) != end:
+                return False
+            records.append((int(header[1]), end, header[2].decode()))
+            end += int(header[4])
+        # An interrupted write leaves the index out of step with the log
+        if end != self.path.stat().st_size:
+            return False
+        for position, record in enumerate(records):
+            self._positions[record[0]] = position
+        self._records = records
+        self._index_lines = lines
+        return True
+
+    def _scan_log(self) -> None:
+        with open(self.path, "rb") as f:
+            offset = f.tell()
+            for line in iter(f.readline, b""):
+                if line.strip():
+                    header = _RECORD_HEADER.match(line)
+                    if header is not None:
+                        timestep, kind = int(header[1]), header[2].decode()
+                    else:
+                        record = json.loads(line)
+                        timestep, kind = int(record["timestep"]), record["kind"]
+                    self._positions[timestep] = len(self._records)
+                    self._records.append((timestep, offset, kind))
+                offset = f.tell()
+
+    @property
+    def timesteps(self) -> list[int]:
+        return sorted(self._positions)
+
+    def materialize(self, timestep: int) -> dict[str, Any]:
+        """Full snapshot as of ``timestep``."""
+        position = self._positions.get(timestep)
+        if position is None:
+            raise KeyError(f"Timestep {timestep} is not in snapshot log {self.path}")
+        start = position
+        while start > 0 and self._records[start][2] != "keyframe":
+            start -= 1
+        snapshot: dict[str, Any] | None = None
+        with open(self.path, "rb") as f:
+            for _, offset, _ in self._records[start : position + 1]:
+                f.seek(offset)
+                record = json.loads(f.readline())
+                if record["kind"] == "keyframe":
+                    snapshot = record["snapshot"]
+                elif snapshot is not None:
+                    snapshot = apply_snapshot_delta(snapshot, record["delta"])
+        if snapshot is None:
+            raise ValueError(f"No keyframe precedes timestep {timestep} in {self.path}")
+        return snapshot
+
+    def view(self, timestep: int) -> "SnapshotView":
+        """Lazily parsed snapshot as of ``timestep``.
+
+        Uses the span index when present; otherwise (logs written without
+        one) falls back to materializing the snapshot.
+        """
+        position = self._positions.get(timestep)
+        if position is None:
+            raise KeyError(f"Timestep {timestep} is not in snapshot log {self.path}")
+        if self._index_lines is None:
+            return SnapshotView.from_snapshot(self.materialize(timestep))
+        start = position
+        while start > 0 and self._records[start][2] != "keyframe":
+            start -= 1
+        if self._records[start][2] != "keyframe":
+            raise ValueError(f"No keyframe precedes timestep {timestep} in {self.path}")
+
+        fields: dict[str, Any] = {}
+        sections: dict[str, dict[str, Any]] = {}
+        for line in self._index_lines[start : position + 1]:
+            entry = json.loads(line)
+            base = entry["offset"]
+            for field in entry.get("unset", ()):
+                fields.pop(field, None)
+                sections.pop(field, None)
+            for field, indexed in entry["sections"].items():
+                spans = {
+                    key: (base + a, base + b)
+                    for key, (a, b) in indexed.get("items", {}).items()
+                }
+                if entry["kind"] == "keyframe":
+                    sections[field] = spans
+                    continue
+                items = sections.get(field)
+                if items is None:
+                    # Section previously stored whole; diff it per item from now on
+                    value = fields.pop(field, None)
+                    if isinstance(value, tuple):
+                        value = _read_span(self.path, value)
+                    mapping = _as_mapping(
+                        value._value if isinstance(value, _Parsed) else value,
+                        KEYED_SECTIONS[field],
+                    )
+                    items = {k: _Parsed(v) for k, v in (mapping or {}).items()}
+                removed = set(indexed.get("removed", ()))
+                items = {k: v for k, v in items.items() if k not in removed}
+                items.update(spans)
+                order = indexed.get("order")
+                if order is not None:
+                    items = {key: items[key] for key in order}
+                sections[field] = items
+            for field, (a, b) in entry["fields"].items():
+                fields[field] = (base + a, base + b)
+                sections.pop(field, None)
+        return SnapshotView(self.path, fields, sections)
+
+
+class _Parsed:
+    """A value already in memory, held where a span would otherwise be."""
+
+    __slots__ = ("_value",)
+
+    def __init__(self, value: Any) -> None:
+        self._value = value
+
+
+def _read_span(path: Path, span: tuple[int, int]) -> Any:
+    with open(path, "rb") as f:
+        f.seek(span[0])
+        return json.loads(f.read(span[1] - span[0]))
+
+
+class SnapshotSection(Mapping[str, Any]):
+    """Items of one snapshot section, parsed from the log on first access."""
+
+    def __init__(self, view: "SnapshotView", items: dict[str, Any]) -> None:
+        self._view = view
+        self._items = items
+
+    def __getitem__(self, key: str) -> Any:
+        return self._view._resolve(self._items, key)
+
+    def items(self):  # type: ignore[override]
+        self._view._resolve_all(self._items)
+        return super().items()
+
+    def values(self):  # type: ignore[override]
+        self._view._resolve_all(self._items)
+        return super().values()
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._items)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+class SnapshotView:
+    """A snapshot whose fields and section items are parsed on demand.
+
+    Top-level fields are small and parsed on first access; sections
+    (``tasks``, ``resources``, ``agents``, ``messages``) are exposed through
+    ``section`` one item at a time. Parsed values are cached.
+    """
+
+    def __init__(
+        self,
+        path: Path | None,
+        fields: dict[str, Any],
+        sections: dict[str, dict[str, Any]],
+    ) -> None:
+        self.path = path
+        self._fields = fields
+        self._sections = sections
+        self._mmap: mmap.mmap | None = None
+
+    @classmethod
+    def from_snapshot(cls, snapshot: dict[str, Any]) -> "SnapshotView":
+        """View over an already materialized snapshot."""
+        fields: dict[str, Any] = {}
+        sections: dict[str, dict[str, Any]] = {}
+        for field, value in snapshot.items():
+            mapping = (
+                _as_mapping(value, KEYED_SECTIONS[field])
+                if field in KEYED_SECTIONS
+                else None
+            )
+            if mapping is None:
+                fields[field] = _Parsed(value)
+            else:
+                sections[field] = {k: _Parsed(v) for k, v in mapping.items()}
+        return cls(None, fields, sections)
+
+    def _data(self) -> mmap.mmap:
+        if self._mmap is None:
+            assert self.path is not None
+            with open(self.path, "rb") as f:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._mmap
+
+    def _resolve(self, values: dict[str, Any], key: str) -> Any:
+        value = values[key]
+        if isinstance(value, _Parsed):
+            return value._value
+        start, end = value
+        parsed = json.loads(self._data()[start:end])
+        values[key] = _Parsed(parsed)
+        return parsed
+
+    def _resolve_all(self, values: dict[str, Any]) -> None:
+        """Parse every unparsed value in one ``json.loads`` call."""
+        pending = [key for key, value in values.items() if type(value) is tuple]
+        if not pending:
+            return
+        data = self._data()
+        parts = [data[values[key][0] : values[key][1]] for key in pending]
+        for key, parsed in zip(pending, json.loads(b"[" + b",".join(parts) + b"]")):
+            values[key] = _Parsed(parsed)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._fields or name in self._sections
+
+    def get(self, name: str, default: Any = None) -> Any:
+        """A top-level field, or a section as a plain dict/list (parses it)."""
+        if name in self._fields:
+            return self._resolve(self._fields, name)
+        if name in self._sections:
+            section = self.section(name)
+            if KEYED_SECTIONS[name] is None:
+                return dict(section.items())
+            return list(section.values())
+        return default
+
+    def __getitem__(self, name: str) -> Any:
+        if name not in self:
+            raise KeyError(name)
+        return self.get(name)
+
+    def section(self, name: str) -> SnapshotSection:
+        """Lazily parsed items of a keyed section (empty if absent)."""
+        return SnapshotSection(self, self._sections.get(name, {}))
+
+    def materialize(self) -> dict[str, Any]:
+        """The full snapshot as a plain dict (parses everything)."""
+        return {name: self.get(name) for name in [*self._fields, *self._sections]}
+
+    def close(self) -> None:
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
@@ -6,17 +6,24 @@ state from saved simulation data, enabling re-evaluation of past states.
 """
 
 import json
+from collections.abc import Mapping
+from functools import partial
 from pathlib import Path
 from datetime import datetime
 from uuid import UUID
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from ..workflow_agents.registry import AgentRegistry
+from ..common.content_store import ContentStore
 from ..common.logging import logger
 from ...schemas.execution.manager_actions import ActionResult
 from ...schemas.core.communication import Message, MessageType
 from ...schemas.core.tasks import TaskStatus
 from ...schemas.preferences.preference import PreferenceWeights, Preference
+from .snapshot_store import SnapshotLogReader, SnapshotView
+
+if TYPE_CHECKING:
+    from ...schemas.core.resources import Resource
 
 
 class WorkflowStateRestorer:
@@ -31,90 +38,228 @@ class WorkflowStateRestorer:
     - Manager agent action buffer
     - Active agent registry
     - Agent workload assignments
+
+    With ``lazy=True`` the workflow snapshot is read through the delta log's
+    span index: loading parses only the small top-level fields and only task
+    state is restored eagerly. Resources are registered with the workflow as
+    lazy entries, each parsed from its snapshot section item and built on
+    first lookup; restored messages are registered as pending messages of the
+    communication graph, built when the graph is next used. The timestep file
+    and execution log are read on first use. Snapshot contents are trusted in
+    this mode, so resources and messages are built with ``model_construct``
+    instead of being re-validated, and a spilled resource without a blob
+    store fails when it is looked up rather than during the restore.
     """
 
-    def __init__(self, snapshot_dir: str, timestep: int):
+    def __init__(
+        self,
+        snapshot_dir: str,
+        timestep: int,
+        snapshot_log: str | None = None,
+        resource_blob_dir: str | None = None,
+        lazy: bool = False,
+    ):
         """
         Initialize the state restorer for a specific snapshot.
 
         Args:
             snapshot_dir: Path to simulation run directory
             timestep: Target timestep to restore from
+            snapshot_log: Delta snapshot log to materialize the workflow snapshot
+                from (default: the log referenced by the timestep file)
+            resource_blob_dir: Content store holding spilled resource content
+                (default: the nearest resource_blobs directory in snapshot_dir
+                or its parents, where runs sharing a base directory keep it)
+            lazy: Parse the snapshot on demand and skip validation (see above)
         """
         self.snapshot_dir = Path(snapshot_dir)
         self.timestep = timestep
-        self.timestep_data: dict[str, Any] = {}
-        self.execution_log_data: dict[str, Any] = {}
-
-    def load_snapshot_data(self) -> None:
-        """Load all necessary snapshot data files."""
-        # Load timestep snapshot
-        timestep_file = (
-            self.snapshot_dir / "timestep_data" / f"timestep_{self.timestep:04d}.json"
+        self.snapshot_log = Path(snapshot_log) if snapshot_log else None
+        blob_dir = (
+            Path(resource_blob_dir)
+            if resource_blob_dir
+            else self._find_resource_blob_dir()
         )
-        if not timestep_file.exists():
-            raise FileNotFoundError(f"Timestep file not found: {timestep_file}")
+        self.content_store: ContentStore | None = (
+            ContentStore(blob_dir)
+            if blob_dir is not None and blob_dir.is_dir()
+            else None
+        )
+        self.lazy = lazy
+        self.snapshot_view: SnapshotView | None = None
+        self._timestep_data: dict[str, Any] | None = None
+        self._workflow_snapshot: dict[str, Any] | None = None
+        self._execution_log_data: dict[str, Any] | None = None
+
+    @property
+    def timestep_data(self) -> dict[str, Any]:
+        """Contents of the timestep file (read on first use)."""
+        data = self._timestep_data
+        if data is None:
+            with open(self._timestep_file(), "r") as f:
+                data = self._timestep_data = json.load(f)
+        return data
+
+    @property
+    def workflow_snapshot(self) -> dict[str, Any]:
+        """The full workflow snapshot as a dict (materialized on first use)."""
+        if self._workflow_snapshot is None:
+            self._workflow_snapshot = (
+                self.snapshot_view.materialize()
+                if self.snapshot_view is not None
+                else {}
+            )
+        return self._workflow_snapshot
+
+    @workflow_snapshot.setter
+    def workflow_snapshot(self, snapshot: dict[str, Any]) -> None:
+        self._workflow_snapshot = snapshot
+        self.snapshot_view = SnapshotView.from_snapshot(snapshot)
 
-        with open(timestep_file, "r") as f:
-            self.timestep_data = json.load(f)
+    @property
+    def execution_log_data(self) -> dict[str, Any]:
+        """Contents of the run's execution log (read on first use)."""
+        if self._execution_log_data is None:
+            self._execution_log_data = self._load_execution_log()
+        return self._execution_log_data
 
-        # Load execution log for manager action buffer
+    def _load_execution_log(self) -> dict[str, Any]:
         execution_log_file = (
             self.snapshot_dir
             / "execution_logs"
             / f"execution_log_{self.snapshot_dir.name.split('_')[-1]}.json"
         )
-        if execution_log_file.exists():
-            with open(execution_log_file, "r") as f:
-                self.execution_log_data = json.load(f)
-        else:
+        if not execution_log_file.exists():
             logger.warning("Execution log not found: %s", execution_log_file)
+            return {}
+        with open(execution_log_file, "r") as f:
+            return json.load(f)
+
+    def _find_resource_blob_dir(self) -> Path | None:
+        for directory in (self.snapshot_dir, *self.snapshot_dir.parents):
+            candidate = directory / "resource_blobs"
+            if candidate.is_dir():
+                return candidate
+        return None
+
+    def _require_content_store(self, resource_id: UUID) -> ContentStore:
+        if self.content_store is None:
+            raise FileNotFoundError(
+                f"Resource {resource_id} in the snapshot of {self.snapshot_dir} "
+                "has spilled content, but no resource_blobs directory was found; "
+                "pass resource_blob_dir"
+            )
+        return self.content_store
+
+    def _timestep_file(self) -> Path:
+        return (
+            self.snapshot_dir / "timestep_data" / f"timestep_{self.timestep:04d}.json"
+        )
+
+    def load_snapshot_data(self) -> None:
+        """Load all necessary snapshot data files."""
+        timestep_file = self._timestep_file()
+        if not timestep_file.exists():
+            raise FileNotFoundError(f"Timestep file not found: {timestep_file}")
+
+        if self.lazy:
+            log_path = self._find_snapshot_log()
+            if log_path is not None:
+                self.snapshot_view = SnapshotLogReader(log_path).view(self.timestep)
+                return
+
+        # Load timestep snapshot and the execution log for the manager action buffer
+        self.workflow_snapshot = self._load_workflow_snapshot()
+        self._execution_log_data = self._load_execution_log()
+
+    def _find_snapshot_log(self, ref: dict[str, Any] | None = None) -> Path | None:
+        """The run's delta snapshot log, if it has one."""
+        log_path = self.snapshot_log
+        if log_path is None and ref and ref.get("log"):
+            log_path = self.snapshot_dir / "workflow_outputs" / ref["log"]
+        if log_path is None or not log_path.exists():
+            candidates = sorted(
+                (self.snapshot_dir / "workflow_outputs").glob(
+                    "workflow_snapshots_*.jsonl"
+                )
+            )
+            log_path = candidates[0] if candidates else None
+        return log_path
+
+    def _load_workflow_snapshot(self) -> dict[str, Any]:
+        """Embedded full snapshot, or the timestep materialized from a delta log."""
+        metadata = self.timestep_data.get("metadata", {})
+        if "workflow_snapshot" in metadata and self.snapshot_log is None:
+            return metadata["workflow_snapshot"]
+
+        ref = metadata.get("workflow_snapshot_ref") or {}
+        log_path = self._find_snapshot_log(ref)
+        if log_path is None:
+            raise FileNotFoundError(
+                f"No workflow snapshot for timestep {self.timestep} in {self.snapshot_dir}"
+            )
+        return SnapshotLogReader(log_path).materialize(
+            int(ref.get("timestep", self.timestep))
+        )
+
+    def _snapshot(self) -> SnapshotView:
+        if self.snapshot_view is None:
+            self.snapshot_view = SnapshotView.from_snapshot(self.workflow_snapshot)
+        return self.snapshot_view
 
     def restore_workflow_state(self, workflow) -> None:
         """Update workflow task and resource states from snapshot."""
-        workflow_snapshot = self.timestep_data["metadata"]["workflow_snapshot"]
+        workflow_snapshot = self._snapshot()
 
-        # Update task states
-        tasks_data = workflow_snapshot.get("tasks", {})
+        # Update task states (only fields that differ: assignments notify the workflow)
+        tasks_data = workflow_snapshot.section("tasks")
+        tasks_by_id = {str(task_id): task for task_id, task in workflow.tasks.items()}
         for task_id_str, task_data in tasks_data.items():
-            task_id = UUID(task_id_str)
-            if task_id in workflow.tasks:
-                task = workflow.tasks[task_id]
+            task = tasks_by_id.get(task_id_str)
+            if task is not None:
                 # Update key state information
-                task.status = TaskStatus(task_data["status"])
-                task.assigned_agent_id = task_data.get("assigned_agent_id")
-                task.actual_duration_hours = task_data.get("actual_duration_hours")
-                task.actual_cost = task_data.get("actual_cost")
-                task.quality_score = task_data.get("quality_score")
+                state: dict[str, Any] = {
+                    "status": TaskStatus(task_data["status"]),
+                    "assigned_agent_id": task_data.get("assigned_agent_id"),
+                    "actual_duration_hours": task_data.get("actual_duration_hours"),
+                    "actual_cost": task_data.get("actual_cost"),
+                    "quality_score": task_data.get("quality_score"),
+                    "execution_notes": task_data.get("execution_notes", []),
+                }
                 if task_data.get("started_at"):
-                    task.started_at = datetime.fromisoformat(task_data["started_at"])
+                    state["started_at"] = datetime.fromisoformat(
+                        task_data["started_at"]
+                    )
                 if task_data.get("completed_at"):
-                    task.completed_at = datetime.fromisoformat(
+                    state["completed_at"] = datetime.fromisoformat(
                         task_data["completed_at"]
                     )
-                task.execution_notes = task_data.get("execution_notes", [])
+                for name, value in state.items():
+                    if getattr(task, name) != value:
+                        setattr(task, name, value)
 
         # Synchronize embedded subtasks with the updated registry to fix status inconsistencies
         for task in workflow.tasks.values():
             task.sync_embedded_tasks_with_registry(workflow.tasks)
 
         # Restore resources from snapshot
-        resources_data = workflow_snapshot.get("resources", {})
+        resources_data = workflow_snapshot.section("resources")
         logger.info("Restoring %s resources from snapshot", len(resources_data))
 
-        # Import Resource here to avoid circular imports
-        from ...schemas.core.resources import Resource
-
-        for resource_id_str, resource_data in resources_data.items():
-            resource_id = UUID(resource_id_str)
-            resource = Resource(
-                id=resource_id,
-                name=resource_data["name"],
-                description=resource_data["description"],
-                content=resource_data.get("content"),
-                content_type=resource_data.get("content_type", "text/plain"),
+        if self.lazy:
+            workflow.add_lazy_resources(
+                {
+                    UUID(resource_id_str): partial(
+                        self._build_resource, resources_data, resource_id_str
+                    )
+                    for resource_id_str in resources_data
+                }
             )
-            workflow.resources[resource_id] = resource
+        else:
+            for resource_id_str in resources_data:
+                workflow.add_resource(
+                    self._build_resource(resources_data, resource_id_str)
+                )
 
         # Update workflow-level state
         workflow.total_cost = workflow_snapshot.get("total_cost", 0.0)
@@ -128,9 +273,37 @@ class WorkflowStateRestorer:
             )
         workflow.is_active = workflow_snapshot.get("is_active", True)
 
+    def _build_resource(
+        self, resources_data: Mapping[str, Any], resource_id_str: str
+    ) -> "Resource":
+        """Resource from its snapshot section item, attached to the blob store if spilled."""
+        # Import Resource here to avoid circular imports
+        from ...schemas.core.resources import ContentRef, Resource
+
+        build_resource = Resource.model_construct if self.lazy else Resource
+        build_ref = ContentRef.model_construct if self.lazy else ContentRef
+        resource_data = resources_data[resource_id_str]
+        resource_id = UUID(resource_id_str)
+        content_ref = resource_data.get("content_ref")
+        resource = build_resource(
+            id=resource_id,
+            name=resource_data["name"],
+            description=resource_data["description"],
+            content=resource_data.get("content"),
+            content_type=resource_data.get("content_type", "text/plain"),
+            content_ref=build_ref(**content_ref) if content_ref else None,
+        )
+        if resource.is_spilled:
+            # Spilled content lives in the snapshot run's blob store
+            resource._content_store = self._require_content_store(resource_id)
+        return resource
+
     def restore_stakeholder_preferences(self, stakeholder_agent) -> None:
         """Update stakeholder agent preferences to match snapshot."""
-        prefs_data = self.timestep_data["metadata"]["stakeholder_preference_state"]
+        # Delta snapshots record the weights; older runs only have the timestep file
+        prefs_data = self._snapshot().get("stakeholder_state")
+        if not prefs_data:
+            prefs_data = self.timestep_data["metadata"]["stakeholder_preference_state"]
 
         stakeholder_agent.apply_preference_change(
             timestep=self.timestep,
@@ -143,61 +316,75 @@ class WorkflowStateRestorer:
             change_event=None,
         )
 
-    def restore_communication_history(self, communication_service) -> None:
-        """Restore communication message history from snapshot."""
-        # Messages are stored in manager_observation.recent_messages
+    def _recent_messages(self) -> list[dict[str, Any]] | Mapping[str, Any]:
+        """Messages the manager observed, keyed by id when read from the snapshot."""
+        snapshot = self._snapshot()
+        if "recent_messages" in snapshot:
+            return snapshot.section("recent_messages")
+        # Older runs: messages are stored in manager_observation.recent_messages
         manager_observation = self.timestep_data["metadata"]["manager_observation"]
-        messages = manager_observation.get("recent_messages", [])
+        return manager_observation.get("recent_messages", [])
 
+    def restore_communication_history(self, communication_service) -> None:
+        """Restore communication message history from snapshot."""
+        messages = self._recent_messages()
         logger.info("Restoring %s messages from snapshot", len(messages))
 
-        for i, msg_data in enumerate(messages):
-            try:
-                # Convert snapshot data to Message object
-                message = Message(
-                    message_id=UUID(msg_data["message_id"]),
-                    sender_id=msg_data["sender_id"],
-                    receiver_id=msg_data.get("receiver_id"),
-                    recipients=msg_data.get("recipients", []),
-                    content=msg_data["content"],
-                    message_type=MessageType(msg_data["message_type"]),
-                    timestamp=datetime.fromisoformat(msg_data["timestamp"]),
-                    thread_id=UUID(msg_data["thread_id"])
-                    if msg_data.get("thread_id")
-                    else None,
-                    parent_message_id=UUID(msg_data["parent_message_id"])
-                    if msg_data.get("parent_message_id")
-                    else None,
-                    related_task_id=UUID(msg_data["related_task_id"])
-                    if msg_data.get("related_task_id")
-                    else None,
-                    priority=msg_data.get("priority", 1),
-                    read_by={
-                        agent_id: datetime.fromisoformat(read_time)
-                        for agent_id, read_time in msg_data.get("read_by", {}).items()
-                    },
-                    metadata=msg_data.get("metadata", {}),
+        graph = communication_service.graph
+        if self.lazy and isinstance(messages, Mapping):
+            for message_id in messages:
+                graph.add_pending_message(
+                    partial(self._build_message, messages, message_id)
                 )
+            logger.info("Registered %s messages to build on first use", len(messages))
+            return
 
-                # Add message to communication service
-                communication_service.graph.add_message(message)
-
+        keys = list(messages) if isinstance(messages, Mapping) else range(len(messages))
+        for i, key in enumerate(keys):
+            try:
+                message = self._build_message(messages, key)
+                graph.add_message(message)
                 logger.debug(
                     "Restored message %s: %s -> %s...",
                     i + 1,
-                    msg_data["sender_id"],
-                    msg_data["content"][:50],
+                    message.sender_id,
+                    message.content[:50],
                 )
-
             except Exception as e:
                 logger.error(
                     "Failed to restore message %s: %s", i + 1, e, exc_info=True
                 )
                 continue
 
-        logger.info(
-            "Successfully restored %s messages",
-            len(communication_service.graph.messages),
+        logger.info("Successfully restored %s messages", len(graph.messages))
+
+    def _build_message(self, messages: Any, key: Any) -> Message:
+        """Message from its snapshot data (``messages[key]``)."""
+        msg_data = messages[key]
+        build_message = Message.model_construct if self.lazy else Message
+        return build_message(
+            message_id=UUID(msg_data["message_id"]),
+            sender_id=msg_data["sender_id"],
+            receiver_id=msg_data.get("receiver_id"),
+            recipients=msg_data.get("recipients", []),
+            content=msg_data["content"],
+            message_type=MessageType(msg_data["message_type"]),
+            timestamp=datetime.fromisoformat(msg_data["timestamp"]),
+            thread_id=UUID(msg_data["thread_id"])
+            if msg_data.get("thread_id")
+            else None,
+            parent_message_id=UUID(msg_data["parent_message_id"])
+            if msg_data.get("parent_message_id")
+            else None,
+            related_task_id=UUID(msg_data["related_task_id"])
+            if msg_data.get("related_task_id")
+            else None,
+            priority=msg_data.get("priority", 1),
+            read_by={
+                agent_id: datetime.fromisoformat(read_time)
+                for agent_id, read_time in msg_data.get("read_by", {}).items()
+            },
+            metadata=msg_data.get("metadata", {}),
         )
 
     def restore_manager_action_buffer(self, manager_agent) -> None:
@@ -248,8 +435,7 @@ class WorkflowStateRestorer:
 
     def restore_active_agents(self, agent_registry: AgentRegistry) -> None:
         """Restore active agent states from snapshot."""
-        workflow_snapshot = self.timestep_data["metadata"]["workflow_snapshot"]
-        agents_data = workflow_snapshot.get("agents", [])
+        agents_data = self._snapshot().get("agents", [])
 
         logger.info("Restoring %s active agents from snapshot", len(agents_data))
 
@@ -268,8 +454,7 @@ class WorkflowStateRestorer:
 
     def get_agent_workloads(self) -> dict[str, list[str]]:
         """Extract current task assignments per agent from workflow state."""
-        workflow_snapshot = self.timestep_data["metadata"]["workflow_snapshot"]
-        tasks_data = workflow_snapshot.get("tasks", {})
+        tasks_data = self._snapshot().section("tasks")
 
         workloads: dict[str, list[str]] = {}
 
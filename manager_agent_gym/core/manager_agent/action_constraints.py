@@ -7,6 +7,7 @@ to the set of valid values observed in the workflow at that timestep.
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Any, Type, Union, cast
 
 from pydantic import BaseModel, Field, create_model
@@ -14,26 +15,54 @@ from pydantic import BaseModel, Field, create_model
 from ...schemas.execution.manager_actions import BaseManagerAction
 from ...schemas.execution.manager import ManagerObservation
 
+# Compiled response models kept across steps (LRU)
+SCHEMA_CACHE_SIZE = 128
+
 
 def build_context_constrained_action_schema(
-    action_classes: list[type[BaseManagerAction]], observation: ManagerObservation
+    action_classes: list[type[BaseManagerAction]],
+    observation: ManagerObservation,
+    constrain_ids: bool = False,
 ) -> Type[BaseModel]:
     """
-    Build a Pydantic model to use as response_format that constrains action parameters
-    (e.g., task_id, agent_id) to only valid values from the current observation.
+    Build a Pydantic model to use as response_format for the given action classes.
+
+    With ``constrain_ids``, ID parameters (e.g., task_id, agent_id) are limited
+    to the valid values in the current observation via JSON schema enums; the
+    constrained action models are for schema purposes only.
+
+    Models are cached per action classes (and ID universes when constrained),
+    so unchanged inputs reuse the already compiled model.
     """
+    id_universes = (
+        (
+            tuple(sorted(str(x) for x in observation.task_ids)),
+            tuple(sorted(str(x) for x in observation.agent_ids)),
+        )
+        if constrain_ids
+        else None
+    )
+    return _cached_action_schema(tuple(action_classes), id_universes)
+
+
+@lru_cache(maxsize=SCHEMA_CACHE_SIZE)
+def _cached_action_schema(
+    action_classes: tuple[type[BaseManagerAction], ...],
+    id_universes: tuple[tuple[str, ...], tuple[str, ...]] | None,
+) -> Type[BaseModel]:
+    members: tuple[Any, ...] = action_classes
+    if id_universes is not None:
+        task_ids, agent_ids = id_universes
+        members = tuple(
+            _constrain_action_class(ac, list(task_ids), list(agent_ids))
+            for ac in action_classes
+        )
 
     constrained_union: Any
-    if len(action_classes) == 1:
-        constrained_union = action_classes[
-            0
-        ]  # _constrain_action_class(action_classes[0], observation)
+    if len(members) == 1:
+        constrained_union = members[0]
     else:
-        constrained_union = Union[
-            tuple(
-                ac for ac in action_classes
-            )  # _constrain_action_class(ac, observation) for ac in action_classes)
-        ]
+        constrained_union = Union[members]
 
     class ConstrainedManagerAction(BaseModel):
         reasoning: str = Field(
@@ -47,7 +76,7 @@ def build_context_constrained_action_schema(
 
 
 def _constrain_action_class(
-    action_class: type[BaseManagerAction], observation: ManagerObservation
+    action_class: type[BaseManagerAction], task_ids: list[str], agent_ids: list[str]
 ) -> type[BaseManagerAction]:
     """
     Create a new action class with ID fields replaced by dynamic Enums of allowed values.
@@ -59,7 +88,7 @@ def _constrain_action_class(
 
         # Map known ID fields to allowed sets via JSON Schema enum hints while preserving runtime types
         if name in {"task_id", "prerequisite_task_id", "dependent_task_id"}:
-            allowed = [str(x) for x in observation.task_ids]
+            allowed = task_ids
             fields_any[name] = (
                 annotation if annotation is not None else str,
                 Field(
@@ -69,7 +98,7 @@ def _constrain_action_class(
                 ),
             )
         elif name == "agent_id":
-            allowed = [str(x) for x in observation.agent_ids]
+            allowed = agent_ids
             fields_any[name] = (
                 annotation if annotation is not None else str,
                 Field(
@@ -79,8 +108,7 @@ def _constrain_action_class(
                 ),
             )
         elif name == "receiver_id":
-            allowed = [str(x) for x in observation.agent_ids]
-            enum_with_null = cast(list[Any], allowed + [None])
+            enum_with_null = cast(list[Any], agent_ids + [None])
             underlying = annotation if annotation is not None else (str | None)
             fields_any[name] = (
                 underlying,
@@ -0,0 +1,146 @@
+"""
+Token-budgeted packing of manager prompt context.
+
+Prompts are assembled from titled sections whose lines are ordered most
+relevant first. ``ContextPacker`` fills a token budget greedily: required
+sections are always included, then sections take as many of their lines as
+still fit in priority order. Sections are rendered in their declared order, so
+the prompt layout stays stable while low-priority content is cut first.
+
+Sizes use the same ~4 characters per token estimate as rate limiting.
+"""
+
+from __future__ import annotations
+
+from pydantic import BaseModel, Field
+
+from ..common.llm_interface import estimate_tokens
+from ..common.logging import logger
+
+CHARS_PER_TOKEN = 4
+DEFAULT_CONTEXT_TOKEN_BUDGET = 8000
+
+# Room kept for the "N more omitted" line of a partially packed section
+_OMISSION_RESERVE = 32
+
+
+class ContextSection(BaseModel):
+    """A titled block of prompt lines, most relevant first."""
+
+    title: str
+    lines: list[str] = Field(default_factory=list)
+    priority: int = Field(default=0, description="Lower values are packed first")
+    required: bool = Field(
+        default=False, description="Always included in full, even over budget"
+    )
+    atomic: bool = Field(
+        default=False, description="Included whole or not at all (e.g. JSON)"
+    )
+    empty_text: str | None = Field(
+        default=None, description="Line rendered when the section has no lines"
+    )
+
+
+class PackedContext(BaseModel):
+    """Packed prompt text plus per-section accounting."""
+
+    text: str
+    tokens: int
+    budget: int | None
+    included_lines: dict[str, int] = Field(default_factory=dict)
+    omitted_lines: dict[str, int] = Field(default_factory=dict)
+
+    @property
+    def truncated(self) -> bool:
+        return any(self.omitted_lines.values())
+
+
+def _heading(title: str) -> str:
+    return f"### {title}"
+
+
+class ContextPacker:
+    """Greedy, priority-ranked packer for prompt sections.
+
+    Args:
+        token_budget: Maximum estimated tokens of the packed text; None packs
+            everything.
+
+    Attributes:
+        last_packed (PackedContext | None): Result of the most recent ``pack``.
+    """
+
+    def __init__(self, token_budget: int | None = DEFAULT_CONTEXT_TOKEN_BUDGET) -> None:
+        self.token_budget = token_budget
+        self.last_packed: PackedContext | None = None
+
+    def pack(self, sections: list[ContextSection], preamble: str = "") -> PackedContext:
+        """Pack ``sections`` after ``preamble`` (always included) into the budget."""
+        limit = (
+            None if self.token_budget is None else self.token_budget * CHARS_PER_TOKEN
+        )
+        used = len(preamble)
+        kept: dict[int, list[str]] = {}
+        omitted: dict[str, int] = {}
+
+        ranked = sorted(
+            range(len(sections)),
+            key=lambda i: (not sections[i].required, sections[i].priority),
+        )
+        for index in ranked:
+            section = sections[index]
+            lines = section.lines or (
+                [section.empty_text] if section.empty_text is not None else []
+            )
+            if not lines:
+                continue
+            # Heading line plus the blank line separating sections
+            overhead = len(_heading(section.title)) + 2
+            size = overhead + sum(len(line) + 1 for line in lines)
+            if section.required or limit is None or used + size <= limit:
+                kept[index] = lines
+                used += size
+                continue
+            if section.atomic:
+                omitted[section.title] = len(section.lines)
+                continue
+            taken: list[str] = []
+            running = used + overhead + _OMISSION_RESERVE
+            for line in lines:
+                if running + len(line) + 1 > limit:
+                    break
+                taken.append(line)
+                running += len(line) + 1
+            omitted[section.title] = len(lines) - len(taken)
+            if taken:
+                taken.append(f"- … ({len(lines) - len(taken)} more omitted)")
+                kept[index] = taken
+                used = running
+
+        blocks = [preamble.rstrip("\n")] if preamble else []
+        included: dict[str, int] = {}
+        for index, section in enumerate(sections):
+            lines = kept.get(index)
+            if lines is None:
+                continue
+            included[section.title] = len(lines) - (
+                1 if omitted.get(section.title) else 0
+            )
+            blocks.append(_heading(section.title) + "\n" + "\n".join(lines))
+        text = "\n\n".join(blocks) + "\n"
+
+        packed = PackedContext(
+            text=text,
+            tokens=estimate_tokens(text),
+            budget=self.token_budget,
+            included_lines=included,
+            omitted_lines={title: n for title, n in omitted.items() if n},
+        )
+        self.last_packed = packed
+        logger.debug(
+            "packed manager context: %d tokens (budget %s), omitted %s",
+            packed.tokens,
+            packed.budget,
+            packed.omitted_lines or "nothing",
+        )
+        return packed
@@ -6,7 +6,7 @@ state and take actions to influence execution.
 """
 
 from collections import deque
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Callable, ClassVar
 from abc import ABC, abstractmethod
 
 from ...schemas.execution import ManagerObservation
@@ -21,6 +21,15 @@ if TYPE_CHECKING:
     from ..communication.service import CommunicationService
 
 
+def _count_task_statuses(workflow: "Workflow") -> dict[str, int]:
+    counts = {status.value: 0 for status in TaskStatus}
+    for task in workflow.tasks.values():
+        status = getattr(task.status, "value", task.status)
+        if status in counts:
+            counts[status] += 1
+    return counts
+
+
 class ManagerAgent(ABC):
     """Abstract interface for manager agents.
 
@@ -35,6 +44,8 @@ class ManagerAgent(ABC):
         agent_id (str): Identifier for logging and communications.
         preferences (PreferenceWeights): Current preference weights.
         _action_buffer (deque[ActionResult]): Recent actions (maxlen 50).
+        last_observation (ManagerObservation | None): Most recent observation
+            built by ``create_observation``.
 
     Example:
         ```python
@@ -48,6 +59,11 @@ class ManagerAgent(ABC):
         ```
     """
 
+    # Observation fields this manager reads. Expensive fields not listed (the
+    # workflow summary, status counts, agent metadata, messages, constraints
+    # and ID universes) are computed on first access; None computes them all.
+    observation_fields: ClassVar[frozenset[str] | None] = None
+
     def __init__(self, agent_id: str, preferences: PreferenceWeights):
         self.agent_id = agent_id
         self.preferences = preferences
@@ -56,6 +72,9 @@ class ManagerAgent(ABC):
         self._max_timesteps: int | None = None
         # Seed configured by engine (if any)
         self._seed: int = 42
+        # Memoized observation and the state it was built from
+        self.last_observation: ManagerObservation | None = None
+        self._observation_key: tuple[Any, ...] | None = None
 
     def configure_seed(self, seed: int) -> None:
         """Configure deterministic seed for this manager (overridable)."""
@@ -94,6 +113,11 @@ class ManagerAgent(ABC):
 
         Subclasses can override this to customize what they observe.
 
+        The observation is memoized as ``last_observation`` and returned again
+        while the workflow version, timestep, execution state, task id sets
+        and message count are unchanged. Expensive fields missing from
+        ``observation_fields`` are deferred until first access.
+
         Args:
             workflow: Current workflow state
             execution_state: Current execution state
@@ -106,27 +130,77 @@ class ManagerAgent(ABC):
         Returns:
             ManagerObservation with workflow state data
         """
-        # Get task status summary
-        task_statuses = {}
-        for status in TaskStatus:
-            task_statuses[status.value] = sum(
-                1 for task in workflow.tasks.values() if task.status == status
-            )
+        # Promotes newly unblocked tasks to READY, so it runs before the state
+        # is keyed and the status counts
+        workflow.get_ready_tasks()
 
-        # Get ready tasks
-        ready_tasks = workflow.get_ready_tasks()
+        key = self._observation_state_key(
+            workflow,
+            execution_state,
+            stakeholder_profile,
+            current_timestep,
+            running_tasks,
+            completed_task_ids,
+            failed_task_ids,
+            communication_service,
+        )
+        if self.last_observation is not None and key == self._observation_key:
+            return self.last_observation
+
+        observation = self._build_observation(
+            workflow,
+            execution_state,
+            stakeholder_profile,
+            current_timestep,
+            running_tasks,
+            completed_task_ids,
+            failed_task_ids,
+            communication_service,
+        )
+        self.last_observation = observation
+        self._observation_key = key
+        return observation
 
-        # Get available agents
-        available_agents = workflow.get_available_agents()
+    def _build_observation(
+        self,
+        workflow: "Workflow",
+        execution_state: "ExecutionState",
+        stakeholder_profile: StakeholderPublicProfile,
+        current_timestep: int,
+        running_tasks: dict,
+        completed_task_ids: set,
+        failed_task_ids: set,
+        communication_service: "CommunicationService | None",
+    ) -> ManagerObservation:
+        """Build a fresh observation, bypassing the ``last_observation`` memo."""
+        ready_tasks = workflow.get_ready_tasks()
 
         # Get recent messages from communication service if available
-        recent_messages = []
-        if communication_service:
-            all_comm_messages = communication_service.get_all_messages()
-            recent_messages = all_comm_messages[:10]  # Last 10 messages
-        else:
+        def recent_messages() -> list:
+            if communication_service:
+                return communication_service.get_all_messages(limit=10)
             # Fallback to workflow messages for backward compatibility
-            recent_messages = workflow.messages[-5:]  # Last 5 messages
+            return workflow.messages[-5:]  # Last 5 messages
+
+        # Fields only computed up front if the manager reads them
+        factories: dict[str, Callable[[], Any]] = {
+            "workflow_summary": workflow.pretty_print,
+            "task_status_counts": lambda: _count_task_statuses(workflow),
+            "available_agent_metadata": lambda: [
+                agent.config for agent in workflow.get_available_agents()
+            ],
+            "recent_messages": recent_messages,
+            "constraints": lambda: list(workflow.constraints),
+            "task_ids": lambda: list(workflow.tasks.keys()),
+            "resource_ids": lambda: list(workflow.resources.keys()),
+            "agent_ids": lambda: list(workflow.agents.keys()),
+        }
+        needed = self.observation_fields
+        eager = {
+            name: factory()
+            for name, factory in factories.items()
+            if needed is None or name in needed
+        }
 
         # Compute timeline awareness fields if configured
         max_ts = self._max_timesteps
@@ -137,29 +211,56 @@ class ManagerAgent(ABC):
             # Clamp progress in [0,1]
             time_progress = min(1.0, max(0.0, float(current_timestep) / float(max_ts)))
 
-        return ManagerObservation(
-            workflow_summary=workflow.pretty_print(),
+        return ManagerObservation.deferred(
+            {name: f for name, f in factories.items() if name not in eager},
             timestep=current_timestep,
             workflow_id=workflow.id,
             execution_state=execution_state,
-            task_status_counts=task_statuses,
             ready_task_ids=[task.id for task in ready_tasks],
             running_task_ids=list(running_tasks.keys()),
             completed_task_ids=list(completed_task_ids),
             failed_task_ids=list(failed_task_ids),
-            available_agent_metadata=[agent.config for agent in available_agents],
-            recent_messages=recent_messages,
             workflow_progress=len(completed_task_ids) / len(workflow.tasks)
             if workflow.tasks
             else 0.0,
             max_timesteps=max_ts,
             timesteps_remaining=ts_remaining,
             time_progress=time_progress,
-            constraints=workflow.constraints,
-            task_ids=list(workflow.tasks.keys()),
-            resource_ids=list(workflow.resources.keys()),
-            agent_ids=list(workflow.agents.keys()),
             stakeholder_profile=stakeholder_profile,
+            **eager,
+        )
+
+    def _observation_state_key(
+        self,
+        workflow: "Workflow",
+        execution_state: "ExecutionState",
+        stakeholder_profile: StakeholderPublicProfile,
+        current_timestep: int,
+        running_tasks: dict,
+        completed_task_ids: set,
+        failed_task_ids: set,
+        communication_service: "CommunicationService | None",
+    ) -> tuple[Any, ...]:
+        message_count = (
+            len(communication_service.graph.messages)
+            if communication_service
+            else len(workflow.messages)
+        )
+        # Sizes guard against registry edits that bypass the workflow's hooks
+        return (
+            id(workflow),
+            workflow.render_version,
+            len(workflow.tasks),
+            len(workflow.resources),
+            len(workflow.agents),
+            current_timestep,
+            execution_state,
+            id(stakeholder_profile),
+            self._max_timesteps,
+            frozenset(running_tasks),
+            frozenset(completed_task_ids),
+            frozenset(failed_task_ids),
+            message_count,
         )
 
     # Note: take_action(observation) has been removed from the abstract interface in favor of step(...).
@@ -183,6 +284,35 @@ class ManagerAgent(ABC):
         """
         raise NotImplementedError
 
+    async def prefetch_next_step(
+        self,
+        workflow: "Workflow",
+        execution_state: "ExecutionState",
+        stakeholder_profile: StakeholderPublicProfile,
+        current_timestep: int,
+        running_tasks: dict,
+        completed_task_ids: set,
+        failed_task_ids: set,
+        communication_service: "CommunicationService | None" = None,
+    ) -> None:
+        """
+        Hook invoked by the engine once the state the next ``step`` will
+        (probably) observe is known, while the rest of the current timestep
+        (evaluation, stakeholder policy) still runs.
+
+        Managers may start deciding ``current_timestep`` speculatively and
+        use the result in ``step`` if the real state matches. The default
+        does nothing.
+        """
+
+    def cancel_prefetch(self) -> None:
+        """Discard speculative work started by ``prefetch_next_step``."""
+
+    @property
+    def prefetch_stats(self) -> dict[str, Any] | None:
+        """Per-run speculation counters, or None if the manager does not prefetch."""
+        return None
+
     def on_action_executed(
         self,
         timestep: int,
@@ -219,3 +349,5 @@ class ManagerAgent(ABC):
         Reset the manager agent state for a new workflow execution.
         """
         self._action_buffer.clear()
+        self.last_observation = None
+        self._observation_key = None
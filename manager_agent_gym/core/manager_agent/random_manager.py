@@ -26,6 +26,11 @@ from ...schemas.execution.manager_actions import (
     AssignmentPair,
 )
 from .action_constraints import build_context_constrained_action_schema
+from .context_packing import (
+    DEFAULT_CONTEXT_TOKEN_BUDGET,
+    ContextPacker,
+    ContextSection,
+)
 from ...schemas.core.workflow import Workflow
 from ...schemas.execution.state import ExecutionState
 from ...schemas.preferences.preference import PreferenceWeights
@@ -37,6 +42,7 @@ from .prompts.structured_manager_prompts import (
     STRUCTURED_MANAGER_SYSTEM_PROMPT_TEMPLATE,
 )
 from ..common.llm_interface import generate_structured_response
+from ..common.rate_limiter import LLMPriority
 from ..common.logging import logger
 from ...core.workflow_agents.interface import AgentConfig
 from ...schemas.workflow_agents.stakeholder import StakeholderPublicProfile
@@ -62,26 +68,49 @@ class BulkAssignmentPromptBuilder:
 
     @staticmethod
     def build_user_prompt(
-        workflow_summary: str, available_agent_configs: list[AgentConfig]
+        workflow_summary: str,
+        available_agent_configs: list[AgentConfig],
+        packer: ContextPacker | None = None,
     ) -> str:
+        """User prompt; with ``packer`` the workflow summary is cut to its budget."""
         agents_block = "\n".join(
             [cfg.get_agent_capability_summary() for cfg in available_agent_configs]
         )
+        instruction_lines = [
+            "- Provide a complete mapping: include every task_id you can see in the workflow.",
+            "- Choose the best agent per task based on capabilities and role suitability.",
+            "- If uncertain, choose the most capable non-stakeholder agent; avoid stakeholder for execution unless clearly required.",
+        ]
+        if packer is not None:
+            return packer.pack(
+                [
+                    ContextSection(
+                        title="WORKFLOW", lines=workflow_summary.splitlines()
+                    ),
+                    ContextSection(
+                        title="AVAILABLE AGENTS",
+                        lines=agents_block.splitlines(),
+                        required=True,
+                    ),
+                    ContextSection(
+                        title="INSTRUCTIONS", lines=instruction_lines, required=True
+                    ),
+                ]
+            ).text
         return (
             "## WORKFLOW\n"
             f"{workflow_summary}\n\n"
             "## AVAILABLE AGENTS\n"
             f"{agents_block}\n\n"
-            "## INSTRUCTIONS\n"
-            "- Provide a complete mapping: include every task_id you can see in the workflow.\n"
-            "- Choose the best agent per task based on capabilities and role suitability.\n"
-            "- If uncertain, choose the most capable non-stakeholder agent; avoid stakeholder for execution unless clearly required.\n"
+            "## INSTRUCTIONS\n" + "\n".join(instruction_lines) + "\n"
         )
 
 
 class RandomManagerAgent(ManagerAgent):
     """Baseline: randomly chooses among a small set of safe actions."""
 
+    observation_fields = frozenset({"available_agent_metadata"})
+
     def __init__(self, preferences: PreferenceWeights, seed: int = 42):
         super().__init__(agent_id="random_manager", preferences=preferences)
         self.random = random.Random(seed)
@@ -169,14 +198,18 @@ class RandomManagerAgentV2(ManagerAgent):
     but restricting the action set to exactly one randomly chosen action.
     """
 
+    observation_fields = frozenset({"available_agent_metadata"})
+
     def __init__(
         self,
         preferences: PreferenceWeights,
         model_name: str = "o3",
         allowed_action_classes: list[type[BaseManagerAction]] | None = None,
         seed: int = 42,
+        context_token_budget: int | None = DEFAULT_CONTEXT_TOKEN_BUDGET,
     ):
         super().__init__(agent_id="random_manager_v2", preferences=preferences)
+        self.context_packer = ContextPacker(context_token_budget)
         self.model_name = model_name
         self.allowed_action_classes = (
             allowed_action_classes or get_default_action_classes()
@@ -209,6 +242,7 @@ class RandomManagerAgentV2(ManagerAgent):
                 response_type=constrained_schema,
                 model=self.model_name,
                 seed=self._seed,
+                priority=LLMPriority.MANAGER,
             )
 
             return parsed_action.action  # type: ignore[attr-defined]
@@ -328,36 +362,52 @@ class RandomManagerAgentV2(ManagerAgent):
 
         if ready_ids:
             details_lines.append(f"- Ready task IDs: {ready_ids}")
+        if available_agents:
+            details_lines.append(f"- Available agent IDs: {available_agents}")
         if running_ids:
             details_lines.append(f"- Running task IDs: {running_ids}")
         if completed_ids:
             details_lines.append(f"- Completed task IDs: {completed_ids}")
-        if available_agents:
-            details_lines.append(f"- Available agent IDs: {available_agents}")
 
-        details_block = "\n".join(details_lines)
-
-        return (
+        preamble = (
             f"## INSTRUCTIONS\n"
             f"  - Provide 'reasoning' explaining why the chosen action is reasonable now.\n"
             f"- Then provide the 'action' object with all required parameters for '{action_type_name}'.\n"
             f"- Do not propose any other action types.\n"
             f"## PRE-SELECTED ACTION TYPE\n"
             f"You MUST output exactly one action of type '{action_type_name}'.\n\n"
-            f"## OBSERVATION (timestep {observation.timestep})\n"
-            f"- Ready tasks: {ready_count}\n"
-            f"- Running tasks: {running_count}\n"
-            f"- Completed tasks: {completed_count}\n"
-            f"- Available agents: {available_count}\n"
-            f"{(details_block) if details_block else ''}\n\n"
         )
+        sections = [
+            ContextSection(
+                title=f"OBSERVATION (timestep {observation.timestep})",
+                lines=[
+                    f"- Ready tasks: {ready_count}",
+                    f"- Running tasks: {running_count}",
+                    f"- Completed tasks: {completed_count}",
+                    f"- Available agents: {available_count}",
+                ],
+                required=True,
+            ),
+            ContextSection(title="IDS", lines=details_lines, priority=1),
+        ]
+        return self.context_packer.pack(sections, preamble=preamble).text
 
 
 class OneShotDelegateManagerAgent(ManagerAgent):
     """Baseline: delegate all pending tasks to any agent exactly once, then no-op."""
 
-    def __init__(self, preferences: PreferenceWeights, model_name: str = "o3"):
+    observation_fields = frozenset(
+        {"available_agent_metadata", "workflow_summary", "task_ids"}
+    )
+
+    def __init__(
+        self,
+        preferences: PreferenceWeights,
+        model_name: str = "o3",
+        context_token_budget: int | None = DEFAULT_CONTEXT_TOKEN_BUDGET,
+    ):
         super().__init__(agent_id="oneshot_delegate_manager", preferences=preferences)
+        self.context_packer = ContextPacker(context_token_budget)
         self._has_delegated = False
         self.model_name = model_name
 
@@ -387,6 +437,7 @@ class OneShotDelegateManagerAgent(ManagerAgent):
             user_prompt = BulkAssignmentPromptBuilder.build_user_prompt(
                 workflow_summary=observation.workflow_summary,
                 available_agent_configs=(avail or []),
+                packer=self.context_packer,
             )
 
             parsed = await generate_structured_response(
@@ -395,6 +446,7 @@ class OneShotDelegateManagerAgent(ManagerAgent):
                 response_type=constrained_schema,
                 model=self.model_name,
                 seed=self._seed,
+                priority=LLMPriority.MANAGER,
             )
 
             action: AssignTasksToAgentsAction = parsed.action  # type: ignore[attr-defined]
@@ -5,8 +5,14 @@ This manager agent uses direct LiteLLM calls with Pydantic schema constraints
 to ensure reliable, validated actions. Based on the management.py pattern.
 """
 
+import asyncio
+import contextlib
+import time
 import traceback
 from datetime import datetime
+from typing import Any
+
+from pydantic import BaseModel
 
 
 from .interface import ManagerAgent
@@ -14,6 +20,11 @@ from .prompts.structured_manager_prompts import (
     STRUCTURED_MANAGER_SYSTEM_PROMPT_TEMPLATE,
 )
 from .action_constraints import build_context_constrained_action_schema
+from .context_packing import (
+    DEFAULT_CONTEXT_TOKEN_BUDGET,
+    ContextPacker,
+    ContextSection,
+)
 
 from .llm_action_utils import (
     get_action_descriptions,
@@ -29,9 +40,39 @@ from ..common.llm_interface import (
     generate_structured_response,
     LLMInferenceTruncationError,
 )
+from ..common.rate_limiter import LLMPriority
 from ...schemas.workflow_agents.config import AgentConfig
 
 
+class _Speculation:
+    """A decision started ahead of time for a predicted observation."""
+
+    __slots__ = ("timestep", "request", "task")
+
+    def __init__(
+        self,
+        timestep: int,
+        request: tuple[type[BaseModel], str, str],
+        task: "asyncio.Task[tuple[BaseManagerAction, float]]",
+    ) -> None:
+        self.timestep = timestep
+        self.request = request
+        self.task = task
+
+
+def _consume_outcome(task: "asyncio.Task[Any]") -> None:
+    # Retrieve the outcome so a discarded speculation never logs
+    # "exception was never retrieved"
+    if not task.cancelled():
+        task.exception()
+
+
+def _discard(task: "asyncio.Task[Any]") -> None:
+    """Cancel ``task`` without awaiting it; its outcome is consumed when it ends."""
+    task.cancel()
+    task.add_done_callback(_consume_outcome)
+
+
 class ChainOfThoughtManagerAgent(ManagerAgent):
     """
     Manager agent that uses constrained LLM generation for reliable actions.
@@ -41,6 +82,11 @@ class ChainOfThoughtManagerAgent(ManagerAgent):
     - Validates all actions through the action registry
     - Provides clean error handling and logging
     - Follows the management.py pattern for reliability
+
+    With ``speculative=True`` the engine's ``prefetch_next_step`` hook starts
+    the next timestep's LLM call while the current timestep is still being
+    evaluated; ``step`` commits that decision only if the real observation
+    produces exactly the same request. See ``prefetch_stats``.
     """
 
     def __init__(
@@ -49,11 +95,24 @@ class ChainOfThoughtManagerAgent(ManagerAgent):
         model_name: str = "o3",
         action_classes: list[type[BaseManagerAction]] | None = None,
         manager_persona: str = "Strategic Project Manager",
+        context_token_budget: int | None = DEFAULT_CONTEXT_TOKEN_BUDGET,
+        speculative: bool = False,
     ):
         super().__init__("structured_manager", preferences)
+        self.context_packer = ContextPacker(context_token_budget)
         self.model_name = model_name
         self.action_classes = action_classes or get_default_action_classes()
         self.manager_persona = manager_persona
+        # Speculative next-step decisions (see prefetch_next_step)
+        self.speculative = speculative
+        self._speculation: _Speculation | None = None
+        self._speculation_stats: dict[str, Any] = {
+            "started": 0,
+            "hits": 0,
+            "misses": 0,
+            "discarded": 0,
+            "saved_seconds": 0.0,
+        }
 
     async def take_action(self, observation: ManagerObservation) -> BaseManagerAction:
         """
@@ -69,15 +128,9 @@ class ChainOfThoughtManagerAgent(ManagerAgent):
             ValueError: If LLM generates invalid action
         """
         try:
-            # Build constrained schema for LLM using current valid IDs
-            constrained_schema = build_context_constrained_action_schema(
-                self.action_classes, observation
-            )
-            # Prepare context using prompt templates
-            system_prompt = self._get_system_prompt(
-                observation.available_agent_metadata
+            constrained_schema, system_prompt, user_prompt = self._build_request(
+                observation
             )
-            user_prompt = self._prepare_context(observation)
 
             # Direct LLM call with structured output (validated by Pydantic)
             parsed_action = await generate_structured_response(
@@ -86,6 +139,7 @@ class ChainOfThoughtManagerAgent(ManagerAgent):
                 response_type=constrained_schema,
                 model=self.model_name,
                 seed=self._seed,
+                priority=LLMPriority.MANAGER,
             )
             return parsed_action.action  # type: ignore[attr-defined]
 
@@ -119,6 +173,19 @@ class ChainOfThoughtManagerAgent(ManagerAgent):
                 result_summary=f"Structured manager failed to take action: {traceback.format_exc()}",
             )
 
+    def _build_request(
+        self, observation: ManagerObservation
+    ) -> tuple[type[BaseModel], str, str]:
+        """Response schema, system prompt and user prompt for ``observation``."""
+        # Build constrained schema for LLM using current valid IDs
+        constrained_schema = build_context_constrained_action_schema(
+            self.action_classes, observation
+        )
+        # Prepare context using prompt templates
+        system_prompt = self._get_system_prompt(observation.available_agent_metadata)
+        user_prompt = self._prepare_context(observation)
+        return constrained_schema, system_prompt, user_prompt
+
     async def step(
         self,
         workflow: Workflow,
@@ -142,12 +209,104 @@ class ChainOfThoughtManagerAgent(ManagerAgent):
             communication_service=communication_service,
             stakeholder_profile=stakeholder_profile,
         )
+        speculated = await self._take_speculated_action(observation)
+        if speculated is not None:
+            return speculated
         return await self.take_action(observation)
 
-    def reset(self) -> None:
-        """Reset manager state (structured manager is stateless)."""
+    async def prefetch_next_step(
+        self,
+        workflow: Workflow,
+        execution_state: ExecutionState,
+        stakeholder_profile: StakeholderPublicProfile,
+        current_timestep: int,
+        running_tasks: dict,
+        completed_task_ids: set,
+        failed_task_ids: set,
+        communication_service=None,
+    ) -> None:
+        """Start deciding ``current_timestep`` on the predicted observation (speculative mode)."""
+        if not self.speculative:
+            return
+        self.cancel_prefetch()
+        predicted = self._build_observation(
+            workflow,
+            execution_state,
+            stakeholder_profile,
+            current_timestep,
+            running_tasks,
+            completed_task_ids,
+            failed_task_ids,
+            communication_service,
+        )
+        self._speculation = _Speculation(
+            timestep=current_timestep,
+            request=self._build_request(predicted),
+            task=asyncio.create_task(self._speculate(predicted)),
+        )
+        self._speculation_stats["started"] += 1
+
+    def cancel_prefetch(self) -> None:
+        speculation, self._speculation = self._speculation, None
+        if speculation is not None and not speculation.task.done():
+            _discard(speculation.task)
+            self._speculation_stats["discarded"] += 1
+
+    @property
+    def prefetch_stats(self) -> dict[str, Any] | None:
+        if not self.speculative:
+            return None
+        stats = dict(self._speculation_stats)
+        decided = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = stats["hits"] / decided if decided else 0.0
+        return stats
+
+    async def _take_speculated_action(
+        self, observation: ManagerObservation
+    ) -> BaseManagerAction | None:
+        """The speculative action for ``observation`` if its request matches, else None."""
+        speculation, self._speculation = self._speculation, None
+        if speculation is None:
+            return None
+        stats = self._speculation_stats
+        # The LLM sees nothing but the request, so identical requests mean the
+        # speculative decision is the one this observation would produce
+        if (
+            speculation.timestep != observation.timestep
+            or speculation.request != self._build_request(observation)
+        ):
+            speculation.task.cancel()
+            with contextlib.suppress(asyncio.CancelledError, Exception):
+                await speculation.task
+            stats["misses"] += 1
+            return None
+        wait_start = time.perf_counter()
+        try:
+            action, llm_seconds = await speculation.task
+        except asyncio.CancelledError:
+            stats["misses"] += 1
+            return None
+        waited = time.perf_counter() - wait_start
+        if isinstance(action, FailedAction):
+            # Not worth trusting a failure from a stale attempt; decide afresh
+            stats["misses"] += 1
+            return None
+        stats["hits"] += 1
+        stats["saved_seconds"] += max(0.0, llm_seconds - waited)
+        return action
+
+    async def _speculate(
+        self, observation: ManagerObservation
+    ) -> tuple[BaseManagerAction, float]:
+        # take_action is only called once the task runs, so a speculation
+        # cancelled before it starts leaves no un-awaited coroutine behind
+        start = time.perf_counter()
+        action = await self.take_action(observation)
+        return action, time.perf_counter() - start
 
-        pass
+    def reset(self) -> None:
+        """Reset manager state, dropping any speculative decision."""
+        self.cancel_prefetch()
 
     def _get_system_prompt(self, available_agent_metadata: list[AgentConfig]) -> str:
         """Get the system prompt for the manager agent using templates."""
@@ -173,6 +332,9 @@ class ChainOfThoughtManagerAgent(ManagerAgent):
         - Valid IDs for actions (ready tasks, available agents)
         - Brief summaries of constraints, messages, and recent manager actions
         - A short, actionable decision aid aligned with the system prompt
+
+        Sections beyond the execution snapshot are packed into the context
+        token budget; see ``context_packer.last_packed`` for the packed size.
         """
 
         # Basic counts
@@ -229,9 +391,6 @@ class ChainOfThoughtManagerAgent(ManagerAgent):
                 constraint_lines.append(line)
             except Exception:
                 constraint_lines.append("- <unavailable constraint>")
-        constraints_block = (
-            "\n".join(constraint_lines) if constraint_lines else "(none)"
-        )
 
         # Recent messages summary (sender → receiver | type: content…)
         message_lines: list[str] = []
@@ -245,9 +404,6 @@ class ChainOfThoughtManagerAgent(ManagerAgent):
                 )
             except Exception:
                 message_lines.append("- <unable to render message>")
-        messages_block = (
-            "\n".join(message_lines) if message_lines else "(no recent messages)"
-        )
 
         # Recent manager actions (briefs)
         action_lines: list[str] = []
@@ -263,9 +419,6 @@ class ChainOfThoughtManagerAgent(ManagerAgent):
                 )
             except Exception:
                 action_lines.append("- <unable to render action brief>")
-        actions_block = (
-            "\n".join(action_lines) if action_lines else "(no prior manager actions)"
-        )
 
         # Valid ID universes (helps the model avoid fabricating IDs)
         id_guidance_lines = [
@@ -280,7 +433,6 @@ class ChainOfThoughtManagerAgent(ManagerAgent):
         # Time awareness strings
         time_budget_line = ""
         if observation.max_timesteps is not None:
-            time_budget_line = "There is a maximum number of timesteps for this workflow before it is ended by force by the stakeholder."
             time_budget_line = (
                 f"- time_budget: {observation.timestep}/{observation.max_timesteps}"
             )
@@ -293,44 +445,81 @@ class ChainOfThoughtManagerAgent(ManagerAgent):
         if observation.time_progress is not None:
             time_progress_line = f" | time_progress: {observation.time_progress:.1%}"
 
-        return f"""
-### Execution Snapshot (timestep {observation.timestep})
-- workflow_id: {observation.workflow_id}
-
-- current_workflow_summary: {observation.workflow_summary}
-
-- execution_state: {observation.execution_state}
-- progress: {observation.workflow_progress:.1%}
-{time_budget_line}{time_remaining_line}{time_progress_line}
-
-### Task Status Counts
-- ready: {ready_count} | running: {running_count} | completed: {completed_count} | failed: {failed_count}
-
-### ID Universes
-{id_guidance_lines}
-
-### Performance Indicators
-- completion_rate: {completion_rate:.1f}% of tracked
-- resource_utilization: {utilization_rate:.1f}%
-
-### Actionable ID Previews
-- ready_task_ids (sample): {ready_ids_preview}
-- running_task_ids (sample): {running_ids_preview}
-- completed_task_ids (sample): {completed_ids_preview}
-- failed_task_ids (sample): {failed_ids_preview}
-
-### Constraints (sample)
-{constraints_block}
-
-### Recent Communications (sample)
-{messages_block}
-
-### Manager Action History (recent)
-{actions_block}
+        snapshot_lines = [
+            f"- workflow_id: {observation.workflow_id}",
+            f"- execution_state: {observation.execution_state}",
+            f"- progress: {observation.workflow_progress:.1%}",
+        ]
+        if time_budget_line or time_remaining_line or time_progress_line:
+            snapshot_lines.append(
+                f"{time_budget_line}{time_remaining_line}{time_progress_line}"
+            )
 
-### Stakeholder Profile (public)
-{stakeholder_block}
-"""
+        # Sections are packed into the token budget by priority (lower first);
+        # the workflow summary, usually the largest, fills whatever is left
+        sections = [
+            ContextSection(
+                title=f"Execution Snapshot (timestep {observation.timestep})",
+                lines=snapshot_lines,
+                required=True,
+            ),
+            ContextSection(
+                title="Task Status Counts",
+                lines=[
+                    f"- ready: {ready_count} | running: {running_count} | completed: {completed_count} | failed: {failed_count}"
+                ],
+                required=True,
+            ),
+            ContextSection(
+                title="Performance Indicators",
+                lines=[
+                    f"- completion_rate: {completion_rate:.1f}% of tracked",
+                    f"- resource_utilization: {utilization_rate:.1f}%",
+                ],
+                required=True,
+            ),
+            ContextSection(
+                title="Actionable ID Previews",
+                lines=[
+                    f"- ready_task_ids (sample): {ready_ids_preview}",
+                    f"- failed_task_ids (sample): {failed_ids_preview}",
+                    f"- running_task_ids (sample): {running_ids_preview}",
+                    f"- completed_task_ids (sample): {completed_ids_preview}",
+                ],
+                priority=1,
+            ),
+            ContextSection(title="ID Universes", lines=id_guidance_lines, priority=2),
+            ContextSection(
+                title="Recent Communications (sample)",
+                lines=message_lines,
+                priority=3,
+                empty_text="(no recent messages)",
+            ),
+            ContextSection(
+                title="Constraints (sample)",
+                lines=constraint_lines,
+                priority=4,
+                empty_text="(none)",
+            ),
+            ContextSection(
+                title="Stakeholder Profile (public)",
+                lines=stakeholder_block.splitlines(),
+                priority=5,
+                atomic=True,
+            ),
+            ContextSection(
+                title="Manager Action History (recent)",
+                lines=action_lines,
+                priority=6,
+                empty_text="(no prior manager actions)",
+            ),
+            ContextSection(
+                title="Current Workflow Summary",
+                lines=observation.workflow_summary.splitlines(),
+                priority=7,
+            ),
+        ]
+        return self.context_packer.pack(sections).text
 
     def _format_actions(self, action_descriptions: dict[str, str]) -> str:
         """Format action descriptions for the system prompt."""
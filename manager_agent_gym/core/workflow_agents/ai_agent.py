@@ -20,12 +20,15 @@ except Exception:
     RunResult = None  # type: ignore
     LitellmModel = None  # type: ignore
 from ...config import settings
+
 try:
     from litellm.cost_calculator import cost_per_token  # type: ignore
 except Exception:  # pragma: no cover - optional dependency guard
+
     def cost_per_token(**kwargs):  # type: ignore
         return 0.0, 0.0
 
+
 from ...schemas.core import Resource, Task
 from ...schemas.workflow_agents import (
     AIAgentConfig,
@@ -34,7 +37,13 @@ from ...schemas.workflow_agents import (
 from ...schemas.unified_results import ExecutionResult, create_task_result
 from ..workflow_agents.interface import AgentInterface
 
-from ..common.llm_interface import build_litellm_model_id
+from ..common.llm_interface import (
+    build_litellm_model_id,
+    estimate_tokens,
+    llm_call_slot,
+    run_agent,
+    run_result_total_tokens,
+)
 
 if TYPE_CHECKING:
     pass
@@ -125,11 +134,15 @@ class AIAgent(AgentInterface[AIAgentConfig]):
             task_prompt = self._create_task_prompt(task, resources or [])
 
             # Execute using OpenAI Agent with DI context
-            result: RunResult = await Runner.run(
-                self.openai_agent,
-                task_prompt,
-                context=context,  # 🎯 DI magic happens here!
-            )
+            async with llm_call_slot(
+                self.config.model_name, estimated_tokens=estimate_tokens(task_prompt)
+            ) as slot:
+                result: RunResult = await run_agent(
+                    self.openai_agent,
+                    task_prompt,
+                    context=context,  # 🎯 DI magic happens here!
+                )
+                slot.record_tokens(run_result_total_tokens(result))
 
             # Extract structured output
             output = result.final_output
@@ -200,11 +213,9 @@ class AIAgent(AgentInterface[AIAgentConfig]):
         """Format resources for inclusion in the prompt."""
         formatted = []
         for resource in resources:
-            content_preview = (
-                (resource.content[:200] + "...")
-                if resource.content and len(resource.content) > 200
-                else (resource.content or "")
-            )
+            content_preview = resource.content_preview(200)
+            if resource.content_chars > 200:
+                content_preview += "..."
             formatted.append(
                 f"- {resource.name}: {resource.description}\n  Content: {content_preview}"
             )
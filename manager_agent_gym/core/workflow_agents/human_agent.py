@@ -11,7 +11,7 @@ import time
 import traceback
 from datetime import datetime
 
-from agents import Agent, Runner, Tool
+from agents import Agent, Tool
 from agents.extensions.models.litellm_model import LitellmModel
 from ...config import settings
 
@@ -23,7 +23,13 @@ from ...schemas.workflow_agents import (
 )
 from ...schemas.unified_results import ExecutionResult, create_task_result
 from ..workflow_agents.interface import AgentInterface
-from ..common.llm_interface import build_litellm_model_id
+from ..common.llm_interface import (
+    build_litellm_model_id,
+    estimate_tokens,
+    llm_call_slot,
+    run_agent,
+    run_result_total_tokens,
+)
 from ..common.logging import logger
 from ..workflow_agents.prompts.human_agent_prompts import (
     HUMAN_SIMULATION_INSTRUCTIONS_TEMPLATE,
@@ -150,7 +156,13 @@ class MockHumanAgent(AgentInterface[HumanAgentConfig]):
                 )
 
             # Execute using roleplay agent with DI context
-            result = await Runner.run(self.roleplay_agent, task_prompt, context=context)
+            async with llm_call_slot(
+                self.config.model_name, estimated_tokens=estimate_tokens(task_prompt)
+            ) as slot:
+                result = await run_agent(
+                    self.roleplay_agent, task_prompt, context=context
+                )
+                slot.record_tokens(run_result_total_tokens(result))
 
             # Extract structured output
             output = result.final_output
@@ -251,15 +263,20 @@ class MockHumanAgent(AgentInterface[HumanAgentConfig]):
             )
 
             # Get time estimation from LLM
-            result = await Runner.run(
-                time_estimation_agent,
-                f"""Task: {task.description}
+            async with llm_call_slot(
+                self.config.model_name,
+                estimated_tokens=estimate_tokens(task.description),
+            ) as slot:
+                result = await run_agent(
+                    time_estimation_agent,
+                    f"""Task: {task.description}
 
                 Please estimate how many hours this task would take you to complete, considering your specific background and experience level.
 
                 Provide your reasoning and estimated hours.
             """,
-            )
+                )
+                slot.record_tokens(run_result_total_tokens(result))
 
             time_estimation: HumanTimeEstimation = result.final_output
 
@@ -303,7 +320,11 @@ class MockHumanAgent(AgentInterface[HumanAgentConfig]):
 
         # Build misunderstanding-oriented prompt and run the roleplay agent
         task_prompt = self._create_misunderstood_task_prompt(task, resources)
-        result = await Runner.run(self.roleplay_agent, task_prompt, context=context)
+        async with llm_call_slot(
+            self.config.model_name, estimated_tokens=estimate_tokens(task_prompt)
+        ) as slot:
+            result = await run_agent(self.roleplay_agent, task_prompt, context=context)
+            slot.record_tokens(run_result_total_tokens(result))
 
         output = result.final_output
         if not isinstance(output, HumanWorkOutput):
@@ -426,11 +447,9 @@ Deliver the output as you normally would for this task, fully believing it satis
         """Format resources for inclusion in the prompt."""
         formatted = []
         for resource in resources:
-            content_preview = (
-                (resource.content[:200] + "...")
-                if resource.content and len(resource.content) > 200
-                else (resource.content or "")
-            )
+            content_preview = resource.content_preview(200)
+            if resource.content_chars > 200:
+                content_preview += "..."
             formatted.append(
                 f"- {resource.name}: {resource.description}\n  Content: {content_preview}"
             )
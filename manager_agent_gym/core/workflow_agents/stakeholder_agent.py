@@ -17,7 +17,7 @@ import os
 import random
 import time
 
-from agents import Agent, Runner, RunResult, Tool
+from agents import Agent, RunResult, Tool
 from agents.extensions.models.litellm_model import LitellmModel
 from litellm.cost_calculator import cost_per_token
 
@@ -37,7 +37,13 @@ from ...schemas.preferences.weight_update import (
 from .interface import StakeholderBase
 from ..communication.service import CommunicationService
 from ..common.logging import logger
-from ..common.llm_interface import build_litellm_model_id
+from ..common.llm_interface import (
+    build_litellm_model_id,
+    estimate_tokens,
+    llm_call_slot,
+    run_agent,
+    run_result_total_tokens,
+)
 from ..execution.context import AgentExecutionContext
 from ..workflow_agents.tools.communication_di import COMMUNICATION_TOOLS
 from ..workflow_agents.prompts.stakeholder_prompts import (
@@ -101,11 +107,15 @@ class StakeholderAgent(StakeholderBase):
             # Prepare prompt tailored for stakeholder review/feedback
             task_prompt = self._build_task_prompt(task, resources)
 
-            run_result: RunResult = await Runner.run(
-                self._stakeholder_agent,
-                task_prompt,
-                context=context,
-            )
+            async with llm_call_slot(
+                self.config.model_name, estimated_tokens=estimate_tokens(task_prompt)
+            ) as slot:
+                run_result: RunResult = await run_agent(
+                    self._stakeholder_agent,
+                    task_prompt,
+                    context=context,
+                )
+                slot.record_tokens(run_result_total_tokens(run_result))
 
             output = run_result.final_output
             cost = self._calculate_accurate_cost(run_result)
@@ -381,7 +391,7 @@ class StakeholderAgent(StakeholderBase):
         resources_text = (
             "\n".join(
                 [
-                    f"- {r.name}: {r.description}\n  Content: {(r.content[:200] + '...') if r.content and len(r.content) > 200 else (r.content or '')}"
+                    f"- {r.name}: {r.description}\n  Content: {r.content_preview(200) + ('...' if r.content_chars > 200 else '')}"
                     for r in resources
                 ]
             )
@@ -3,6 +3,7 @@ import functools
 from typing import Literal
 
 from .....clients import COHERE_CLIENT, EXA_CLIENT
+from ....common.rate_limiter import rate_limited
 from .....schemas.workflow_agents.tools.web_search import (
     SearchDomain,
     SearchItem,
@@ -28,25 +29,27 @@ async def search(
         maximum_length_search_result: The maximum length of the search result.
         rerank_model: The rerank model to use.
     """
+    # Runs inside the calling agent's LLM slot, so only the rate budget applies here
     loop = asyncio.get_event_loop()
-    fut = loop.run_in_executor(
-        None,
-        functools.partial(
-            _search,
-            query=query,
-            domain=domain,
-            maximum_length_search_result=maximum_length_search_result,
-            return_results_from=return_results_from,
-        ),
-    )
-    items: list[SearchItem] = await fut
-    if rerank_model:
-        reranked_indices = await COHERE_CLIENT.rerank(
-            model=rerank_model,
-            query=query,
-            documents=[item.truncated_contents for item in items],
-            top_n=num_results,
+    async with rate_limited("exa-search"):
+        items: list[SearchItem] = await loop.run_in_executor(
+            None,
+            functools.partial(
+                _search,
+                query=query,
+                domain=domain,
+                maximum_length_search_result=maximum_length_search_result,
+                return_results_from=return_results_from,
+            ),
         )
+    if rerank_model:
+        async with rate_limited(rerank_model):
+            reranked_indices = await COHERE_CLIENT.rerank(
+                model=rerank_model,
+                query=query,
+                documents=[item.truncated_contents for item in items],
+                top_n=num_results,
+            )
         items = [items[i.index] for i in reranked_indices.results]
 
     return SearchResult(results=items, original_query=query)
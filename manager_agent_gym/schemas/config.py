@@ -1,11 +1,27 @@
 """Configuration schemas for output directories and simulation settings."""
 
+from enum import Enum
 from pathlib import Path
 from pydantic import BaseModel, Field
 from datetime import datetime
 from ..core.common.logging import logger
 
 
+class SnapshotFormat(str, Enum):
+    """How per-timestep workflow snapshots are written."""
+
+    FULL = "full"  # a complete snapshot file per timestep, also embedded in results
+    DELTA = "delta"  # one JSONL log of keyframes plus per-timestep deltas
+
+
+class RunLogCompression(str, Enum):
+    """Compression of the append-only per-timestep run log."""
+
+    NONE = "none"
+    GZIP = "gzip"
+    ZSTD = "zstd"  # requires the optional ``zstandard`` package
+
+
 class OutputConfig(BaseModel):
     """Configuration for all simulation output directories."""
 
@@ -36,6 +52,11 @@ class OutputConfig(BaseModel):
         description="Directory for detailed execution logs (default: base_output_dir/execution_logs)",
     )
 
+    resource_blob_dir: Path | None = Field(
+        default=None,
+        description="Content store for spilled resource content, shared by every run under base_output_dir (default: base_output_dir/resource_blobs)",
+    )
+
     # Run-specific settings
     create_run_subdirectory: bool = Field(
         default=True,
@@ -46,6 +67,34 @@ class OutputConfig(BaseModel):
         default=None, description="Custom run identifier (default: timestamp)"
     )
 
+    snapshot_format: SnapshotFormat = Field(
+        default=SnapshotFormat.DELTA,
+        description="Per-timestep workflow snapshot format",
+    )
+    snapshot_keyframe_interval: int = Field(
+        default=50,
+        ge=1,
+        description="Timesteps between full keyframes in a delta snapshot log",
+    )
+    run_log_compression: RunLogCompression = Field(
+        default=RunLogCompression.NONE,
+        description="Compression of the per-timestep run log",
+    )
+    background_writes: bool = Field(
+        default=True,
+        description="Encode and write output files on a background thread",
+    )
+    max_pending_writes: int = Field(
+        default=64,
+        ge=1,
+        description="Queued background writes before output calls block",
+    )
+    resource_spill_threshold_bytes: int | None = Field(
+        default=None,
+        ge=0,
+        description="Spill resource content of at least this size to resource_blob_dir (None keeps all content in memory)",
+    )
+
     def model_post_init(self, __context) -> None:
         """Set default subdirectories if not provided."""
         if self.run_id is None:
@@ -70,6 +119,10 @@ class OutputConfig(BaseModel):
         if self.execution_logs_dir is None:
             self.execution_logs_dir = run_base / "execution_logs"
 
+        # Shared across runs so content repeated across seeds is stored once
+        if self.resource_blob_dir is None:
+            self.resource_blob_dir = self.base_output_dir / "resource_blobs"
+
     def ensure_directories_exist(self) -> None:
         """Create all configured output directories."""
         directories = [
@@ -97,6 +150,17 @@ class OutputConfig(BaseModel):
             raise ValueError("timestep_dir is not configured")
         return self.timestep_dir / "final_metrics.json"
 
+    def get_run_log_path(self) -> Path:
+        """Get the file path for the append-only per-timestep run log."""
+        if self.timestep_dir is None:
+            raise ValueError("timestep_dir is not configured")
+        suffix = {
+            RunLogCompression.NONE: "",
+            RunLogCompression.GZIP: ".gz",
+            RunLogCompression.ZSTD: ".zst",
+        }[self.run_log_compression]
+        return self.timestep_dir / f"run_log.jsonl{suffix}"
+
     def get_workflow_summary_path(self, timestamp: str | None = None) -> Path:
         """Get the file path for workflow summary."""
         if timestamp is None:
@@ -106,6 +170,18 @@ class OutputConfig(BaseModel):
             raise ValueError("workflow_dir is not configured")
         return self.workflow_dir / filename
 
+    def get_workflow_snapshot_log_path(self) -> Path:
+        """Get the file path for the delta-encoded per-timestep snapshot log."""
+        if self.workflow_dir is None:
+            raise ValueError("workflow_dir is not configured")
+        return self.workflow_dir / f"workflow_snapshots_{self.run_id}.jsonl"
+
+    def get_profile_trace_path(self) -> Path:
+        """Get the file path for the engine's Chrome-trace profile."""
+        if self.execution_logs_dir is None:
+            raise ValueError("execution_logs_dir is not configured")
+        return self.execution_logs_dir / f"profile_trace_{self.run_id}.json"
+
     def get_evaluation_results_path(self, timestamp: str | None = None) -> Path:
         """Get the file path for evaluation results."""
         if timestamp is None:
@@ -125,6 +201,44 @@ class OutputConfig(BaseModel):
         return self.evaluation_dir / filename
 
 
+class TimestepAdvancePolicy(str, Enum):
+    """When an event-driven timestep stops waiting for task completions."""
+
+    ALL = "all"  # every task running at the start of the wait has finished
+    FIRST_K = "first_k"  # ``first_k`` completions have been processed
+    QUANTUM = "quantum"  # ``quantum_seconds`` of wall-clock time have elapsed
+
+
+class EventDrivenExecutionConfig(BaseModel):
+    """Opt-in event-driven task completion for the execution engine.
+
+    Completed agent tasks are consumed from a completion queue instead of a
+    per-timestep ``asyncio.wait`` barrier, and downstream tasks whose
+    dependencies are now satisfied start immediately rather than at the next
+    timestep.
+    """
+
+    advance_policy: TimestepAdvancePolicy = Field(
+        default=TimestepAdvancePolicy.ALL,
+        description="Condition under which the timestep stops waiting for completions",
+    )
+    first_k: int = Field(
+        default=1,
+        ge=1,
+        description="Completions to wait for under the FIRST_K policy",
+    )
+    quantum_seconds: float = Field(
+        default=1.0,
+        gt=0,
+        description="Wall-clock budget per timestep under the QUANTUM policy",
+    )
+    max_wait_seconds: float = Field(
+        default=300.0,
+        gt=0,
+        description="Upper bound on time spent waiting for completions in one timestep",
+    )
+
+
 class SimulationConfig(BaseModel):
     """Complete configuration for a simulation run."""
 
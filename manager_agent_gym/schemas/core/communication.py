@@ -7,10 +7,19 @@ described in the paper, enabling graph-based message storage and agent coordinat
 
 from datetime import datetime
 from enum import Enum
-from typing import Any
+from typing import Any, Callable
 from uuid import uuid4, UUID
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import (
+    BaseModel,
+    Field,
+    PrivateAttr,
+    SerializerFunctionWrapHandler,
+    field_validator,
+    model_serializer,
+)
+
+from .message_index import MessageIndex, take
 
 
 class MessageType(str, Enum):
@@ -185,6 +194,8 @@ class CommunicationGraph(BaseModel):
 
     Implements the communication component (C) from the POSG state model,
     storing message relationships and enabling communication pattern analysis.
+    Queries are served from time-ordered secondary indexes (see
+    ``message_index``) rather than scans of ``messages``.
     """
 
     edges: dict[str, CommunicationEdge] = Field(
@@ -200,6 +211,45 @@ class CommunicationGraph(BaseModel):
         default_factory=set, description="Set of all known agent IDs"
     )
 
+    _index: MessageIndex = PrivateAttr(default_factory=MessageIndex)
+    # Messages registered with add_pending_message, built on first use
+    _pending: list[Callable[[], Message]] = PrivateAttr(default_factory=list)
+
+    @property
+    def index(self) -> MessageIndex:
+        """Message indexes, rebuilt if ``messages`` is replaced or resized."""
+        self.link_pending()
+        return self._index.ensure(self)
+
+    def add_pending_message(self, factory: Callable[[], Message]) -> None:
+        """Register a message that ``factory`` builds when the graph is next used.
+
+        Edges, threads and indexes need every message, so pending messages are
+        built and added together, in registration order, by ``link_pending``
+        (called by ``index``, ``add_message``, dumps and the communication
+        service).
+        """
+        self._pending.append(factory)
+
+    @property
+    def pending_count(self) -> int:
+        """Number of registered messages not built yet."""
+        return len(self._pending)
+
+    def link_pending(self) -> None:
+        """Build and add every message registered with ``add_pending_message``."""
+        pending = self._pending
+        if not pending:
+            return
+        self._pending = []
+        for factory in pending:
+            self.add_message(factory())
+
+    @model_serializer(mode="wrap")
+    def _serialize_linked(self, handler: SerializerFunctionWrapHandler) -> Any:
+        self.link_pending()
+        return handler(self)
+
     def add_message(self, message: Message) -> None:
         """
         Add a message to the graph and update all related structures.
@@ -207,8 +257,10 @@ class CommunicationGraph(BaseModel):
         Args:
             message: The message to add to the graph
         """
+        self.link_pending()
         # Store the message
         self.messages[message.message_id] = message
+        self._index.on_message_added(self, message)
 
         # Register agents
         self.agent_registry.add(message.sender_id)
@@ -234,6 +286,7 @@ class CommunicationGraph(BaseModel):
             self.edges[edge_key] = CommunicationEdge(
                 from_agent=message.sender_id, to_agent=recipient
             )
+            self._index.on_edge_added(edge_key, message.sender_id, recipient)
 
         self.edges[edge_key].update_for_message(message)
 
@@ -245,6 +298,7 @@ class CommunicationGraph(BaseModel):
             self.edges[edge_key] = CommunicationEdge(
                 from_agent=message.sender_id, to_agent=None
             )
+            self._index.on_edge_added(edge_key, message.sender_id, None)
 
         self.edges[edge_key].update_for_message(message)
 
@@ -284,31 +338,10 @@ class CommunicationGraph(BaseModel):
         Returns:
             List of messages sorted by timestamp (newest first)
         """
-        relevant_messages = []
-
-        for message in self.messages.values():
-            # Check if message is for this agent
-            if not (agent_id in message.get_all_recipients() or message.is_broadcast()):
-                continue
-
-            # Apply time filter
-            if since and message.timestamp < since:
-                continue
-
-            # Apply message type filter
-            if message_types and message.message_type not in message_types:
-                continue
-
-            relevant_messages.append(message)
-
-        # Sort by timestamp (newest first)
-        relevant_messages.sort(key=lambda m: m.timestamp, reverse=True)
-
-        # Apply limit
-        if limit:
-            relevant_messages = relevant_messages[:limit]
-
-        return relevant_messages
+        received = self.index.received_newest_first(agent_id, since)
+        if message_types:
+            received = (m for m in received if m.message_type in message_types)
+        return take(received, limit or None)
 
     def get_conversation_history(
         self, agent_id: str, other_agent: str, limit: int = 50
@@ -324,43 +357,52 @@ class CommunicationGraph(BaseModel):
         Returns:
             List of messages in chronological order
         """
-        conversation = []
+        newest = self.index.conversation(agent_id, other_agent).latest(limit or None)
+        return newest[::-1]
 
-        for message in self.messages.values():
-            # Check if message is between these two agents
-            sender = message.sender_id
-            recipients = message.get_all_recipients()
+    def get_recent_messages(
+        self, limit: int | None = None, since: datetime | None = None
+    ) -> list[Message]:
+        """All messages at or after ``since``, newest first."""
+        return self.index.all.latest(limit, since)
 
-            if (sender == agent_id and other_agent in recipients) or (
-                sender == other_agent and agent_id in recipients
-            ):
-                conversation.append(message)
+    def get_messages_from_agent(
+        self, agent_id: str, since: datetime | None = None, limit: int | None = None
+    ) -> list[Message]:
+        """Messages sent by ``agent_id``, newest first."""
+        outbox = self.index.outbox.get(agent_id)
+        return outbox.latest(limit, since) if outbox is not None else []
 
-        # Sort chronologically and apply limit
-        conversation.sort(key=lambda m: m.timestamp)
-        return conversation[-limit:] if limit else conversation
+    def get_task_messages(
+        self, task_id: UUID, since: datetime | None = None
+    ) -> list[Message]:
+        """Messages related to ``task_id`` in chronological order."""
+        messages = self.index.by_task.get(task_id)
+        return messages.oldest_first(since) if messages is not None else []
+
+    def get_thread_messages(
+        self, thread_id: UUID, since: datetime | None = None
+    ) -> list[Message]:
+        """Messages in ``thread_id`` in chronological order."""
+        messages = self.index.by_thread.get(thread_id)
+        return messages.oldest_first(since) if messages is not None else []
+
+    def get_broadcasts(
+        self, since: datetime | None = None, limit: int | None = None
+    ) -> list[Message]:
+        """Broadcast messages, newest first."""
+        return self.index.broadcasts.latest(limit, since)
 
     def get_agent_communication_stats(self, agent_id: str) -> dict[str, Any]:
         """Get communication statistics for an agent."""
-        sent_count = sum(
-            1 for msg in self.messages.values() if msg.sender_id == agent_id
-        )
-        received_count = sum(
-            1
-            for msg in self.messages.values()
-            if agent_id in msg.get_all_recipients() or msg.is_broadcast()
-        )
+        index = self.index
+        outbox = index.outbox.get(agent_id)
 
         return {
-            "messages_sent": sent_count,
-            "messages_received": received_count,
-            "communication_partners": len(
-                [
-                    edge
-                    for edge in self.edges.values()
-                    if edge.from_agent == agent_id or edge.to_agent == agent_id
-                ]
-            ),
+            "messages_sent": len(outbox) if outbox is not None else 0,
+            "messages_received": index.direct_received.get(agent_id, 0)
+            + len(index.broadcasts),
+            "communication_partners": len(index.edge_keys_by_agent.get(agent_id, ())),
             "active_threads": len(
                 [
                     thread
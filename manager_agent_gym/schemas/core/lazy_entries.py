@@ -0,0 +1,170 @@
+"""
+A dict whose entries can be registered as factories and built on first lookup.
+
+Used when restoring a workflow from a snapshot: every restored resource is
+registered up front, but only the ones a re-evaluation actually looks up are
+parsed and constructed. Single-key operations (``[key]``, ``get``, ``in``,
+``pop``) build at most that entry; anything that needs every value (``values``,
+``items``, equality, copies, pickling) builds the rest first.
+
+C-level consumers that read the underlying dict storage directly (pydantic
+serialization, ``json.dumps``) only see built entries, so owners call
+``materialize`` before handing the dict to them.
+"""
+
+from __future__ import annotations
+
+import copy
+from typing import Any, Callable, Iterator, TypeVar
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+_MISSING: Any = object()
+
+
+class LazyEntries(dict[K, V]):
+    """``dict`` with entries built from factories on first lookup."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._pending: dict[K, Callable[[], V]] = {}
+        # Keys in insertion order, built or not (an ordered set)
+        self._order: dict[K, None] = dict.fromkeys(dict.__iter__(self))
+        # Set when built entries are stored out of that order
+        self._reorder = False
+
+    def add_lazy(self, key: K, factory: Callable[[], V]) -> None:
+        """Register ``key`` to be built by ``factory`` when first looked up."""
+        dict.pop(self, key, None)
+        self._pending[key] = factory
+        self._order.setdefault(key)
+
+    @property
+    def pending_count(self) -> int:
+        """Number of registered entries not built yet."""
+        return len(self._pending)
+
+    def _build(self, key: K) -> V:
+        value = self._pending.pop(key)()
+        dict.__setitem__(self, key, value)
+        self._reorder = True
+        return value
+
+    def materialize(self) -> None:
+        """Build every pending entry, keeping iteration order."""
+        for key in list(self._pending):
+            self._build(key)
+        if not self._reorder:
+            return
+        self._reorder = False
+        items = [(key, dict.__getitem__(self, key)) for key in self._order]
+        dict.clear(self)
+        dict.update(self, items)
+
+    # Single-key operations build at most the requested entry
+
+    def __missing__(self, key: K) -> V:
+        if key in self._pending:
+            return self._build(key)
+        raise KeyError(key)
+
+    def get(self, key: K, default: Any = None) -> Any:  # type: ignore[override]
+        if dict.__contains__(self, key):
+            return dict.__getitem__(self, key)
+        if key in self._pending:
+            return self._build(key)
+        return default
+
+    def __contains__(self, key: object) -> bool:
+        return dict.__contains__(self, key) or key in self._pending
+
+    def __setitem__(self, key: K, value: V) -> None:
+        if self._pending.pop(key, _MISSING) is not _MISSING:
+            self._reorder = True
+        self._order.setdefault(key)
+        dict.__setitem__(self, key, value)
+
+    def __delitem__(self, key: K) -> None:
+        if self._pending.pop(key, _MISSING) is _MISSING:
+            dict.__delitem__(self, key)
+        del self._order[key]
+
+    def pop(self, key: K, default: Any = _MISSING) -> Any:  # type: ignore[override]
+        if key in self:
+            value = self[key]
+            del self[key]
+            return value
+        if default is _MISSING:
+            raise KeyError(key)
+        return default
+
+    def setdefault(self, key: K, default: Any = None) -> Any:  # type: ignore[override]
+        if key in self:
+            return self[key]
+        self[key] = default
+        return default
+
+    # Key-only views do not build anything
+
+    def __iter__(self) -> Iterator[K]:
+        # A snapshot of the keys, so lookups while iterating may build entries
+        return iter(list(self._order))
+
+    def __len__(self) -> int:
+        return dict.__len__(self) + len(self._pending)
+
+    def keys(self):  # type: ignore[override]
+        return list(self)
+
+    # Whole-collection operations build everything first
+
+    def values(self):  # type: ignore[override]
+        self.materialize()
+        return dict.values(self)
+
+    def items(self):  # type: ignore[override]
+        self.materialize()
+        return dict.items(self)
+
+    def clear(self) -> None:
+        self._pending.clear()
+        self._order.clear()
+        dict.clear(self)
+
+    def update(self, *args: Any, **kwargs: Any) -> None:  # type: ignore[override]
+        updates: dict[Any, Any] = dict(*args, **kwargs)
+        for key, value in updates.items():
+            self[key] = value
+
+    def popitem(self) -> tuple[K, V]:
+        self.materialize()
+        key, value = dict.popitem(self)
+        del self._order[key]
+        return key, value
+
+    def copy(self) -> dict[K, V]:  # type: ignore[override]
+        self.materialize()
+        return dict(dict.items(self))
+
+    def __eq__(self, other: object) -> bool:
+        self.materialize()
+        if isinstance(other, LazyEntries):
+            other.materialize()
+        return dict.__eq__(self, other)
+
+    def __ne__(self, other: object) -> bool:
+        return not self == other
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        self.materialize()
+        return dict.__repr__(self)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Pickles (and shallow copies) as a plain dict of built entries
+        return (dict, (self.copy(),))
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> dict[K, V]:
+        return copy.deepcopy(self.copy(), memo)
@@ -0,0 +1,200 @@
+"""
+Time-ordered secondary indexes over a communication graph's messages.
+
+Messages are kept in timestamp order (ties in insertion order) per inbox,
+outbox, conversation pair, task, thread and broadcast stream, so recent-N and
+since-T queries cost ``O(log n + k)`` instead of a scan and sort of the whole
+history. Inserts are ``O(log n)`` amortized; messages almost always arrive in
+timestamp order and are appended.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from datetime import datetime
+from itertools import count, islice
+from typing import TYPE_CHECKING, Any, Iterable, Iterator
+from uuid import UUID
+
+if TYPE_CHECKING:
+    from .communication import CommunicationGraph, Message
+
+
+class TimeOrderedMessages:
+    """Messages sorted by ``(timestamp, insertion order)``."""
+
+    def __init__(self) -> None:
+        self._keys: list[tuple[datetime, int]] = []
+        self._messages: list[Message] = []
+
+    def __len__(self) -> int:
+        return len(self._messages)
+
+    def add(self, message: Message, sequence: int) -> None:
+        key = (message.timestamp, sequence)
+        if not self._keys or key >= self._keys[-1]:
+            self._keys.append(key)
+            self._messages.append(message)
+            return
+        position = bisect_left(self._keys, key)
+        self._keys.insert(position, key)
+        self._messages.insert(position, message)
+
+    def _start(self, since: datetime | None) -> int:
+        if since is None:
+            return 0
+        return bisect_left(self._keys, (since, -1))
+
+    def count_since(self, since: datetime | None) -> int:
+        return len(self._messages) - self._start(since)
+
+    def oldest_first(self, since: datetime | None = None) -> list[Message]:
+        return self._messages[self._start(since) :]
+
+    def iter_newest_first(self, since: datetime | None = None) -> Iterator[Message]:
+        start = self._start(since)
+        for position in range(len(self._messages) - 1, start - 1, -1):
+            yield self._messages[position]
+
+    def latest(self, limit: int | None, since: datetime | None = None) -> list[Message]:
+        """Newest-first messages at or after ``since``."""
+        start = self._start(since)
+        if limit is not None:
+            start = max(start, len(self._messages) - limit)
+        return self._messages[start:][::-1]
+
+
+def _pair(agent_id: str, other_agent: str) -> tuple[str, str]:
+    return (
+        (agent_id, other_agent) if agent_id <= other_agent else (other_agent, agent_id)
+    )
+
+
+def _merge_newest_first(*streams: Iterator[Message]) -> Iterator[Message]:
+    """Merge newest-first streams, dropping messages present in several."""
+    seen: set[UUID] = set()
+    heads: list[tuple[Message, Iterator[Message]]] = []
+    for stream in streams:
+        head = next(stream, None)
+        if head is not None:
+            heads.append((head, stream))
+    while heads:
+        index = max(range(len(heads)), key=lambda i: heads[i][0].timestamp)
+        message, stream = heads[index]
+        following = next(stream, None)
+        if following is None:
+            heads.pop(index)
+        else:
+            heads[index] = (following, stream)
+        if message.message_id not in seen:
+            seen.add(message.message_id)
+            yield message
+
+
+class MessageIndex:
+    """Per-recipient, per-sender, per-pair, per-task and per-thread indexes.
+
+    Maintained incrementally by ``CommunicationGraph.add_message`` and rebuilt
+    lazily when ``graph.messages`` is reassigned (e.g. after loading a
+    serialized graph) or changes size outside ``add_message``. Replacing a
+    message in place under its existing key is not detected.
+    """
+
+    def __init__(self) -> None:
+        self._reset()
+        self._indexed = -1
+        # The messages dict the index was built from; a reassigned dict of the
+        # same length must still trigger a rebuild
+        self._source: dict[UUID, Message] | None = None
+
+    def _is_current(self, graph: "CommunicationGraph", pending: int = 0) -> bool:
+        return (
+            self._source is graph.messages
+            and self._indexed == len(graph.messages) - pending
+        )
+
+    def _reset(self) -> None:
+        self._indexed: int = 0
+        self._sequence = count()
+        self.all = TimeOrderedMessages()
+        self.broadcasts = TimeOrderedMessages()
+        self.inbox: dict[str, TimeOrderedMessages] = {}
+        self.outbox: dict[str, TimeOrderedMessages] = {}
+        self.conversations: dict[tuple[str, str], TimeOrderedMessages] = {}
+        self.by_task: dict[UUID, TimeOrderedMessages] = {}
+        self.by_thread: dict[UUID, TimeOrderedMessages] = {}
+        # Direct (non-broadcast) messages received per agent
+        self.direct_received: dict[str, int] = {}
+        self.edge_keys_by_agent: dict[str, set[str]] = {}
+
+    def ensure(self, graph: "CommunicationGraph") -> "MessageIndex":
+        if not self._is_current(graph):
+            self._reset()
+            for message in graph.messages.values():
+                self._insert(message)
+            for key, edge in graph.edges.items():
+                self._add_edge_key(key, edge.from_agent, edge.to_agent)
+            self._indexed = len(graph.messages)
+            self._source = graph.messages
+        return self
+
+    def on_message_added(self, graph: "CommunicationGraph", message: Message) -> None:
+        if not self._is_current(graph, pending=1):
+            self.ensure(graph)
+            return
+        self._insert(message)
+        self._indexed += 1
+
+    def on_edge_added(self, key: str, from_agent: str, to_agent: str | None) -> None:
+        self._add_edge_key(key, from_agent, to_agent)
+
+    def _add_edge_key(self, key: str, from_agent: str, to_agent: str | None) -> None:
+        self.edge_keys_by_agent.setdefault(from_agent, set()).add(key)
+        if to_agent is not None:
+            self.edge_keys_by_agent.setdefault(to_agent, set()).add(key)
+
+    def _insert(self, message: Message) -> None:
+        sequence = next(self._sequence)
+        recipients = message.get_all_recipients()
+
+        def add(index: dict[Any, TimeOrderedMessages], key: Any) -> None:
+            bucket = index.get(key)
+            if bucket is None:
+                bucket = index[key] = TimeOrderedMessages()
+            bucket.add(message, sequence)
+
+        self.all.add(message, sequence)
+        add(self.outbox, message.sender_id)
+        for recipient in recipients:
+            add(self.inbox, recipient)
+            add(self.conversations, _pair(message.sender_id, recipient))
+        if message.is_broadcast():
+            self.broadcasts.add(message, sequence)
+        else:
+            for recipient in recipients:
+                self.direct_received[recipient] = (
+                    self.direct_received.get(recipient, 0) + 1
+                )
+        if message.related_task_id is not None:
+            add(self.by_task, message.related_task_id)
+        if message.thread_id is not None:
+            add(self.by_thread, message.thread_id)
+
+    def received_newest_first(
+        self, agent_id: str, since: datetime | None = None
+    ) -> Iterator[Message]:
+        """Messages addressed to ``agent_id`` plus all broadcasts, newest first."""
+        inbox = self.inbox.get(agent_id)
+        streams: list[Iterator[Message]] = [self.broadcasts.iter_newest_first(since)]
+        if inbox is not None:
+            streams.append(inbox.iter_newest_first(since))
+        return _merge_newest_first(*streams)
+
+    def conversation(self, agent_id: str, other_agent: str) -> TimeOrderedMessages:
+        return self.conversations.get(
+            _pair(agent_id, other_agent), TimeOrderedMessages()
+        )
+
+
+def take(messages: Iterable[Message], limit: int | None) -> list[Message]:
+    return list(messages if limit is None else islice(messages, limit))
@@ -2,9 +2,22 @@
 Resource data models for Manager Agent Gym.
 """
 
+from typing import Any
 from uuid import UUID, uuid4
+from weakref import ReferenceType
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
+
+from ...core.common.content_store import ContentStore
+
+
+class ContentRef(BaseModel):
+    """Handle to resource content spilled to a ``ContentStore``."""
+
+    sha256: str = Field(..., description="SHA-256 of the UTF-8 encoded content")
+    bytes: int = Field(..., ge=0, description="Encoded size in bytes")
+    chars: int = Field(..., ge=0, description="Length in characters")
+    words: int = Field(..., ge=0, description="Whitespace-separated word count")
 
 
 class Resource(BaseModel):
@@ -22,6 +35,11 @@ class Resource(BaseModel):
             content_type="text/markdown",
         )
         ```
+
+    Large content can be spilled to a ``ContentStore`` (see ``spill``): the
+    resource then keeps a ``content_ref``, serializes ``content`` as None and
+    reads ``content`` back from disk on access, while previews read only the
+    prefix they show.
     """
 
     id: UUID = Field(
@@ -45,27 +63,157 @@ class Resource(BaseModel):
         description="MIME type, e.g., text/plain, text/markdown, application/json",
         examples=["text/markdown", "application/json"],
     )
+    content_ref: ContentRef | None = Field(
+        default=None,
+        description="Handle to content spilled to a content store; set instead of content",
+    )
+
+    # Weak back-reference to the workflow that registered this resource
+    _workflow_ref: "ReferenceType[Any] | None" = PrivateAttr(default=None)
+    # Cached ``pretty_print`` output keyed by preview length
+    _rendered: dict[int, str] = PrivateAttr(default_factory=dict)
+    # Store holding the spilled content (set by ``spill`` or the workflow)
+    _content_store: ContentStore | None = PrivateAttr(default=None)
+
+    def model_post_init(self, __context: Any) -> None:
+        if self.content_ref is not None and self.__dict__.get("content") is not None:
+            # Inline content wins over a stale handle, as on assignment
+            object.__setattr__(self, "content_ref", None)
+
+    def __getattribute__(self, name: str) -> Any:
+        if name == "content":
+            # Spilled content is stored as None and resolved from the store
+            content_ref = object.__getattribute__(self, "__dict__").get("content_ref")
+            if content_ref is not None:
+                require_store = object.__getattribute__(self, "_require_store")
+                return require_store().read(content_ref.sha256)
+        return object.__getattribute__(self, name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name == "content":
+            # New inline content replaces any spilled copy
+            object.__setattr__(self, "content_ref", None)
+        if name in Resource.model_fields:
+            private = self.__pydantic_private__
+            if private:
+                private["_rendered"] = {}
+                owner_ref = private.get("_workflow_ref")
+                owner = owner_ref() if owner_ref is not None else None
+                if owner is not None:
+                    owner._invalidate_renderings()
+
+    def __copy__(self) -> "Resource":
+        copied = super().__copy__()
+        # Copies are edited (and rendered) independently of the original
+        copied._rendered = {}
+        return copied
+
+    def __deepcopy__(self, memo: dict[int, Any] | None = None) -> "Resource":
+        copied = super().__deepcopy__(memo)
+        copied._rendered = {}
+        return copied
+
+    def __getstate__(self) -> dict[Any, Any]:
+        # Neither the store (holds a lock) nor the workflow weakref pickles;
+        # attach a store again after unpickling to read spilled content
+        state = super().__getstate__()
+        private = state.get("__pydantic_private__")
+        if private:
+            state["__pydantic_private__"] = {
+                **private,
+                "_content_store": None,
+                "_workflow_ref": None,
+            }
+        return state
 
     @property
     def resource_id(self) -> UUID:
         """Alias for id field to maintain compatibility."""
         return self.id
 
+    @property
+    def is_spilled(self) -> bool:
+        """Whether the content lives in a content store rather than inline."""
+        return self.__dict__.get("content_ref") is not None
+
+    @property
+    def content_chars(self) -> int:
+        """Length of the content in characters, without loading spilled content."""
+        content_ref = self.__dict__.get("content_ref")
+        if content_ref is not None:
+            return content_ref.chars
+        return len(self.__dict__.get("content") or "")
+
+    def content_preview(self, max_chars: int) -> str:
+        """Leading ``max_chars`` characters of the content (reads only that prefix)."""
+        content_ref = self.__dict__.get("content_ref")
+        if content_ref is not None:
+            return self._require_store().read_prefix(content_ref.sha256, max_chars)
+        return (self.__dict__.get("content") or "")[:max_chars]
+
+    def attach_content_store(self, store: ContentStore) -> None:
+        """Use ``store`` for this resource, spilling content above its threshold."""
+        self._content_store = store
+        content = self.__dict__.get("content")
+        if content and store.should_spill(content):
+            self.spill(store)
+
+    def spill(self, store: ContentStore) -> None:
+        """Move inline content to ``store``, keeping only a ``ContentRef``.
+
+        The stored ``content`` field becomes None (so dumps carry the handle,
+        not the text); reading ``content`` still returns the text. Cached
+        renderings stay valid.
+        """
+        self._content_store = store
+        content = self.__dict__.get("content")
+        if not content:
+            return
+        object.__setattr__(
+            self,
+            "content_ref",
+            ContentRef(
+                sha256=store.put(content),
+                bytes=len(content.encode("utf-8")),
+                chars=len(content),
+                words=len(content.split()),
+            ),
+        )
+        object.__setattr__(self, "content", None)
+
+    def _require_store(self) -> ContentStore:
+        store = self._content_store
+        if store is None:
+            raise LookupError(
+                f"Content of resource {self.id} is spilled but no content store is attached"
+            )
+        return store
+
     def pretty_print(self, max_preview_chars: int = 5000) -> str:
         """Return a human-readable summary of the resource with a safe content preview."""
+        rendered = self._rendered.get(max_preview_chars)
+        if rendered is None:
+            rendered = self._rendered[max_preview_chars] = self._render(
+                max_preview_chars
+            )
+        return rendered
+
+    def _render(self, max_preview_chars: int) -> str:
         lines: list[str] = []
         lines.append(f"Resource: {self.name} (ID: {self.id}, type={self.content_type})")
         if self.description:
             lines.append(f"  Description: {self.description}")
-        if self.content:
-            try:
-                word_count = len(self.content.split())
-            except Exception:
-                word_count = 0
-            char_len = len(self.content)
+        content_ref = self.__dict__.get("content_ref")
+        content = self.__dict__.get("content") or ""
+        if content_ref is not None or content:
+            if content_ref is not None:
+                word_count, char_len = content_ref.words, content_ref.chars
+            else:
+                word_count, char_len = len(content.split()), len(content)
             lines.append(f"  Content stats: words={word_count}, chars={char_len}")
-            preview = self.content[:max_preview_chars]
-            if len(self.content) > max_preview_chars:
+            preview = self.content_preview(max_preview_chars)
+            if char_len > max_preview_chars:
                 preview += "... (truncated)"
             lines.append("  Content preview:")
             for line in preview.splitlines()[:60]:
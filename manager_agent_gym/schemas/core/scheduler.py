@@ -0,0 +1,193 @@
+"""
+Incremental ready-set scheduling for workflow task graphs.
+
+The scheduler keeps a leaf-level dependency DAG with per-leaf counters of
+unmet prerequisites. Status transitions are applied incrementally (only the
+successors of the changed leaf are touched), while structural edits (new or
+removed tasks, dependency rewiring, decomposition) mark the DAG stale so it is
+rebuilt once on the next query.
+"""
+
+from typing import TYPE_CHECKING
+from uuid import UUID
+from weakref import ref
+
+from .base import TaskStatus
+from .tasks import Task
+
+if TYPE_CHECKING:
+    from .workflow import Workflow
+
+
+SCHEDULABLE_STATUSES = frozenset({TaskStatus.PENDING, TaskStatus.READY})
+
+
+class ReadyTaskScheduler:
+    """Maintains the set of atomic tasks whose dependencies are satisfied.
+
+    Owned by a ``Workflow``; tasks adopted by the workflow notify it of
+    ``status``/``dependency_task_ids``/``subtasks`` assignments, which the
+    workflow forwards here. In-place list edits are not reported: they are
+    only seen after ``Workflow.invalidate_task_graph``.
+
+    Attributes:
+        rebuild_count (int): Number of full DAG rebuilds performed (diagnostics).
+    """
+
+    def __init__(self) -> None:
+        self._dirty: bool = True
+        self._registry_size: int = -1
+        self._leaves: dict[UUID, Task] = {}
+        self._rank: dict[UUID, int] = {}
+        self._successors: dict[UUID, list[UUID]] = {}
+        self._unmet: dict[UUID, int] = {}
+        self._ready: set[UUID] = set()
+        self.rebuild_count: int = 0
+
+    def invalidate(self) -> None:
+        """Mark the DAG stale; it is rebuilt lazily on the next query."""
+        self._dirty = True
+
+    def needs_rebuild(self, workflow: "Workflow") -> bool:
+        """Whether the DAG is stale (explicitly, or the registry changed size)."""
+        return self._dirty or len(workflow.tasks) != self._registry_size
+
+    def get_ready_tasks(self, workflow: "Workflow") -> list[Task]:
+        """Return ready atomic tasks in registry order, marking them READY."""
+        if self.needs_rebuild(workflow):
+            self.rebuild(workflow)
+
+        ready = [
+            self._leaves[tid] for tid in sorted(self._ready, key=self._rank.__getitem__)
+        ]
+        for task in ready:
+            if task.status != TaskStatus.READY:
+                # Make the state explicit for observers
+                task.status = TaskStatus.READY
+        return ready
+
+    def on_status_changed(self, task: Task, previous: TaskStatus | None) -> None:
+        """Apply a leaf status transition to the unmet-dependency counters."""
+        if self._dirty or self._leaves.get(task.id) is not task:
+            return
+
+        was_done = previous == TaskStatus.COMPLETED
+        is_done = task.status == TaskStatus.COMPLETED
+        if was_done != is_done:
+            delta = -1 if is_done else 1
+            for successor_id in self._successors.get(task.id, ()):
+                self._unmet[successor_id] += delta
+                self._refresh(successor_id)
+        self._refresh(task.id)
+
+    def on_task_replaced(self, previous: Task | None, task: Task) -> None:
+        """Swap a registry entry in place when its graph shape is unchanged."""
+        if (
+            self._dirty
+            or previous is None
+            or self._leaves.get(task.id) is not previous
+            or not task.is_atomic_task()
+            or task.dependency_task_ids != previous.dependency_task_ids
+        ):
+            self.invalidate()
+            return
+        self._leaves[task.id] = task
+        self.on_status_changed(task, previous.status)
+
+    def rebuild(self, workflow: "Workflow") -> None:
+        """Recompute the leaf DAG from the workflow's task forest.
+
+        Composite dependencies are pushed down to every descendant leaf and
+        expanded to leaf IDs (rewriting ``dependency_task_ids`` in place), and
+        every leaf is registered in ``workflow.tasks`` so the engine and manager
+        actions can address it directly.
+        """
+        owner = ref(workflow)
+        # Snapshot: registering leaves below grows the registry (and the index)
+        nodes = dict(workflow._index.tasks(workflow))
+        roots = list(workflow.tasks.values())
+
+        leaf_cache: dict[UUID, list[UUID]] = {}
+
+        def _leaf_ids(node: Task) -> list[UUID]:
+            cached = leaf_cache.get(node.id)
+            if cached is None:
+                if node.is_atomic_task():
+                    cached = [node.id]
+                else:
+                    cached = [
+                        leaf_id
+                        for child in node.subtasks
+                        for leaf_id in _leaf_ids(child)
+                    ]
+                leaf_cache[node.id] = cached
+            return cached
+
+        def _expand(dep_ids: list[UUID]) -> dict[UUID, None]:
+            expanded: dict[UUID, None] = {}
+            for dep_id in dep_ids:
+                dep_task = nodes.get(dep_id)
+                if dep_task is None:
+                    # Keep unknown dependency so it blocks until it appears
+                    expanded[dep_id] = None
+                    continue
+                for leaf_id in _leaf_ids(dep_task):
+                    expanded[leaf_id] = None
+            return expanded
+
+        def _propagate(node: Task, inherited: dict[UUID, None]) -> None:
+            effective = _expand(node.dependency_task_ids)
+            effective.update(inherited)
+            if node.is_atomic_task():
+                if set(node.dependency_task_ids) != effective.keys():
+                    node.dependency_task_ids = list(effective)
+                resolved = workflow.tasks.get(node.id)
+                if resolved is None:
+                    resolved = workflow.tasks[node.id] = node
+                    workflow._index.on_task_added(workflow, node)
+                if resolved is not node and set(resolved.dependency_task_ids) != set(
+                    effective
+                ):
+                    resolved.dependency_task_ids = list(effective)
+                return
+            for child in node.subtasks:
+                _propagate(child, effective)
+
+        for root in roots:
+            _propagate(root, {})
+
+        # Build the leaf DAG over authoritative registry objects
+        self._leaves = {}
+        self._rank = {}
+        self._successors = {}
+        self._unmet = {}
+        self._ready = set()
+        for rank, (task_id, task) in enumerate(workflow.tasks.items()):
+            task._workflow_ref = owner
+            if task.is_atomic_task():
+                self._leaves[task_id] = task
+                self._rank[task_id] = rank
+
+        for leaf_id, leaf in self._leaves.items():
+            unmet = 0
+            for dep_id in dict.fromkeys(leaf.dependency_task_ids):
+                dep = self._leaves.get(dep_id)
+                if dep is None or dep.status != TaskStatus.COMPLETED:
+                    unmet += 1
+                if dep is not None:
+                    self._successors.setdefault(dep_id, []).append(leaf_id)
+            self._unmet[leaf_id] = unmet
+            self._refresh(leaf_id)
+
+        self._registry_size = len(workflow.tasks)
+        self._dirty = False
+        self.rebuild_count += 1
+
+    def _refresh(self, task_id: UUID) -> None:
+        if (
+            self._unmet.get(task_id) == 0
+            and self._leaves[task_id].status in SCHEDULABLE_STATUSES
+        ):
+            self._ready.add(task_id)
+        else:
+            self._ready.discard(task_id)
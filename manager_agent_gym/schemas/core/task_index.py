@@ -0,0 +1,145 @@
+"""
+Constant-time task lookup over a workflow's task forest.
+
+Maintains a ``UUID -> Task`` map covering every task reachable from the
+workflow registry (including nested subtasks) plus a child -> parent map, so
+lookups, ancestor walks and subtree membership checks never rescan the tree.
+
+The index also keeps the forest single-sourced: whenever an embedded subtask
+and a registry entry share an ID, the parent's ``subtasks`` list is pointed at
+the registry object, so a status write on either view is seen by both.
+"""
+
+from typing import TYPE_CHECKING, Iterator
+from uuid import UUID
+from weakref import ref
+
+from .tasks import Task
+
+if TYPE_CHECKING:
+    from .workflow import Workflow
+
+
+class TaskIndex:
+    """Maintained ``UUID -> Task`` and ``child -> parent`` indexes.
+
+    Registry entries in ``workflow.tasks`` take precedence over embedded copies
+    with the same ID, and embedded copies are replaced by the registry object.
+    The index is updated incrementally by the owning workflow (``add_task``,
+    ``Task.add_subtask``/``remove_subtask`` via the task change hook) and
+    rebuilt lazily if the registry is edited directly.
+    """
+
+    def __init__(self) -> None:
+        self._dirty: bool = True
+        self._registry_size: int = -1
+        self._tasks: dict[UUID, Task] = {}
+        self._parent: dict[UUID, UUID] = {}
+        self._children: dict[UUID, list[UUID]] = {}
+
+    def invalidate(self) -> None:
+        """Mark the index stale; it is rebuilt lazily on the next lookup."""
+        self._dirty = True
+
+    def tasks(self, workflow: "Workflow") -> dict[UUID, Task]:
+        """Return the live ``UUID -> Task`` map (do not mutate)."""
+        self._ensure(workflow)
+        return self._tasks
+
+    def get(self, workflow: "Workflow", task_id: UUID) -> Task | None:
+        self._ensure(workflow)
+        return self._tasks.get(task_id)
+
+    def parent_id(self, workflow: "Workflow", task_id: UUID) -> UUID | None:
+        self._ensure(workflow)
+        return self._parent.get(task_id)
+
+    def iter_ancestor_ids(self, workflow: "Workflow", task_id: UUID) -> Iterator[UUID]:
+        """Yield ancestor IDs from the direct parent up to the root."""
+        self._ensure(workflow)
+        parent_id = self._parent.get(task_id)
+        while parent_id is not None:
+            yield parent_id
+            parent_id = self._parent.get(parent_id)
+
+    def on_task_added(self, workflow: "Workflow", task: Task) -> None:
+        """Index a newly registered task and its subtree."""
+        if self._dirty or len(workflow.tasks) != self._registry_size + 1:
+            # Not a plain single insertion on a fresh index; rebuild once
+            self.invalidate()
+            self._ensure(workflow)
+            return
+        parent_id = self._parent.get(task.id)
+        self._tasks[task.id] = task
+        if parent_id is not None and parent_id in self._tasks:
+            self._link_registry_children(workflow, self._tasks[parent_id])
+        self._add_tree(ref(workflow), task, parent_id)
+        self._registry_size = len(workflow.tasks)
+
+    def on_task_replaced(self, workflow: "Workflow", task: Task) -> None:
+        """Point the index at a new registry object for an existing ID."""
+        if self._ensure(workflow):
+            return
+        self._tasks[task.id] = task
+        parent_id = self._parent.get(task.id)
+        if parent_id is not None and parent_id in self._tasks:
+            self._link_registry_children(workflow, self._tasks[parent_id])
+        self.on_subtasks_changed(workflow, task)
+
+    def on_subtasks_changed(self, workflow: "Workflow", task: Task) -> None:
+        """Re-index the children of ``task`` after its subtask list changed."""
+        if self._dirty:
+            return
+        for child_id in self._children.pop(task.id, []):
+            self._drop_tree(workflow, child_id)
+        owner = ref(workflow)
+        self._link_registry_children(workflow, task)
+        self._children[task.id] = [child.id for child in task.subtasks]
+        for child in task.subtasks:
+            self._add_tree(owner, child, task.id)
+
+    def _ensure(self, workflow: "Workflow") -> bool:
+        """Rebuild if stale. Returns True when a rebuild happened."""
+        if not self._dirty and len(workflow.tasks) == self._registry_size:
+            return False
+        self._tasks = {}
+        self._parent = {}
+        self._children = {}
+        owner = ref(workflow)
+        for root in list(workflow.tasks.values()):
+            self._add_tree(owner, root, None)
+        # Registry entries are authoritative over embedded copies
+        self._tasks.update(workflow.tasks)
+        self._registry_size = len(workflow.tasks)
+        self._dirty = False
+        return True
+
+    def _add_tree(
+        self, owner: "ref[Workflow]", node: Task, parent_id: UUID | None
+    ) -> None:
+        node._workflow_ref = owner
+        workflow = owner()
+        if workflow is not None:
+            self._link_registry_children(workflow, node)
+        self._tasks.setdefault(node.id, node)
+        if parent_id is not None:
+            self._parent[node.id] = parent_id
+        self._children[node.id] = [child.id for child in node.subtasks]
+        for child in node.subtasks:
+            self._add_tree(owner, child, node.id)
+
+    @staticmethod
+    def _link_registry_children(workflow: "Workflow", node: Task) -> None:
+        """Point embedded subtasks at their registry objects (no change hooks)."""
+        subtasks = node.subtasks
+        for position, child in enumerate(subtasks):
+            registered = workflow.tasks.get(child.id)
+            if registered is not None and registered is not child:
+                subtasks[position] = registered
+
+    def _drop_tree(self, workflow: "Workflow", task_id: UUID) -> None:
+        for child_id in self._children.pop(task_id, []):
+            self._drop_tree(workflow, child_id)
+        self._parent.pop(task_id, None)
+        if task_id not in workflow.tasks:
+            self._tasks.pop(task_id, None)
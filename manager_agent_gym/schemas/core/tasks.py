@@ -3,11 +3,16 @@ Task data models for Manager Agent Gym.
 """
 
 from datetime import datetime
+from typing import Any
 from uuid import UUID, uuid4
-from pydantic import BaseModel, Field
+from weakref import ReferenceType
+from pydantic import BaseModel, Field, PrivateAttr
 
 from .base import TaskStatus
 
+# Fields whose reassignment is reported to the owning workflow's scheduler
+_SCHEDULING_FIELDS = frozenset({"status", "dependency_task_ids", "subtasks"})
+
 
 class Task(BaseModel):
     """
@@ -32,7 +37,9 @@ class Task(BaseModel):
         examples=["Write a 2-page memo for execs."],
     )
 
-    # Hierarchical structure
+    # Hierarchical structure. Reassign ``subtasks`` (or use ``add_subtask``/
+    # ``remove_subtask``) rather than editing the list in place: only those
+    # are reported to the owning workflow's task index and ready-set scheduler.
     subtasks: list["Task"] = Field(
         default_factory=list,
         description="Subtasks that make up this task (recursive structure)",
@@ -41,7 +48,9 @@ class Task(BaseModel):
         default=None, description="ID of parent task if this is a subtask"
     )
 
-    # Dependencies and resources
+    # Dependencies and resources. As with ``subtasks``, reassign these lists
+    # instead of appending in place, or the workflow's ready set and cached
+    # renderings will not see the change (see ``Workflow.invalidate_task_graph``).
     input_resource_ids: list[UUID] = Field(
         default_factory=list, description="IDs of required input resources"
     )
@@ -94,6 +103,71 @@ class Task(BaseModel):
         description="Derived status for composites based on descendant leaves; for leaves equals status.",
     )
 
+    # Weak back-reference to the owning workflow (set when the workflow adopts the task)
+    _workflow_ref: "ReferenceType[Any] | None" = PrivateAttr(default=None)
+    # Rendered own-field lines of ``pretty_print`` keyed by indent
+    _rendered: dict[int, str] = PrivateAttr(default_factory=dict)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name in _SCHEDULING_FIELDS:
+            previous = self.__dict__.get(name)
+            super().__setattr__(name, value)
+            self._invalidate_rendering()
+            self._notify_workflow(name, previous)
+            return
+        super().__setattr__(name, value)
+        if name in Task.model_fields:
+            self._invalidate_rendering()
+
+    def __copy__(self) -> "Task":
+        copied = super().__copy__()
+        # Copies are edited (and rendered) independently of the original
+        copied._rendered = {}
+        return copied
+
+    def __deepcopy__(self, memo: dict[int, Any] | None = None) -> "Task":
+        copied = super().__deepcopy__(memo)
+        copied._rendered = {}
+        return copied
+
+    def __getstate__(self) -> dict[Any, Any]:
+        # The workflow weakref does not pickle; an unpickled workflow re-adopts
+        # its tasks when its indexes are rebuilt
+        state = super().__getstate__()
+        private = state.get("__pydantic_private__")
+        if private:
+            state["__pydantic_private__"] = {
+                **private,
+                "_workflow_ref": None,
+                "_rendered": {},
+            }
+        return state
+
+    def _invalidate_rendering(self) -> None:
+        """Drop cached text for this task and the owning workflow's documents.
+
+        Like scheduling updates, this relies on fields being reassigned rather
+        than mutated in place.
+        """
+        private = self.__pydantic_private__
+        if private and private.get("_rendered"):
+            private["_rendered"] = {}
+        owner = self._owning_workflow()
+        if owner is not None:
+            owner._invalidate_renderings()
+
+    def _owning_workflow(self) -> Any:
+        """Return the workflow that adopted this task, if it is still alive."""
+        private = self.__pydantic_private__
+        owner_ref = private.get("_workflow_ref") if private else None
+        return owner_ref() if owner_ref is not None else None
+
+    def _notify_workflow(self, field_name: str, previous: Any) -> None:
+        """Report a scheduling-relevant change to the owning workflow, if any."""
+        owner = self._owning_workflow()
+        if owner is not None:
+            owner._on_task_changed(self, field_name, previous)
+
     @property
     def task_id(self) -> UUID:
         """Alias for id field to maintain compatibility."""
@@ -149,12 +223,14 @@ class Task(BaseModel):
         """Add a subtask and set its parent reference."""
         subtask.parent_task_id = self.id
         self.subtasks.append(subtask)
+        self._notify_workflow("subtasks", None)
 
     def remove_subtask(self, subtask_id: UUID) -> bool:
         """Remove a subtask by ID. Returns True if found and removed."""
         for i, subtask in enumerate(self.subtasks):
             if subtask.id == subtask_id:
                 self.subtasks.pop(i)
+                self._notify_workflow("subtasks", None)
                 return True
             # Check recursively in subtasks
             if subtask.remove_subtask(subtask_id):
@@ -162,9 +238,18 @@ class Task(BaseModel):
         return False
 
     def find_task_by_id(self, task_id: UUID) -> "Task | None":
-        """Find a task by ID in this task tree."""
+        """Find a task by ID in this task tree.
+
+        Uses the owning workflow's task index when this task has been adopted
+        by a workflow; falls back to a recursive search otherwise.
+        """
         if self.id == task_id:
             return self
+        owner = self._owning_workflow()
+        if owner is not None:
+            if not owner.is_in_subtree(task_id, self.id):
+                return None
+            return owner.find_task_by_id(task_id)
         for subtask in self.subtasks:
             found = subtask.find_task_by_id(task_id)
             if found:
@@ -196,7 +281,21 @@ class Task(BaseModel):
                 subtask.sync_embedded_tasks_with_registry(task_registry)
 
     def pretty_print(self, indent: int = 0) -> str:
-        """Return a human-readable summary of the task and selected fields."""
+        """Return a human-readable summary of the task and selected fields.
+
+        Each task's own lines are cached until one of its fields is reassigned.
+        """
+        rendered = self._rendered.get(indent)
+        if rendered is None:
+            rendered = self._rendered[indent] = self._render_fields(indent)
+        if not self.subtasks:
+            return rendered
+        lines = [rendered, f"{'  ' * indent}  Subtasks:"]
+        for st in self.subtasks:
+            lines.append(st.pretty_print(indent + 2))
+        return "\n".join(lines)
+
+    def _render_fields(self, indent: int) -> str:
         prefix = "  " * indent
         lines: list[str] = []
         lines.append(f"{prefix}• Task: {self.name} (ID: {self.id})")
@@ -224,10 +323,6 @@ class Task(BaseModel):
             lines.append(
                 f"{prefix}  Output resources: {[str(r) for r in self.output_resource_ids]}"
             )
-        if self.subtasks:
-            lines.append(f"{prefix}  Subtasks:")
-            for st in self.subtasks:
-                lines.append(st.pretty_print(indent + 2))
         return "\n".join(lines)
 
 
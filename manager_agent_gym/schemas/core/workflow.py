@@ -3,14 +3,26 @@ Workflow data models for Manager Agent Gym.
 """
 
 from datetime import datetime
+from typing import Any, Callable, Mapping
 from uuid import UUID, uuid4
-
-from pydantic import BaseModel, Field
+from weakref import ref
+
+from pydantic import (
+    BaseModel,
+    Field,
+    PrivateAttr,
+    SerializerFunctionWrapHandler,
+    model_serializer,
+)
 from pydantic import ConfigDict
 
 from .base import TaskStatus
 from .tasks import Task
+from .scheduler import ReadyTaskScheduler
+from .task_index import TaskIndex
 from .resources import Resource
+from .lazy_entries import LazyEntries
+from ...core.common.content_store import ContentStore
 
 from .communication import Message
 from ..preferences import Constraint
@@ -100,6 +112,34 @@ class Workflow(BaseModel):
         description="Total simulated time across all completed tasks (hours)",
     )
 
+    # Incremental ready-set scheduler over the leaf dependency DAG
+    _scheduler: ReadyTaskScheduler = PrivateAttr(default_factory=ReadyTaskScheduler)
+    # UUID -> Task and parent indexes over the whole task forest
+    _index: TaskIndex = PrivateAttr(default_factory=TaskIndex)
+    # Bumped on every change that can alter a text rendering of the workflow
+    _render_version: int = PrivateAttr(default=0)
+    _renderings: dict[tuple[Any, ...], str] = PrivateAttr(default_factory=dict)
+    # Blob store that large resource content is spilled to (None = keep inline)
+    _content_store: ContentStore | None = PrivateAttr(default=None)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in Workflow.model_fields:
+            self._invalidate_renderings()
+
+    @property
+    def render_version(self) -> int:
+        """Version of the workflow's rendered state; changes on every mutation."""
+        return self._render_version
+
+    def _invalidate_renderings(self) -> None:
+        private = self.__pydantic_private__
+        if private is None:
+            return
+        private["_render_version"] = private.get("_render_version", 0) + 1
+        if private.get("_renderings"):
+            private["_renderings"] = {}
+
     @property
     def workflow_id(self) -> UUID:
         """Alias for id field to maintain compatibility."""
@@ -138,10 +178,164 @@ class Workflow(BaseModel):
     def add_task(self, task: Task) -> None:
         """Add a task to the workflow."""
         self.tasks[task.id] = task
+        self._index.on_task_added(self, task)
+        self._scheduler.invalidate()
+        self._invalidate_renderings()
+
+    def remove_task(self, task_id: UUID) -> Task | None:
+        """Remove a task from the registry. Returns the removed task, if any."""
+        removed = self.tasks.pop(task_id, None)
+        if removed is not None:
+            self._invalidate_renderings()
+            self._index.invalidate()
+            self._scheduler.invalidate()
+            # Detach the removed subtree unless it is still embedded elsewhere
+            for node in [removed, *removed.get_all_subtasks_flat()]:
+                if self._index.get(self, node.id) is None:
+                    node._workflow_ref = None
+        return removed
+
+    def replace_task(self, task: Task) -> None:
+        """Replace the registry entry for ``task.id`` with ``task``."""
+        previous = self.tasks.get(task.id)
+        self.tasks[task.id] = task
+        if previous is not None and previous is not task:
+            previous._workflow_ref = None
+        self._index.on_task_replaced(self, task)
+        self._scheduler.on_task_replaced(previous, task)
+        # The replacement may carry text cached for another state
+        task._rendered = {}
+        self._invalidate_renderings()
+
+    def invalidate_task_graph(self) -> None:
+        """Rebuild the task index and ready set on their next use.
+
+        Task changes are tracked through field assignment, so call this after
+        editing a task's ``dependency_task_ids`` or ``subtasks`` list in place.
+        """
+        self._index.invalidate()
+        self._scheduler.invalidate()
+        self._invalidate_renderings()
+
+    def _on_task_changed(self, task: Task, field_name: str, previous: Any) -> None:
+        """Hook invoked by adopted tasks when a scheduling-relevant field changes."""
+        if field_name == "status":
+            self._scheduler.on_status_changed(task, previous)
+            return
+        if field_name == "subtasks":
+            self._index.on_subtasks_changed(self, task)
+            self._invalidate_renderings()
+        self._scheduler.invalidate()
 
     def add_resource(self, resource: Resource) -> None:
         """Add a resource to the workflow."""
         self.resources[resource.id] = resource
+        self._adopt_resource(resource)
+        self._invalidate_renderings()
+
+    def add_lazy_resources(
+        self, factories: Mapping[UUID, Callable[[], Resource]]
+    ) -> None:
+        """Register resources, each built by its factory on first lookup.
+
+        Built resources are adopted as by ``add_resource``. Dumps and copies of
+        the workflow build every pending resource first.
+        """
+        if not isinstance(self.resources, LazyEntries):
+            self.resources = LazyEntries(self.resources)
+        workflow_ref = ref(self)
+
+        def adopted(factory: Callable[[], Resource]) -> Callable[[], Resource]:
+            def build() -> Resource:
+                resource = factory()
+                workflow = workflow_ref()
+                if workflow is not None:
+                    workflow._adopt_resource(resource)
+                return resource
+
+            return build
+
+        for resource_id, factory in factories.items():
+            self.resources.add_lazy(resource_id, adopted(factory))
+        self._invalidate_renderings()
+
+    def _adopt_resource(self, resource: Resource) -> None:
+        resource._workflow_ref = ref(self)
+        # A resource that already has a store keeps it: spilled content lives there
+        if self._content_store is not None and resource._content_store is None:
+            resource.attach_content_store(self._content_store)
+
+    def materialize_resources(self) -> None:
+        """Build every resource registered with ``add_lazy_resources``."""
+        if isinstance(self.resources, LazyEntries):
+            self.resources.materialize()
+
+    def __copy__(self) -> "Workflow":
+        self.materialize_resources()
+        copied = super().__copy__()
+        # Shallow copies share task objects, which stay adopted by the original
+        copied._reset_derived_state()
+        return copied
+
+    def __deepcopy__(self, memo: dict[int, Any] | None = None) -> "Workflow":
+        self.materialize_resources()
+        copied = super().__deepcopy__(memo)
+        copied._adopt_copied_state()
+        return copied
+
+    def model_copy(
+        self, *, update: Mapping[str, Any] | None = None, deep: bool = False
+    ) -> "Workflow":
+        copied = super().model_copy(update=update, deep=deep)
+        if deep and update:
+            # Pydantic deep-copies field by field here, bypassing __deepcopy__
+            copied._adopt_copied_state()
+        return copied
+
+    def __getstate__(self) -> dict[Any, Any]:
+        # Derived indexes are rebuilt (re-adopting every task) on first use
+        # after unpickling; the content store holds a lock and does not pickle
+        self.materialize_resources()
+        state = super().__getstate__()
+        private = state.get("__pydantic_private__")
+        if private:
+            state["__pydantic_private__"] = {
+                **private,
+                "_scheduler": ReadyTaskScheduler(),
+                "_index": TaskIndex(),
+                "_renderings": {},
+                "_content_store": None,
+            }
+        return state
+
+    def _reset_derived_state(self) -> None:
+        """Start from stale indexes and no cached renderings."""
+        self._scheduler = ReadyTaskScheduler()
+        self._index = TaskIndex()
+        self._renderings = {}
+
+    def _adopt_copied_state(self) -> None:
+        """Re-adopt deep-copied tasks and resources, which still point at the original."""
+        self._reset_derived_state()
+        # Rebuilding the index adopts every task in the forest
+        self._index.tasks(self)
+        for resource in self.resources.values():
+            resource._workflow_ref = ref(self)
+
+    @model_serializer(mode="wrap")
+    def _serialize_materialized(self, handler: SerializerFunctionWrapHandler) -> Any:
+        self.materialize_resources()
+        return handler(self)
+
+    def set_content_store(self, store: ContentStore | None) -> None:
+        """Spill large resource content to ``store`` from now on.
+
+        Resources already registered are attached (and spilled) immediately.
+        """
+        self._content_store = store
+        if store is not None:
+            for resource in self.resources.values():
+                resource.attach_content_store(store)
 
     def get_task_output_resources(self, task: Task) -> list[Resource]:
         """Return realized output resources for a given task by id lookup."""
@@ -159,106 +353,63 @@ class Workflow(BaseModel):
     def add_agent(self, agent: AgentInterface) -> None:
         """Add an agent to the workflow."""
         self.agents[agent.agent_id] = agent
+        self._invalidate_renderings()
 
     def get_ready_tasks(self) -> list[Task]:
         """Get atomic tasks that are ready to start (all dependencies satisfied).
 
         Recursively considers leaf subtasks and ensures they are registered as
         executable tasks so downstream systems can schedule and update them.
+        Readiness is maintained incrementally by the workflow's scheduler; the
+        leaf DAG is only rebuilt after structural changes.
         """
-        # 1) Propagate dependencies from composite parents down to all leaf subtasks,
-        # then register any leaf subtasks into the top-level task registry so they
-        # can be scheduled and updated consistently by the engine/manager actions.
         try:
-
-            def _expand_to_leaf_dependencies(dep_ids: set[UUID]) -> set[UUID]:
-                """Expand any composite task IDs in dep_ids into their atomic descendant IDs."""
-                expanded: set[UUID] = set()
-                for dep_id in dep_ids:
-                    dep_task = self.find_task_by_id(dep_id)
-                    if dep_task is None:
-                        # Keep unknown dependency to let validation catch it later
-                        expanded.add(dep_id)
-                        continue
-                    if dep_task.is_atomic_task():
-                        expanded.add(dep_task.id)
-                    else:
-                        for leaf in dep_task.get_atomic_subtasks():
-                            expanded.add(leaf.id)
-                return expanded
-
-            def _propagate_and_register(task: Task, inherited_deps: set[UUID]) -> None:
-                # Aggregate dependencies from ancestors including this node
-                aggregated_raw: set[UUID] = set(inherited_deps)
-                aggregated_raw.update(task.dependency_task_ids)
-                # Expand any composite dependencies to their leaf IDs
-                aggregated_expanded = _expand_to_leaf_dependencies(aggregated_raw)
-
-                # If composite, push aggregated deps to children and recurse
-                if not task.is_atomic_task():
-                    for child in task.subtasks:
-                        child_deps_raw = set(child.dependency_task_ids)
-                        child_deps_expanded = _expand_to_leaf_dependencies(
-                            child_deps_raw
-                        )
-                        merged = child_deps_expanded.union(aggregated_expanded)
-                        child.dependency_task_ids = list(merged)
-                        _propagate_and_register(child, aggregated_expanded)
-                else:
-                    # Atomic leaf: rewrite its deps to the expanded set (including its own)
-                    own_expanded = _expand_to_leaf_dependencies(
-                        set(task.dependency_task_ids)
-                    )
-                    effective = own_expanded.union(aggregated_expanded)
-                    task.dependency_task_ids = list(effective)
-                    # Ensure it is available at top level for scheduling
-                    if task.id not in self.tasks:
-                        self.tasks[task.id] = task
-
-            for root in list(self.tasks.values()):
-                _propagate_and_register(root, set())
+            return self._scheduler.get_ready_tasks(self)
         except Exception:
             logger.error(
                 "When trying to add dependancies from a parent to its children, an error occurred",
                 exc_info=True,
             )
-            # Defensive: if any malformed structure, fallback to current registry only
-            pass
-
-        # 2) Compute readiness based on completed tasks
-        completed_task_ids = {
-            tid
-            for tid, task in self.tasks.items()
-            if task.status == TaskStatus.COMPLETED
-        }
-
-        ready = []
-        for task in self.tasks.values():
-            if (
-                task.status in (TaskStatus.PENDING, TaskStatus.READY)
+            # Defensive: if any malformed structure, fall back to a registry-only scan
+            self._scheduler.invalidate()
+            completed_task_ids = {
+                tid
+                for tid, task in self.tasks.items()
+                if task.status == TaskStatus.COMPLETED
+            }
+            return [
+                task
+                for task in self.tasks.values()
+                if task.status in (TaskStatus.PENDING, TaskStatus.READY)
                 and task.is_atomic_task()
                 and task.is_ready_to_start(completed_task_ids)
-            ):
-                # Mark as READY to make the state explicit for observers
-                task.status = TaskStatus.READY
-                ready.append(task)
-        return ready
+            ]
 
     def get_available_agents(self) -> list[AgentInterface]:
         """Get agents that are currently available for task assignment."""
         return [agent for agent in self.agents.values() if agent.is_available]
 
     def find_task_by_id(self, task_id: UUID) -> Task | None:
-        """Find a task by ID in the workflow."""
-        if task_id in self.tasks:
-            return self.tasks[task_id]
-
-        # Search in task hierarchies (subtasks)
-        for task in self.tasks.values():
-            found = task.find_task_by_id(task_id)
-            if found:
-                return found
-        return None
+        """Find a task by ID in the workflow, including nested subtasks (O(1))."""
+        return self._index.get(self, task_id)
+
+    def get_parent_task(self, task_id: UUID) -> Task | None:
+        """Return the composite task that directly contains ``task_id``, if any."""
+        parent_id = self._index.parent_id(self, task_id)
+        return self._index.get(self, parent_id) if parent_id is not None else None
+
+    def get_ancestor_ids(self, task_id: UUID) -> list[UUID]:
+        """Return ancestor task IDs from the direct parent up to the root."""
+        return list(self._index.iter_ancestor_ids(self, task_id))
+
+    def is_in_subtree(self, task_id: UUID, root_id: UUID) -> bool:
+        """Whether ``task_id`` is ``root_id`` or one of its (nested) subtasks."""
+        if task_id == root_id:
+            return True
+        return any(
+            ancestor_id == root_id
+            for ancestor_id in self._index.iter_ancestor_ids(self, task_id)
+        )
 
     def is_complete(self) -> bool:
         """Check if all atomic tasks in the workflow are completed."""
@@ -282,18 +433,8 @@ class Workflow(BaseModel):
         - The effective atomic-task dependency graph has at least one start
           and is acyclic (i.e., the workflow is completable without deadlock)
         """
-        # Build a registry of all tasks including nested subtasks, and a parent map
-        all_tasks: dict[UUID, Task] = {}
-        parent_of: dict[UUID, UUID] = {}
-
-        def register_task_tree(task: Task) -> None:
-            all_tasks[task.id] = task
-            for child in task.subtasks:
-                parent_of[child.id] = task.id
-                register_task_tree(child)
-
-        for root in self.tasks.values():
-            register_task_tree(root)
+        # Registry of all tasks including nested subtasks (from the maintained index)
+        all_tasks = self._index.tasks(self)
 
         # Identify atomic (leaf) tasks
         leaf_tasks = [t for t in all_tasks.values() if t.is_atomic_task()]
@@ -321,13 +462,11 @@ class Workflow(BaseModel):
         effective_deps: dict[UUID, set[UUID]] = {}
         for leaf in leaf_tasks:
             agg: set[UUID] = set(leaf.dependency_task_ids)
-            ancestor_id = parent_of.get(leaf.id)
-            while ancestor_id is not None:
+            for ancestor_id in self._index.iter_ancestor_ids(self, leaf.id):
                 ancestor = all_tasks.get(ancestor_id)
                 if ancestor is None:
                     break
                 agg.update(ancestor.dependency_task_ids)
-                ancestor_id = parent_of.get(ancestor_id)
             expanded = expand_to_leaf_ids(agg)
             # Validate that all deps exist and are leaf IDs after expansion
             for dep_id in expanded:
@@ -370,7 +509,29 @@ class Workflow(BaseModel):
     def pretty_print(
         self, include_resources: bool = True, max_preview_chars: int = 300
     ) -> str:
-        """Return a human-readable summary of the workflow, tasks, and selected resources."""
+        """Return a human-readable summary of the workflow, tasks, and selected resources.
+
+        The document is memoized per ``render_version``; task and resource
+        fragments are cached on the objects themselves.
+        """
+        # Adopt tasks so their field writes invalidate this cache; sizes guard
+        # against direct edits of the registries that bypass the hooks
+        self._index.tasks(self)
+        key = (
+            include_resources,
+            max_preview_chars,
+            len(self.tasks),
+            len(self.resources),
+            len(self.agents),
+        )
+        rendered = self._renderings.get(key)
+        if rendered is None:
+            rendered = self._renderings[key] = self._render(
+                include_resources, max_preview_chars
+            )
+        return rendered
+
+    def _render(self, include_resources: bool, max_preview_chars: int) -> str:
         lines: list[str] = []
         lines.append("-" * 70)
         lines.append(f"Workflow: {self.name} (ID: {self.id})")
@@ -388,7 +549,9 @@ class Workflow(BaseModel):
             lines.append(t.pretty_print(indent=1))
         if include_resources and self.resources:
             lines.append("\nResources:")
+            owner = ref(self)
             for r in self.resources.values():
+                r._workflow_ref = owner
                 try:
                     lines.append(r.pretty_print(max_preview_chars=max_preview_chars))
                 except Exception:
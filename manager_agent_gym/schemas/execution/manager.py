@@ -3,8 +3,16 @@ Manager agent observation and action data models.
 """
 
 from datetime import datetime
+from typing import Any, Callable, cast
 from uuid import UUID
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import (
+    BaseModel,
+    Field,
+    ConfigDict,
+    PrivateAttr,
+    SerializerFunctionWrapHandler,
+    model_serializer,
+)
 
 from ...schemas.core import Message
 from ...schemas.preferences.constraints import Constraint
@@ -13,11 +21,18 @@ from ...schemas.workflow_agents.config import AgentConfig
 
 
 class ManagerObservation(BaseModel):
-    """Observation provided to manager agent at each timestep."""
+    """Observation provided to manager agent at each timestep.
+
+    Fields can be deferred (see ``deferred``): they are computed on first
+    access, or when the observation is serialized, copied or compared, and
+    memoized from then on.
+    """
 
     # Allow non-Pydantic types like AgentInterface in fields
     model_config = ConfigDict(arbitrary_types_allowed=True)
-    workflow_summary: str
+    workflow_summary: str = Field(
+        default="", description="Rendered workflow state (tasks, resources)"
+    )
     timestep: int = Field(..., description="Current timestep number")
     workflow_id: UUID = Field(..., description="ID of the workflow being executed")
     execution_state: str = Field(..., description="Current execution state")
@@ -81,3 +96,68 @@ class ManagerObservation(BaseModel):
     stakeholder_profile: StakeholderPublicProfile = Field(
         description="Public stakeholder profile",
     )
+
+    # Field name -> function computing it, for fields not computed yet
+    _deferred: dict[str, Callable[[], Any]] = PrivateAttr(default_factory=dict)
+
+    @classmethod
+    def deferred(
+        cls, factories: dict[str, Callable[[], Any]], **values: Any
+    ) -> "ManagerObservation":
+        """Observation from ``values`` whose ``factories`` fields are computed lazily.
+
+        Deferred values are read from the live state at first access and are
+        not validated.
+        """
+        observation = cls(**values)
+        fields = cast(dict[str, Any], observation.__dict__)
+        for name in factories:
+            fields.pop(name, None)
+        observation._deferred = dict(factories)
+        return observation
+
+    def materialize(self) -> "ManagerObservation":
+        """Compute every deferred field now, pinning it to the current state."""
+        for name in list(self._deferred):
+            getattr(self, name)
+        return self
+
+    def __getattr__(self, name: str) -> Any:
+        private = object.__getattribute__(self, "__pydantic_private__")
+        deferred = private.get("_deferred") if private else None
+        if deferred and name in deferred:
+            value = deferred.pop(name)()
+            cast(dict[str, Any], self.__dict__)[name] = value
+            return value
+        return super().__getattr__(name)  # type: ignore[misc]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, ManagerObservation):
+            other.materialize()
+        return super(ManagerObservation, self.materialize()).__eq__(other)
+
+    def model_copy(self, *args: Any, **kwargs: Any) -> "ManagerObservation":
+        self.materialize()
+        return super().model_copy(*args, **kwargs)
+
+    # Copies, pickles and reprs see every field: pending factories are not shared
+
+    def __copy__(self) -> "ManagerObservation":
+        self.materialize()
+        return super().__copy__()
+
+    def __deepcopy__(self, memo: dict[int, Any] | None = None) -> "ManagerObservation":
+        self.materialize()
+        return super().__deepcopy__(memo)
+
+    def __getstate__(self) -> dict[Any, Any]:
+        self.materialize()
+        return super().__getstate__()
+
+    def __repr_args__(self) -> Any:
+        self.materialize()
+        return super().__repr_args__()
+
+    @model_serializer(mode="wrap")
+    def _serialize_materialized(self, handler: SerializerFunctionWrapHandler) -> Any:
+        return handler(self.materialize())
@@ -325,7 +325,7 @@ class CreateTaskAction(BaseManagerAction):
             dependency_task_ids=[],
         )
 
-        workflow.tasks[new_task.task_id] = new_task
+        workflow.add_task(new_task)
         logger.info(f"New task created: {self.name} (ID: {new_task.task_id})")
         summary = f"Created task '{self.name}' ({new_task.task_id})"
         data = {"task_id": str(new_task.task_id)}
@@ -361,7 +361,7 @@ class RemoveTaskAction(BaseManagerAction):
                 success=False,
             )
 
-        del workflow.tasks[self.task_id]
+        workflow.remove_task(self.task_id)
         logger.info(f"Task {self.task_id} removed from workflow")
         summary = f"Removed task {self.task_id}"
         data = {"task_id": str(self.task_id)}
@@ -599,7 +599,8 @@ class RefineTaskAction(BaseManagerAction):
         communication_service: "CommunicationService | None" = None,
     ) -> ActionResult:
         """Execute task refinement."""
-        if self.task_id not in workflow.tasks:
+        task = workflow.find_task_by_id(self.task_id)
+        if task is None:
             return ActionResult(
                 summary=f"Failed: Task {self.task_id} not found in workflow from set of all tasks: {workflow.tasks.keys()}",
                 kind="failed_action",
@@ -608,7 +609,6 @@ class RefineTaskAction(BaseManagerAction):
                 success=False,
             )
 
-        task = workflow.tasks[self.task_id]
         updates = []
 
         if self.new_name:
@@ -689,7 +689,9 @@ class AddTaskDependencyAction(BaseManagerAction):
     ) -> ActionResult:
         """Execute dependency addition."""
 
-        if self.prerequisite_task_id not in workflow.tasks:
+        prerequisite_task = workflow.find_task_by_id(self.prerequisite_task_id)
+        dependent_task = workflow.find_task_by_id(self.dependent_task_id)
+        if prerequisite_task is None:
             return ActionResult(
                 summary=f"Failed: Prerequisite task {self.prerequisite_task_id} not found in workflow from set of all tasks: {workflow.tasks.keys()}",
                 kind="failed_action",
@@ -697,7 +699,7 @@ class AddTaskDependencyAction(BaseManagerAction):
                 action_type=self.action_type,
                 success=False,
             )
-        if self.dependent_task_id not in workflow.tasks:
+        if dependent_task is None:
             return ActionResult(
                 summary=f"Failed: Dependent task {self.dependent_task_id} not found in workflow from set of all tasks: {workflow.tasks.keys()}",
                 kind="failed_action",
@@ -714,8 +716,6 @@ class AddTaskDependencyAction(BaseManagerAction):
                 success=False,
             )
 
-        dependent_task = workflow.tasks[self.dependent_task_id]
-
         # Check for circular dependencies
         def has_circular_dependency(
             start_id: UUID, target_id: UUID, visited: set | None = None
@@ -726,10 +726,11 @@ class AddTaskDependencyAction(BaseManagerAction):
                 return start_id == target_id
             visited.add(start_id)
 
-            if start_id not in workflow.tasks:
+            start_task = workflow.find_task_by_id(start_id)
+            if start_task is None:
                 return False
 
-            for dep_id in workflow.tasks[start_id].dependency_task_ids:
+            for dep_id in start_task.dependency_task_ids:
                 if has_circular_dependency(dep_id, target_id, visited.copy()):
                     return True
             return False
@@ -749,11 +750,15 @@ class AddTaskDependencyAction(BaseManagerAction):
 
         # Add dependency if not already present
         if prereq_uuid not in dependent_task.dependency_task_ids:
-            dependent_task.dependency_task_ids.append(prereq_uuid)
+            # Reassign (rather than append) so the workflow scheduler sees the edit
+            dependent_task.dependency_task_ids = [
+                *dependent_task.dependency_task_ids,
+                prereq_uuid,
+            ]
             logger.info(
-                f"Added dependency: {workflow.tasks[prereq_uuid].name} -> {dependent_task.name}"
+                f"Added dependency: {prerequisite_task.name} -> {dependent_task.name}"
             )
-            summary = f"Added dependency between {workflow.tasks[prereq_uuid].name} and {dependent_task.name}"
+            summary = f"Added dependency between {prerequisite_task.name} and {dependent_task.name}"
             data = {
                 "prerequisite_task_id": self.prerequisite_task_id,
                 "dependent_task_id": self.dependent_task_id,
@@ -768,7 +773,7 @@ class AddTaskDependencyAction(BaseManagerAction):
             )
         else:
             logger.info(
-                f" Dependency already exists: {workflow.tasks[prereq_uuid].name} -> {dependent_task.name}"
+                f" Dependency already exists: {prerequisite_task.name} -> {dependent_task.name}"
             )
             summary = "Dependency already existed (no change)"
             data = {
@@ -816,7 +821,11 @@ class RemoveTaskDependencyAction(BaseManagerAction):
         dependent_task = workflow.tasks[self.dependent_task_id]
 
         if self.prerequisite_task_id in dependent_task.dependency_task_ids:
-            dependent_task.dependency_task_ids.remove(self.prerequisite_task_id)
+            dependent_task.dependency_task_ids = [
+                dep_id
+                for dep_id in dependent_task.dependency_task_ids
+                if dep_id != self.prerequisite_task_id
+            ]
             prereq_name = workflow.tasks[self.prerequisite_task_id].name
             logger.info(f"Removed dependency: {prereq_name} -> {dependent_task.name}")
             summary = f"Removed dependency {self.prerequisite_task_id} -> {self.dependent_task_id} between {prereq_name} and {dependent_task.name}"
@@ -870,7 +879,8 @@ class InspectTaskAction(BaseManagerAction):
     ) -> ActionResult:
         """Execute task inspection (read-only)."""
 
-        if self.task_id not in workflow.tasks:
+        task = workflow.find_task_by_id(self.task_id)
+        if task is None:
             return ActionResult(
                 summary=f"Failed: Task {self.task_id} not found in workflow from set of all tasks: {workflow.tasks.keys()}",
                 kind="failed_action",
@@ -879,7 +889,6 @@ class InspectTaskAction(BaseManagerAction):
                 success=False,
             )
 
-        task = workflow.tasks[self.task_id]
         logger.info(
             f"Manager inspected task '{task.name}' (Status: {task.status.value})"
         )
@@ -2,6 +2,8 @@ from typing import Any, Callable, Set
 from enum import Enum
 from pydantic import BaseModel, Field, model_validator
 
+from ..evaluation.workflow_scope import WorkflowScope
+
 
 class RunCondition(str, Enum):
     EACH_TIMESTEP = "each_timestep"
@@ -57,6 +59,14 @@ class WorkflowRubric(BaseModel):
         default_factory=set,
         description="Optional set of context items this rubric needs at evaluation time",
     )
+    scope: WorkflowScope | None = Field(
+        default=None,
+        description=(
+            "Workflow sections this rubric reads. LLM rubrics only see the scoped"
+            " context (None = full workflow); declaring a scope on a function rubric"
+            " allows its result to be reused while those sections are unchanged."
+        ),
+    )
 
     @model_validator(mode="after")
     def check_evaluator_source(self) -> "WorkflowRubric":
@@ -0,0 +1,100 @@
+import time
+from uuid import uuid4
+
+import pytest  # type: ignore[import-not-found]
+
+from manager_agent_gym.core.execution.engine import WorkflowExecutionEngine
+from manager_agent_gym.core.workflow_agents.registry import AgentRegistry
+from manager_agent_gym.schemas.config import (
+    EventDrivenExecutionConfig,
+    OutputConfig,
+    TimestepAdvancePolicy,
+)
+from manager_agent_gym.schemas.core.base import TaskStatus
+from manager_agent_gym.schemas.core.tasks import Task
+from manager_agent_gym.schemas.core.workflow import Workflow
+from tests.helpers.stubs import ManagerNoOp, StakeholderStub, StubAgent
+
+pytestmark = pytest.mark.integration
+
+
+def _engine(
+    w: Workflow, tmp_path, config: EventDrivenExecutionConfig
+) -> WorkflowExecutionEngine:
+    return WorkflowExecutionEngine(
+        workflow=w,
+        agent_registry=AgentRegistry(),
+        manager_agent=ManagerNoOp(),
+        stakeholder_agent=StakeholderStub(),
+        output_config=OutputConfig(
+            base_output_dir=tmp_path, create_run_subdirectory=False
+        ),
+        enable_timestep_logging=False,
+        enable_final_metrics_logging=False,
+        max_timesteps=10,
+        seed=42,
+        event_driven_execution=config,
+    )
+
+
+def _chain(w: Workflow, agent_id: str, names: list[str]) -> list[Task]:
+    tasks: list[Task] = []
+    for name in names:
+        task = Task(
+            name=name,
+            description="d",
+            assigned_agent_id=agent_id,
+            dependency_task_ids=[tasks[-1].id] if tasks else [],
+        )
+        w.add_task(task)
+        tasks.append(task)
+    return tasks
+
+
+@pytest.mark.asyncio
+async def test_quantum_policy_starts_dependents_within_the_timestep(tmp_path):
+    w = Workflow(name="event", workflow_goal="d", owner_id=uuid4())
+    w.add_agent(StubAgent(agent_id="fast"))
+    a, b, c = _chain(w, "fast", ["A", "B", "C"])
+    engine = _engine(
+        w,
+        tmp_path,
+        EventDrivenExecutionConfig(
+            advance_policy=TimestepAdvancePolicy.QUANTUM, quantum_seconds=0.2
+        ),
+    )
+
+    await engine.execute_timestep()  # starts A
+    assert a.status == TaskStatus.RUNNING
+
+    # A's completion starts B immediately, and B's starts C, within one quantum
+    await engine.execute_timestep()
+    assert [t.status for t in (a, b, c)] == [TaskStatus.COMPLETED] * 3
+    assert w.is_complete()
+
+
+@pytest.mark.asyncio
+async def test_first_k_policy_does_not_wait_for_slow_agents(tmp_path):
+    w = Workflow(name="event", workflow_goal="d", owner_id=uuid4())
+    w.add_agent(StubAgent(agent_id="fast"))
+    w.add_agent(StubAgent(agent_id="slow", delay_s=0.5))
+    a, b = _chain(w, "fast", ["A", "B"])
+    (slow,) = _chain(w, "slow", ["Slow"])
+    engine = _engine(
+        w,
+        tmp_path,
+        EventDrivenExecutionConfig(
+            advance_policy=TimestepAdvancePolicy.FIRST_K, first_k=1
+        ),
+    )
+
+    await engine.execute_timestep()  # starts A and Slow
+    start = time.perf_counter()
+    await engine.execute_timestep()
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < 0.5
+    assert a.status == TaskStatus.COMPLETED
+    assert b.status == TaskStatus.RUNNING
+    assert slow.status == TaskStatus.RUNNING
+    assert slow.id in engine.running_tasks
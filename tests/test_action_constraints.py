@@ -0,0 +1,68 @@
+from uuid import uuid4
+
+from manager_agent_gym.core.manager_agent.action_constraints import (
+    build_context_constrained_action_schema,
+)
+from manager_agent_gym.schemas.execution.manager import ManagerObservation
+from manager_agent_gym.schemas.execution.manager_actions import (
+    AssignTaskAction,
+    NoOpAction,
+)
+from manager_agent_gym.schemas.workflow_agents.stakeholder import (
+    StakeholderPublicProfile,
+)
+
+
+def _observation(task_ids: list, agent_ids: list[str]) -> ManagerObservation:
+    return ManagerObservation(
+        timestep=0,
+        workflow_id=uuid4(),
+        execution_state="running",
+        workflow_progress=0.0,
+        task_ids=task_ids,
+        agent_ids=agent_ids,
+        stakeholder_profile=StakeholderPublicProfile(
+            display_name="S", role="Owner", preference_summary=""
+        ),
+    )
+
+
+def test_schema_reused_for_same_action_classes() -> None:
+    classes = [AssignTaskAction, NoOpAction]
+    first = build_context_constrained_action_schema(
+        classes, _observation([uuid4()], ["a"])
+    )
+    # Unconstrained schemas do not depend on the ID universes
+    again = build_context_constrained_action_schema(
+        classes, _observation([uuid4()], ["b"])
+    )
+    assert again is first
+    assert build_context_constrained_action_schema([NoOpAction], _observation([], []))
+    assert (
+        build_context_constrained_action_schema(
+            [NoOpAction, AssignTaskAction], _observation([], [])
+        )
+        is not first
+    )
+
+
+def test_constrained_schema_keyed_by_id_universes() -> None:
+    t1, t2 = uuid4(), uuid4()
+    schema = build_context_constrained_action_schema(
+        [AssignTaskAction], _observation([t1, t2], ["a", "b"]), constrain_ids=True
+    )
+    # Same universes in a different order hit the cache
+    assert (
+        build_context_constrained_action_schema(
+            [AssignTaskAction], _observation([t2, t1], ["b", "a"]), constrain_ids=True
+        )
+        is schema
+    )
+    changed = build_context_constrained_action_schema(
+        [AssignTaskAction], _observation([t1], ["a", "b"]), constrain_ids=True
+    )
+    assert changed is not schema
+
+    action_schema = changed.model_json_schema()["$defs"]["AssignTaskAction"]
+    assert action_schema["properties"]["task_id"]["enum"] == [str(t1)]
+    assert action_schema["properties"]["agent_id"]["enum"] == ["a", "b"]
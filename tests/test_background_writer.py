@@ -0,0 +1,76 @@
+import asyncio
+import json
+import threading
+from pathlib import Path
+
+import pytest
+
+from manager_agent_gym.core.execution.background_writer import BackgroundWriter
+
+
+def test_writes_keep_submission_order(tmp_path: Path) -> None:
+    writer = BackgroundWriter(max_pending=2)
+    path = tmp_path / "out" / "state.json"
+    for version in range(20):
+        writer.write_json(path, {"version": version})
+    writer.submit(lambda: (_ for _ in ()).throw(OSError("disk full")))
+    writer.write_json(tmp_path / "after.json", {"ok": True})
+    writer.close()
+
+    assert json.loads(path.read_text()) == {"version": 19}
+    assert json.loads((tmp_path / "after.json").read_text()) == {"ok": True}
+    assert writer.jobs_completed == 22
+    assert writer.jobs_failed == 1
+
+
+def test_full_queue_blocks_submitter(tmp_path: Path) -> None:
+    writer = BackgroundWriter(max_pending=1)
+    release = threading.Event()
+
+    def hold() -> None:
+        release.wait()
+
+    writer.submit(hold)  # occupies the writer thread
+    writer.submit(lambda: None)  # fills the queue
+
+    submitted = threading.Event()
+
+    def submit_third() -> None:
+        writer.submit(lambda: None)
+        submitted.set()
+
+    thread = threading.Thread(target=submit_third)
+    thread.start()
+    assert not submitted.wait(0.1)
+    release.set()
+    assert submitted.wait(2)
+    thread.join()
+    writer.flush()
+    assert writer.jobs_completed == 3
+    assert writer.blocked_seconds > 0
+    writer.close()
+
+
+@pytest.mark.asyncio
+async def test_full_queue_does_not_block_event_loop() -> None:
+    writer = BackgroundWriter(max_pending=1)
+    release = threading.Event()
+
+    def hold() -> None:
+        release.wait()
+
+    await writer.submit_async(hold)  # occupies the writer thread
+    await writer.submit_async(lambda: None)  # fills the queue
+
+    pending = asyncio.create_task(writer.submit_async(lambda: None))
+    ticks = 0
+    for _ in range(5):
+        await asyncio.sleep(0.01)
+        ticks += 1
+    assert ticks == 5 and not pending.done()
+
+    release.set()
+    await asyncio.wait_for(pending, 2)
+    await asyncio.to_thread(writer.close)
+    assert writer.jobs_completed == 3
+    assert writer.blocked_seconds > 0
@@ -0,0 +1,106 @@
+import csv
+import json
+import os
+from pathlib import Path
+
+from manager_agent_gym.batch import BatchRunSpec, BatchRunner, expand_grid
+from manager_agent_gym.core.common.rate_limiter import RateBudget
+from manager_agent_gym.schemas.config import OutputConfig
+
+
+async def _flaky_run(
+    spec: BatchRunSpec, output_config: OutputConfig
+) -> dict[str, float]:
+    # Fails for seed 1 until a marker file exists, to exercise resume
+    if spec.seed == 1 and not (output_config.base_output_dir / "allow").exists():
+        raise RuntimeError("boom")
+    output_config.ensure_directories_exist()
+    (output_config.workflow_dir / "pid.txt").write_text(str(os.getpid()))  # type: ignore[operator]
+    return {"score": float(spec.seed), "mode_len": float(len(spec.manager_mode or ""))}
+
+
+def test_batch_runner_isolates_outputs_and_resumes_failures(tmp_path: Path) -> None:
+    specs = expand_grid(["alpha"], seeds=range(3), manager_modes=["cot", "random"])
+    runner = BatchRunner(
+        _flaky_run,
+        base_output_dir=tmp_path,
+        max_workers=2,
+        llm_concurrency=4,
+        start_method="fork",  # avoid re-importing the package in each worker
+    )
+    first = runner.run(specs)
+
+    assert [r.status for r in first].count("failed") == 2  # seed 1 for each mode
+    assert {r.spec.run_key for r in first if r.status == "failed"} == {
+        "alpha/cot/seed_1",
+        "alpha/random/seed_1",
+    }
+    ok = next(r for r in first if r.spec.run_key == "alpha/random/seed_2")
+    assert ok.metrics == {"score": 2.0, "mode_len": 6.0}
+    assert Path(ok.output_dir) == tmp_path / "alpha" / "random" / "run_seed_2"
+    assert (Path(ok.output_dir) / "workflow_outputs" / "pid.txt").exists()
+
+    for mode in ("cot", "random"):
+        (tmp_path / "alpha" / mode / "allow").touch()
+    second = runner.run(specs)
+    assert all(r.status == "succeeded" for r in second)
+    assert sum(not r.resumed for r in second) == 2
+
+    with open(tmp_path / "batch_results.csv") as f:
+        rows = list(csv.DictReader(f))
+    assert len(rows) == 6
+    assert {row["status"] for row in rows} == {"succeeded"}
+    assert rows[0]["score"] == "0.0"
+
+
+def test_llm_budgets_split_across_started_workers(tmp_path: Path) -> None:
+    runner = BatchRunner(
+        _flaky_run,
+        base_output_dir=tmp_path,
+        max_workers=8,
+        llm_concurrency=8,
+        llm_rate_budget=RateBudget(requests_per_minute=60),
+    )
+    # Two chunks start two workers, each getting half of the budget
+    workers = runner.pool_size(2)
+    assert workers == 2
+    assert runner.llm_concurrency_per_worker(workers) == 4
+    budget = runner.llm_rate_budget_per_worker(workers)
+    assert budget is not None and budget.requests_per_minute == 30
+
+    # A cap below the worker count limits the pool instead of being exceeded
+    runner.llm_concurrency = 3
+    workers = runner.pool_size(10)
+    assert workers == 3
+    assert runner.llm_concurrency_per_worker(workers) == 1
+
+
+async def _spilling_run(
+    spec: BatchRunSpec, output_config: OutputConfig
+) -> dict[str, float]:
+    from manager_agent_gym.core.common.content_store import ContentStore
+
+    assert output_config.resource_blob_dir is not None
+    store = ContentStore(
+        output_config.resource_blob_dir,
+        spill_threshold_bytes=output_config.resource_spill_threshold_bytes or 0,
+    )
+    store.put("shared fallback artifact " * 10)
+    store.write_manifest(output_config.timestep_dir.parent)  # type: ignore[union-attr]
+    return {}
+
+
+def test_batch_runner_shares_resource_store_across_runs(tmp_path: Path) -> None:
+    runner = BatchRunner(
+        _spilling_run,
+        base_output_dir=tmp_path,
+        max_workers=2,
+        start_method="fork",
+        resource_spill_threshold_bytes=0,
+    )
+    runner.run(expand_grid(["alpha", "beta"], seeds=range(2)))
+
+    stats = json.loads((tmp_path / "resource_store_stats.json").read_text())
+    assert stats["runs"] == 4
+    assert stats["blobs"] == 1
+    assert stats["logical_bytes"] == 4 * stats["disk_bytes"]
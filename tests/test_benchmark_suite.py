@@ -0,0 +1,44 @@
+from benchmarks.run_suite import compare
+from benchmarks.synthetic import SyntheticWorkflowSpec, build_workflow
+from manager_agent_gym.schemas.core.base import TaskStatus
+
+
+def test_synthetic_workflow_shape() -> None:
+    spec = SyntheticWorkflowSpec(
+        width=4, depth=3, fan_in=2, subtask_depth=2, subtask_width=2, resources=5
+    )
+    workflow = build_workflow(spec)
+    tasks = workflow._index.tasks(workflow)
+    # 12 top-level tasks, each with 2 + 4 nested subtasks
+    assert len(workflow.tasks) == 12
+    assert len(tasks) == 12 * 7
+    assert workflow.validate_task_graph()
+    leaves = [t for t in tasks.values() if t.is_atomic_task()]
+    assert all(t.assigned_agent_id for t in leaves)
+    completed = [t for t in leaves if t.status == TaskStatus.COMPLETED]
+    assert len(completed) == 4 * 4
+    assert len(workflow.resources) == 5
+    # Only the second layer can start
+    assert len(workflow.get_ready_tasks()) > 0
+
+
+def test_compare_flags_slower_durations_and_lower_rates() -> None:
+    baseline = {
+        "commit": "abc",
+        "results": {
+            "ops": {"mean_us": 100.0, "bytes": 10},
+            "engine": {"timesteps_per_sec": 50.0},
+        },
+    }
+    current = {
+        "results": {
+            "ops": {"mean_us": 130.0, "bytes": 99},
+            "engine": {"timesteps_per_sec": 45.0},
+        }
+    }
+    report = compare(current, baseline, threshold=0.2)
+    assert report["ratios"] == {
+        "engine.timesteps_per_sec": 0.9,
+        "ops.mean_us": 1.3,
+    }
+    assert report["regressions"] == ["ops.mean_us"]
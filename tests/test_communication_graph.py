@@ -1,7 +1,15 @@
+import random
+from datetime import datetime, timedelta
+from uuid import uuid4
+
 import pytest
 
 from manager_agent_gym.core.communication.service import CommunicationService
-from manager_agent_gym.schemas.core.communication import MessageType
+from manager_agent_gym.schemas.core.communication import (
+    CommunicationGraph,
+    Message,
+    MessageType,
+)
 
 
 @pytest.mark.asyncio
@@ -30,3 +38,123 @@ async def test_multicast_threads_and_read_tracking() -> None:
     # Analytics sanity
     analytics = svc.get_communication_analytics()
     assert analytics["total_messages"] >= 3
+
+
+def test_pending_messages_are_linked_on_first_use() -> None:
+    svc = CommunicationService()
+    messages = [
+        Message(sender_id="a", receiver_id="b", content="one"),
+        Message(sender_id="b", receiver_id="a", content="two"),
+    ]
+    built: list[str] = []
+
+    def factory(message: Message):
+        def build() -> Message:
+            built.append(message.content)
+            return message
+
+        return build
+
+    for message in messages:
+        svc._graph.add_pending_message(factory(message))
+    assert svc._graph.pending_count == 2 and built == []
+
+    # First use through the service builds and links them in order
+    inbox = svc.get_messages_for_agent("a")
+    assert built == ["one", "two"]
+    assert [m.content for m in inbox] == ["two"]
+    assert svc.graph.agent_registry == {"a", "b"}
+    assert svc.graph.pending_count == 0
+
+
+def test_indexed_queries_match_full_scan() -> None:
+    rng = random.Random(7)
+    agents = ["a", "b", "c", "d"]
+    task_id, thread_id = uuid4(), uuid4()
+    start = datetime(2025, 1, 1)
+    graph = CommunicationGraph()
+    for i in range(300):
+        roll = rng.random()
+        if roll < 0.1:
+            kwargs: dict = {"message_type": MessageType.BROADCAST}
+        elif roll < 0.3:
+            kwargs = {"recipients": rng.sample(agents, 2)}
+        else:
+            kwargs = {"receiver_id": rng.choice(agents)}
+        graph.add_message(
+            Message(
+                sender_id=rng.choice(agents),
+                content=str(i),
+                # Out-of-order arrivals must still come back time-ordered
+                timestamp=start + timedelta(seconds=rng.randint(0, 1000)),
+                related_task_id=task_id if i % 5 == 0 else None,
+                thread_id=thread_id if i % 7 == 0 else None,
+                **kwargs,
+            )
+        )
+
+    everything = list(graph.messages.values())
+    since = start + timedelta(seconds=600)
+
+    def ts(messages: list[Message]) -> list[datetime]:
+        return [m.timestamp for m in messages]
+
+    def newest_first(messages) -> list[datetime]:
+        return sorted((m.timestamp for m in messages), reverse=True)
+
+    inbox = [m for m in everything if "a" in m.get_all_recipients() or m.is_broadcast()]
+    assert ts(graph.get_messages_for_agent("a")) == newest_first(inbox)
+    assert len(graph.get_messages_for_agent("a")) == len(inbox)
+    assert (
+        ts(graph.get_messages_for_agent("a", since=since, limit=5))
+        == (newest_first(m for m in inbox if m.timestamp >= since)[:5])
+    )
+    assert ts(
+        graph.get_messages_for_agent("a", message_types=[MessageType.BROADCAST])
+    ) == newest_first(m for m in inbox if m.message_type == MessageType.BROADCAST)
+
+    conversation = [
+        m
+        for m in everything
+        if (m.sender_id == "a" and "b" in m.get_all_recipients())
+        or (m.sender_id == "b" and "a" in m.get_all_recipients())
+    ]
+    assert (
+        ts(graph.get_conversation_history("a", "b", limit=10))
+        == sorted(m.timestamp for m in conversation)[-10:]
+    )
+    assert ts(graph.get_recent_messages(limit=3)) == newest_first(everything)[:3]
+    assert ts(graph.get_task_messages(task_id)) == sorted(
+        m.timestamp for m in everything if m.related_task_id == task_id
+    )
+    assert len(graph.get_thread_messages(thread_id)) == 43
+
+    stats = graph.get_agent_communication_stats("a")
+    assert stats["messages_sent"] == sum(m.sender_id == "a" for m in everything)
+    assert stats["messages_received"] == sum(
+        "a" in m.get_all_recipients() for m in everything if not m.is_broadcast()
+    ) + sum(m.is_broadcast() for m in everything)
+    assert stats["communication_partners"] == sum(
+        "a" in (edge.from_agent, edge.to_agent) for edge in graph.edges.values()
+    )
+
+    # Indexes are rebuilt after the message dict is replaced wholesale
+    reloaded = CommunicationGraph.model_validate(graph.model_dump())
+    assert ts(reloaded.get_messages_for_agent("a", limit=5)) == ts(
+        graph.get_messages_for_agent("a", limit=5)
+    )
+
+
+def test_index_rebuilds_when_messages_dict_is_reassigned() -> None:
+    graph = CommunicationGraph()
+    graph.add_message(Message(sender_id="a", receiver_id="b", content="old"))
+    assert [m.content for m in graph.get_messages_for_agent("b")] == ["old"]
+
+    # Same length, different dict: the index must not serve the old message
+    replacement = Message(sender_id="a", receiver_id="c", content="new")
+    graph.messages = {replacement.message_id: replacement}
+    assert graph.get_messages_for_agent("b") == []
+    assert [m.content for m in graph.get_messages_for_agent("c")] == ["new"]
+
+    graph.add_message(Message(sender_id="c", receiver_id="b", content="reply"))
+    assert [m.content for m in graph.get_messages_for_agent("b")] == ["reply"]
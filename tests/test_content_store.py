@@ -0,0 +1,132 @@
+import copy
+import pickle
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+
+from manager_agent_gym.core.common.content_store import (
+    ContentStore,
+    content_hash,
+    dedup_report,
+)
+from manager_agent_gym.core.execution.state_restorer import WorkflowStateRestorer
+from manager_agent_gym.schemas.core.resources import Resource
+from manager_agent_gym.schemas.core.workflow import Workflow
+
+
+def _workflow() -> Workflow:
+    return Workflow(name="wf", workflow_goal="goal", owner_id=uuid4())
+
+
+def test_store_writes_once_and_reads_prefixes(tmp_path: Path) -> None:
+    store = ContentStore(tmp_path, spill_threshold_bytes=10)
+    text = "héllo wörld " * 100
+    sha = store.put(text)
+    assert sha == content_hash(text)
+    assert store.put(text) == sha
+    assert store.stats()["writes"] == 1
+    assert store.stats()["duplicate_puts"] == 1
+    assert store.read(sha) == text
+    # Multi-byte characters are never split
+    assert store.read_prefix(sha, 7) == "héllo w"
+    assert store.read_prefix(store.put(""), 5) == ""
+    assert store.should_spill("x" * 10) and not store.should_spill("x" * 9)
+
+
+def test_workflow_spills_large_resources_and_reads_lazily(tmp_path: Path) -> None:
+    store = ContentStore(tmp_path, spill_threshold_bytes=1000)
+    workflow = _workflow()
+    small = Resource(name="small", description="d", content="short")
+    large = Resource(name="large", description="d", content="line of text\n" * 500)
+    workflow.add_resource(small)
+    workflow.set_content_store(store)
+    workflow.add_resource(large)
+
+    assert not small.is_spilled and small.content == "short"
+    assert large.is_spilled
+    assert large.__dict__["content"] is None
+    assert large.content_chars == 13 * 500
+    text = "line of text\n" * 500
+    assert large.content == text
+
+    dumped = workflow.model_dump(mode="json")["resources"][str(large.id)]
+    assert dumped["content"] is None
+    assert dumped["content_ref"]["sha256"] == content_hash(text)
+    assert '"content":null' in large.model_dump_json()
+
+    # Copies share the store; pickles drop it and need it attached again
+    assert copy.deepcopy(large).content == text
+    assert copy.deepcopy(workflow).resources[large.id].content == text
+    unpickled = pickle.loads(pickle.dumps(large))
+    with pytest.raises(LookupError):
+        _ = unpickled.content
+    unpickled.attach_content_store(store)
+    assert unpickled.content == text
+
+    reads = store.reads
+    rendered = large.pretty_print(max_preview_chars=20)
+    assert "chars=6500" in rendered and "... (truncated)" in rendered
+    assert large.content_preview(5) == "line "
+    assert store.reads == reads
+    assert store.prefix_reads == 2
+
+    large.content = "replaced"
+    assert not large.is_spilled and large.content == "replaced"
+    assert "replaced" in large.pretty_print()
+
+
+def test_restorer_reattaches_spilled_content(tmp_path: Path) -> None:
+    store = ContentStore(tmp_path / "resource_blobs", spill_threshold_bytes=0)
+    source = _workflow()
+    source.set_content_store(store)
+    resource = Resource(name="report", description="d", content="body " * 50)
+    source.add_resource(resource)
+
+    restorer = WorkflowStateRestorer(str(tmp_path), timestep=0)
+    restorer.workflow_snapshot = source.model_dump(mode="json")
+    restored = _workflow()
+    restorer.restore_workflow_state(restored)
+
+    restored_resource = restored.resources[resource.id]
+    assert restored_resource.is_spilled
+    assert restored_resource.content == "body " * 50
+
+
+def test_restorer_requires_store_for_spilled_content(tmp_path: Path) -> None:
+    store = ContentStore(tmp_path / "blobs", spill_threshold_bytes=0)
+    source = _workflow()
+    source.set_content_store(store)
+    source.add_resource(Resource(name="report", description="d", content="body"))
+
+    run_dir = tmp_path / "run"
+    run_dir.mkdir()
+    restorer = WorkflowStateRestorer(str(run_dir), timestep=0)
+    restorer.workflow_snapshot = source.model_dump(mode="json")
+    with pytest.raises(FileNotFoundError, match="resource_blob_dir"):
+        restorer.restore_workflow_state(_workflow())
+
+
+def test_runs_sharing_a_store_write_repeated_content_once(tmp_path: Path) -> None:
+    root = tmp_path / "resource_blobs"
+    fallback = "Completed: Draft report\n" + "agent output " * 100
+    stores = [ContentStore(root, spill_threshold_bytes=0) for _ in range(3)]
+    for seed, store in enumerate(stores):
+        workflow = _workflow()
+        workflow.set_content_store(store)
+        workflow.add_resource(Resource(name="r", description="d", content=fallback))
+        workflow.add_resource(
+            Resource(name="unique", description="d", content=f"seed {seed}")
+        )
+        store.write_manifest(tmp_path / f"run_seed_{seed}")
+    # Re-running into an existing run directory replaces its manifest
+    stores[-1].write_manifest(tmp_path / "run_seed_2")
+
+    report = dedup_report(root)
+    size = len(fallback.encode("utf-8"))
+    assert report["runs"] == 3
+    assert report["blobs"] == 4
+    assert report["disk_bytes"] == size + 3 * len("seed 0")
+    assert report["logical_bytes"] == 3 * (size + len("seed 0"))
+    assert report["blobs_shared_across_runs"] == 1
+    assert report["saved_bytes"] == 2 * size
@@ -0,0 +1,58 @@
+from manager_agent_gym.core.manager_agent.context_packing import (
+    ContextPacker,
+    ContextSection,
+)
+
+
+def _sections() -> list[ContextSection]:
+    return [
+        ContextSection(title="Snapshot", lines=["- timestep: 3"], required=True),
+        ContextSection(
+            title="Summary", lines=[f"task line {i} " + "x" * 60 for i in range(200)]
+        ),
+        ContextSection(title="Ready", lines=["- ready: [a, b]"], priority=-1),
+        ContextSection(
+            title="Profile",
+            lines=["{", '  "role": "Owner"', "}"],
+            priority=1,
+            atomic=True,
+        ),
+    ]
+
+
+def test_unbounded_packer_includes_everything_in_declared_order() -> None:
+    packed = ContextPacker(token_budget=None).pack(_sections(), preamble="INTRO")
+    assert not packed.truncated
+    text = packed.text
+    assert text.startswith("INTRO")
+    positions = [
+        text.index(f"### {t}") for t in ("Snapshot", "Summary", "Ready", "Profile")
+    ]
+    assert positions == sorted(positions)
+    assert packed.included_lines["Summary"] == 200
+
+
+def test_budget_cuts_lowest_priority_lines_first() -> None:
+    packer = ContextPacker(token_budget=400)
+    packed = packer.pack(_sections())
+
+    assert packer.last_packed is packed
+    assert packed.tokens <= 400
+    assert "- timestep: 3" in packed.text
+    assert "- ready: [a, b]" in packed.text
+    # Packed after the summary took the remaining budget
+    assert "### Profile" not in packed.text
+    assert packed.omitted_lines["Profile"] == 3
+    # The large default-priority section is cut line-wise, most relevant first
+    assert 0 < packed.included_lines["Summary"] < 200
+    assert "task line 0 " in packed.text
+    assert "task line 199 " not in packed.text
+    assert packed.omitted_lines["Summary"] == 200 - packed.included_lines["Summary"]
+    assert "more omitted)" in packed.text
+
+
+def test_required_sections_kept_over_budget() -> None:
+    packed = ContextPacker(token_budget=5).pack(_sections())
+    assert "### Snapshot" in packed.text
+    assert "### Summary" not in packed.text
+    assert packed.omitted_lines["Profile"] == 3
@@ -45,3 +45,44 @@ async def test_execute_timestep_requires_manager() -> None:
             enable_final_metrics_logging=False,
             seed=42,
         )
+
+
+@pytest.mark.asyncio
+async def test_custom_action_without_action_type_is_executed() -> None:
+    from manager_agent_gym.schemas.execution.manager_actions import (
+        ActionResult,
+        BaseManagerAction,
+    )
+    from tests.helpers.stubs import ManagerNoOp, StakeholderStub
+
+    executed: list[str] = []
+
+    class _CustomAction(BaseManagerAction):
+        async def execute(self, workflow, communication_service=None) -> ActionResult:
+            executed.append(self.reasoning)
+            return ActionResult(
+                action_type="noop", summary="custom", kind="noop", data={}
+            )
+
+    class _CustomManager(ManagerNoOp):
+        async def step(self, *args, **kwargs):  # type: ignore[override]
+            return _CustomAction(reasoning="custom", success=None, result_summary=None)
+
+        def on_action_executed(self, timestep, action, action_result) -> None:
+            pass
+
+    w = Workflow(name="w", workflow_goal="d", owner_id=uuid4())
+    w.add_task(Task(name="t", description="d"))
+    stakeholder = StakeholderStub()
+    w.add_agent(stakeholder)
+    engine = WorkflowExecutionEngine(
+        workflow=w,
+        agent_registry=AgentRegistry(),
+        manager_agent=_CustomManager(),
+        stakeholder_agent=stakeholder,
+        enable_timestep_logging=False,
+        enable_final_metrics_logging=False,
+        seed=42,
+    )
+    await engine.execute_timestep()
+    assert executed == ["custom"]
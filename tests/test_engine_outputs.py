@@ -2,7 +2,9 @@ import pytest
 from pathlib import Path
 from uuid import uuid4
 
+from manager_agent_gym.core.communication.service import CommunicationService
 from manager_agent_gym.core.execution.engine import WorkflowExecutionEngine
+from manager_agent_gym.core.execution.run_log import iter_run_log
 from manager_agent_gym.schemas.config import OutputConfig
 from manager_agent_gym.schemas.core.workflow import Workflow
 from manager_agent_gym.schemas.core.tasks import Task
@@ -11,6 +13,7 @@ from manager_agent_gym.core.manager_agent.interface import ManagerAgent
 from manager_agent_gym.schemas.preferences.preference import PreferenceWeights
 from manager_agent_gym.schemas.execution.manager import ManagerObservation
 from manager_agent_gym.schemas.core.resources import Resource
+from manager_agent_gym.schemas.core.lazy_entries import LazyEntries
 from manager_agent_gym.core.workflow_agents.stakeholder_agent import StakeholderAgent
 from manager_agent_gym.schemas.workflow_agents.stakeholder import StakeholderConfig
 from manager_agent_gym.schemas.execution.state import ExecutionState
@@ -55,10 +58,12 @@ async def test_output_files_written_when_enabled(tmp_path: Path, enable_logs: bo
         seed=42,
     )
 
-    await engine.run_full_execution()
+    results = await engine.run_full_execution()
     if enable_logs:
         assert out.get_timestep_file_path(0).exists()
         assert out.get_final_metrics_path().exists()
+        logged = list(iter_run_log(out.get_run_log_path()))
+        assert [r["id"] for r in logged] == [r.id for r in results]
     else:
         assert not out.get_timestep_file_path(0).exists()
         assert not out.get_final_metrics_path().exists()
@@ -212,3 +217,74 @@ async def test_cost_bucket_and_cost_efficiency_when_agents_incur_cost(tmp_path:
         float(t.actual_cost or 0.0) for t in engine.workflow.tasks.values()
     )
     assert pytest.approx(total_actual, rel=0, abs=1e-9) == 140.0
+
+
+@pytest.mark.asyncio
+async def test_delta_snapshot_log_restorable(tmp_path: Path):
+    from manager_agent_gym.core.execution.state_restorer import WorkflowStateRestorer
+
+    out = OutputConfig(base_output_dir=tmp_path, run_id="delta")
+    w = Workflow(name="w", workflow_goal="d", owner_id=uuid4())
+    task = Task(name="t", description="d")
+    w.add_task(task)
+    resource = Resource(name="notes", description="d", content="body")
+    w.add_resource(resource)
+    comms = CommunicationService()
+    await comms.send_direct_message("stakeholder", "agent", "hello")
+    stakeholder = StakeholderAgent(
+        config=StakeholderConfig(
+            agent_id="stakeholder",
+            agent_type="stakeholder",
+            system_prompt="Stakeholder",
+            model_name="o3",
+            name="Stakeholder",
+            role="Owner",
+            initial_preferences=PreferenceWeights(preferences=[]),
+            agent_description="Stakeholder",
+            agent_capabilities=["Stakeholder"],
+        )
+    )
+    w.add_agent(stakeholder)
+    engine = WorkflowExecutionEngine(
+        workflow=w,
+        agent_registry=AgentRegistry(),
+        manager_agent=ManagerNoOp(),
+        stakeholder_agent=stakeholder,
+        output_config=out,
+        max_timesteps=3,
+        seed=42,
+        communication_service=comms,
+    )
+    results = await engine.run_full_execution()
+
+    assert all("workflow_snapshot" not in r.metadata for r in results)
+    assert out.get_workflow_snapshot_log_path().exists()
+    assert not list(out.workflow_dir.glob("workflow_execution_delta_t*.json"))  # type: ignore[union-attr]
+
+    last = results[-1].metadata["timestep"]
+    restorer = WorkflowStateRestorer(str(tmp_path / "run_delta"), last)
+    restorer.load_snapshot_data()
+    assert restorer.workflow_snapshot["timestep"] == last
+    assert restorer.workflow_snapshot["tasks"][str(task.id)]["status"] == (
+        task.status.value
+    )
+
+    lazy = WorkflowStateRestorer(str(tmp_path / "run_delta"), last, lazy=True)
+    lazy.load_snapshot_data()
+    assert lazy.snapshot_view is not None
+    restored = Workflow(name="w", workflow_goal="d", owner_id=w.owner_id)
+    restored.add_task(Task(id=task.id, name="t", description="d"))
+    lazy.restore_workflow_state(restored)
+    assert restored.tasks[task.id].status == task.status
+    # Resources are registered, and built on first lookup
+    assert resource.id in restored.resources
+    assert isinstance(restored.resources, LazyEntries)
+    assert restored.resources.pending_count == 1
+    assert restored.resources[resource.id].content == "body"
+    assert restored.resources.pending_count == 0
+
+    restored_comms = CommunicationService()
+    lazy.restore_communication_history(restored_comms)
+    assert [m.content for m in restored_comms.graph.messages.values()] == ["hello"]
+    assert lazy._timestep_data is None  # restored without reading the timestep file
+    assert lazy.workflow_snapshot == restorer.workflow_snapshot
@@ -0,0 +1,121 @@
+from pathlib import Path
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from pydantic import BaseModel
+
+from manager_agent_gym.core.common import llm_interface as llm_iface
+from manager_agent_gym.core.common.llm_cache import (
+    LLMCacheMissError,
+    LLMResponseCache,
+    make_cache_key,
+)
+
+
+class _Verdict(BaseModel):
+    score: float
+    reason: str
+
+
+def _mock_client(result: BaseModel) -> Mock:
+    client = Mock()
+    client.chat = Mock()
+    client.chat.completions = Mock()
+    client.chat.completions.create = AsyncMock(return_value=result)
+    return client
+
+
+def test_cache_key_covers_request_fields() -> None:
+    base = dict(
+        model="gpt-4o",
+        system_prompt="s",
+        user_prompt="u",
+        response_schema=_Verdict.model_json_schema(),
+        seed=1,
+        temperature=0.0,
+    )
+    key = make_cache_key(**base)  # type: ignore[arg-type]
+    assert key == make_cache_key(**base)  # type: ignore[arg-type]
+    assert key != make_cache_key(**{**base, "seed": 2})  # type: ignore[arg-type]
+    assert key != make_cache_key(**{**base, "user_prompt": "v"})  # type: ignore[arg-type]
+
+
+def test_lru_eviction_by_size(tmp_path: Path) -> None:
+    cache = LLMResponseCache(tmp_path / "c.sqlite", max_bytes=250)
+    for i in range(3):
+        cache.put(f"k{i}", "x" * 100)
+    # k0 was least recently used and is evicted first
+    assert cache.get("k0") is None
+    assert cache.get("k2") == "x" * 100
+    stats = cache.stats()
+    assert stats["evictions"] == 1 and stats["entries"] == 2
+    assert stats["bytes"] <= 250
+    cache.close()
+
+
+def test_rewriting_a_key_replaces_its_size(tmp_path: Path) -> None:
+    cache = LLMResponseCache(tmp_path / "c.sqlite", max_bytes=250)
+    for _ in range(5):
+        cache.put("k0", "x" * 100)
+    cache.put("k1", "y" * 100)
+    assert cache.stats()["bytes"] == 200
+    assert cache.evictions == 0
+    cache.put("k0", "x" * 40)
+    assert cache.stats()["bytes"] == 140
+    cache.close()
+
+
+def test_hits_batch_access_updates_and_keep_lru_order(tmp_path: Path) -> None:
+    path = tmp_path / "c.sqlite"
+    cache = LLMResponseCache(path, max_bytes=250)
+    cache.put("k0", "x" * 100)
+    cache.put("k1", "x" * 100)
+    # Hits do not commit; the refreshed access time is written back later
+    assert cache.get("k0") is not None
+    assert not cache._conn.in_transaction
+    assert "k0" in cache._pending_access
+    # Storing k2 evicts k1, the least recently used once the hit is applied
+    cache.put("k2", "x" * 100)
+    assert cache.get("k1") is None
+    assert cache.get("k0") is not None
+    cache.close()
+
+    reopened = LLMResponseCache(path, max_bytes=250)
+    assert reopened.stats()["entries"] == 2
+    reopened.close()
+
+
+@pytest.mark.asyncio
+async def test_generate_structured_response_hits_cache_and_replays(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    client = _mock_client(_Verdict(score=0.7, reason="ok"))
+    monkeypatch.setattr(llm_iface, "_get_openai_client", lambda: client)
+    path = tmp_path / "llm.sqlite"
+    cache = LLMResponseCache(path)
+    llm_iface.configure_llm_cache(cache)
+    try:
+        for _ in range(3):
+            result = await llm_iface.generate_structured_response(
+                "sys", "rubric", _Verdict, seed=3, model="gpt-4o"
+            )
+            assert result == _Verdict(score=0.7, reason="ok")
+        assert client.chat.completions.create.await_count == 1
+        assert (cache.hits, cache.misses, cache.writes) == (2, 1, 1)
+        cache.close()
+
+        # Replay: served from disk without touching the provider; misses fail
+        replay = LLMResponseCache(path, mode="replay")
+        llm_iface.configure_llm_cache(replay)
+        again = await llm_iface.generate_structured_response(
+            "sys", "rubric", _Verdict, seed=3, model="gpt-4o"
+        )
+        assert again.score == 0.7
+        with pytest.raises(LLMCacheMissError):
+            await llm_iface.generate_structured_response(
+                "sys", "other rubric", _Verdict, seed=3, model="gpt-4o"
+            )
+        assert client.chat.completions.create.await_count == 1
+        replay.close()
+    finally:
+        llm_iface.configure_llm_cache(None)
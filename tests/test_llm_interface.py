@@ -166,6 +166,30 @@ async def test_generate_structured_response_across_providers(
     assert result.foo == f"ok:{model_name}"
 
 
+@pytest.mark.asyncio
+async def test_llm_call_slot_caps_concurrency() -> None:
+    import asyncio
+    from manager_agent_gym.core.common import llm_interface as li
+
+    in_flight = 0
+    peak = 0
+
+    async def _call() -> None:
+        nonlocal in_flight, peak
+        async with li.llm_call_slot():
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+    li.configure_llm_concurrency(2)
+    try:
+        await asyncio.gather(*(_call() for _ in range(6)))
+    finally:
+        li.configure_llm_concurrency(None)
+    assert peak == 2
+
+
 @pytest.mark.asyncio
 @pytest.mark.live_llm
 @pytest.mark.parametrize("model_name", ["gpt-5", "gpt-4.1"])  # OpenAI live
@@ -242,3 +266,101 @@ async def test_live_anthropic_returns_pydantic() -> None:
     assert isinstance(user, _AnthModel)
     assert isinstance(user.foo, str)
     assert len(user.foo) > 0
+
+
+@pytest.mark.asyncio
+async def test_pooled_client_reuses_connections_under_burst(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    import asyncio
+    import json
+    from manager_agent_gym.core.common import llm_interface as li
+
+    connections = 0
+    requests = 0
+
+    async def _handle(
+        reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        # Minimal keep-alive HTTP/1.1 server answering chat completions
+        nonlocal connections, requests
+        connections += 1
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                length = 0
+                for line in head.decode().split("\r\n"):
+                    if line.lower().startswith("content-length:"):
+                        length = int(line.split(":", 1)[1])
+                body = json.loads(await reader.readexactly(length))
+                requests += 1
+                tool_name = body["tools"][0]["function"]["name"]
+                payload = json.dumps(
+                    {
+                        "id": "cmpl",
+                        "object": "chat.completion",
+                        "created": 0,
+                        "model": body["model"],
+                        "choices": [
+                            {
+                                "index": 0,
+                                "finish_reason": "stop",
+                                "message": {
+                                    "role": "assistant",
+                                    "content": None,
+                                    "tool_calls": [
+                                        {
+                                            "id": "call",
+                                            "type": "function",
+                                            "function": {
+                                                "name": tool_name,
+                                                "arguments": json.dumps({"foo": "ok"}),
+                                            },
+                                        }
+                                    ],
+                                },
+                            }
+                        ],
+                    }
+                ).encode()
+                await asyncio.sleep(0.001)
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                    + f"Content-Length: {len(payload)}\r\n\r\n".encode()
+                    + payload
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionResetError):
+            pass
+        finally:
+            writer.close()
+
+    server = await asyncio.start_server(_handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    monkeypatch.setenv("OPENAI_BASE_URL", f"http://127.0.0.1:{port}/v1")
+    li.configure_llm_client_pool(max_connections=8)
+    try:
+        # 200 rubric-style calls issued at once
+        results = await asyncio.gather(
+            *(
+                li.generate_structured_response(
+                    system_prompt="grade",
+                    user_prompt=f"rubric {i}",
+                    response_type=_ToyModel,
+                    seed=i,
+                    model="gpt-4o",
+                )
+                for i in range(200)
+            )
+        )
+        assert li._get_openai_client() is li._get_openai_client()
+    finally:
+        await li.close_llm_clients()
+        li.configure_llm_client_pool(max_connections=100)
+        server.close()
+        await server.wait_closed()
+
+    assert all(r.foo == "ok" for r in results)
+    assert requests == 200
+    assert connections <= 8
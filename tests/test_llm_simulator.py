@@ -0,0 +1,140 @@
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+
+from manager_agent_gym.core.common import llm_interface as llm_iface
+from manager_agent_gym.core.common.llm_simulator import SimulatedLLM
+from manager_agent_gym.core.execution.engine import WorkflowExecutionEngine
+from manager_agent_gym.core.manager_agent.action_constraints import (
+    build_context_constrained_action_schema,
+)
+from manager_agent_gym.core.manager_agent.structured_manager import (
+    ChainOfThoughtManagerAgent,
+)
+from manager_agent_gym.core.workflow_agents.ai_agent import AIAgent
+from manager_agent_gym.core.workflow_agents.registry import AgentRegistry
+from manager_agent_gym.core.workflow_agents.stakeholder_agent import StakeholderAgent
+from manager_agent_gym.schemas.common.llm_responses import LLMScoredResponse
+from manager_agent_gym.schemas.config import OutputConfig
+from manager_agent_gym.schemas.core.base import TaskStatus
+from manager_agent_gym.schemas.core.tasks import Task
+from manager_agent_gym.schemas.core.workflow import Workflow
+from manager_agent_gym.schemas.execution.manager_actions import (
+    AssignTaskAction,
+    BaseManagerAction,
+    FailedAction,
+)
+from manager_agent_gym.schemas.preferences.preference import PreferenceWeights
+from manager_agent_gym.schemas.workflow_agents import (
+    AIAgentConfig,
+    AITaskOutput,
+    HumanWorkOutput,
+)
+from manager_agent_gym.schemas.workflow_agents.stakeholder import StakeholderConfig
+from tests.helpers.stubs import ManagerAssignFirstReady
+from tests.test_action_constraints import _observation
+
+
+@pytest.fixture
+def simulator():
+    simulator = SimulatedLLM(seed=7)
+    llm_iface.configure_llm_simulator(simulator)
+    yield simulator
+    llm_iface.configure_llm_simulator(None)
+
+
+def test_outputs_are_schema_valid_and_deterministic() -> None:
+    sim = SimulatedLLM(seed=3)
+    for model in (AITaskOutput, HumanWorkOutput, LLMScoredResponse):
+        first = sim.synthesize(model, sim.rng_for("prompt"))
+        assert model.model_validate(first.model_dump()) == first
+        assert sim.synthesize(model, sim.rng_for("prompt")) == first
+    output = sim.synthesize(AITaskOutput, sim.rng_for("prompt"))
+    # Agents reject outputs without resources, so lists are never empty
+    assert output.resources
+    other = SimulatedLLM(seed=4)
+    assert other.synthesize(AITaskOutput, other.rng_for("prompt")) != output
+
+
+def test_constrained_action_ids_drawn_from_enum_hints() -> None:
+    task_ids = [uuid4(), uuid4()]
+    schema = build_context_constrained_action_schema(
+        [AssignTaskAction], _observation(task_ids, ["a", "b"]), constrain_ids=True
+    )
+    sim = SimulatedLLM()
+    for i in range(10):
+        action = sim.synthesize(schema, sim.rng_for(i)).action  # type: ignore[attr-defined]
+        assert action.task_id in {str(t) for t in task_ids}
+        assert action.agent_id in {"a", "b"}
+
+
+@pytest.mark.asyncio
+async def test_structured_calls_served_offline(simulator: SimulatedLLM) -> None:
+    manager = ChainOfThoughtManagerAgent(PreferenceWeights(preferences=[]))
+    action = await manager.take_action(_observation([uuid4()], ["a"]))
+    assert isinstance(action, BaseManagerAction)
+    assert not isinstance(action, FailedAction)
+
+    scored = await llm_iface.generate_structured_response(
+        system_prompt="s", user_prompt="u", response_type=LLMScoredResponse, seed=1
+    )
+    again = await llm_iface.generate_structured_response(
+        system_prompt="s", user_prompt="u", response_type=LLMScoredResponse, seed=1
+    )
+    assert scored == again
+    assert simulator.stats()["calls"] == 3
+    assert simulator.output_tokens > 0
+
+
+@pytest.mark.asyncio
+async def test_engine_runs_llm_agents_offline(
+    simulator: SimulatedLLM, tmp_path: Path
+) -> None:
+    workflow = Workflow(name="w", workflow_goal="g", owner_id=uuid4())
+    for name in ("A", "B", "C"):
+        workflow.add_task(Task(name=name, description=f"Write section {name}"))
+    workflow.add_agent(
+        AIAgent(
+            AIAgentConfig(
+                agent_id="writer",
+                agent_type="ai",
+                system_prompt="You write report sections.",
+                agent_description="Writer",
+                agent_capabilities=["writing"],
+            ),
+            tools=[],
+        )
+    )
+    stakeholder = StakeholderAgent(
+        config=StakeholderConfig(
+            agent_id="stakeholder",
+            agent_type="stakeholder",
+            system_prompt="Stakeholder",
+            model_name="o3",
+            name="Stakeholder",
+            role="Owner",
+            initial_preferences=PreferenceWeights(preferences=[]),
+            agent_description="Stakeholder",
+            agent_capabilities=["Stakeholder"],
+        )
+    )
+    workflow.add_agent(stakeholder)
+    engine = WorkflowExecutionEngine(
+        workflow=workflow,
+        agent_registry=AgentRegistry(),
+        manager_agent=ManagerAssignFirstReady(),
+        stakeholder_agent=stakeholder,
+        output_config=OutputConfig(
+            base_output_dir=tmp_path, create_run_subdirectory=False
+        ),
+        enable_timestep_logging=False,
+        enable_final_metrics_logging=False,
+        max_timesteps=10,
+        seed=1,
+    )
+    await engine.run_full_execution()
+
+    assert all(t.status == TaskStatus.COMPLETED for t in workflow.tasks.values())
+    assert all(t.output_resource_ids for t in workflow.tasks.values())
+    assert simulator.calls >= 3
@@ -112,3 +112,34 @@ async def test_assign_all_pending_tasks_assigns_unassigned_only() -> None:
     assert w.tasks[t2.id].assigned_agent_id == "a1"
     assert w.tasks[t3.id].assigned_agent_id == "preassigned"
     assert res.kind in {"info", "mutation"}
+
+
+@pytest.mark.asyncio
+async def test_actions_resolve_nested_tasks_through_index() -> None:
+    from manager_agent_gym.schemas.execution.manager_actions import (
+        AddTaskDependencyAction,
+        InspectTaskAction,
+    )
+
+    w = Workflow(name="w", workflow_goal="d", owner_id=uuid4())
+    phase = Task(name="Phase", description="d")
+    nested = Task(name="Nested", description="d")
+    phase.add_subtask(nested)
+    other = Task(name="Other", description="d")
+    w.add_task(phase)
+    w.add_task(other)
+
+    inspect = await InspectTaskAction(
+        reasoning="r", task_id=nested.id, success=None, result_summary=None
+    ).execute(w)
+    assert inspect.success and inspect.data["task_id"] == nested.id
+
+    add_dep = await AddTaskDependencyAction(
+        reasoning="r",
+        prerequisite_task_id=other.id,
+        dependent_task_id=nested.id,
+        success=None,
+        result_summary=None,
+    ).execute(w)
+    assert add_dep.kind == "mutation"
+    assert other.id in nested.dependency_task_ids
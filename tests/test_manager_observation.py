@@ -77,3 +77,109 @@ async def test_create_observation_counts_and_progress() -> None:
     assert len(obs.recent_messages) >= 1
     # ID universes contain known IDs
     assert t1.id in obs.task_ids and t2.id in obs.task_ids
+
+
+@pytest.mark.asyncio
+async def test_create_observation_memoized_until_state_changes() -> None:
+    w = Workflow(name="w", workflow_goal="d", owner_id=uuid4())
+    t1 = Task(name="A", description="d")
+    w.add_task(t1)
+    profile = StakeholderPublicProfile(
+        display_name="Test Stakeholder", role="Owner", preference_summary=""
+    )
+    mgr = _Mgr()
+
+    async def observe(timestep: int, completed: set) -> ManagerObservation:
+        return await mgr.create_observation(
+            workflow=w,
+            execution_state=ExecutionState.RUNNING,
+            stakeholder_profile=profile,
+            current_timestep=timestep,
+            running_tasks={},
+            completed_task_ids=completed,
+            failed_task_ids=set(),
+        )
+
+    first = await observe(0, set())
+    assert await observe(0, set()) is first
+    assert mgr.last_observation is first
+
+    assert await observe(1, set()) is not first
+
+    before = mgr.last_observation
+    t1.status = TaskStatus.COMPLETED
+    after = await observe(1, {t1.id})
+    assert after is not before
+    assert after.task_status_counts.get("completed") == 1
+
+    w.add_task(Task(name="B", description="d"))
+    assert len((await observe(1, {t1.id})).task_ids) == 2
+
+
+@pytest.mark.asyncio
+async def test_undeclared_fields_are_deferred_until_read() -> None:
+    w = Workflow(name="w", workflow_goal="d", owner_id=uuid4())
+    w.add_task(Task(name="A", description="d"))
+
+    class _Narrow(_Mgr):
+        observation_fields = frozenset({"task_ids"})
+
+    mgr = _Narrow()
+    obs = await mgr.create_observation(
+        workflow=w,
+        execution_state=ExecutionState.RUNNING,
+        stakeholder_profile=StakeholderPublicProfile(
+            display_name="Test Stakeholder", role="Owner", preference_summary=""
+        ),
+        current_timestep=0,
+        running_tasks={},
+        completed_task_ids=set(),
+        failed_task_ids=set(),
+    )
+    assert "task_ids" in obs.__dict__
+    assert "workflow_summary" not in obs.__dict__
+
+    assert obs.workflow_summary == w.pretty_print()
+    assert "workflow_summary" in obs.__dict__
+
+    # Serialization materializes the remaining deferred fields
+    dumped = obs.model_dump(mode="json")
+    assert dumped["task_status_counts"]["ready"] == 1
+    assert "constraints" in obs.__dict__
+
+
+@pytest.mark.asyncio
+async def test_copies_pickles_and_reprs_include_deferred_fields() -> None:
+    import copy
+    import pickle
+
+    w = Workflow(name="w", workflow_goal="d", owner_id=uuid4())
+    w.add_task(Task(name="A", description="d"))
+
+    class _Narrow(_Mgr):
+        observation_fields = frozenset({"task_ids"})
+
+    async def observe() -> ManagerObservation:
+        return await _Narrow().create_observation(
+            workflow=w,
+            execution_state=ExecutionState.RUNNING,
+            stakeholder_profile=StakeholderPublicProfile(
+                display_name="Test Stakeholder", role="Owner", preference_summary=""
+            ),
+            current_timestep=0,
+            running_tasks={},
+            completed_task_ids=set(),
+            failed_task_ids=set(),
+        )
+
+    obs = await observe()
+    shallow = copy.copy(obs)
+    assert obs.workflow_summary == shallow.workflow_summary == w.pretty_print()
+
+    deep = copy.deepcopy(await observe())
+    assert deep.workflow_summary == w.pretty_print()
+
+    restored = pickle.loads(pickle.dumps(await observe()))
+    assert restored.task_status_counts["ready"] == 1
+
+    assert "workflow_summary=" in repr(await observe())
@@ -0,0 +1,150 @@
+import asyncio
+import json
+from pathlib import Path
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from manager_agent_gym.core.communication.service import CommunicationService
+from manager_agent_gym.core.execution.engine import WorkflowExecutionEngine
+from manager_agent_gym.core.manager_agent import structured_manager
+from manager_agent_gym.core.manager_agent.structured_manager import (
+    ChainOfThoughtManagerAgent,
+)
+from manager_agent_gym.core.workflow_agents.registry import AgentRegistry
+from manager_agent_gym.core.workflow_agents.stakeholder_agent import StakeholderAgent
+from manager_agent_gym.schemas.config import OutputConfig
+from manager_agent_gym.schemas.core.tasks import Task
+from manager_agent_gym.schemas.core.workflow import Workflow
+from manager_agent_gym.schemas.execution.manager_actions import NoOpAction
+from manager_agent_gym.schemas.execution.state import ExecutionState
+from manager_agent_gym.schemas.preferences.preference import PreferenceWeights
+from manager_agent_gym.schemas.workflow_agents.stakeholder import (
+    StakeholderConfig,
+    StakeholderPublicProfile,
+)
+from tests.helpers.stubs import StubAgent
+
+
+@pytest.fixture
+def llm_calls(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    calls: list[str] = []
+
+    async def fake_generate(*, user_prompt: str, **_: object) -> SimpleNamespace:
+        calls.append(user_prompt)
+        await asyncio.sleep(0.02)
+        return SimpleNamespace(
+            action=NoOpAction(
+                reasoning=f"decision {len(calls)}", success=True, result_summary="noop"
+            )
+        )
+
+    monkeypatch.setattr(
+        structured_manager, "generate_structured_response", fake_generate
+    )
+    return calls
+
+
+def _state(workflow: Workflow, comms: CommunicationService, timestep: int) -> dict:
+    return dict(
+        workflow=workflow,
+        execution_state=ExecutionState.WAITING_FOR_MANAGER,
+        stakeholder_profile=StakeholderPublicProfile(
+            display_name="S", role="Owner", preference_summary=""
+        ),
+        current_timestep=timestep,
+        running_tasks={},
+        completed_task_ids=set(),
+        failed_task_ids=set(),
+        communication_service=comms,
+    )
+
+
+@pytest.mark.asyncio
+async def test_speculative_decision_committed_only_when_request_matches(
+    llm_calls: list[str],
+) -> None:
+    workflow = Workflow(name="w", workflow_goal="g", owner_id=uuid4())
+    workflow.add_task(Task(name="A", description="d"))
+    comms = CommunicationService()
+    manager = ChainOfThoughtManagerAgent(
+        PreferenceWeights(preferences=[]), speculative=True
+    )
+
+    await manager.prefetch_next_step(**_state(workflow, comms, 1))
+    await asyncio.sleep(0.05)
+    action = await manager.step(**_state(workflow, comms, 1))
+    assert action.reasoning == "decision 1"
+    assert len(llm_calls) == 1
+    stats = manager.prefetch_stats
+    assert stats is not None
+    assert stats["hits"] == 1
+    assert stats["saved_seconds"] > 0
+
+    # A message arriving after the prefetch changes the prompt: decide again
+    await manager.prefetch_next_step(**_state(workflow, comms, 2))
+    await comms.send_direct_message("stakeholder", manager.agent_id, "change plan")
+    action = await manager.step(**_state(workflow, comms, 2))
+    assert "change plan" in llm_calls[-1]
+    stats = manager.prefetch_stats
+    assert stats is not None
+    assert stats["misses"] == 1
+    assert stats["hit_rate"] == 0.5
+
+    # Cancelled before the speculative task ever ran: take_action is never called
+    calls_before = len(llm_calls)
+    await manager.prefetch_next_step(**_state(workflow, comms, 3))
+    manager.cancel_prefetch()
+    await asyncio.sleep(0.05)
+    assert len(llm_calls) == calls_before
+    stats = manager.prefetch_stats
+    assert stats is not None
+    assert stats["discarded"] == 1
+
+    plain = ChainOfThoughtManagerAgent(PreferenceWeights(preferences=[]))
+    await plain.prefetch_next_step(**_state(workflow, comms, 1))
+    assert plain.prefetch_stats is None
+
+
+@pytest.mark.asyncio
+async def test_engine_prefetches_and_reports_stats(
+    tmp_path: Path, llm_calls: list[str]
+) -> None:
+    workflow = Workflow(name="w", workflow_goal="g", owner_id=uuid4())
+    workflow.add_task(Task(name="A", description="d"))
+    workflow.add_agent(StubAgent(agent_id="worker"))
+    stakeholder = StakeholderAgent(
+        config=StakeholderConfig(
+            agent_id="stakeholder",
+            agent_type="stakeholder",
+            system_prompt="Stakeholder",
+            model_name="o3",
+            name="Stakeholder",
+            role="Owner",
+            initial_preferences=PreferenceWeights(preferences=[]),
+            agent_description="Stakeholder",
+            agent_capabilities=["Stakeholder"],
+        )
+    )
+    workflow.add_agent(stakeholder)
+    out = OutputConfig(base_output_dir=tmp_path, create_run_subdirectory=False)
+    engine = WorkflowExecutionEngine(
+        workflow=workflow,
+        agent_registry=AgentRegistry(),
+        manager_agent=ChainOfThoughtManagerAgent(
+            PreferenceWeights(preferences=[]), speculative=True
+        ),
+        stakeholder_agent=stakeholder,
+        output_config=out,
+        max_timesteps=4,
+        seed=1,
+    )
+    await engine.run_full_execution()
+
+    stats = json.loads(out.get_final_metrics_path().read_text())["manager_prefetch"]
+    # Every step after the first was prefetched, and nothing changes between
+    # the prefetch and the step in this run
+    assert stats["started"] == 3
+    assert stats["hits"] == 3
+    assert len(llm_calls) == 4
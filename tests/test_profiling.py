@@ -0,0 +1,89 @@
+import asyncio
+import json
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+
+from manager_agent_gym.core.common.profiling import PhaseProfiler
+from manager_agent_gym.core.execution.engine import WorkflowExecutionEngine
+from manager_agent_gym.core.workflow_agents.registry import AgentRegistry
+from manager_agent_gym.core.workflow_agents.stakeholder_agent import StakeholderAgent
+from manager_agent_gym.schemas.config import OutputConfig
+from manager_agent_gym.schemas.core.tasks import Task
+from manager_agent_gym.schemas.core.workflow import Workflow
+from manager_agent_gym.schemas.preferences.preference import PreferenceWeights
+from manager_agent_gym.schemas.workflow_agents.stakeholder import StakeholderConfig
+from tests.helpers.stubs import ManagerAssignFirstReady, StubAgent
+
+
+@pytest.mark.asyncio
+async def test_spans_nest_across_tasks() -> None:
+    profiler = PhaseProfiler(enabled=True)
+    profiler.start_timestep(0)
+    with profiler.span("outer"):
+        await asyncio.create_task(
+            profiler.instrument(asyncio.sleep(0.01), "child", n=1)
+        )
+    spans = {s["name"]: s for s in profiler.timestep_profile(0)["spans"]}
+    assert spans["child"]["parent_id"] == spans["outer"]["span_id"]
+    assert spans["child"]["attributes"] == {"n": 1}
+    assert spans["outer"]["wall_ms"] >= spans["child"]["wall_ms"] >= 9
+    assert profiler.timestep_profile(0)["phases"]["outer"]["count"] == 1
+
+    disabled = PhaseProfiler()
+    assert disabled.span("a") is disabled.span("b")
+    with disabled.span("a"):
+        pass
+    assert disabled.chrome_trace()["traceEvents"] == []
+
+
+@pytest.mark.asyncio
+async def test_engine_exports_phase_profile_and_trace(tmp_path: Path) -> None:
+    w = Workflow(name="w", workflow_goal="g", owner_id=uuid4())
+    w.add_task(Task(name="A", description="d", assigned_agent_id="worker"))
+    w.add_agent(StubAgent(agent_id="worker"))
+    stakeholder = StakeholderAgent(
+        config=StakeholderConfig(
+            agent_id="stakeholder",
+            agent_type="stakeholder",
+            system_prompt="Stakeholder",
+            model_name="o3",
+            name="Stakeholder",
+            role="Owner",
+            initial_preferences=PreferenceWeights(preferences=[]),
+            agent_description="Stakeholder",
+            agent_capabilities=["Stakeholder"],
+        )
+    )
+    w.add_agent(stakeholder)
+    out = OutputConfig(base_output_dir=tmp_path, create_run_subdirectory=False)
+    engine = WorkflowExecutionEngine(
+        workflow=w,
+        agent_registry=AgentRegistry(),
+        manager_agent=ManagerAssignFirstReady(),
+        stakeholder_agent=stakeholder,
+        output_config=out,
+        max_timesteps=5,
+        seed=1,
+        profiler=PhaseProfiler(enabled=True),
+    )
+    results = await engine.run_full_execution()
+
+    phases = results[0].metadata["profile"]["phases"]
+    for name in (
+        "timestep",
+        "manager_step",
+        "manager_action",
+        "agent_tasks",
+        "stakeholder_policy",
+        "observation",
+        "save_outputs",
+    ):
+        assert phases[name]["count"] >= 1, name
+    all_spans = [s["name"] for r in results for s in r.metadata["profile"]["spans"]]
+    assert "agent_task" in all_spans
+
+    trace = json.loads(out.get_profile_trace_path().read_text())
+    names = {e["name"] for e in trace["traceEvents"] if e["ph"] == "X"}
+    assert {"timestep", "agent_task"} <= names
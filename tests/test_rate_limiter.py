@@ -0,0 +1,135 @@
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import httpx
+import pytest
+from pydantic import BaseModel
+
+from manager_agent_gym.core.common import llm_interface as llm_iface
+from manager_agent_gym.core.common.rate_limiter import (
+    LLMPriority,
+    LLMRateLimiter,
+    RateBudget,
+    configure_rate_limiter,
+    is_rate_limit_error,
+    rate_limited,
+    retry_after_from_error,
+)
+
+
+class _Verdict(BaseModel):
+    score: float
+
+
+class _RateLimitError(Exception):
+    def __init__(self, headers: dict[str, str]) -> None:
+        super().__init__("429 Too Many Requests")
+        self.status_code = 429
+        self.response = httpx.Response(429, headers=headers)
+
+
+def test_retry_after_header_parsing() -> None:
+    assert retry_after_from_error(_RateLimitError({"retry-after-ms": "1500"})) == 1.5
+    assert retry_after_from_error(_RateLimitError({"retry-after": "2"})) == 2.0
+    assert (
+        retry_after_from_error(
+            _RateLimitError(
+                {
+                    "x-ratelimit-reset-requests": "1m6s",
+                    "x-ratelimit-reset-tokens": "20ms",
+                }
+            )
+        )
+        == 66.0
+    )
+    assert retry_after_from_error(_RateLimitError({})) is None
+
+    # Wrapped by an SDK retry layer
+    try:
+        try:
+            raise _RateLimitError({"retry-after": "3"})
+        except _RateLimitError as inner:
+            raise RuntimeError("retries exhausted") from inner
+    except RuntimeError as wrapped:
+        assert is_rate_limit_error(wrapped)
+        assert retry_after_from_error(wrapped) == 3.0
+    assert not is_rate_limit_error(ValueError("bad schema"))
+
+
+@pytest.mark.asyncio
+async def test_queued_requests_are_served_by_priority() -> None:
+    # One request per 0.05s; the first is admitted from the full bucket
+    limiter = LLMRateLimiter(
+        default_budget=RateBudget(requests_per_minute=1200), min_rate_factor=1.0
+    )
+    limiter._state("m").requests.level = 0  # type: ignore[union-attr]
+    order: list[LLMPriority] = []
+
+    async def call(priority: LLMPriority) -> None:
+        await limiter.acquire("m", priority)
+        order.append(priority)
+
+    await asyncio.gather(
+        call(LLMPriority.EVALUATION),
+        call(LLMPriority.TASK_EXECUTION),
+        call(LLMPriority.MANAGER),
+        call(LLMPriority.EVALUATION),
+    )
+    assert order == [
+        LLMPriority.MANAGER,
+        LLMPriority.TASK_EXECUTION,
+        LLMPriority.EVALUATION,
+        LLMPriority.EVALUATION,
+    ]
+    assert limiter.stats()["m"]["granted"] == 4
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_error_pauses_key_and_recovers() -> None:
+    limiter = LLMRateLimiter(recovery_step=0.25)
+    configure_rate_limiter(limiter)
+    try:
+        with pytest.raises(_RateLimitError):
+            async with rate_limited("m"):
+                raise _RateLimitError({"retry-after-ms": "100"})
+        assert limiter.stats()["m"]["rate_limited"] == 1
+        assert limiter.stats()["m"]["rate_factor"] == 0.5
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        async with rate_limited("m"):
+            pass
+        # Waited out the advertised retry-after instead of retrying immediately
+        assert loop.time() - start >= 0.09
+        assert limiter.stats()["m"]["rate_factor"] == 0.75
+    finally:
+        configure_rate_limiter(None)
+
+
+@pytest.mark.asyncio
+async def test_structured_response_charges_actual_tokens(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    result = _Verdict(score=1.0)
+    object.__setattr__(result, "_raw_response", Mock(usage=Mock(total_tokens=500)))
+    client = Mock()
+    client.chat.completions.create = AsyncMock(return_value=result)
+    monkeypatch.setattr(llm_iface, "_get_openai_client", lambda: client)
+
+    limiter = LLMRateLimiter(budgets={"gpt-4o": RateBudget(tokens_per_minute=10_000)})
+    configure_rate_limiter(limiter)
+    try:
+        await llm_iface.generate_structured_response(
+            "sys",
+            "user",
+            _Verdict,
+            seed=0,
+            model="gpt-4o",
+            max_completion_tokens=100,
+            priority=LLMPriority.EVALUATION,
+        )
+        bucket = limiter._state("gpt-4o").tokens
+        assert bucket is not None
+        assert 9_500 <= bucket.level < 9_510
+    finally:
+        configure_rate_limiter(None)
@@ -0,0 +1,114 @@
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from manager_agent_gym.core.evaluation import validation_rules
+from manager_agent_gym.core.evaluation.validation_engine import ValidationEngine
+from manager_agent_gym.schemas.common.llm_responses import LLMScoredResponse
+from manager_agent_gym.schemas.core.base import TaskStatus
+from manager_agent_gym.schemas.core.resources import Resource
+from manager_agent_gym.schemas.core.tasks import Task
+from manager_agent_gym.schemas.core.workflow import Workflow
+from manager_agent_gym.schemas.evaluation.workflow_scope import (
+    WorkflowScope,
+    WorkflowSection,
+)
+from manager_agent_gym.schemas.preferences.evaluator import Evaluator
+from manager_agent_gym.schemas.preferences.rubric import RunCondition, WorkflowRubric
+
+
+def _workflow() -> tuple[Workflow, Task]:
+    workflow = Workflow(name="wf", workflow_goal="memo", owner_id=uuid4())
+    task = Task(name="t", description="d")
+    workflow.add_task(task)
+    return workflow, task
+
+
+async def _evaluate(engine: ValidationEngine, workflow: Workflow, timestep: int, ev):
+    return await engine.evaluate_timestep(
+        workflow=workflow,
+        timestep=timestep,
+        cadence=RunCondition.EACH_TIMESTEP,
+        communications=None,
+        manager_actions=None,
+        workflow_evaluators=[ev],
+    )
+
+
+@pytest.mark.asyncio
+async def test_scoped_function_rubric_reused_until_section_changes() -> None:
+    workflow, task = _workflow()
+    calls = {"scoped": 0, "unscoped": 0}
+
+    def completed(workflow: Workflow) -> float:
+        calls["scoped"] += 1
+        return float(
+            sum(t.status == TaskStatus.COMPLETED for t in workflow.tasks.values())
+        )
+
+    def unscoped(workflow: Workflow) -> float:
+        calls["unscoped"] += 1
+        return 1.0
+
+    ev = Evaluator(
+        name="ops",
+        description="",
+        rubrics=[
+            WorkflowRubric(
+                name="completed",
+                evaluator_function=completed,
+                max_score=5.0,
+                scope=WorkflowScope(sections={WorkflowSection.TASKS}),
+            ),
+            WorkflowRubric(name="unscoped", evaluator_function=unscoped, max_score=1.0),
+        ],
+    )
+    engine = ValidationEngine(seed=0)
+
+    await _evaluate(engine, workflow, 0, ev)
+    result = await _evaluate(engine, workflow, 1, ev)
+    assert calls == {"scoped": 1, "unscoped": 2}
+    assert result.metrics["rubric_memo"] == {"hits": 1, "misses": 0, "hit_rate": 1.0}
+
+    # A resource outside the rubric's scope does not invalidate it
+    workflow.add_resource(Resource(name="r", description="", content="x"))
+    await _evaluate(engine, workflow, 2, ev)
+    assert calls["scoped"] == 1
+
+    task.status = TaskStatus.COMPLETED
+    result = await _evaluate(engine, workflow, 3, ev)
+    assert calls["scoped"] == 2
+    scores = {r.name: r.score for r in result.evaluation_results[0].rubric_scores}
+    assert scores["completed"] == 1.0
+    assert engine.rubric_memo_stats[3]["misses"] == 1
+
+
+@pytest.mark.asyncio
+async def test_llm_rubric_memoized_on_workflow_fingerprint(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    workflow, task = _workflow()
+    llm = AsyncMock(return_value=LLMScoredResponse(reasoning="fine", score=0.5))
+    monkeypatch.setattr(validation_rules, "generate_structured_response", llm)
+    ev = Evaluator(
+        name="quality",
+        description="",
+        rubrics=[
+            WorkflowRubric(name="q", llm_prompt="Is the work good?", max_score=1.0)
+        ],
+    )
+
+    engine = ValidationEngine(seed=0)
+    for timestep in range(3):
+        await _evaluate(engine, workflow, timestep, ev)
+    assert llm.await_count == 1
+
+    task.description = "changed scope"
+    await _evaluate(engine, workflow, 3, ev)
+    assert llm.await_count == 2
+
+    uncached = ValidationEngine(seed=0, memoize_rubrics=False)
+    await _evaluate(uncached, workflow, 0, ev)
+    await _evaluate(uncached, workflow, 1, ev)
+    assert llm.await_count == 4
@@ -0,0 +1,31 @@
+from pathlib import Path
+
+import pytest
+
+from manager_agent_gym.core.execution.run_log import RunLogWriter, iter_run_log
+
+
+@pytest.mark.parametrize("name", ["run_log.jsonl", "run_log.jsonl.gz"])
+def test_appended_records_stream_back_in_order(tmp_path: Path, name: str) -> None:
+    path = tmp_path / name
+    writer = RunLogWriter(path)
+    for t in range(3):
+        writer.append({"timestep": t, "payload": "x" * t})
+    writer.flush()
+    if not name.endswith(".gz"):
+        # Flushed records are readable while the run is still going
+        assert [r["timestep"] for r in iter_run_log(path)] == [0, 1, 2]
+    writer.close()
+
+    # A later session appends to the same log
+    resumed = RunLogWriter(path)
+    resumed.append({"timestep": 3})
+    resumed.close()
+    assert [r["timestep"] for r in iter_run_log(path)] == [0, 1, 2, 3]
+    assert writer.records_written == 3
+
+
+def test_truncated_final_record_is_skipped(tmp_path: Path) -> None:
+    path = tmp_path / "run_log.jsonl"
+    path.write_text('{"timestep":0}\n{"timestep":1}\n{"timest')
+    assert [r["timestep"] for r in iter_run_log(path)] == [0, 1]
@@ -0,0 +1,113 @@
+import json
+from pathlib import Path
+
+from manager_agent_gym.core.execution.snapshot_store import (
+    SnapshotLogReader,
+    SnapshotLogWriter,
+    apply_snapshot_delta,
+    diff_snapshots,
+    index_path_for,
+)
+
+
+def _snapshots() -> list[dict]:
+    base = {
+        "name": "wf",
+        "total_cost": 0.0,
+        "tasks": {"t1": {"status": "pending"}, "t2": {"status": "pending"}},
+        "resources": {},
+        "agents": [{"agent_id": "a", "state": {"busy": False}}],
+        "messages": [],
+        "timestep": 0,
+    }
+    steps = [base]
+    s1 = json.loads(json.dumps(steps[-1]))
+    s1["tasks"]["t1"]["status"] = "running"
+    s1["agents"][0]["state"]["busy"] = True
+    s1["messages"].append({"message_id": "m1", "read_by": {}})
+    s1["timestep"] = 1
+    steps.append(s1)
+    s2 = json.loads(json.dumps(s1))
+    s2["tasks"]["t1"]["status"] = "completed"
+    s2["resources"]["r1"] = {"content": "x" * 100}
+    s2["messages"][0]["read_by"] = {"a": "now"}
+    s2["messages"].append({"message_id": "m2", "read_by": {}})
+    s2["agents"].insert(0, {"agent_id": "b", "state": {}})
+    s2["total_cost"] = 10.0
+    s2["timestep"] = 2
+    steps.append(s2)
+    s3 = json.loads(json.dumps(s2))
+    del s3["tasks"]["t2"]
+    del s3["resources"]["r1"]
+    s3["completed_at"] = "2025-01-01T00:00:00"
+    s3["timestep"] = 3
+    steps.append(s3)
+    s4 = json.loads(json.dumps(s3))
+    s4["timestep"] = 4
+    steps.append(s4)
+    return steps
+
+
+def test_delta_roundtrip_and_size() -> None:
+    steps = _snapshots()
+    for previous, current in zip(steps, steps[1:]):
+        delta = diff_snapshots(previous, current)
+        assert apply_snapshot_delta(previous, delta) == current
+
+    # Only what changed is stored
+    delta = diff_snapshots(steps[1], steps[2])
+    assert set(delta["sections"]["tasks"]["changed"]) == {"t1"}
+    assert set(delta["sections"]["messages"]["changed"]) == {"m1", "m2"}
+    assert diff_snapshots(steps[3], steps[4]) == {"set": {"timestep": 4}}
+
+
+def test_log_reader_materializes_every_timestep(tmp_path: Path) -> None:
+    steps = _snapshots()
+    path = tmp_path / "snapshots.jsonl"
+    writer = SnapshotLogWriter(path, keyframe_interval=3)
+    kinds = [writer.write(t, snapshot) for t, snapshot in enumerate(steps)]
+    assert kinds == ["keyframe", "delta", "delta", "keyframe", "delta"]
+
+    reader = SnapshotLogReader(path)
+    assert reader.timesteps == [0, 1, 2, 3, 4]
+    for t, snapshot in enumerate(steps):
+        assert reader.materialize(t) == snapshot
+
+
+def test_views_read_only_the_spans_they_touch(tmp_path: Path) -> None:
+    steps = _snapshots()
+    path = tmp_path / "snapshots.jsonl"
+    writer = SnapshotLogWriter(path, keyframe_interval=3)
+    for t, snapshot in enumerate(steps):
+        writer.write(t, snapshot)
+
+    reader = SnapshotLogReader(path)
+    for t, snapshot in enumerate(steps):
+        assert reader.view(t).materialize() == snapshot
+
+    view = reader.view(2)
+    tasks = view.section("tasks")
+    assert list(tasks) == ["t1", "t2"]
+    assert tasks["t1"] == {"status": "completed"}
+    # Untouched items stay as byte spans into the log
+    assert isinstance(tasks._items["t2"], tuple)
+    assert view["total_cost"] == 10.0 and "completed_at" not in view
+    assert [a["agent_id"] for a in view["agents"]] == ["b", "a"]
+    assert len(view.section("missing")) == 0
+    view.close()
+
+
+def test_reader_falls_back_without_a_usable_index(tmp_path: Path) -> None:
+    steps = _snapshots()
+    path = tmp_path / "snapshots.jsonl"
+    writer = SnapshotLogWriter(path, keyframe_interval=3, index=False)
+    for t, snapshot in enumerate(steps):
+        writer.write(t, snapshot)
+    assert not index_path_for(path).exists()
+    assert SnapshotLogReader(path).view(4).materialize() == steps[4]
+
+    # An index that stops short of the log is ignored
+    index_path_for(path).write_text("")
+    reader = SnapshotLogReader(path)
+    assert reader.timesteps == [0, 1, 2, 3, 4]
+    assert reader.view(2).materialize() == steps[2]
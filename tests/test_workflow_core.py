@@ -117,3 +117,244 @@ def test_task_deadtime_calculation() -> None:
     t.deps_ready_at = now
     t.started_at = now + datetime.timedelta(seconds=5)
     assert t.calculate_coordination_deadtime_seconds() == 5.0
+
+
+def test_ready_set_updates_incrementally_on_status_changes() -> None:
+    w = Workflow(name="w", workflow_goal="d", owner_id=uuid4())
+    a = Task(name="A", description="d")
+    b = Task(name="B", description="d", dependency_task_ids=[a.id])
+    c = Task(name="C", description="d", dependency_task_ids=[a.id, b.id])
+    for t in (a, b, c):
+        w.add_task(t)
+
+    assert [t.name for t in w.get_ready_tasks()] == ["A"]
+    rebuilds = w._scheduler.rebuild_count
+
+    a.status = TaskStatus.RUNNING
+    assert w.get_ready_tasks() == []
+    a.status = TaskStatus.COMPLETED
+    assert [t.name for t in w.get_ready_tasks()] == ["B"]
+    assert b.status == TaskStatus.READY
+    b.status = TaskStatus.COMPLETED
+    assert [t.name for t in w.get_ready_tasks()] == ["C"]
+
+    # Reopening a prerequisite blocks its dependents again
+    b.status = TaskStatus.PENDING
+    assert [t.name for t in w.get_ready_tasks()] == ["B"]
+
+    # Pure status transitions never rebuild the DAG
+    assert w._scheduler.rebuild_count == rebuilds
+
+
+def test_ready_set_tracks_structural_edits() -> None:
+    w = Workflow(name="w", workflow_goal="d", owner_id=uuid4())
+    a = Task(name="A", description="d")
+    b = Task(name="B", description="d")
+    w.add_task(a)
+    w.add_task(b)
+    assert {t.name for t in w.get_ready_tasks()} == {"A", "B"}
+
+    # Dependency rewiring is picked up
+    b.dependency_task_ids = [a.id]
+    assert [t.name for t in w.get_ready_tasks()] == ["A"]
+
+    # Decomposing a ready leaf replaces it with its children
+    a1 = Task(name="A1", description="d")
+    a.add_subtask(a1)
+    ready = w.get_ready_tasks()
+    assert [t.name for t in ready] == ["A1"]
+    assert a1.id in w.tasks
+
+    # B now waits on A's leaves
+    a1.status = TaskStatus.COMPLETED
+    assert [t.name for t in w.get_ready_tasks()] == ["B"]
+
+    w.remove_task(b.id)
+    assert w.get_ready_tasks() == []
+
+
+def test_task_index_tracks_nested_edits() -> None:
+    w = Workflow(name="w", workflow_goal="d", owner_id=uuid4())
+    root = Task(name="Root", description="d")
+    mid = Task(name="Mid", description="d")
+    leaf = Task(name="Leaf", description="d")
+    mid.add_subtask(leaf)
+    root.add_subtask(mid)
+    w.add_task(root)
+
+    assert w.find_task_by_id(leaf.id) is leaf
+    assert w.get_parent_task(leaf.id) is mid
+    assert w.get_ancestor_ids(leaf.id) == [mid.id, root.id]
+    assert w.is_in_subtree(leaf.id, root.id)
+    assert not w.is_in_subtree(root.id, leaf.id)
+
+    # Subtasks added after registration are indexed through the task hook
+    late = Task(name="Late", description="d")
+    leaf.add_subtask(late)
+    assert w.find_task_by_id(late.id) is late
+    assert root.find_task_by_id(late.id) is late
+    assert mid.find_task_by_id(root.id) is None
+
+    # Removing a subtree drops it from the index
+    assert root.remove_subtask(mid.id)
+    assert w.find_task_by_id(mid.id) is None
+    assert w.find_task_by_id(late.id) is None
+    assert w.find_task_by_id(root.id) is root
+
+
+def test_embedded_copies_resolve_to_registry_objects() -> None:
+    root = Task(name="Root", description="d")
+    leaf = Task(name="Leaf", description="d")
+    root.add_subtask(leaf)
+    # Deserialized workflows carry separate copies for registry and embedded views
+    w = Workflow.model_validate(
+        {
+            "name": "w",
+            "workflow_goal": "d",
+            "owner_id": uuid4(),
+            "tasks": {root.id: root.model_dump(), leaf.id: leaf.model_dump()},
+        }
+    )
+    registered_leaf = w.tasks[leaf.id]
+    assert w.tasks[root.id].subtasks[0] is not registered_leaf
+
+    assert w.find_task_by_id(leaf.id) is registered_leaf
+    assert w.tasks[root.id].subtasks[0] is registered_leaf
+
+    # A single in-place write is visible from both views
+    registered_leaf.status = TaskStatus.COMPLETED
+    assert w.tasks[root.id].subtasks[0].status == TaskStatus.COMPLETED
+    assert w.is_complete()
+
+
+def test_pretty_print_memoized_and_invalidated_on_mutation() -> None:
+    from manager_agent_gym.schemas.core.resources import Resource
+
+    w = Workflow(name="w", workflow_goal="d", owner_id=uuid4())
+    root = Task(name="root", description="r")
+    leaf = Task(name="leaf", description="l")
+    root.add_subtask(leaf)
+    w.add_task(root)
+    resource = Resource(name="doc", description="d", content="one two")
+    w.add_resource(resource)
+
+    first = w.pretty_print()
+    assert w.pretty_print() is first
+    version = w.render_version
+
+    leaf.status = TaskStatus.COMPLETED
+    assert w.render_version > version
+    assert "Status: completed" in w.pretty_print()
+
+    resource.content = "one two three"
+    assert "words=3" in w.pretty_print()
+
+    w.total_cost = 12.5
+    assert "Cost (actual): $12.50" in w.pretty_print()
+
+    # Fragments of untouched tasks are reused across documents
+    cached_root = root._rendered[1]
+    leaf.description = "changed"
+    assert "Description: changed" in w.pretty_print()
+    assert root._rendered[1] is cached_root
+
+
+def test_lazy_resources_build_on_first_lookup() -> None:
+    import copy
+    import pickle
+
+    from manager_agent_gym.schemas.core.resources import Resource
+
+    w = Workflow(name="w", workflow_goal="d", owner_id=uuid4())
+    resources = [Resource(name=f"r{i}", description="d", content="x") for i in range(3)]
+    built: list[str] = []
+
+    def factory(resource: Resource):
+        def build() -> Resource:
+            built.append(resource.name)
+            return resource
+
+        return build
+
+    w.add_lazy_resources({resource.id: factory(resource) for resource in resources})
+
+    # Keys, membership and counts do not build anything
+    assert len(w.resources) == 3
+    assert resources[1].id in w.resources
+    assert list(w.resources) == [r.id for r in resources]
+    assert built == []
+
+    assert w.resources[resources[1].id] is resources[1]
+    assert w.resources.get(resources[2].id) is resources[2]
+    assert built == ["r1", "r2"]
+    assert resources[1]._workflow_ref is not None and resources[1]._workflow_ref() is w
+
+    # Dumps and copies see every resource, in registration order
+    dumped = w.model_dump(mode="json")["resources"]
+    assert list(dumped) == [str(r.id) for r in resources]
+    assert built == ["r1", "r2", "r0"]
+    assert list(copy.deepcopy(w).resources) == [r.id for r in resources]
+    assert list(pickle.loads(pickle.dumps(w.resources))) == [r.id for r in resources]
+
+
+def test_copies_and_unpickled_workflows_schedule_their_own_tasks() -> None:
+    import copy
+    import pickle
+
+    w = Workflow(name="w", workflow_goal="d", owner_id=uuid4())
+    a = Task(name="A", description="a")
+    b = Task(name="B", description="b", dependency_task_ids=[a.id])
+    w.add_task(a)
+    w.add_task(b)
+    assert [t.name for t in w.get_ready_tasks()] == ["A"]
+
+    copies = [
+        copy.deepcopy(w),
+        w.model_copy(deep=True),
+        w.model_copy(deep=True, update={"name": "renamed"}),
+        pickle.loads(pickle.dumps(w)),
+    ]
+    for w2 in copies:
+        w2.tasks[a.id].status = TaskStatus.COMPLETED
+        assert [t.name for t in w2.get_ready_tasks()] == ["B"]
+        assert w2.tasks[a.id].status == TaskStatus.COMPLETED
+    # The original is untouched
+    assert [t.name for t in w.get_ready_tasks()] == ["A"]
+
+
+def test_copies_do_not_share_cached_renderings() -> None:
+    from manager_agent_gym.schemas.core.resources import Resource
+
+    w = Workflow(name="w", workflow_goal="d", owner_id=uuid4())
+    task = Task(name="t", description="d")
+    w.add_task(task)
+    resource = Resource(name="doc", description="d", content="one two")
+    w.add_resource(resource)
+    assert "Status: pending" in w.pretty_print()
+
+    w.replace_task(task.model_copy(update={"status": TaskStatus.COMPLETED}))
+    assert "Status: completed" in w.pretty_print()
+
+    copied = resource.model_copy(update={"content": "one two three"})
+    assert "words=3" in copied.pretty_print()
+    assert "words=2" in resource.pretty_print()
+
+
+def test_in_place_task_edits_need_reassignment_or_invalidation() -> None:
+    w = Workflow(name="w", workflow_goal="d", owner_id=uuid4())
+    a = Task(name="A", description="a")
+    b = Task(name="B", description="b")
+    w.add_task(a)
+    w.add_task(b)
+    assert [t.name for t in w.get_ready_tasks()] == ["A", "B"]
+
+    # In-place edits are not reported to the scheduler...
+    b.dependency_task_ids.append(a.id)
+    assert [t.name for t in w.get_ready_tasks()] == ["A", "B"]
+    # ...until the task graph is invalidated
+    w.invalidate_task_graph()
+    assert [t.name for t in w.get_ready_tasks()] == ["A"]
+
+    # Reassignment is reported directly
+    b.dependency_task_ids = []
+    assert [t.name for t in w.get_ready_tasks()] == ["A", "B"]